@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+AI Cache Benchmark
+Fills the AI response cache with synthetic entries through both backends of
+lib/ai_cache.sh (the .txt/.meta file layout and the SQLite response store),
+then times lookups, saves, expiry cleanup and disk usage the way the
+workflow sees them: by calling the shell functions.
+
+Usage:
+    python3 scripts/benchmarks/bench_ai_cache.py [--entries 2000] [--lookups 50]
+
+Saves to the file layout also rewrite index.json, which lists every entry.
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+AI_CACHE_LIB = REPO_ROOT / "src" / "workflow" / "lib" / "ai_cache.sh"
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from ai_workflow_docs.ai_cache_store import ResponseCache  # noqa: E402
+
+# A typical review response: repetitive markdown of a few KB
+RESPONSE = "\n".join(f"- Finding {i}: update the documentation for `module_{i}.sh`" for i in range(60))
+
+
+def fill_files(cache_dir: Path, keys: list, created: float) -> None:
+    index_file = cache_dir / "index.json"
+    index = json.loads(index_file.read_text()) if index_file.exists() else {
+        "version": "1.0.0", "created": "", "last_cleanup": "", "entries": []}
+    index["entries"] += [{"cache_key": key, "created": "", "last_accessed": "", "access_count": 1}
+                         for key in keys]
+    index_file.write_text(json.dumps(index, indent=2))
+    for key in keys:
+        (cache_dir / f"{key}.txt").write_text(RESPONSE + "\n")
+        (cache_dir / f"{key}.meta").write_text(json.dumps({
+            "cache_key": key, "timestamp_epoch": int(created), "response_size": len(RESPONSE) + 1}))
+
+
+def fill_store(cache_dir: Path, keys: list, created: float) -> None:
+    cache = ResponseCache(cache_dir / "responses.db")
+    for key in keys:
+        cache.put(key, (RESPONSE + "\n").encode(), created=created)
+    cache.close()
+
+
+def run_shell(cache_dir: Path, use_store: bool, script: str) -> float:
+    """Seconds taken by script after sourcing ai_cache.sh"""
+    env = dict(os.environ, USE_PYTHON_AI_CACHE="true" if use_store else "false")
+    prelude = (f"source '{AI_CACHE_LIB}'; AI_CACHE_DIR='{cache_dir}'; "
+               f"AI_CACHE_INDEX='{cache_dir}/index.json'; ")
+    start = time.perf_counter()
+    subprocess.run(["bash", "-c", prelude + script], env=env, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def disk_usage(cache_dir: Path) -> tuple:
+    files = [p for p in cache_dir.iterdir() if p.is_file()]
+    return len(files), sum(p.stat().st_blocks * 512 for p in files)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=2000, help="Cached entries")
+    parser.add_argument("--lookups", type=int, default=50,
+                        help="Timed get_cached_response and save_to_cache calls")
+    args = parser.parse_args()
+
+    keys = [hashlib.sha256(f"prompt {i}".encode()).hexdigest() for i in range(args.entries)]
+    probes = " ".join(keys[1::max(1, args.entries // args.lookups)][:args.lookups])
+    lookup = f"for k in {probes}; do get_cached_response \"$k\" > /dev/null || true; done"
+    save = (f"for i in $(seq {args.lookups}); do "
+            f"save_to_cache \"$(generate_cache_key \"new $i\" '')\" \"{RESPONSE}\" \"new $i\"; done")
+    # Every fifth entry is older than the TTL
+    fresh, expired = time.time(), time.time() - 2 * 86400
+
+    results = {}
+    for label, use_store, fill in (("files", False, fill_files), ("store", True, fill_store)):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_dir = Path(tmp)
+            fill(cache_dir, [k for i, k in enumerate(keys) if i % 5], fresh)
+            fill(cache_dir, [k for i, k in enumerate(keys) if not i % 5], expired)
+            files, usage = disk_usage(cache_dir)
+            get_time = run_shell(cache_dir, use_store, lookup) / args.lookups
+            save_time = run_shell(cache_dir, use_store, save) / args.lookups
+            cleanup_time = run_shell(cache_dir, use_store, "cleanup_ai_cache_old_entries")
+            results[label] = (files, usage, get_time, save_time, cleanup_time)
+
+    print(f"Entries:               {args.entries} ({args.entries // 5} expired)")
+    print(f"{'':22} {'files':>12} {'store':>12}")
+    rows = [("Files on disk:", "{:12d}", 0), ("Disk usage (KB):", "{:12.0f}", 1),
+            ("Lookup (ms):", "{:12.1f}", 2), ("Save (ms):", "{:12.1f}", 3), ("Cleanup (s):", "{:12.2f}", 4)]
+    for title, fmt, i in rows:
+        scale = 1 / 1024 if i == 1 else 1000 if i in (2, 3) else 1
+        print(f"{title:22} " + " ".join(fmt.format(results[b][i] * scale) for b in ("files", "store")))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Change Classifier Benchmark
+Creates a git repository with a large synthetic change set (modified,
+staged and untracked files across every FILE_PATTERNS category plus
+workflow artifacts), then times the lib/change_detection.sh functions
+detect_change_type, analyze_changes, assess_change_impact and
+classify_files_by_nature with the bash pattern loops and with the
+compiled classifier, and checks that both print the same.
+
+Usage:
+    python3 scripts/benchmarks/bench_change_classifier.py [--files 500 2000] [--repeat 1]
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+CHANGE_LIB = REPO_ROOT / "src" / "workflow" / "lib" / "change_detection.sh"
+
+FUNCTIONS = ("detect_change_type", "analyze_changes", "assess_change_impact", "classify_files_by_nature")
+DIRECTORIES = ("src", "src/components", "lib", "docs", "docs/api", "tests", "__tests__", "scripts",
+               "src/workflow/lib", ".github/workflows", "assets", "config", ".ai_workflow/logs",
+               "src/workflow/backlog/run")
+NAMES = ("index", "util", "README", "CHANGELOG", "Makefile", "Dockerfile", "setup", "tsconfig",
+         "app.test", "app.spec", "helper", "main", "notes")
+EXTENSIONS = (".md", ".txt", ".rst", ".js", ".test.js", ".spec.mjs", ".ts", ".py", ".go", ".json",
+              ".yaml", ".yml", ".toml", ".sh", ".png", ".svg", ".css", ".tmp", ".bak", "")
+
+
+def git(repo: Path, *args) -> None:
+    subprocess.run(["git", "-C", str(repo), *args], check=True, stdout=subprocess.DEVNULL)
+
+
+def make_repository(repo: Path, files: int, rng: random.Random) -> None:
+    """Half the files committed then modified, a quarter staged, a quarter untracked"""
+    git(repo, "init", "-q")
+    git(repo, "config", "user.email", "bench@example.com")
+    git(repo, "config", "user.name", "bench")
+    paths = set()
+    while len(paths) < files:
+        paths.add(f"{rng.choice(DIRECTORIES)}/{rng.choice(NAMES)}{rng.randrange(files * 4)}{rng.choice(EXTENSIONS)}")
+    paths = sorted(paths)
+    rng.shuffle(paths)
+    for path in paths:
+        (repo / path).parent.mkdir(parents=True, exist_ok=True)
+        (repo / path).write_text("initial\n")
+    committed, staged = paths[:files // 2], paths[files // 2:files * 3 // 4]
+    (repo / ".gitignore").write_text("")
+    git(repo, "add", "--", ".gitignore", *committed)
+    git(repo, "commit", "-q", "-m", "initial")
+    for path in committed:
+        with open(repo / path, "a") as f:
+            f.write("changed\n")
+    git(repo, "add", "--", *staged)
+
+
+def run_functions(repo: Path, use_classifier: bool, repeat: int) -> tuple:
+    """(best seconds per function, outputs) with one bash process per call"""
+    env = dict(os.environ, USE_PYTHON_CHANGE_CLASSIFIER="true" if use_classifier else "false")
+    times, outputs = {}, {}
+    for function in FUNCTIONS:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = subprocess.run(["bash", "-c", f"source '{CHANGE_LIB}'; {function}"], cwd=repo, env=env,
+                                    capture_output=True, text=True, check=True)
+            best = min(best, time.perf_counter() - start)
+        times[function], outputs[function] = best, result.stdout
+    return times, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, nargs="+", default=[500, 2000], help="Changed files per run")
+    parser.add_argument("--repeat", type=int, default=1, help="Timings per function (best is kept)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'Files':>6} {'Function':26} {'bash (ms)':>10} {'classifier (ms)':>16} {'same':>5}")
+    for files in args.files:
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = Path(tmp)
+            make_repository(repo, files, rng)
+            bash_times, bash_outputs = run_functions(repo, False, args.repeat)
+            classifier_times, classifier_outputs = run_functions(repo, True, args.repeat)
+        for function in FUNCTIONS:
+            same = "yes" if bash_outputs[function] == classifier_outputs[function] else "NO"
+            print(f"{files:6d} {function:26} {bash_times[function] * 1000:10.0f} "
+                  f"{classifier_times[function] * 1000:16.0f} {same:>5}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
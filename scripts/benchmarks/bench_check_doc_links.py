@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Link Checker Benchmark
+Compares serial and parallel (--jobs) runs of check_doc_links.py on a
+synthetic documentation tree and verifies both produce identical output.
+
+Usage:
+    python3 scripts/benchmarks/bench_check_doc_links.py [--files 10000] [--jobs N]
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from ai_workflow_docs.check_doc_links import LinkChecker  # noqa: E402
+
+
+def build_tree(root: Path, file_count: int) -> Path:
+    """Create a synthetic docs tree with internal, anchor and external links"""
+    docs = root / "docs"
+    for i in range(file_count):
+        section = docs / f"section_{i % 50:02d}"
+        section.mkdir(parents=True, exist_ok=True)
+        neighbour = f"../section_{(i + 1) % 50:02d}/page_{i + 1}.md"
+        missing = "missing.md" if i % 97 == 0 else f"page_{i}.md"
+        lines = [f"# Page {i}", ""]
+        for h in range(5):
+            lines += [f"## Topic {h}", "",
+                      f"See [next]({neighbour}) and [self]({missing}).",
+                      f"Jump to [topic](#topic-{(h + 1) % 5}) or "
+                      f"[docs](https://example.com/{i}/{h}).", ""]
+        (section / f"page_{i}.md").write_text("\n".join(lines), encoding="utf-8")
+    return docs
+
+
+def run(docs: Path, jobs: int):
+    """Run the checker once, returning (seconds, stdout, stderr, exit code)"""
+    out, err = io.StringIO(), io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        code = LinkChecker(str(docs)).validate_all(jobs=jobs)
+    return time.perf_counter() - start, out.getvalue(), err.getvalue(), code
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=10000, help="Synthetic file count")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes for the parallel run")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bench_links_") as tmp:
+        print(f"Building synthetic tree: {args.files} files...")
+        docs = build_tree(Path(tmp), args.files)
+
+        serial, s_out, s_err, s_code = run(docs, 1)
+        parallel, p_out, p_err, p_code = run(docs, args.jobs)
+
+    identical = (s_out, s_err, s_code) == (p_out, p_err, p_code)
+    print(f"Serial   (jobs=1):  {serial:8.2f}s")
+    print(f"Parallel (jobs={args.jobs}): {parallel:8.2f}s")
+    print(f"Speedup:            {serial / parallel:8.2f}x")
+    print(f"Identical output:   {'yes' if identical else 'NO'}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+CLI Start-up Benchmark
+Measures wall-clock start-up of `ai-workflow-docs` subcommands in fresh
+interpreters and checks that subcommands only import what they need
+(no PyYAML for link checking, no asyncio/ssl unless --check-external).
+
+Usage:
+    python3 scripts/benchmarks/bench_cli_startup.py [--runs 20] [--target-ms 50]
+
+Exits 1 when `ai-workflow-docs --help` is slower than the target or a
+subcommand imports a module it should not.
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+# (label, arguments after `python3 -m ai_workflow_docs`)
+CASES = [
+    ("--help", ["--help"]),
+    ("check-links --help", ["check-links", "--help"]),
+    ("validate-api --help", ["validate-api", "--help"]),
+    ("validate-context --help", ["validate-context", "--help"]),
+    ("extract --help", ["extract", "--help"]),
+]
+
+# Subcommand module -> modules that must not be imported when it loads
+FORBIDDEN_IMPORTS = {
+    "cli": ["yaml", "argparse", "typing", "asyncio", "ssl"],
+    "check_doc_links": ["yaml", "asyncio", "ssl", "http.client", "concurrent.futures"],
+    "validate_api_docs": ["yaml", "asyncio", "ssl"],
+}
+
+IMPORT_PROBE = """
+import importlib, json, sys
+before = set(sys.modules)
+importlib.import_module("ai_workflow_docs." + sys.argv[1])
+print(json.dumps(sorted(set(sys.modules) - before)))
+"""
+
+
+def environment() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    return env
+
+
+def time_command(command: list, runs: int, env: dict) -> float:
+    """Median wall time in ms of running command in a fresh interpreter"""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def imported_modules(module: str, env: dict) -> list:
+    output = subprocess.run([sys.executable, "-c", IMPORT_PROBE, module], env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="Runs per command (median is reported)")
+    parser.add_argument("--target-ms", type=float, default=50.0,
+                        help="Maximum median start-up for `ai-workflow-docs --help` (default: 50)")
+    args = parser.parse_args()
+    env = environment()
+
+    baseline = time_command([sys.executable, "-c", "pass"], args.runs, env)
+    print(f"Interpreter only:          {baseline:7.1f} ms")
+    results = {}
+    for label, argv in CASES:
+        results[label] = time_command([sys.executable, "-m", "ai_workflow_docs"] + argv, args.runs, env)
+        print(f"{label + ':':<26} {results[label]:7.1f} ms")
+
+    print()
+    clean = True
+    for module, forbidden in FORBIDDEN_IMPORTS.items():
+        loaded = set(imported_modules(module, env))
+        leaked = [name for name in forbidden if name in loaded]
+        clean = clean and not leaked
+        print(f"Imports of {module + ':':<19} {len(loaded):4d} modules"
+              f"{', unexpected: ' + ', '.join(leaked) if leaked else ''}")
+
+    fast = results["--help"] <= args.target_ms
+    print()
+    print(f"--help target ({args.target_ms:.0f} ms):  {'met' if fast else 'MISSED'}")
+    print(f"Lazy imports:              {'yes' if clean else 'NO'}")
+    return 0 if fast and clean else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Context Rule Benchmark
+Measures prompt template checks per second for the compiled rule set in
+ai_workflow_docs.prompt_rules against the original inline checks, on synthetic persona
+prompt variants, and verifies both report the same failures.
+
+Usage:
+    python3 scripts/benchmarks/bench_context_rules.py [--templates 5000] [--rounds 3]
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from ai_workflow_docs.prompt_rules import RuleSet  # noqa: E402
+
+STANDARD_PARAMS = ['project_name', 'project_description', 'primary_language',
+                   'change_scope', 'modified_count']
+EXTRA_PARAMS = ['doc_files', 'test_results', 'Bad_Param', 'script_list', 'coverage']
+
+
+def legacy_check(task: str):
+    """The checks as written inline in validate_context_blocks() before the rule engine"""
+    failures = []
+    if '**Context:**' not in task:
+        failures.append("Missing **Context:** block")
+    params_found = re.findall(r'\{(\w+)\}', task)
+    missing = [p for p in STANDARD_PARAMS if p not in params_found]
+    if missing:
+        failures.append(f"Missing parameters: {', '.join(missing)}")
+    bad_params = [p for p in params_found if p[0].isupper() or ' ' in p or '-' in p]
+    if bad_params:
+        failures.append(f"Non-snake_case parameters: {', '.join(bad_params)}")
+    match = re.search(r'\*\*Context:\*\*(.*?)(?:\*\*|$)', task, re.DOTALL)
+    if match:
+        lines = [l.strip() for l in match.group(1).split('\n') if l.strip()]
+        non_bullet_lines = [l for l in lines if not l.startswith('-')]
+        if lines and non_bullet_lines:
+            failures.append(f"Non-bullet lines in context: {len(non_bullet_lines)}")
+    return failures
+
+
+def build_templates(count: int, seed: int = 42):
+    """Generate persona/step prompt variants, some deliberately broken"""
+    rng = random.Random(seed)
+    templates = []
+    for i in range(count):
+        params = [p for p in STANDARD_PARAMS if rng.random() > 0.1]
+        params += rng.sample(EXTRA_PARAMS, rng.randint(0, 2))
+        context = [f"- {p.replace('_', ' ').title()}: {{{p}}}" for p in params]
+        if rng.random() < 0.1:
+            context.insert(1, "Additional details follow.")
+        body = "\n".join(
+            f"{rng.choice(['Review', 'Check', 'Validate'])} section {j} of {{doc_files}} "
+            f"and report on **issue {j}** found." for j in range(rng.randint(5, 30)))
+        marker = "**Context:**" if rng.random() > 0.05 else "Context:"
+        templates.append(f"**Role:** persona {i}\n\n{marker}\n" + "\n".join(context)
+                         + f"\n\n**Task:**\n{body}\n")
+    return templates
+
+
+def timed(check, templates, rounds: int):
+    """Best-of-rounds seconds for one pass, and the results of the last pass"""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        results = [check(t) for t in templates]
+        best = min(best, time.perf_counter() - start)
+    return best, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--templates", type=int, default=5000, help="Synthetic template count")
+    parser.add_argument("--rounds", type=int, default=3, help="Timed rounds (best is reported)")
+    args = parser.parse_args()
+
+    templates = build_templates(args.templates)
+    start = time.perf_counter()
+    rules = RuleSet.from_yaml()
+    compile_time = time.perf_counter() - start
+
+    legacy, legacy_results = timed(legacy_check, templates, args.rounds)
+    compiled, rule_results = timed(rules.check, templates, args.rounds)
+
+    identical = legacy_results == rule_results
+    failing = sum(1 for r in rule_results if r)
+    print(f"Templates:          {len(templates)} ({failing} failing)")
+    print(f"Rule set load:      {compile_time * 1000:8.2f} ms")
+    print(f"Inline checks:      {len(templates) / legacy:10.0f} templates/s")
+    print(f"Compiled rules:     {len(templates) / compiled:10.0f} templates/s")
+    print(f"Speedup:            {legacy / compiled:8.2f}x")
+    print(f"Identical results:  {'yes' if identical else 'NO'}")
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
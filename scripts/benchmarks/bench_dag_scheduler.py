@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+DAG Scheduler Benchmark
+Exports the step graph with export_step_metadata_json, then compares the
+static phases of the execution plan with the critical-path DAG schedule
+on the same worker pool. Actual step durations are the estimates times
+lognormal noise, while both schedules are planned from the estimates
+(as they are before a run). It reports the mean and worst makespan over
+the simulated runs, and the wall clock of one run of each with the
+durations scaled down to sleeps, timed from the scheduler trace.
+
+Usage:
+    python3 scripts/benchmarks/bench_dag_scheduler.py [--workers 2 4 8] [--runs 1000] [--scale 0.005]
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import argparse
+import json
+import random
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+GRAPH_LIB = REPO_ROOT / "src" / "workflow" / "lib" / "dependency_graph.sh"
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from ai_workflow_docs.dag_scheduler import StepGraph, run, simulate, simulate_phases  # noqa: E402
+
+
+def export_metadata(path: Path) -> None:
+    subprocess.run(["bash", "-c", f"source '{GRAPH_LIB}'; export_step_metadata_json '{path}'"],
+                   check=True, stdout=subprocess.DEVNULL)
+
+
+def makespan(schedule: list) -> float:
+    return max(end for _, _, end in schedule)
+
+
+def run_phases(graph: StepGraph, workers: int, command: list) -> float:
+    """Wall clock of the static phases, each phase on a fresh pool"""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for phase in graph.phases():
+            list(pool.map(lambda step: subprocess.call(command + [step]),
+                          sorted(phase, key=lambda s: -graph.durations[s])))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4, 8], help="Pool sizes")
+    parser.add_argument("--runs", type=int, default=1000, help="Simulated runs per pool size")
+    parser.add_argument("--sigma", type=float, default=0.5, help="Lognormal noise of actual durations")
+    parser.add_argument("--scale", type=float, default=0.005,
+                        help="Seconds slept per estimated second in the wall clock run (0 to skip)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        metadata = Path(tmp) / "step_metadata.json"
+        export_metadata(metadata)
+        graph = StepGraph.load(str(metadata))
+        runs = [{step: seconds * rng.lognormvariate(0, args.sigma) for step, seconds in graph.durations.items()}
+                for _ in range(args.runs)]
+
+        print(f"Steps: {len(graph.steps)}, phases: {len(graph.phases())}, "
+              f"estimated critical path: {graph.bottom_levels[graph.critical_path()[0]]:.0f} s, "
+              f"sequential: {sum(graph.durations.values()):.0f} s")
+        print(f"{'Workers':>7} {'phases (s)':>11} {'DAG (s)':>9} {'saved':>7} {'worst phases':>13} {'worst DAG':>10}")
+        for workers in args.workers:
+            phases = [makespan(simulate_phases(graph, workers, actual)) for actual in runs]
+            dag = [makespan(simulate(graph, workers, actual)) for actual in runs]
+            saved = sum((p - d) / p for p, d in zip(phases, dag)) / len(runs) * 100
+            print(f"{workers:7d} {sum(phases) / len(runs):11.0f} {sum(dag) / len(runs):9.0f} {saved:6.1f}% "
+                  f"{max(phases):13.0f} {max(dag):10.0f}")
+
+        if args.scale > 0:
+            actual = runs[0]
+            sleeps = Path(tmp) / "sleeps.json"
+            sleeps.write_text(json.dumps({step: seconds * args.scale for step, seconds in actual.items()}))
+            command = [sys.executable, "-c", "import json, sys, time; "
+                       f"time.sleep(json.load(open({str(sleeps)!r}))[sys.argv[1]])"]
+            workers = args.workers[len(args.workers) // 2]
+            phases_wall = run_phases(graph, workers, command)
+            trace = run(graph, workers, shlex.join(command) + " {step}")
+            if trace["failed"]:
+                raise SystemExit(f"Step command failed for {', '.join(trace['failed'])}")
+            print(f"Wall clock ({workers} workers, x{args.scale}): phases {phases_wall:.2f} s, "
+                  f"DAG {trace['makespan']:.2f} s (simulated {makespan(simulate_phases(graph, workers, actual)) * args.scale:.2f}"
+                  f" / {makespan(simulate(graph, workers, actual)) * args.scale:.2f} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
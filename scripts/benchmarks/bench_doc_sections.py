@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Doc Sections Benchmark
+Generates a markdown document with nested sections and updates a number
+of them two ways: one replace_doc_section call per section (an awk rescan
+of the whole file each) and one run_doc_section_batch of doc_sections.py,
+cold and with the section index cached. Both must leave identical files.
+
+Usage:
+    python3 scripts/benchmarks/bench_doc_sections.py [--sections 50 200 800] [--updates 25]
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import argparse
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+EXTRACTOR_LIB = REPO_ROOT / "src" / "workflow" / "lib" / "doc_section_extractor.sh"
+
+
+def make_document(sections: int, rng: random.Random) -> tuple:
+    """Markdown text and the ids of its level 2 and 3 sections"""
+    lines = ["# Reference", "", "Generated for the benchmark.", ""]
+    ids = []
+    for number in range(sections):
+        level = 2 if number % 4 == 0 else 3
+        title = f"Section {number} {rng.choice(['Setup', 'Usage', 'Options', 'Notes'])}"
+        ids.append(title.lower().replace(" ", "-"))
+        lines += ["#" * level + " " + title, ""]
+        lines += [f"Paragraph {line} of {title.lower()}, with `code` and a [link](#top)." for line in range(8)]
+        lines.append("")
+    return "\n".join(lines) + "\n", ids
+
+
+def bash(script: str, env_python: bool, cwd: str) -> float:
+    start = time.perf_counter()
+    subprocess.run(["bash", "-c", f"source '{EXTRACTOR_LIB}'; {script}"], check=True, cwd=cwd,
+                   env={"PATH": "/usr/bin:/bin:/usr/local/bin",
+                        "USE_PYTHON_DOC_SECTIONS": "true" if env_python else "false"},
+                   stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sections", type=int, nargs="+", default=[50, 200, 800], help="Sections per document")
+    parser.add_argument("--updates", type=int, default=25, help="Sections replaced per run")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'Sections':>8} {'KB':>6} {'per call (s)':>13} {'batch cold (s)':>15} {'batch cached (s)':>17} {'speedup':>8}")
+    for sections in args.sections:
+        text, ids = make_document(sections, rng)
+        targets = rng.sample(ids, min(args.updates, len(ids)))
+        with tempfile.TemporaryDirectory() as tmp:
+            work = Path(tmp)
+            for target in targets:
+                (work / f"{target}.content").write_text(f"Updated {target}.\n\nNew details.")
+            (work / "ops").write_text("".join(f"replace\tbatch.md\t{target}\t{target}.content\n" for target in targets))
+            calls = "; ".join(f"replace_doc_section per_call.md '{target}' \"$(cat '{target}.content')\""
+                              for target in targets)
+
+            (work / "per_call.md").write_text(text)
+            per_call = bash(calls, False, tmp)
+            (work / "batch.md").write_text(text)
+            cold = bash("run_doc_section_batch < ops", True, tmp)
+            if (work / "batch.md").read_bytes() != (work / "per_call.md").read_bytes():
+                raise SystemExit(f"Batch and per-call results differ ({sections} sections)")
+            (work / "batch.md").write_text(text)
+            cached = bash("run_doc_section_batch < ops", True, tmp)
+
+            print(f"{sections:8d} {len(text) / 1024:6.0f} {per_call:13.3f} {cold:15.3f} {cached:17.3f} "
+                  f"{per_call / cached:7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
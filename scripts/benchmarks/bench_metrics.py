@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Metrics History Benchmark
+Writes a synthetic history.jsonl of past runs (in the pretty-printed layout
+finalize_metrics appends), then times the history queries of lib/metrics.sh
+(generate_historical_stats, calculate_average_duration, get_success_rate,
+get_average_step_duration) against the file and against the indexed
+metrics store, and the cost of recording one more run in the store.
+
+Usage:
+    python3 scripts/benchmarks/bench_metrics.py [--runs 1000 5000] [--repeat 3]
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+METRICS_LIB = REPO_ROOT / "src" / "workflow" / "lib" / "metrics.sh"
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from ai_workflow_docs.metrics_store import MetricsStore, read_records  # noqa: E402
+
+QUERIES = ("generate_historical_stats > /dev/null; calculate_average_duration > /dev/null; "
+           "get_success_rate 10 > /dev/null; get_average_step_duration 5 > /dev/null")
+
+
+def run_record(index: int, rng: random.Random) -> dict:
+    end_epoch = int(time.time()) - (10000 - index) * 600
+    steps = {f"step_{n}": {"name": f"Step_{n}", "status": rng.choice(["success"] * 9 + ["failed"]),
+                           "duration_seconds": rng.randint(1, 120)} for n in range(13)}
+    duration = sum(step["duration_seconds"] for step in steps.values())
+    success = all(step["status"] == "success" for step in steps.values())
+    return {"workflow_run_id": f"workflow_bench_{index:06d}", "start_epoch": end_epoch - duration,
+            "end_epoch": end_epoch, "duration_seconds": duration, "success": success,
+            "status": "success" if success else "failed", "steps": steps}
+
+
+def run_shell(metrics_dir: Path, use_store: bool, script: str, repeat: int) -> float:
+    """Best of repeat wall times of script after sourcing metrics.sh"""
+    env = dict(os.environ, USE_PYTHON_METRICS="true" if use_store else "false")
+    prelude = (f"source '{METRICS_LIB}'; METRICS_DIR='{metrics_dir}'; "
+               f"METRICS_HISTORY='{metrics_dir}/history.jsonl'; METRICS_DB='{metrics_dir}/metrics.db'; ")
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(["bash", "-c", prelude + script], env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, nargs="+", default=[1000, 5000], help="History sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="Timings per query (best is kept)")
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    print(f"{'Runs':>6} {'file (ms)':>10} {'store (ms)':>11} {'record (ms)':>12} {'import (s)':>11}")
+    for runs in args.runs:
+        with tempfile.TemporaryDirectory() as tmp:
+            metrics_dir = Path(tmp)
+            history = metrics_dir / "history.jsonl"
+            with open(history, "w") as f:
+                for i in range(runs):
+                    f.write(json.dumps(run_record(i, rng), indent=2) + "\n\n")
+            file_time = run_shell(metrics_dir, False, QUERIES, args.repeat)
+
+            start = time.perf_counter()
+            store = MetricsStore(metrics_dir / "metrics.db")
+            store.import_records(read_records(history.read_text()))
+            import_time = time.perf_counter() - start
+            store.close()
+            store_time = run_shell(metrics_dir, True, QUERIES, args.repeat)
+
+            current = metrics_dir / "current_run.json"
+            current.write_text(json.dumps(dict(run_record(runs, rng), workflow_run_id="workflow_bench_next")))
+            start = time.perf_counter()
+            subprocess.run([sys.executable, str(REPO_ROOT / "src" / "ai_workflow_docs" / "metrics_store.py"),
+                            "--db", str(metrics_dir / "metrics.db"), "record", str(current),
+                            "--keep-runs", str(runs + 1)], check=True)
+            record_time = time.perf_counter() - start
+        print(f"{runs:6d} {file_time * 1000:10.0f} {store_time * 1000:11.0f} "
+              f"{record_time * 1000:12.0f} {import_time:11.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+ML Duration Predictor Benchmark
+Writes a synthetic training_data.jsonl in the record_step_execution layout,
+then compares predict_step_duration in lib/ml_optimization.sh using the jq
+estimator with the same call answered by the fitted duration model. It
+reports per-call latency and the error against the noise-free duration of
+held-out queries, plus fit and refit times.
+
+Usage:
+    python3 scripts/benchmarks/bench_ml_predictor.py [--records 100000] [--queries 20]
+
+Durations are generated as a per-step base time scaled by the change type
+and by log1p(lines_changed) and log1p(total_files), times lognormal noise.
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+ML_LIB = REPO_ROOT / "src" / "workflow" / "lib" / "ml_optimization.sh"
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from ai_workflow_docs.duration_model import DurationModel, fit  # noqa: E402
+
+STEP_BASE = [20, 60, 45, 30, 15, 90, 120, 40, 35, 150, 25, 30, 20, 10, 50]
+TYPE_FACTOR = {"docs_only": 0.5, "code_only": 1.2, "test_only": 0.8, "config_change": 1.0, "mixed": 1.1}
+
+
+def random_features(rng: random.Random) -> dict:
+    change_type = rng.choice(list(TYPE_FACTOR))
+    total = max(1, int(rng.expovariate(1 / 15)))
+    split = {name: 0 for name in ("doc_files", "code_files", "test_files", "config_files")}
+    main = {"docs_only": "doc_files", "code_only": "code_files", "test_only": "test_files",
+            "config_change": "config_files"}.get(change_type)
+    for _ in range(total):
+        split[main if main and rng.random() < 0.8 else rng.choice(list(split))] += 1
+    lines = int(total * rng.lognormvariate(3, 1))
+    added = int(lines * rng.random())
+    return dict(change_type=change_type, total_files=total, lines_added=added,
+                lines_deleted=lines - added, lines_changed=lines, max_depth=rng.randint(1, 6), **split)
+
+
+def expected_duration(step: int, features: dict) -> float:
+    return (STEP_BASE[step] * TYPE_FACTOR[features["change_type"]]
+            * (1 + 0.15 * math.log1p(features["lines_changed"]) + 0.1 * math.log1p(features["total_files"])))
+
+
+def write_history(path: Path, records: int, rng: random.Random) -> None:
+    now = int(time.time())
+    with open(path, "w") as f:
+        for _ in range(records):
+            step, features = rng.randrange(len(STEP_BASE)), random_features(rng)
+            duration = int(expected_duration(step, features) * rng.lognormvariate(0, 0.2))
+            f.write(json.dumps({"step": step, "duration": duration, "features": features,
+                                "issues_found": int(rng.random() < 0.1),
+                                "timestamp": now - rng.randint(0, 180 * 86400), "parallel": False,
+                                "date": ""}, separators=(",", ":")) + "\n")
+
+
+def shell_predictions(data_dir: Path, use_model: bool, queries: list) -> tuple:
+    """(predictions, seconds per call) of predict_step_duration, one bash process per call"""
+    env = dict(os.environ, USE_PYTHON_ML_MODEL="true" if use_model else "false",
+               ML_DATA_DIR=str(data_dir), ML_TRAINING_DATA=str(data_dir / "training_data.jsonl"),
+               ML_MODEL_DIR=str(data_dir / "models"), ML_ENABLED="true")
+    predictions, elapsed = [], 0.0
+    for step, features in queries:
+        script = f"source '{ML_LIB}'; predict_step_duration {step} '{json.dumps(features)}'"
+        start = time.perf_counter()
+        result = subprocess.run(["bash", "-c", script], env=env, capture_output=True, text=True, check=True)
+        elapsed += time.perf_counter() - start
+        predictions.append(float(result.stdout.strip() or 0))
+    return predictions, elapsed / len(queries)
+
+
+def errors(predictions: list, queries: list) -> tuple:
+    """(mean absolute error in seconds, mean absolute percentage error)"""
+    expected = [expected_duration(step, features) for step, features in queries]
+    mae = sum(abs(p - e) for p, e in zip(predictions, expected)) / len(expected)
+    mape = sum(abs(p - e) / e for p, e in zip(predictions, expected)) / len(expected) * 100
+    return mae, mape
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type=int, default=100000, help="Training records")
+    parser.add_argument("--queries", type=int, default=20, help="Held-out predictions timed through the shell")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    queries = [(rng.randrange(len(STEP_BASE)), random_features(rng)) for _ in range(args.queries)]
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        data_file = data_dir / "training_data.jsonl"
+        write_history(data_file, args.records, rng)
+
+        jq_predictions, jq_latency = shell_predictions(data_dir, False, queries)
+
+        start = time.perf_counter()
+        fit(str(data_file), str(data_dir / "models"))
+        fit_time = time.perf_counter() - start
+        write_history(data_dir / "more.jsonl", 1000, rng)
+        with open(data_file, "a") as f:
+            f.write((data_dir / "more.jsonl").read_text())
+        start = time.perf_counter()
+        fit(str(data_file), str(data_dir / "models"))
+        refit_time = time.perf_counter() - start
+
+        model_predictions, model_latency = shell_predictions(data_dir, True, queries)
+        model = DurationModel.load(str(data_dir / "models"))
+        many = [(rng.randrange(len(STEP_BASE)), random_features(rng)) for _ in range(10000)]
+        start = time.perf_counter()
+        in_process = [model.predict([step], features)[0] for step, features in many]
+        in_process_time = (time.perf_counter() - start) / len(many)
+
+    print(f"Training records:      {args.records}")
+    print(f"Fit (cold):            {fit_time:.2f} s")
+    print(f"Refit (+1000 records): {refit_time:.2f} s")
+    print(f"{'':22} {'jq':>10} {'model':>10}")
+    print(f"{'Latency (ms/call):':22} {jq_latency * 1000:10.0f} {model_latency * 1000:10.0f}")
+    for label, (jq_error, model_error) in (("MAE (s):", (errors(jq_predictions, queries)[0],
+                                                         errors(model_predictions, queries)[0])),
+                                           ("MAPE (%):", (errors(jq_predictions, queries)[1],
+                                                          errors(model_predictions, queries)[1]))):
+        print(f"{label:22} {jq_error:10.1f} {model_error:10.1f}")
+    print(f"In-process predict:    {in_process_time * 1e6:.1f} us "
+          f"(MAPE {errors(in_process, many)[1]:.1f}% over {len(many)} queries)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Prompt Key Benchmark
+Renders synthetic prompts from the ai_helpers.yaml templates the way the
+workflow does, with the usual run-to-run noise (reflowed whitespace,
+{modified_count}, file list order, timestamps) and some genuine changes,
+then compares the cache hit rate of verbatim keys (sha256 of
+"prompt|context") with canonical keys, and counts the near-duplicate misses
+the response store reports.
+
+Usage:
+    python3 scripts/benchmarks/bench_prompt_keys.py [--templates FILE] [--runs 20]
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import argparse
+import hashlib
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+from ai_workflow_docs.ai_cache_store import ResponseCache  # noqa: E402
+from ai_workflow_docs.prompt_keys import (  # noqa: E402
+    DEFAULT_RULES_FILE, KeyCanonicalizer, NearDuplicateIndex, shingle_text, signature)
+
+# ai_helpers.yaml is generated into .workflow_core/; the tree keeps a backup
+DEFAULT_TEMPLATES = REPO_ROOT / "src" / "workflow" / "lib" / "ai_helpers.yaml.backup"
+PARAM_RE = re.compile(r'\{(\w+)\}')
+
+
+def render(template: str, values: dict) -> str:
+    return PARAM_RE.sub(lambda m: values.get(m.group(1), m.group(0)), template)
+
+
+def base_values(params: set, unordered: set, rng: random.Random) -> dict:
+    values = {}
+    for name in params:
+        if name in unordered:
+            values[name] = "\n".join(f"src/{name}/file_{i}.sh" for i in range(rng.randint(3, 12)))
+        else:
+            values[name] = f"{name} value {rng.randint(0, 3)}"
+    return values
+
+
+def noisy(values: dict, unordered: set, rng: random.Random) -> dict:
+    """Same content, different rendering: shuffled lists and a new modified_count"""
+    result = dict(values)
+    for name in unordered & set(values):
+        files = values[name].split("\n")
+        rng.shuffle(files)
+        result[name] = rng.choice(["\n", " ", ", "]).join(files)
+    result["modified_count"] = str(rng.randint(1, 50))
+    return result
+
+
+def reflow(text: str, rng: random.Random) -> str:
+    """Extra spaces and trailing whitespace, as heredocs and echo pipelines produce"""
+    return "\n".join(line + " " * rng.randint(0, 2) for line in text.split("\n"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--templates", type=Path, default=DEFAULT_TEMPLATES, help="Prompt templates YAML")
+    parser.add_argument("--runs", type=int, default=20, help="Simulated workflow runs")
+    parser.add_argument("--change-rate", type=float, default=0.2,
+                        help="Share of prompts with a genuine content change (default: 0.2)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    rules = yaml.safe_load(Path(DEFAULT_RULES_FILE).read_text(encoding='utf-8'))
+    unordered = set(rules.get("unordered_params", []))
+    data = yaml.safe_load(args.templates.read_text(encoding='utf-8'))
+    templates = {name: spec["task_template"] for name, spec in data.items()
+                 if isinstance(spec, dict) and PARAM_RE.search(spec.get("task_template") or "")}
+
+    start = time.perf_counter()
+    canonicalizer = KeyCanonicalizer.load(str(args.templates), cache_dir=None)
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    prompts = []
+    for name, template in templates.items():
+        values = base_values(set(PARAM_RE.findall(template)), unordered, rng)
+        for _ in range(args.runs):
+            if rng.random() < args.change_rate:
+                # A genuine change: one more file, or a different parameter value
+                name_to_change = rng.choice(sorted(values))
+                values = dict(values, **{name_to_change: values[name_to_change] + "\nsrc/new_file.sh"})
+            prompt = reflow(render(template, noisy(values, unordered, rng)), rng)
+            prompt += f"\n\nGenerated: 2026-10-{rng.randint(10, 28)}T{rng.randint(0, 23):02d}:00:00Z"
+            prompts.append((prompt, name))
+
+    verbatim_seen, verbatim_hits = set(), 0
+    for prompt, context in prompts:
+        key = hashlib.sha256(f"{prompt}|{context}".encode()).hexdigest()
+        verbatim_hits += key in verbatim_seen
+        verbatim_seen.add(key)
+
+    canonical_hits = near_misses = 0
+    key_time = 0.0
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ResponseCache(Path(tmp) / "responses.db")
+        index = NearDuplicateIndex.open(str(Path(tmp) / "responses.db"))
+        for prompt, context in prompts:
+            start = time.perf_counter()
+            document = canonicalizer.document(prompt, context)
+            key = canonicalizer.key(document)
+            key_time += time.perf_counter() - start
+            if store.has(key):
+                canonical_hits += 1
+                continue
+            sig = signature(shingle_text(document))
+            near_misses += index.lookup(key, sig) is not None
+            index.record(key, sig)
+            store.put(key, b"response\n")
+        index.close()
+        store.close()
+
+    total = len(prompts)
+    print(f"Templates:             {len(templates)} ({len(canonicalizer.templates)} compiled in {compile_ms:.0f} ms)")
+    print(f"Prompts:               {total} ({args.runs} runs, {args.change_rate:.0%} genuine changes)")
+    print(f"Verbatim key hits:     {verbatim_hits:5d} ({verbatim_hits / total:.1%})")
+    print(f"Canonical key hits:    {canonical_hits:5d} ({canonical_hits / total:.1%})")
+    print(f"Near-duplicate misses: {near_misses:5d} "
+          f"({near_misses / max(1, total - canonical_hits):.1%} of misses)")
+    print(f"Canonical key time:    {key_time / total * 1000:.2f} ms/prompt")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Documentation Daemon Client
+Compatibility wrapper for `ai-workflow-docs client` (src/ai_workflow_docs/docs_client.py)
+
+Kept so existing workflow steps, CI jobs and docs can call this path.
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src"))
+
+from ai_workflow_docs.docs_client import main  # noqa: E402
+
+if __name__ == "__main__":
+    sys.exit(main())
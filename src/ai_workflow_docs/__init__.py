@@ -0,0 +1,12 @@
+"""
+AI Workflow documentation tools
+
+Link checking, API reference extraction and validation, and prompt context
+block validation, run as `ai-workflow-docs <subcommand>` (see cli.py).
+Nothing is imported here so that the CLI only loads the subcommand it runs.
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+__version__ = "1.0.0"
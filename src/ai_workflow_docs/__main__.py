@@ -0,0 +1,7 @@
+"""Run the documentation tools as `python -m ai_workflow_docs <subcommand>`"""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
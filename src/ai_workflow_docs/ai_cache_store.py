@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+"""
+AI Response Cache Store
+Indexed SQLite store for cached AI responses, used by lib/ai_cache.sh
+
+Usage:
+    ai-workflow-docs ai-cache [--db FILE] get KEY [--ttl SECONDS]
+    ai-workflow-docs ai-cache [--db FILE] has KEY [--ttl SECONDS]
+    echo "$response" | ai-workflow-docs ai-cache put KEY [--prompt P] [--context C] [--max-mb N]
+    ai-workflow-docs ai-cache [--db FILE] init [--ttl SECONDS] [--max-mb N] [--import-legacy DIR]
+    ai-workflow-docs ai-cache [--db FILE] expire [--ttl SECONDS]
+    ai-workflow-docs ai-cache [--db FILE] evict [--max-mb N]
+    ai-workflow-docs ai-cache [--db FILE] import-legacy DIR [--keep]
+    ai-workflow-docs ai-cache [--db FILE] stats [--json]
+    ai-workflow-docs ai-cache [--db FILE] clear
+
+lib/ai_cache.sh used to keep every response as <key>.txt plus <key>.meta,
+forking jq and date on each lookup and scanning the whole directory to
+expire entries. This store keeps all entries in one SQLite database in WAL
+mode: lookups go through the primary key index, expiry and LRU eviction
+through indexes on the creation and access times, and a trigger-maintained
+totals row makes the size check constant time. Responses of
+COMPRESS_MIN_BYTES or more are stored zlib-compressed.
+
+Writers take the database lock up front (BEGIN IMMEDIATE) and wait up to
+BUSY_TIMEOUT seconds for each other, so concurrent workflow steps never
+interleave a half-written entry. Readers are never blocked in WAL mode.
+
+`get` prints the response byte for byte and exits 1 on a miss or an entry
+older than --ttl; `has` only sets the exit status. Expiry is measured from
+the time an entry was stored, as in the .meta timestamp_epoch field, and
+eviction drops the least recently read entries first (access times are
+refreshed at most once per ACCESS_REFRESH seconds, unless an entry has been
+stored since the last refresh and would otherwise be evicted first).
+
+ai_cache.sh runs a lookup for every AI call, so get/has are parsed by hand
+and, like docs_client.py, this module avoids typing/pathlib; argparse and
+json are only imported by the maintenance commands.
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import os
+import sqlite3
+import sys
+import time
+import zlib
+from types import SimpleNamespace
+
+# Default database (relative to the working directory); ai_cache.sh passes
+# ${AI_CACHE_DIR}/responses.db
+CACHE_DB = os.path.join("src", "workflow", ".ai_cache", "responses.db")
+# Bump when the schema changes; older databases are rebuilt
+SCHEMA_VERSION = "1"
+
+# Same defaults as AI_CACHE_TTL and AI_CACHE_MAX_SIZE_MB in ai_cache.sh
+DEFAULT_TTL = 86400
+DEFAULT_MAX_MB = 100
+
+# Smaller responses are stored as they are
+COMPRESS_MIN_BYTES = 256
+COMPRESS_LEVEL = 6
+
+# Seconds a writer waits for another writer's lock
+BUSY_TIMEOUT = 30.0
+
+# Seconds before a hit updates an entry's access time again: eviction only
+# needs a rough LRU order, and each update takes the write lock. A hit on an
+# entry last read before the newest write is always recorded, so a read is
+# never ordered behind entries stored after it.
+ACCESS_REFRESH = 60.0
+
+# Entries deleted per query while evicting
+EVICT_BATCH = 64
+
+# Characters of the prompt kept with an entry, as in the .meta prompt_preview
+PROMPT_PREVIEW_CHARS = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    compressed INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_accessed REAL NOT NULL,
+    access_count INTEGER NOT NULL DEFAULT 0,
+    prompt_preview TEXT,
+    context TEXT,
+    workflow_run_id TEXT,
+    version TEXT
+);
+CREATE INDEX IF NOT EXISTS entries_created ON entries (created);
+CREATE INDEX IF NOT EXISTS entries_last_accessed ON entries (last_accessed);
+
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    entries INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals VALUES (0, 0, 0, 0);
+
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE totals SET entries = entries + 1, size = size + NEW.size,
+                      stored_size = stored_size + NEW.stored_size;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE totals SET entries = entries - 1, size = size - OLD.size,
+                      stored_size = stored_size - OLD.stored_size;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size, stored_size ON entries BEGIN
+    UPDATE totals SET size = size - OLD.size + NEW.size,
+                      stored_size = stored_size - OLD.stored_size + NEW.stored_size;
+END;
+"""
+
+
+def encode(value: bytes) -> tuple:
+    """(stored bytes, compressed flag); compression is kept only when it helps"""
+    if len(value) >= COMPRESS_MIN_BYTES:
+        packed = zlib.compress(value, COMPRESS_LEVEL)
+        if len(packed) < len(value):
+            return packed, 1
+    return value, 0
+
+
+def decode(stored: bytes, compressed: int) -> bytes:
+    return zlib.decompress(stored) if compressed else bytes(stored)
+
+
+def iso_time(epoch) -> str:
+    """Local ISO 8601 time with offset, like `date -Iseconds`"""
+    if epoch is None:
+        return ""
+    from datetime import datetime
+    return datetime.fromtimestamp(epoch).astimezone().isoformat(timespec="seconds")
+
+
+def format_size(size: int) -> str:
+    """Human-readable size, like `du -h`"""
+    for unit in ("B", "K", "M", "G"):
+        if size < 1024 or unit == "G":
+            return f"{size}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size}"
+
+
+class ResponseCache:
+    """SQLite-backed response cache with TTL expiry and LRU size eviction"""
+
+    def __init__(self, db_path: str):
+        self.db_path = str(db_path)
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        # Autocommit mode: write transactions are opened explicitly below
+        self.conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        version = None
+        try:
+            row = self.conn.execute("SELECT value FROM meta WHERE name = 'schema_version'").fetchone()
+            version = row[0] if row else None
+        except sqlite3.OperationalError:
+            pass
+        if version == SCHEMA_VERSION:
+            return
+        with self.transaction():
+            if version is not None:
+                for table in ("entries", "meta", "totals"):
+                    self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+            for statement in self._statements():
+                self.conn.execute(statement)
+            now = str(time.time())
+            self.conn.executemany("INSERT OR IGNORE INTO meta VALUES (?, ?)",
+                                  [("created", now), ("last_cleanup", now)])
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)", (SCHEMA_VERSION,))
+
+    @staticmethod
+    def _statements() -> list:
+        """SCHEMA split into statements (trigger bodies keep their inner semicolons)"""
+        statements, current = [], ""
+        for line in SCHEMA.splitlines(keepends=True):
+            current += line
+            if sqlite3.complete_statement(current):
+                statements.append(current.strip())
+                current = ""
+        return statements
+
+    def transaction(self):
+        return _Transaction(self.conn)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+
+    def get(self, key: str, ttl=DEFAULT_TTL):
+        """Response for key, or None when missing or older than ttl seconds
+
+        A hit refreshes the entry's access time, which drives LRU eviction,
+        once it is ACCESS_REFRESH seconds old or when another entry has been
+        stored since; other reads take no write lock (and are not added to
+        access_count).
+        """
+        row = self.conn.execute("SELECT value, compressed, created, last_accessed FROM entries WHERE key = ?",
+                                (key,)).fetchone()
+        now = time.time()
+        if row is None or (ttl is not None and now - row[2] > ttl):
+            return None
+        if now - row[3] >= ACCESS_REFRESH or row[3] < self._newest_created():
+            with self.transaction():
+                self.conn.execute("UPDATE entries SET last_accessed = ?, access_count = access_count + 1 "
+                                  "WHERE key = ?", (now, key))
+        return decode(row[0], row[1])
+
+    def _newest_created(self) -> float:
+        """Creation time of the most recently stored entry (entries_created index)"""
+        return self.conn.execute("SELECT MAX(created) FROM entries").fetchone()[0] or 0.0
+
+    def has(self, key: str, ttl=DEFAULT_TTL) -> bool:
+        row = self.conn.execute("SELECT created FROM entries WHERE key = ?", (key,)).fetchone()
+        return row is not None and (ttl is None or time.time() - row[0] <= ttl)
+
+    def put(self, key: str, value: bytes, prompt: str = "", context: str = "",
+            run_id: str = "unknown", version: str = "1.0.0", max_bytes=None,
+            created=None) -> None:
+        """Store a response, replacing any entry for key, then evict down to max_bytes"""
+        stored, compressed = encode(value)
+        now = time.time()
+        created = now if created is None else created
+        with self.transaction():
+            self.conn.execute(
+                "INSERT INTO entries (key, value, compressed, size, stored_size, created, last_accessed,"
+                " access_count, prompt_preview, context, workflow_run_id, version)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?, ?, ?)"
+                " ON CONFLICT (key) DO UPDATE SET value = excluded.value,"
+                " compressed = excluded.compressed, size = excluded.size,"
+                " stored_size = excluded.stored_size, created = excluded.created,"
+                " last_accessed = excluded.last_accessed, access_count = access_count + 1,"
+                " prompt_preview = excluded.prompt_preview, context = excluded.context,"
+                " workflow_run_id = excluded.workflow_run_id, version = excluded.version",
+                (key, stored, compressed, len(value), len(stored), created, now,
+                 prompt[:PROMPT_PREVIEW_CHARS], context, run_id, version))
+            if max_bytes is not None:
+                self._evict(max_bytes)
+
+    def delete(self, key: str) -> bool:
+        with self.transaction():
+            return self.conn.execute("DELETE FROM entries WHERE key = ?", (key,)).rowcount > 0
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def expire(self, ttl: float = DEFAULT_TTL) -> int:
+        """Delete entries stored more than ttl seconds ago; returns the number deleted"""
+        now = time.time()
+        with self.transaction():
+            deleted = self.conn.execute("DELETE FROM entries WHERE created < ?", (now - ttl,)).rowcount
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('last_cleanup', ?)", (str(now),))
+        return deleted
+
+    def evict(self, max_bytes: int) -> int:
+        """Delete least recently read entries until the stored size fits max_bytes"""
+        with self.transaction():
+            return self._evict(max_bytes)
+
+    def _evict(self, max_bytes: int) -> int:
+        excess = self._stored_size() - max_bytes
+        deleted = 0
+        while excess > 0:
+            victims = self.conn.execute("SELECT key, stored_size FROM entries "
+                                        "ORDER BY last_accessed LIMIT ?", (EVICT_BATCH,)).fetchall()
+            if not victims:
+                break
+            doomed = []
+            for key, stored_size in victims:
+                doomed.append((key,))
+                excess -= stored_size
+                if excess <= 0:
+                    break
+            self.conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+            deleted += len(doomed)
+        return deleted
+
+    def _stored_size(self) -> int:
+        return self.conn.execute("SELECT stored_size FROM totals WHERE id = 0").fetchone()[0]
+
+    def clear(self) -> int:
+        with self.transaction():
+            deleted = self.conn.execute("DELETE FROM entries").rowcount
+        self.conn.execute("VACUUM")
+        return deleted
+
+    def import_legacy(self, cache_dir: str, keep: bool = False) -> int:
+        """Move <key>.txt/<key>.meta entries from the old file layout into the store
+
+        Entries keep their original timestamp_epoch, so TTL expiry is unchanged.
+        The files are removed once the entries are committed unless keep is set.
+        """
+        import json
+        imported = []
+        with self.transaction():
+            for name in os.listdir(cache_dir):
+                key, extension = os.path.splitext(name)
+                if extension != ".txt":
+                    continue
+                text_file = os.path.join(cache_dir, name)
+                meta_file = os.path.join(cache_dir, key + ".meta")
+                try:
+                    with open(text_file, 'rb') as f:
+                        value = f.read()
+                    mtime = os.stat(text_file).st_mtime
+                except OSError:
+                    continue
+                try:
+                    with open(meta_file, encoding='utf-8') as f:
+                        meta = json.load(f)
+                except (OSError, ValueError):
+                    meta = {}   # .meta was optional in the file layout
+                stored, compressed = encode(value)
+                created = float(meta.get("timestamp_epoch") or mtime)
+                self.conn.execute(
+                    "INSERT OR IGNORE INTO entries (key, value, compressed, size, stored_size, created,"
+                    " last_accessed, access_count, prompt_preview, context, workflow_run_id, version)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?, ?, ?)",
+                    (key, stored, compressed, len(value), len(stored), created, created,
+                     str(meta.get("prompt_preview", "")), str(meta.get("context", "")),
+                     str(meta.get("workflow_run_id", "unknown")), str(meta.get("version", ""))))
+                imported.append((text_file, meta_file))
+        if not keep:
+            for text_file, meta_file in imported:
+                for path in (text_file, meta_file):
+                    try:
+                        os.unlink(path)
+                    except FileNotFoundError:
+                        pass
+        return len(imported)
+
+    def stats(self) -> dict:
+        entries, size, stored_size = self.conn.execute(
+            "SELECT entries, size, stored_size FROM totals WHERE id = 0").fetchone()
+        meta = dict(self.conn.execute("SELECT name, value FROM meta"))
+        return {
+            "entries": entries,
+            "size": size,
+            "stored_size": stored_size,
+            "created": float(meta["created"]) if "created" in meta else None,
+            "last_cleanup": float(meta["last_cleanup"]) if "last_cleanup" in meta else None,
+            "location": self.db_path,
+        }
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT, rolled back on any exception
+
+    Taking the write lock at BEGIN means a writer either waits for the
+    busy timeout or owns the database; it never fails halfway through.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("COMMIT" if exc_type is None else "ROLLBACK")
+        return False
+
+
+def format_stats(stats: dict) -> str:
+    """Statistics block in the get_cache_stats layout"""
+    size = format_size(stats["stored_size"])
+    if stats["size"] != stats["stored_size"]:
+        size += f" ({format_size(stats['size'])} uncompressed)"
+    return "\n".join([
+        "",
+        "AI Cache Statistics:",
+        f"  Total Entries: {stats['entries']}",
+        f"  Cache Size: {size}",
+        f"  Created: {iso_time(stats['created'])}",
+        f"  Last Cleanup: {iso_time(stats['last_cleanup'])}",
+        f"  Location: {stats['location']}",
+    ])
+
+
+def parse_lookup(argv: list):
+    """Arguments of `[--db FILE] get|has KEY [--ttl SECONDS]`, or None for anything else
+
+    Lookups run once per AI call, so they skip importing argparse.
+    """
+    args = list(argv)
+    db = CACHE_DB
+    if len(args) >= 2 and args[0] == "--db":
+        db = args[1]
+        del args[:2]
+    if len(args) not in (2, 4) or args[0] not in ("get", "has") or args[1].startswith("-"):
+        return None
+    ttl = DEFAULT_TTL
+    if len(args) == 4:
+        if args[2] != "--ttl":
+            return None
+        try:
+            ttl = float(args[3])
+        except ValueError:
+            return None
+    return SimpleNamespace(db=db, command=args[0], key=args[1], ttl=ttl)
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Indexed store for cached AI responses")
+    parser.add_argument("--db", default=CACHE_DB, help=f"Cache database (default: {CACHE_DB})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def ttl_option(command):
+        command.add_argument("--ttl", type=float, default=DEFAULT_TTL,
+                             help=f"Maximum entry age in seconds (default: {DEFAULT_TTL})")
+
+    def size_option(command, default):
+        command.add_argument("--max-mb", type=float, default=default,
+                             help="Evict least recently read entries above this size in MB"
+                                  + (f" (default: {default})" if default else ""))
+
+    get = commands.add_parser("get", help="Print a cached response; exit 1 on a miss")
+    get.add_argument("key")
+    ttl_option(get)
+    has = commands.add_parser("has", help="Exit 0 if a fresh response is cached")
+    has.add_argument("key")
+    ttl_option(has)
+
+    put = commands.add_parser("put", help="Store the response read from stdin")
+    put.add_argument("key")
+    put.add_argument("--prompt", default="", help="Prompt (its first 100 characters are kept)")
+    put.add_argument("--context", default="", help="Prompt context")
+    put.add_argument("--run-id", default="unknown", help="Workflow run ID")
+    put.add_argument("--version", default="1.0.0", help="Workflow version")
+    size_option(put, None)
+
+    init = commands.add_parser("init", help="Create the store, expire and evict entries")
+    ttl_option(init)
+    size_option(init, DEFAULT_MAX_MB)
+    init.add_argument("--import-legacy", metavar="DIR",
+                      help="Move <key>.txt/.meta entries from DIR into the store")
+
+    expire = commands.add_parser("expire", help="Delete entries older than --ttl")
+    ttl_option(expire)
+    evict = commands.add_parser("evict", help="Delete least recently read entries above --max-mb")
+    size_option(evict, DEFAULT_MAX_MB)
+
+    legacy = commands.add_parser("import-legacy", help="Move <key>.txt/.meta entries into the store")
+    legacy.add_argument("cache_dir")
+    legacy.add_argument("--keep", action="store_true", help="Keep the imported files")
+
+    stats = commands.add_parser("stats", help="Print cache statistics")
+    stats.add_argument("--json", action="store_true", help="Print statistics as JSON")
+    commands.add_parser("clear", help="Delete every entry")
+    return parser.parse_args(argv)
+
+
+def megabytes(value):
+    return None if value is None else int(value * 1024 * 1024)
+
+
+def main(argv=None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    args = parse_lookup(argv) or parse_args(argv)
+    try:
+        cache = ResponseCache(args.db)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Error: cannot open AI cache {args.db}: {e}", file=sys.stderr)
+        return 2
+
+    try:
+        if args.command == "get":
+            value = cache.get(args.key, args.ttl)
+            if value is None:
+                return 1
+            sys.stdout.buffer.write(value)
+            sys.stdout.flush()
+        elif args.command == "has":
+            return 0 if cache.has(args.key, args.ttl) else 1
+        elif args.command == "put":
+            cache.put(args.key, sys.stdin.buffer.read(), args.prompt, args.context,
+                      args.run_id, args.version, megabytes(args.max_mb))
+        elif args.command == "init":
+            if args.import_legacy is not None:
+                cache.import_legacy(args.import_legacy)
+            cache.expire(args.ttl)
+            cache.evict(megabytes(args.max_mb))
+        elif args.command == "expire":
+            print(cache.expire(args.ttl))
+        elif args.command == "evict":
+            print(cache.evict(megabytes(args.max_mb)))
+        elif args.command == "import-legacy":
+            print(cache.import_legacy(args.cache_dir, args.keep))
+        elif args.command == "stats":
+            import json
+            stats = cache.stats()
+            print(json.dumps(stats, indent=2) if args.json else format_stats(stats))
+        elif args.command == "clear":
+            print(cache.clear())
+    except sqlite3.Error as e:
+        print(f"Error: AI cache {args.db}: {e}", file=sys.stderr)
+        return 2
+    finally:
+        cache.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
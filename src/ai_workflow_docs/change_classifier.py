@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Change Classifier
+Workflow artifact filtering and file category classification for
+lib/change_detection.sh, with the patterns compiled once
+
+Usage:
+    ai-workflow-docs classify-changes [--artifact GLOB]... [--category NAME=GLOB|GLOB...]... [-z] filter
+    ai-workflow-docs classify-changes ... [-z] counts [--order NAME,NAME...]
+    ai-workflow-docs classify-changes ... [-z] change-type
+    ai-workflow-docs classify-changes ... [-z] nature
+
+change_detection.sh passes WORKFLOW_ARTIFACTS and FILE_PATTERNS and pipes
+the changed files (`git diff --name-only -z`, one per line without -z) to
+stdin. The shell functions tested every file against every pattern,
+rebuilding each regex from its glob, once more for every category
+question asked of the same file. Here each pattern set becomes one
+alternation regex and every file is matched once per set:
+
+- artifacts match as the `[[ $file =~ ^${pattern//\\*/.*}$ ]]` of
+  is_workflow_artifact (so "." matches any character)
+- a category matches as matches_pattern does: the whole path against one
+  of its globs, or one glob contained literally in the path
+
+`filter` prints the files that are not artifacts (filter_workflow_artifacts).
+`counts` prints "total", "artifacts" and one line per category: every
+category a file matches (analyze_changes), or with --order only the first
+that matches (assess_change_impact uses code,docs). `change-type` prints
+detect_change_type and `nature` the "code|docs|tests|config" lists of
+classify_files_by_nature. Files are deduplicated, in input order.
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import os
+import re
+import sys
+
+# detect_change_type: first matching category counts
+CHANGE_TYPE_ORDER = ("docs", "tests", "config", "scripts", "assets", "code")
+# Single-category change types, in the order detect_change_type checks them
+SINGLE_CHANGE_TYPES = (("docs", "docs-only"), ("tests", "tests-only"), ("config", "config-only"),
+                       ("scripts", "scripts-only"), ("code", "code-only"))
+# classify_files_by_nature: tests > docs > config > code, scripts count as code
+NATURE_ORDER = ("tests", "docs", "config", "code", "scripts")
+NATURE_LISTS = {"tests": "tests", "docs": "docs", "config": "config", "code": "code", "scripts": "code"}
+
+
+def glob_regex(pattern: str) -> str:
+    """Regex of a bash [[ == ]] glob matching the whole path (* crosses "/")"""
+    parts = []
+    for char in pattern:
+        if char == "*":
+            parts.append(".*")
+        elif char == "?":
+            parts.append(".")
+        else:
+            parts.append(re.escape(char))
+    return "".join(parts)
+
+
+class PatternSet:
+    """Artifact and category patterns, one compiled alternation per set"""
+
+    def __init__(self, artifacts, categories: dict):
+        self.artifacts = None
+        if artifacts:
+            # Each artifact glob is used as an ERE after * -> .*, as the shell does
+            self.artifacts = re.compile("(?:" + "|".join(p.replace("*", ".*") for p in artifacts) + r")\Z", re.S)
+        self.categories = {}
+        for name, patterns in categories.items():
+            patterns = [p for p in patterns if p]
+            if not patterns:
+                continue
+            # Whole-path glob match, or the pattern text anywhere in the path
+            whole = "|".join(glob_regex(p) for p in patterns)
+            literal = "|".join(re.escape(p) for p in patterns)
+            self.categories[name] = re.compile(rf"\A(?:{whole})\Z|{literal}", re.S)
+
+    @classmethod
+    def from_arguments(cls, artifacts, categories) -> "PatternSet":
+        parsed = {}
+        for spec in categories or []:
+            name, sep, patterns = spec.partition("=")
+            if not sep or not name:
+                raise ValueError(f"expected NAME=GLOB|GLOB...: {spec}")
+            parsed[name] = patterns.split("|")
+        return cls(artifacts or [], parsed)
+
+    def is_artifact(self, path: str) -> bool:
+        return self.artifacts is not None and self.artifacts.match(path) is not None
+
+    def matching(self, path: str) -> set:
+        return {name for name, regex in self.categories.items() if regex.search(path)}
+
+    def first_match(self, path: str, order) -> str:
+        for name in order:
+            regex = self.categories.get(name)
+            if regex is not None and regex.search(path):
+                return name
+        return ""
+
+
+def read_paths(stream, null_separated: bool) -> list:
+    """Unique non-empty paths of a -z or newline separated stream, in order"""
+    data = stream.read()
+    paths = data.split(b"\0" if null_separated else b"\n")
+    return [os.fsdecode(path) for path in dict.fromkeys(paths) if path]
+
+
+class Classification:
+    """The changed files split into artifacts and the rest"""
+
+    def __init__(self, patterns: PatternSet, paths: list):
+        self.patterns = patterns
+        self.files = []
+        self.artifacts = 0
+        for path in paths:
+            if patterns.is_artifact(path):
+                self.artifacts += 1
+            else:
+                self.files.append(path)
+
+    def counts(self, order=None) -> dict:
+        counts = dict.fromkeys(order or self.patterns.categories, 0)
+        for path in self.files:
+            if order:
+                name = self.patterns.first_match(path, order)
+                if name:
+                    counts[name] += 1
+            else:
+                for name in self.patterns.matching(path):
+                    counts[name] += 1
+        return counts
+
+    def change_type(self) -> str:
+        if not self.files:
+            return "unknown"
+        counts = self.counts(CHANGE_TYPE_ORDER)
+        changed = sum(1 for name in ("docs", "tests", "config", "scripts", "code") if counts.get(name))
+        if changed == 0:
+            return "unknown"
+        if changed >= 3:
+            return "full-stack"
+        if changed == 2:
+            return "mixed"
+        for name, change_type in SINGLE_CHANGE_TYPES:
+            if counts.get(name) == len(self.files):
+                return change_type
+        return "mixed"
+
+    def nature(self) -> dict:
+        """code, docs, tests and config file lists, in input order"""
+        lists = {"code": [], "docs": [], "tests": [], "config": []}
+        for path in self.files:
+            name = self.patterns.first_match(path, NATURE_ORDER)
+            if name:
+                lists[NATURE_LISTS[name]].append(path)
+        return lists
+
+
+def join_words(paths: list) -> str:
+    # classify_files_by_nature joins with spaces and trims through xargs
+    return " ".join(" ".join(path.split()) for path in paths)
+
+
+def parse_args(argv=None):
+    # Imported here: change detection runs before every workflow
+    import argparse
+    parser = argparse.ArgumentParser(description="Classify changed files for change detection")
+    parser.add_argument("--artifact", action="append", metavar="GLOB",
+                        help="Workflow artifact pattern (repeatable)")
+    parser.add_argument("--category", action="append", metavar="NAME=GLOB|GLOB...",
+                        help="Category patterns (repeatable)")
+    parser.add_argument("-z", action="store_true", dest="null", help="Paths on stdin are NUL-separated")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("filter", help="Print the files that are not workflow artifacts")
+    counts = commands.add_parser("counts", help="Print total, artifacts and per-category file counts")
+    counts.add_argument("--order", help="Count each file in the first matching of these categories only")
+    commands.add_parser("change-type", help="Print the detect_change_type classification")
+    commands.add_parser("nature", help="Print code|docs|tests|config file lists")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    try:
+        patterns = PatternSet.from_arguments(args.artifact, args.category)
+        order = [name for name in args.order.split(",") if name] if getattr(args, "order", None) else None
+        if order and set(order) - set(patterns.categories):
+            raise ValueError(f"unknown categories: {', '.join(sorted(set(order) - set(patterns.categories)))}")
+    except (ValueError, re.error) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    result = Classification(patterns, read_paths(sys.stdin.buffer, args.null))
+    if args.command == "filter":
+        output = "".join(f"{path}\n" for path in result.files)
+    elif args.command == "counts":
+        lines = [f"total {len(result.files)}", f"artifacts {result.artifacts}"]
+        lines.extend(f"{name} {count}" for name, count in result.counts(order).items())
+        output = "\n".join(lines) + "\n"
+    elif args.command == "change-type":
+        output = result.change_type() + "\n"
+    else:
+        output = "|".join(join_words(paths) for paths in result.nature().values()) + "\n"
+    sys.stdout.buffer.write(os.fsencode(output))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,585 @@
+#!/usr/bin/env python3
+"""
+Documentation Link Checker
+Validates all markdown links in documentation
+
+Usage:
+    ai-workflow-docs check-links [docs_dir] [--jobs N] [--incremental] [--check-external]
+                                 [--format text|json|sarif|junit] [--quiet] [--stream-results FILE]
+
+Version: 1.4.0
+Created: 2026-02-07
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+from urllib.parse import unquote, urlparse
+
+from .doc_corpus import Document
+from .reporter import Reporter, add_report_arguments, reporting
+
+if TYPE_CHECKING:
+    # asyncio/ssl/http.client are only imported when --check-external is given
+    from .external_links import ExternalLinkChecker
+
+# Default location of the incremental result cache (relative to project root)
+LINK_CACHE_DIR = Path(".ai_workflow/cache/links")
+LINK_CACHE_VERSION = "1.1.0"
+# Shared with lib/link_validator.sh (LINK_CACHE_DIR)
+URL_CACHE_DIR = Path(".link_cache")
+
+
+class FileResult(NamedTuple):
+    """Outcome of checking one markdown file"""
+    total_links: int
+    broken_links: int
+    messages: List[Tuple[str, str]]
+    # (kind, path) pairs the result depends on: ('path', p) existence probes
+    # and ('anchors', p) heading indexes of link targets
+    dependencies: List[Tuple[str, str]]
+    # Well-formed http(s) URLs, for the optional reachability pass
+    external_urls: List[str]
+    lookups: int = 0
+    probes: int = 0
+
+
+class PathIndex:
+    """Existence cache of every path below a root, built from one os.scandir walk
+    
+    Lookups inside the root become set membership tests; only paths outside
+    the root (or inside skipped directories and looping directory symlinks)
+    fall back to a filesystem probe. Directories named in skip_dirs are
+    skipped at any depth.
+    """
+    
+    SKIP_DIRS = {'.git'}
+    
+    def __init__(self, root: Path, skip_dirs: Optional[Set[str]] = None):
+        self.root = os.path.abspath(root)
+        self.skip_dirs = set(self.SKIP_DIRS if skip_dirs is None else skip_dirs)
+        self.paths: Set[str] = {self.root}
+        # Directory symlinks not descended into (they would loop)
+        self.unwalked: List[str] = []
+        self.lookups = 0
+        self.probes = 0
+        self._walk()
+        
+    def _walk(self) -> None:
+        """Collect all files and directories below the root
+        
+        Directory symlinks are followed, as os.path.exists() would; a link
+        to one of its own ancestors, or to a target already followed on the
+        way down, is indexed but not descended into, so loops terminate.
+        Paths below such a link are probed by exists() instead.
+        """
+        # (directory, real paths of the symlink targets followed to reach it)
+        stack = [(self.root, frozenset())]
+        while stack:
+            directory, followed = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.name in self.skip_dirs:
+                        continue
+                    self.paths.add(entry.path)
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, followed))
+                    elif entry.is_symlink() and entry.is_dir():
+                        target = os.path.realpath(entry.path)
+                        parent = os.path.realpath(directory)
+                        if target in followed or parent == target or parent.startswith(target + os.sep):
+                            self.unwalked.append(entry.path + os.sep)
+                            continue
+                        stack.append((entry.path, followed | {target}))
+                        
+    def exists(self, path: str) -> bool:
+        """Check whether a path exists, using the index when possible"""
+        self.lookups += 1
+        path = os.path.normpath(path)
+        indexed = self._indexed(path)
+        if indexed is None:
+            self.probes += 1
+            return os.path.exists(path)
+        return indexed
+        
+    def contains(self, path: str) -> bool:
+        """exists() without counting lookups or probes, for cache bookkeeping"""
+        path = os.path.normpath(path)
+        indexed = self._indexed(path)
+        return os.path.exists(path) if indexed is None else indexed
+        
+    def _indexed(self, path: str) -> Optional[bool]:
+        """Index answer for a normalized path, or None when it must be probed"""
+        if path.startswith(self.root + os.sep):
+            parts = path[len(self.root) + 1:].split(os.sep)
+            if self.skip_dirs.isdisjoint(parts) and not path.startswith(tuple(self.unwalked)):
+                return path in self.paths
+        elif path == self.root:
+            return True
+        return None
+
+
+class LinkResultCache:
+    """Persistent per-file link check results keyed on content and dependency hashes
+    
+    An entry is reused when the file's content hash is unchanged and the hash
+    of everything its links depend on (target existence, target headings) is
+    unchanged too. Layout mirrors lib/step_validation_cache.sh: a single
+    index.json with version and entries, replaced atomically on save.
+    """
+    
+    def __init__(self, cache_dir: Path, path_index: PathIndex):
+        self.cache_dir = Path(cache_dir)
+        self.index_file = self.cache_dir / "index.json"
+        self.path_index = path_index
+        self.entries: Dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self._content_hashes: Dict[str, str] = {}
+        
+        try:
+            data = json.loads(self.index_file.read_text(encoding='utf-8'))
+            if data.get("version") == LINK_CACHE_VERSION:
+                self.entries = data.get("entries", {})
+        except (OSError, ValueError):
+            pass
+            
+    def content_hash(self, path: str) -> str:
+        """SHA256 of a file's content (memoized per run)"""
+        digest = self._content_hashes.get(path)
+        if digest is None:
+            try:
+                with open(path, 'rb') as f:
+                    digest = hashlib.sha256(f.read()).hexdigest()
+            except OSError:
+                digest = "FILE_NOT_FOUND"
+            self._content_hashes[path] = digest
+        return digest
+        
+    def dependency_hash(self, dependencies: List[Tuple[str, str]]) -> str:
+        """Hash the current state of every recorded dependency"""
+        digest = hashlib.sha256()
+        for kind, path in dependencies:
+            if kind == 'path':
+                # Not counted: the check itself already looked the path up
+                state = '1' if self.path_index.contains(path) else '0'
+            else:
+                state = self.content_hash(path)
+            digest.update(f"{kind}:{path}:{state}\n".encode('utf-8'))
+        return digest.hexdigest()
+        
+    def lookup(self, key: str, md_file: Path) -> Optional[FileResult]:
+        """Return the cached result for a file if content and dependencies are unchanged"""
+        entry = self.entries.get(key)
+        if entry is not None \
+                and entry["content_hash"] == self.content_hash(os.path.abspath(md_file)):
+            dependencies = [tuple(dep) for dep in entry["dependencies"]]
+            if entry["dependency_hash"] == self.dependency_hash(dependencies):
+                self.hits += 1
+                return FileResult(entry["total_links"], entry["broken_links"],
+                                  [tuple(m) for m in entry["messages"]], dependencies,
+                                  entry["external_urls"])
+        self.misses += 1
+        return None
+        
+    def store(self, key: str, md_file: Path, result: FileResult) -> None:
+        """Record a freshly computed result"""
+        self.entries[key] = {
+            "content_hash": self.content_hash(os.path.abspath(md_file)),
+            "dependency_hash": self.dependency_hash(result.dependencies),
+            "dependencies": result.dependencies,
+            "total_links": result.total_links,
+            "broken_links": result.broken_links,
+            "messages": result.messages,
+            "external_urls": result.external_urls,
+        }
+        
+    def save(self) -> None:
+        """Write the index atomically, dropping entries of deleted files"""
+        # Keys are "<docs dir>:<file>", both relative to the indexed project root
+        root = self.path_index.root
+        self.entries = {key: entry for key, entry in self.entries.items()
+                        if self.path_index.contains(os.path.join(root, key.partition(':')[2]))}
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"version": LINK_CACHE_VERSION, "entries": self.entries}, f)
+            os.replace(temp_path, self.index_file)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+
+class LinkChecker(Reporter):
+    """Checks markdown links for validity"""
+    
+    def __init__(self, docs_dir: str = "docs", path_index: Optional[PathIndex] = None):
+        super().__init__()
+        self.docs_dir = Path(docs_dir)
+        self.project_root = self.docs_dir.parent
+        self.location_base = self.project_root
+        self.path_index = path_index
+        self.checked_links: Set[str] = set()
+        # Per-run document index: each file is read and its anchors built once
+        self.documents: Dict[str, Document] = {}
+        # Per-file checks buffer (level, message) pairs for the parent to replay
+        self.buffer: Optional[List[Tuple[str, str]]] = None
+        self.cache_dir: Optional[Path] = None
+        self.result_cache: Optional[LinkResultCache] = None
+        # Dependencies recorded while checking the current file
+        self.dependencies: Optional[Set[Tuple[str, str]]] = None
+        self.external_urls: Optional[List[str]] = None
+        # Set to check http(s) URLs for reachability after the per-file pass
+        self.external_checker: Optional["ExternalLinkChecker"] = None
+        
+    def report(self, level: str, msg: str) -> None:
+        """Record a message, or buffer it while checking a single file"""
+        if self.buffer is not None:
+            self.buffer.append((level, msg))
+            return
+        super().report(level, msg)
+        
+    def validate_all(self, jobs: int = 1) -> int:
+        """Run all link checks. Returns 0 if valid, 1 if errors
+        
+        With jobs > 1 files are sharded across a process pool; results are
+        still reported in sorted file order so output is identical to a
+        serial run. When cache_dir is set, files whose content and link
+        targets are unchanged since the last run reuse their cached results.
+        When external_checker is set, http(s) URLs are then checked for
+        reachability.
+        """
+        print("╔════════════════════════════════════════════════════════╗")
+        print("║      Documentation Link Checker v1.4.0                ║")
+        print("╚════════════════════════════════════════════════════════╝")
+        print()
+        
+        if not self.docs_dir.exists():
+            self.error(f"Documentation directory not found: {self.docs_dir}")
+            return 1
+            
+        self.info(f"Checking links in: {self.docs_dir}")
+        print()
+        
+        # Index every path under the project root once (replaces per-link stat calls)
+        if self.path_index is None:
+            self.path_index = PathIndex(self.project_root)
+        if self.cache_dir is not None:
+            self.result_cache = LinkResultCache(self.cache_dir, self.path_index)
+            
+        # Find all markdown files (sorted for stable output)
+        md_files = sorted(self.docs_dir.glob("**/*.md"))
+        self.info(f"Found {len(md_files)} markdown files")
+        print()
+        
+        # Check links in each file
+        print("═══ Link Validation ═══")
+        total_links = 0
+        broken_links = 0
+        
+        external: List[Tuple[Path, str]] = []
+        
+        for md_file, result in zip(md_files, self._check_files(md_files, jobs)):
+            for level, msg in result.messages:
+                getattr(self, level)(msg)
+            total_links += result.total_links
+            broken_links += result.broken_links
+            external.extend((md_file, url) for url in result.external_urls)
+            
+        if self.result_cache is not None:
+            self.result_cache.save()
+            
+        unreachable = 0
+        if self.external_checker is not None:
+            unreachable = self._check_external_links(external)
+            
+        # Print summary
+        self.flush_results()
+        print()
+        print("═══ Link Check Summary ═══")
+        print(f"Total links checked: {total_links}")
+        print(f"Broken links:        {broken_links}")
+        print(f"Valid links:         {total_links - broken_links}")
+        print(f"Path lookups:        {self.path_index.lookups} "
+              f"({self.path_index.probes} filesystem probes, "
+              f"{len(self.path_index.paths)} indexed paths)")
+        if self.external_checker is not None:
+            print(f"External URLs:       {len({url for _, url in external})} checked "
+                  f"({unreachable} unreachable links, "
+                  f"{self.external_checker.cache_hits} from cache, "
+                  f"{self.external_checker.requests} HTTP requests)")
+        if self.result_cache is not None:
+            print(f"Incremental cache:   {self.result_cache.hits} files reused, "
+                  f"{self.result_cache.misses} re-checked")
+        print()
+        self.print_totals()
+        
+        return 1 if self.counts['error'] else 0
+        
+    def _check_external_links(self, external: List[Tuple[Path, str]]) -> int:
+        """Check URL reachability and warn for each unreachable occurrence"""
+        print()
+        print("═══ External URL Validation ═══")
+        statuses = self.external_checker.check(url for _, url in external)
+        unreachable = 0
+        for md_file, url in external:
+            status = statuses[url]
+            if not status.valid:
+                relative_path = md_file.relative_to(self.project_root)
+                self.warning(f"{relative_path}: Unreachable URL ({status.status}): {url}")
+                unreachable += 1
+        if unreachable == 0 and statuses:
+            self.success(f"{len(statuses)} external URLs reachable")
+        return unreachable
+        
+    def _check_files(self, md_files: List[Path], jobs: int) -> Iterator[FileResult]:
+        """Yield per-file results in input order, reusing cached results when valid"""
+        cache = self.result_cache
+        cached: Dict[Path, FileResult] = {}
+        if cache is not None:
+            for md_file in md_files:
+                result = cache.lookup(self._cache_key(md_file), md_file)
+                if result is not None:
+                    cached[md_file] = result
+                    
+        pending = [f for f in md_files if f not in cached]
+        if jobs > 1 and len(pending) > 1:
+            computed = self._check_files_parallel(pending, jobs)
+        else:
+            computed = (self._check_file(md_file) for md_file in pending)
+            
+        for md_file in md_files:
+            result = cached.get(md_file)
+            if result is None:
+                result = next(computed)
+                self.path_index.lookups += result.lookups
+                self.path_index.probes += result.probes
+                if cache is not None:
+                    cache.store(self._cache_key(md_file), md_file, result)
+            yield result
+            
+    def _cache_key(self, md_file: Path) -> str:
+        """Cache key for a file: docs directory and file path relative to the project root
+        
+        The docs directory is part of the key because links are also resolved
+        relative to it.
+        """
+        docs_dir = os.path.relpath(self.docs_dir, self.project_root)
+        return f"{Path(docs_dir).as_posix()}:{md_file.relative_to(self.project_root).as_posix()}"
+        
+    def _check_files_parallel(self, md_files: List[Path], jobs: int) -> Iterator[FileResult]:
+        """Check files in a process pool, yielding per-file results in input order"""
+        from concurrent.futures import ProcessPoolExecutor
+        chunksize = max(1, len(md_files) // (jobs * 8))
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(str(self.docs_dir), self.path_index)) as executor:
+            yield from executor.map(_check_file_worker, md_files, chunksize=chunksize)
+            
+    def _check_file(self, md_file: Path) -> FileResult:
+        """Check one file, buffering its messages and recording its dependencies
+        
+        Path lookups made here are returned in the result rather than left on
+        the index, so serial and pool runs account for them the same way.
+        """
+        index = self.path_index
+        lookups, probes = index.lookups, index.probes
+        saved_buffer = self.buffer
+        self.buffer = []
+        self.dependencies = set()
+        self.external_urls = []
+        try:
+            total_links, broken_links = self._check_file_links(md_file)
+            return FileResult(total_links, broken_links, self.buffer,
+                              sorted(self.dependencies), self.external_urls,
+                              index.lookups - lookups, index.probes - probes)
+        finally:
+            index.lookups, index.probes = lookups, probes
+            self.buffer = saved_buffer
+            self.dependencies = None
+            self.external_urls = None
+        
+    def _check_file_links(self, md_file: Path) -> Tuple[int, int]:
+        """Check all links in a markdown file. Returns (total_links, broken_links)"""
+        relative_path = md_file.relative_to(self.project_root)
+        
+        doc = self._load_document(md_file)
+        if doc.read_error:
+            self.error(f"{relative_path}: Failed to read - {doc.read_error}")
+            return 0, 0
+            
+        # Links inside fenced code blocks are examples, not navigation
+        links = [link for link in doc.links if not link.in_code]
+        
+        if not links:
+            return 0, 0
+            
+        total_links = len(links)
+        broken_links = 0
+        
+        for link in links:
+            link_url = link.url
+            # Skip if already checked (for efficiency)
+            link_key = f"{md_file}:{link_url}"
+            if link_key in self.checked_links:
+                continue
+            self.checked_links.add(link_key)
+            
+            # Parse link
+            if self._is_external_link(link_url):
+                # External links - just validate format
+                if not self._validate_external_link(link_url):
+                    self.warning(f"{relative_path}: Invalid URL format: {link_url}")
+                    broken_links += 1
+                elif self.external_urls is not None:
+                    self.external_urls.append(link_url)
+            elif self._is_anchor_link(link_url):
+                # Anchor links - validate target exists
+                if not self._validate_anchor_link(md_file, link_url):
+                    self.warning(f"{relative_path}: Broken anchor link: {link_url}")
+                    broken_links += 1
+            else:
+                # Internal file links (optionally with a #fragment)
+                link_path, _, fragment = link_url.partition('#')
+                target_path = self._resolve_internal_link(md_file, link_path)
+                if target_path is None:
+                    self.error(f"{relative_path}: Broken link to {link_url}")
+                    broken_links += 1
+                elif fragment and target_path.suffix == '.md' \
+                        and not self._has_anchor(target_path, fragment):
+                    self.warning(f"{relative_path}: Broken anchor link: {link_url}")
+                    broken_links += 1
+                    
+        if broken_links == 0 and total_links > 0:
+            self.success(f"{relative_path}: {total_links} links OK")
+            
+        return total_links, broken_links
+        
+    def _is_external_link(self, url: str) -> bool:
+        """Check if URL is external (http/https)"""
+        return url.startswith(('http://', 'https://'))
+        
+    def _is_anchor_link(self, url: str) -> bool:
+        """Check if URL is an anchor link (#section)"""
+        return url.startswith('#')
+        
+    def _validate_external_link(self, url: str) -> bool:
+        """Validate external URL format"""
+        try:
+            result = urlparse(url)
+            return all([result.scheme, result.netloc])
+        except:
+            return False
+            
+    def _load_document(self, md_file: Path) -> Document:
+        """Return the parsed document for a file, reading it at most once per run"""
+        key = os.path.abspath(md_file)
+        doc = self.documents.get(key)
+        if doc is None:
+            doc = self.documents[key] = Document(md_file, self.project_root)
+        return doc
+        
+    def _has_anchor(self, md_file: Path, fragment: str) -> bool:
+        """Check a fragment against the file's heading-slug index"""
+        doc = self._load_document(md_file)
+        if self.dependencies is not None:
+            self.dependencies.add(('anchors', os.path.abspath(md_file)))
+        if doc.read_error:
+            return False
+        return fragment in doc.anchors or unquote(fragment) in doc.anchors
+            
+    def _validate_anchor_link(self, md_file: Path, anchor: str) -> bool:
+        """Validate anchor link exists in current file"""
+        return self._has_anchor(md_file, anchor.lstrip('#'))
+            
+    def _resolve_internal_link(self, md_file: Path, link_path: str) -> Optional[Path]:
+        """Resolve an internal link path to an existing file, or None"""
+        # Try relative to the current file, the docs directory, then the project root
+        for base in (md_file.parent, self.docs_dir, self.project_root):
+            target_path = os.path.normpath(os.path.join(os.path.abspath(base), link_path))
+            if self.dependencies is not None:
+                self.dependencies.add(('path', target_path))
+            if self.path_index.exists(target_path):
+                return Path(target_path)
+                
+        return None
+
+
+# Per-process checker reused by pool workers
+_WORKER_CHECKER: Optional[LinkChecker] = None
+
+
+def _init_worker(docs_dir: str, path_index: PathIndex) -> None:
+    """Create the worker's checker, sharing the parent's path index"""
+    global _WORKER_CHECKER
+    _WORKER_CHECKER = LinkChecker(docs_dir, path_index=path_index)
+
+
+def _check_file_worker(md_file: Path) -> FileResult:
+    """Check one file in a worker process"""
+    return _WORKER_CHECKER._check_file(md_file)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Validate markdown links in documentation")
+    parser.add_argument("docs_dir", nargs="?", default="docs",
+                        help="Documentation directory (default: docs)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Check files in N worker processes (0 = one per CPU)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Reuse cached results for files whose content and link targets are unchanged")
+    parser.add_argument("--cache-dir", type=Path, default=None,
+                        help=f"Result cache directory (default: <project root>/{LINK_CACHE_DIR})")
+    parser.add_argument("--check-external", action="store_true",
+                        help="Check http(s) URLs for reachability (HEAD, then GET fallback)")
+    parser.add_argument("--url-concurrency", type=int, default=None,
+                        help="Concurrent URL checks (default: 5, as lib/link_validator.sh)")
+    parser.add_argument("--url-timeout", type=float, default=None,
+                        help="Per-request timeout in seconds (default: 10)")
+    parser.add_argument("--host-rate", type=float, default=10.0,
+                        help="Maximum requests per second to one host (default: 10)")
+    parser.add_argument("--url-cache-dir", type=Path, default=None,
+                        help=f"URL result cache shared with lib/link_validator.sh "
+                             f"(default: <project root>/{URL_CACHE_DIR}; TTL from LINK_CACHE_TTL)")
+    add_report_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def create_checker(args: argparse.Namespace, path_index: Optional[PathIndex] = None) -> LinkChecker:
+    """Build a checker configured from parsed command line arguments"""
+    checker = LinkChecker(args.docs_dir, path_index=path_index)
+    if args.incremental or args.cache_dir is not None:
+        checker.cache_dir = args.cache_dir or checker.project_root / LINK_CACHE_DIR
+    if args.check_external:
+        from .external_links import ExternalLinkChecker, URLCache
+        options = {"concurrency": args.url_concurrency, "timeout": args.url_timeout}
+        checker.external_checker = ExternalLinkChecker(
+            URLCache(args.url_cache_dir or checker.project_root / URL_CACHE_DIR),
+            host_rate=args.host_rate,
+            **{name: value for name, value in options.items() if value is not None})
+    return checker
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point"""
+    args = parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    
+    # Create checker and run
+    checker = create_checker(args)
+    with reporting(checker, args, "check-links"):
+        return checker.validate_all(jobs=jobs)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
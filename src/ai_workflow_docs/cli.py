@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+AI Workflow Docs CLI
+Single entry point for the documentation tools
+
+Usage:
+    ai-workflow-docs <subcommand> [ARGS...]
+    ai-workflow-docs <subcommand> --help
+    python3 -m ai_workflow_docs <subcommand> [ARGS...]
+
+Subcommand modules are imported only when they run, so checking links
+never loads PyYAML and `--help` imports nothing beyond this module.
+Every subcommand takes the same arguments as the script it replaces.
+Like docs_client.py, this module avoids typing/argparse to keep start-up cheap.
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import sys
+
+from . import __version__
+
+# Subcommand -> (module, summary); modules are imported lazily by run()
+COMMANDS = {
+    "check-links": ("check_doc_links", "Validate markdown links in documentation"),
+    "validate-api": ("validate_api_docs", "Validate API documentation structure and completeness"),
+    "validate-context": ("validate_context_blocks", "Validate Context blocks in step prompt YAML files"),
+    "extract": ("extract_api_docs", "Generate the API reference from source modules"),
+    "enhance": ("enhance_api_docs", "Add the introduction and usage guide to the API reference"),
+    "hash-files": ("file_hashes", "Hash file lists for the step validation cache"),
+    "ai-cache": ("ai_cache_store", "Look up and maintain the AI response cache store"),
+    "prompt-key": ("prompt_keys", "Canonical AI cache keys and near-duplicate prompt detection"),
+    "metrics": ("metrics_store", "Indexed workflow metrics history with rollups and retention"),
+    "duration-model": ("duration_model", "Fit and query the ML step duration model"),
+    "classify-changes": ("change_classifier", "Filter workflow artifacts and classify changed files"),
+    "dag-schedule": ("dag_scheduler", "Critical-path DAG scheduling of workflow steps with a timing trace"),
+    "doc-sections": ("doc_sections", "Indexed markdown section extract/replace with batched operations"),
+    "daemon": ("docs_daemon", "Serve the documentation tools from memory over a Unix socket"),
+    "client": ("docs_client", "Send one command to the docs daemon"),
+}
+
+USAGE = "Usage: ai-workflow-docs <subcommand> [ARGS...]"
+
+
+def usage() -> str:
+    """Top-level help text"""
+    width = max(len(name) for name in COMMANDS)
+    lines = [USAGE, "", "Subcommands:"]
+    lines += [f"  {name:<{width}}  {summary}" for name, (_, summary) in COMMANDS.items()]
+    lines += ["", "Run 'ai-workflow-docs <subcommand> --help' for subcommand options."]
+    return "\n".join(lines)
+
+
+def run(command: str, argv: list) -> int:
+    """Import a subcommand's module and run its main()"""
+    from importlib import import_module
+    module = import_module(f"{__package__}.{COMMANDS[command][0]}")
+    # argparse takes its prog name from argv[0]: "usage: ai-workflow-docs check-links ..."
+    sys.argv[0] = f"ai-workflow-docs {command}"
+    return module.main(argv) or 0
+
+
+def main(argv=None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or argv[0] in ("-h", "--help"):
+        print(usage())
+        return 0 if argv else 2
+    if argv[0] == "--version":
+        print(f"ai-workflow-docs {__version__}")
+        return 0
+    if argv[0] not in COMMANDS:
+        print(f"Error: unknown subcommand: {argv[0]}", file=sys.stderr)
+        print(usage(), file=sys.stderr)
+        return 2
+    return run(argv[0], argv[1:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Workflow DAG Scheduler
+Critical-path list scheduling of workflow steps on a bounded worker pool
+
+Usage:
+    ai-workflow-docs dag-schedule METADATA_JSON [--durations FILE] plan [--workers N]
+    ai-workflow-docs dag-schedule METADATA_JSON [--durations FILE] run --command TEMPLATE [--workers N]
+    ai-workflow-docs dag-schedule METADATA_JSON [--durations FILE] dispatch [--workers N] [--trace FILE]
+    ai-workflow-docs dag-schedule TRACE_JSON gantt
+
+The execution plan of lib/dependency_graph.sh runs the steps in static
+phases: a phase starts when every step of the previous one has finished,
+so one slow step holds back steps whose own dependencies are already met.
+This scheduler reads the steps and dependencies written by
+export_step_metadata_json and starts each step as soon as its
+dependencies have finished. When more steps are ready than there are
+workers, the step with the longest remaining critical path (its own
+duration plus the longest chain of dependents after it) goes first.
+
+Durations are the historical ones when --durations is given (a
+{"step": seconds} object, or the output of `ai-workflow-docs metrics
+stats --json`, where the step_N rollups are used), falling back to each
+step's estimated_time_seconds.
+
+`plan` simulates the static phases and the list schedule on the same
+pool. `run` executes a command per step (TEMPLATE with {step} replaced).
+`dispatch` leaves execution to the caller so steps keep the shell state
+of the workflow: it writes "start STEP" lines and "wait" when nothing
+more can start, reads "done STEP STATUS" lines (an exit code, or
+"skipped" for a step that was not selected, which counts as a success),
+and ends with "end ok" or "end failed STEP...". `run` and `dispatch`
+record a trace of every step, written as JSON with --trace and rendered
+as a Gantt chart by `gantt`.
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import heapq
+import json
+import os
+import sys
+import time
+
+DEFAULT_WORKERS = 4
+# Seconds assumed for a step without history or estimate
+DEFAULT_DURATION = 60.0
+# Character width of the Gantt bars
+GANTT_WIDTH = 60
+
+
+def step_sort_key(step: str) -> tuple:
+    """Workflow order of step ids: 0, 0a, 0b, 1, ..., 11, 11.5, 11.7, 12"""
+    number = step.rstrip("abcdefghijklmnopqrstuvwxyz")
+    try:
+        return (float(number), step[len(number):])
+    except ValueError:
+        return (float("inf"), step)
+
+
+def read_durations(path: str, stat: str) -> dict:
+    """Seconds per step id from a {"step": seconds} file or metrics stats --json"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict) and isinstance(data.get("rollups"), dict):
+        data = {scope[len("step_"):]: rollup.get(stat) if rollup.get(stat) is not None else rollup.get("mean")
+                for scope, rollup in data["rollups"].items()
+                if scope.startswith("step_") and isinstance(rollup, dict)}
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected a JSON object of step durations")
+    return {str(step): float(seconds) for step, seconds in data.items()
+            if isinstance(seconds, (int, float)) and not isinstance(seconds, bool) and seconds >= 0}
+
+
+class StepGraph:
+    """Steps, their dependencies and durations, with critical-path priorities"""
+
+    def __init__(self, dependencies: dict, durations: dict):
+        self.steps = sorted(dependencies, key=step_sort_key)
+        self.dependencies = {step: list(dict.fromkeys(dependencies[step])) for step in self.steps}
+        self.durations = {step: float(durations.get(step, DEFAULT_DURATION)) for step in self.steps}
+        self.dependents = {step: [] for step in self.steps}
+        for step in self.steps:
+            for dep in self.dependencies[step]:
+                if dep not in self.dependents:
+                    raise ValueError(f"step {step} depends on unknown step {dep}")
+                self.dependents[dep].append(step)
+        self.order = self._topological_order()
+        self.bottom_levels = self._bottom_levels()
+
+    @classmethod
+    def load(cls, metadata_file: str, durations_file=None, stat: str = "p50") -> "StepGraph":
+        with open(metadata_file, encoding='utf-8') as f:
+            metadata = json.load(f)
+        dependencies, durations = {}, {}
+        for entry in metadata.get("steps", []):
+            step = str(entry["id"])
+            deps = entry.get("dependencies") or []
+            if isinstance(deps, str):
+                deps = deps.split(",")
+            dependencies[step] = [str(dep).strip() for dep in deps if str(dep).strip()]
+            if isinstance(entry.get("estimated_time_seconds"), (int, float)):
+                durations[step] = entry["estimated_time_seconds"]
+        if not dependencies:
+            raise ValueError(f"{metadata_file}: no steps")
+        if durations_file:
+            durations.update((step, seconds) for step, seconds in read_durations(durations_file, stat).items()
+                             if step in dependencies)
+        return cls(dependencies, durations)
+
+    def _topological_order(self) -> list:
+        remaining = {step: len(deps) for step, deps in self.dependencies.items()}
+        ready = [step for step in self.steps if not remaining[step]]
+        order = []
+        while ready:
+            step = ready.pop(0)
+            order.append(step)
+            for dependent in self.dependents[step]:
+                remaining[dependent] -= 1
+                if not remaining[dependent]:
+                    ready.append(dependent)
+        if len(order) != len(self.steps):
+            cycle = sorted((step for step in self.steps if remaining[step]), key=step_sort_key)
+            raise ValueError(f"dependency cycle among steps {', '.join(cycle)}")
+        return order
+
+    def _bottom_levels(self) -> dict:
+        """Longest path from the start of each step to the end of the workflow"""
+        levels = {}
+        for step in reversed(self.order):
+            levels[step] = self.durations[step] + max((levels[d] for d in self.dependents[step]), default=0.0)
+        return levels
+
+    def critical_path(self) -> list:
+        step = max((s for s in self.steps if not self.dependencies[s]), key=lambda s: self.bottom_levels[s])
+        path = [step]
+        while self.dependents[step]:
+            step = max(self.dependents[step], key=lambda s: self.bottom_levels[s])
+            path.append(step)
+        return path
+
+    def phases(self) -> list:
+        """Steps grouped by dependency depth, as the static execution plan runs them"""
+        depth = {}
+        for step in self.order:
+            depth[step] = 1 + max((depth[d] for d in self.dependencies[step]), default=-1)
+        phases = [[] for _ in range(max(depth.values()) + 1)]
+        for step in self.steps:
+            phases[depth[step]].append(step)
+        return phases
+
+
+class ListScheduler:
+    """Ready steps started by descending critical path on a bounded pool"""
+
+    def __init__(self, graph: StepGraph, workers: int = DEFAULT_WORKERS, keep_going: bool = False):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.graph = graph
+        self.workers = workers
+        self.keep_going = keep_going
+        self.waiting = {step: len(deps) for step, deps in graph.dependencies.items()}
+        self.ready = []
+        self.running = set()
+        self.failed = []
+        self.blocked = set()
+        self.finished = set()
+        for step in graph.steps:
+            if not self.waiting[step]:
+                self._release(step)
+
+    def _release(self, step: str) -> None:
+        # Longest remaining path first; workflow order breaks ties
+        heapq.heappush(self.ready, (-self.graph.bottom_levels[step], step_sort_key(step), step))
+
+    def startable(self) -> list:
+        """Steps to start now, marked running"""
+        started = []
+        while self.ready and len(self.running) < self.workers and (self.keep_going or not self.failed):
+            step = heapq.heappop(self.ready)[2]
+            self.running.add(step)
+            started.append(step)
+        return started
+
+    def finish(self, step: str, success: bool) -> None:
+        if step not in self.running:
+            raise ValueError(f"step {step} is not running")
+        self.running.discard(step)
+        self.finished.add(step)
+        if not success:
+            self.failed.append(step)
+            pending = list(self.graph.dependents[step])
+            while pending:
+                dependent = pending.pop()
+                if dependent not in self.blocked:
+                    self.blocked.add(dependent)
+                    pending.extend(self.graph.dependents[dependent])
+            return
+        for dependent in self.graph.dependents[step]:
+            self.waiting[dependent] -= 1
+            if not self.waiting[dependent] and dependent not in self.blocked:
+                self._release(dependent)
+
+    @property
+    def done(self) -> bool:
+        return not self.running and (not self.ready or (self.failed and not self.keep_going))
+
+
+class Trace:
+    """Start and end times of each step, relative to the start of the run"""
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        self.origin = time.time()
+        self.entries = {}
+        self.free = list(range(workers))
+
+    def start(self, step: str, at=None) -> None:
+        worker = heapq.heappop(self.free) if self.free else len(self.entries)
+        self.entries[step] = {"step": step, "worker": worker, "status": "running",
+                              "start": self._now() if at is None else at, "end": None}
+
+    def end(self, step: str, status: str, at=None) -> None:
+        entry = self.entries[step]
+        entry.update(status=status, end=self._now() if at is None else at)
+        heapq.heappush(self.free, entry["worker"])
+
+    def _now(self) -> float:
+        return round(time.time() - self.origin, 3)
+
+    def to_dict(self, graph: StepGraph, scheduler: ListScheduler) -> dict:
+        entries = sorted(self.entries.values(), key=lambda e: (e["start"], step_sort_key(e["step"])))
+        path = graph.critical_path()
+        return {
+            "workers": self.workers,
+            "started": self.origin,
+            "makespan": max((e["end"] or 0 for e in entries), default=0),
+            "critical_path": path,
+            "critical_path_seconds": graph.bottom_levels[path[0]],
+            "failed": scheduler.failed,
+            "not_run": sorted(set(graph.steps) - set(self.entries), key=step_sort_key),
+            "steps": entries,
+        }
+
+
+def simulate(graph: StepGraph, workers: int, actual=None) -> list:
+    """(step, start, end) of the list schedule, prioritized by the graph durations
+
+    actual maps steps to the durations they really take (default: the graph's)
+    """
+    actual = actual or graph.durations
+    scheduler = ListScheduler(graph, workers)
+    now, events, schedule = 0.0, [], []
+    while not scheduler.done:
+        for step in scheduler.startable():
+            end = now + actual[step]
+            heapq.heappush(events, (end, step_sort_key(step), step))
+            schedule.append((step, now, end))
+        now, _, step = heapq.heappop(events)
+        scheduler.finish(step, True)
+    return schedule
+
+
+def simulate_phases(graph: StepGraph, workers: int, actual=None) -> list:
+    """(step, start, end) of the static phases, each on the same pool"""
+    actual = actual or graph.durations
+    schedule, phase_start = [], 0.0
+    for phase in graph.phases():
+        pool = [phase_start] * workers
+        for step in sorted(phase, key=lambda s: -graph.durations[s]):
+            start = heapq.heappop(pool)
+            schedule.append((step, start, start + actual[step]))
+            heapq.heappush(pool, start + actual[step])
+        phase_start = max(pool)
+    return schedule
+
+
+def format_duration(seconds: float) -> str:
+    if seconds < 59.95:
+        return f"{seconds:.1f}s"
+    seconds = int(round(seconds))
+    return f"{seconds // 60}m {seconds % 60:02d}s"
+
+
+def format_plan(graph: StepGraph, workers: int) -> str:
+    phases = max(end for _, _, end in simulate_phases(graph, workers))
+    listed = simulate(graph, workers)
+    makespan = max(end for _, _, end in listed)
+    path = graph.critical_path()
+    lines = [
+        f"Workers:         {workers}",
+        f"Sequential:      {format_duration(sum(graph.durations.values()))}",
+        f"Static phases:   {format_duration(phases)} ({len(graph.phases())} phases)",
+        f"DAG schedule:    {format_duration(makespan)} "
+        f"({(phases - makespan) / phases * 100 if phases else 0:.0f}% faster than phases)",
+        f"Critical path:   {format_duration(graph.bottom_levels[path[0]])} ({' → '.join(path)})",
+        "",
+        "Start order:",
+    ]
+    lines.extend(f"  {step:>5}  {format_duration(start):>8} → {format_duration(end):>8}"
+                 f"  (critical path {format_duration(graph.bottom_levels[step])})"
+                 for step, start, end in sorted(listed, key=lambda e: (e[1], step_sort_key(e[0]))))
+    return "\n".join(lines)
+
+
+def format_gantt(trace: dict) -> str:
+    """Text Gantt chart of a trace, one row per step"""
+    steps = trace.get("steps", [])
+    makespan = trace.get("makespan") or max((e["end"] or 0 for e in steps), default=0) or 1
+    scale = GANTT_WIDTH / makespan
+    lines = [f"{'Step':>5} {'W':>2} {'Start':>8} {'End':>8}  |{'0s':<{GANTT_WIDTH - 8}}{format_duration(makespan):>8}|"]
+    for entry in steps:
+        end = entry["end"] if entry["end"] is not None else makespan
+        left = min(GANTT_WIDTH - 1, int(entry["start"] * scale))
+        width = max(1, int(round(end * scale)) - left)
+        # Failed steps are shaded, steps that were not selected dotted
+        bar = {"0": "█", "skipped": "·"}.get(entry["status"], "▒") * width
+        lines.append(f"{entry['step']:>5} {entry['worker']:>2} {format_duration(entry['start']):>8} "
+                     f"{format_duration(end):>8}  |{' ' * left}{bar:<{GANTT_WIDTH - left}}|")
+    lines.append("")
+    lines.append(f"Makespan {format_duration(makespan)} on {trace.get('workers')} workers; estimated critical path "
+                 f"{format_duration(trace.get('critical_path_seconds') or 0)} "
+                 f"({' → '.join(trace.get('critical_path', []))})")
+    if trace.get("failed"):
+        lines.append(f"Failed: {', '.join(trace['failed'])}; not run: {', '.join(trace.get('not_run', []))}")
+    return "\n".join(lines)
+
+
+def write_trace(path, trace: dict) -> None:
+    if not path:
+        return
+    tmp = f"{path}.tmp.{os.getpid()}"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(trace, f, indent=2)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def run(graph: StepGraph, workers: int, command: str, keep_going: bool = False) -> dict:
+    """Run command for every step on the pool; returns the trace"""
+    import shlex
+    import subprocess
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    scheduler = ListScheduler(graph, workers, keep_going)
+    trace = Trace(workers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {}
+        while not scheduler.done:
+            for step in scheduler.startable():
+                argv = [part.replace("{step}", step) for part in shlex.split(command)]
+                trace.start(step)
+                futures[pool.submit(subprocess.call, argv)] = step
+            finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in finished:
+                step = futures.pop(future)
+                status = future.result()
+                trace.end(step, str(status))
+                scheduler.finish(step, status == 0)
+    return trace.to_dict(graph, scheduler)
+
+
+def dispatch(graph: StepGraph, workers: int, keep_going: bool, stdin, stdout) -> dict:
+    """Schedule steps run by the caller over the start/wait/done line protocol"""
+    scheduler = ListScheduler(graph, workers, keep_going)
+    trace = Trace(workers)
+    while not scheduler.done:
+        for step in scheduler.startable():
+            trace.start(step)
+            stdout.write(f"start {step}\n")
+        stdout.write("wait\n")
+        stdout.flush()
+        line = stdin.readline()
+        if not line:
+            raise ValueError("input closed while steps were running")
+        parts = line.split()
+        if len(parts) != 3 or parts[0] != "done" or parts[1] not in trace.entries:
+            raise ValueError(f"unexpected input: {line.strip()}")
+        trace.end(parts[1], parts[2])
+        scheduler.finish(parts[1], parts[2] in ("0", "skipped"))
+    stdout.write(f"end failed {' '.join(scheduler.failed)}\n" if scheduler.failed else "end ok\n")
+    stdout.flush()
+    return trace.to_dict(graph, scheduler)
+
+
+def parse_args(argv=None):
+    # Imported here: the dispatch loop starts with the workflow
+    import argparse
+    parser = argparse.ArgumentParser(description="Critical-path DAG scheduling of workflow steps")
+    parser.add_argument("metadata", help="export_step_metadata_json output, or a trace for gantt")
+    parser.add_argument("--durations", help="Historical durations: {step: seconds} or metrics stats --json")
+    parser.add_argument("--stat", default="p50", help="Rollup statistic used from metrics stats (default: p50)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def pool_options(command):
+        command.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                             help=f"Steps run at once (default: {DEFAULT_WORKERS})")
+
+    def run_options(command):
+        pool_options(command)
+        command.add_argument("--keep-going", action="store_true",
+                             help="Keep starting independent steps after a failure")
+        command.add_argument("--trace", help="Write the timing trace JSON here")
+
+    pool_options(commands.add_parser("plan", help="Compare the static phases with the DAG schedule"))
+    run_command = commands.add_parser("run", help="Run a command per step")
+    run_command.add_argument("--command", dest="template", required=True,
+                             help="Command template, {step} is replaced")
+    run_options(run_command)
+    run_command.add_argument("--quiet", action="store_true", help="Do not print the Gantt chart")
+    run_options(commands.add_parser("dispatch", help="Schedule steps run by the caller (line protocol)"))
+    commands.add_parser("gantt", help="Render a trace file as a Gantt chart")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    try:
+        if args.command == "gantt":
+            with open(args.metadata, encoding='utf-8') as f:
+                print(format_gantt(json.load(f)))
+            return 0
+
+        graph = StepGraph.load(args.metadata, args.durations, args.stat)
+        if args.command == "plan":
+            print(format_plan(graph, args.workers))
+            return 0
+        if args.command == "run":
+            trace = run(graph, args.workers, args.template, args.keep_going)
+            if not args.quiet:
+                print(format_gantt(trace))
+        else:
+            trace = dispatch(graph, args.workers, args.keep_going, sys.stdin, sys.stdout)
+        write_trace(args.trace, trace)
+        return 1 if trace["failed"] else 0
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Documentation Corpus
+Loads markdown documentation once and exposes parsed documents to validators
+
+Every markdown file is globbed, read and tokenized exactly once per run.
+The resulting documents carry the raw bytes, a line index, headings, code
+fences and links so validators can share them without further I/O.
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import copy
+import re
+from bisect import bisect_right
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set
+
+# Markdown token patterns (applied per line by the tokenizer)
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.+?)\s*$')
+FENCE_RE = re.compile(r'^\s{0,3}(`{3,})\s*(\w+)?')
+LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+HTML_ANCHOR_RE = re.compile(r'<a\s+[^>]*?(?:name|id)=["\']([^"\']+)["\']', re.IGNORECASE)
+
+# GitHub slug rules: drop inline markup, keep letters/digits/_/-/space
+SLUG_LINK_RE = re.compile(r'!?\[([^\]]*)\]\([^)]*\)')
+SLUG_STRIP_RE = re.compile(r'[^\w\- ]')
+
+
+def github_slug(text: str) -> str:
+    """Convert heading text to its GitHub anchor slug (without duplicate suffix)"""
+    text = SLUG_LINK_RE.sub(r'\1', text).replace('`', '')
+    text = SLUG_STRIP_RE.sub('', text.strip().lower())
+    return text.replace(' ', '-')
+
+
+class Heading(NamedTuple):
+    """A markdown ATX heading"""
+    level: int
+    text: str
+    line: int
+
+
+class CodeBlock(NamedTuple):
+    """A fenced code block"""
+    language: Optional[str]
+    code: str
+    line: int
+    closed: bool
+
+
+class Link(NamedTuple):
+    """An inline markdown link: [text](url)"""
+    text: str
+    url: str
+    line: int
+    in_code: bool
+
+
+class Document:
+    """A markdown file tokenized in a single pass"""
+
+    def __init__(self, path: Path, root: Path):
+        self.path = path
+        try:
+            self.relative_path = path.relative_to(root)
+        except ValueError:
+            self.relative_path = path
+        self.data: bytes = b""
+        self.text: str = ""
+        self.line_offsets: List[int] = []
+        self.headings: List[Heading] = []
+        self.code_blocks: List[CodeBlock] = []
+        self.links: List[Link] = []
+        self.html_anchors: List[str] = []
+        self.read_error: Optional[str] = None
+        self._anchors: Optional[Set[str]] = None
+
+        try:
+            self.data = path.read_bytes()
+            self.text = self.data.decode('utf-8')
+        except Exception as e:
+            self.read_error = str(e)
+            return
+
+        self._tokenize()
+
+    def _tokenize(self) -> None:
+        """Extract line offsets, headings, code fences and links in one pass"""
+        fence: Optional[str] = None
+        fence_lang: Optional[str] = None
+        fence_line = 0
+        fence_body: List[str] = []
+        offset = 0
+
+        for number, line in enumerate(self.text.split('\n'), start=1):
+            self.line_offsets.append(offset)
+            offset += len(line) + 1
+
+            fence_match = FENCE_RE.match(line)
+            if fence is not None:
+                if fence_match and fence_match.group(1).startswith(fence) \
+                        and not line.strip().strip('`'):
+                    self.code_blocks.append(CodeBlock(
+                        fence_lang, '\n'.join(fence_body), fence_line, True))
+                    fence = None
+                else:
+                    fence_body.append(line)
+                    self._scan_links(line, number, in_code=True)
+                continue
+
+            if fence_match:
+                fence = fence_match.group(1)
+                fence_lang = fence_match.group(2)
+                fence_line = number
+                fence_body = []
+                continue
+
+            heading = HEADING_RE.match(line)
+            if heading:
+                self.headings.append(
+                    Heading(len(heading.group(1)), heading.group(2), number))
+
+            self._scan_links(line, number, in_code=False)
+            if '<a ' in line:
+                self.html_anchors.extend(HTML_ANCHOR_RE.findall(line))
+
+        if fence is not None:
+            self.code_blocks.append(CodeBlock(
+                fence_lang, '\n'.join(fence_body), fence_line, False))
+
+    def _scan_links(self, line: str, number: int, in_code: bool) -> None:
+        """Record inline links found on a single line"""
+        if '](' not in line:
+            return
+        for match in LINK_RE.finditer(line):
+            self.links.append(
+                Link(match.group(1), match.group(2), number, in_code))
+
+    @property
+    def anchors(self) -> Set[str]:
+        """Anchor slugs GitHub generates for this document (built once)
+
+        Duplicate headings get -1, -2, ... suffixes exactly like GitHub's
+        slugger; explicit <a name/id> anchors are included as-is.
+        """
+        if self._anchors is None:
+            occurrences: Dict[str, int] = {}
+            for heading in self.headings:
+                base = slug = github_slug(heading.text)
+                while slug in occurrences:
+                    occurrences[base] += 1
+                    slug = f"{base}-{occurrences[base]}"
+                occurrences[slug] = 0
+            self._anchors = set(occurrences) | set(self.html_anchors)
+        return self._anchors
+
+    def line_of(self, offset: int) -> int:
+        """Return the 1-based line number containing a character offset"""
+        return bisect_right(self.line_offsets, offset)
+
+    def line_text(self, number: int) -> str:
+        """Return the text of a 1-based line number"""
+        start = self.line_offsets[number - 1]
+        if number < len(self.line_offsets):
+            return self.text[start:self.line_offsets[number] - 1]
+        return self.text[start:]
+
+
+class DocCorpus:
+    """All markdown documents below a directory, loaded once"""
+
+    def __init__(self, docs_dir: Path, root: Optional[Path] = None,
+                 pattern: str = "**/*.md",
+                 preloaded: Optional[Dict[str, Document]] = None):
+        """preloaded maps absolute paths to already parsed documents (e.g. the
+        docs daemon's in-memory corpus); those files are not read again."""
+        self.docs_dir = Path(docs_dir)
+        self.root = Path(root) if root is not None else self.docs_dir.parent
+        self.documents: List[Document] = [
+            self._document(path, preloaded)
+            for path in sorted(self.docs_dir.glob(pattern))
+        ]
+        self._by_path: Dict[Path, Document] = {
+            doc.path.resolve(): doc for doc in self.documents
+        }
+
+    def _document(self, path: Path, preloaded: Optional[Dict[str, Document]]) -> Document:
+        doc = preloaded.get(str(path.resolve())) if preloaded else None
+        if doc is None:
+            return Document(path, self.root)
+        # Same parse, but paths reported relative to this corpus' root
+        doc = copy.copy(doc)
+        doc.path = path
+        try:
+            doc.relative_path = path.relative_to(self.root)
+        except ValueError:
+            doc.relative_path = path
+        return doc
+
+    def __iter__(self) -> Iterator[Document]:
+        return iter(self.documents)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def get(self, path: Path) -> Optional[Document]:
+        """Return the loaded document for a path, if it belongs to the corpus"""
+        return self._by_path.get(Path(path).resolve())
+
+    @property
+    def stems(self) -> set:
+        """File stems of every document (used for cross-reference checks)"""
+        return {doc.path.stem for doc in self.documents}
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Markdown Section Index
+Heading index with byte offsets and batched section extract/replace for
+lib/doc_section_extractor.sh
+
+Usage:
+    ai-workflow-docs doc-sections [--cache DIR | --no-cache] index FILE
+    ai-workflow-docs doc-sections ... extract [--with-heading] FILE SECTION
+    ai-workflow-docs doc-sections ... exists FILE SECTION
+    ai-workflow-docs doc-sections ... level FILE SECTION
+    ai-workflow-docs doc-sections ... replace FILE SECTION [CONTENT_FILE]
+    ai-workflow-docs doc-sections ... batch < operations
+
+The shell functions rescan a document from the top with awk (or a grep/sed
+pipeline per heading) for every section they touch, so updating many
+sections of one file costs a full scan each. Here a document is parsed
+once into its headings, each with the byte offsets of the heading line,
+the section body and the section end (the next heading of the same or a
+higher level). Indexes are cached under .ai_workflow/cache/doc_sections,
+keyed by the SHA-256 of the file content.
+
+Sections match as in the shell: a heading is a line of "#"s followed by
+whitespace, and its id is the heading text with every character outside
+[a-zA-Z0-9-] turned into "-", runs of "-" squeezed, leading/trailing "-"
+trimmed and lowercased. `exists` and `level` only consider "## " headings
+and deeper, like section_exists and get_section_level. `extract` prints
+the first section with the id, without its heading line unless
+--with-heading. `replace` rewrites every section with the id as
+replace_doc_section does: heading line, new content, blank line. Content
+comes from CONTENT_FILE or stdin and is written byte for byte.
+
+`batch` reads one tab-separated operation per line:
+    extract FILE SECTION OUTPUT_FILE
+    exists  FILE SECTION
+    level   FILE SECTION
+    replace FILE SECTION CONTENT_FILE
+Operations run in order against the documents in memory, so an extract
+after a replace sees the new content. Each changed document is written
+once at the end, atomically. One line is printed per operation:
+"ok|missing|error<TAB>op<TAB>file<TAB>section", with the heading level
+appended for `level`.
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+
+# Persistent section indexes (relative to the working directory)
+CACHE_DIR = os.path.join(".ai_workflow", "cache", "doc_sections")
+# Bump when the index layout changes to discard old indexes
+INDEX_VERSION = "1.0.0"
+# Oldest indexes are removed beyond this many
+MAX_CACHE_ENTRIES = 512
+
+# /^#+[[:space:]]/ of the awk scripts, one match per heading line
+HEADING = re.compile(rb"^(#+)[ \t\r\v\f][^\n]*", re.M)
+NOT_ID = re.compile(r"[^a-zA-Z0-9-]")
+DASHES = re.compile(r"--+")
+
+OPERATIONS = {"extract": 4, "exists": 3, "level": 3, "replace": 4}
+
+# Heading fields
+LEVEL, SLUG, STRICT, START, BODY = range(5)
+
+
+def section_id(text: str) -> str:
+    """Anchor id of a heading or section argument, as the shell normalizes it"""
+    return DASHES.sub("-", NOT_ID.sub("-", text)).strip("-").lower()
+
+
+def parse_headings(data: bytes, offset: int = 0) -> list:
+    """[level, id, strict, start, body] of every heading line
+
+    strict marks the "## " headings section_exists and get_section_level
+    see; start is the offset of the heading line and body that of the line
+    after it.
+    """
+    headings = []
+    size = len(data)
+    for match in HEADING.finditer(data):
+        level = len(match.group(1))
+        text = data[match.start() + level:match.end()].decode("utf-8", "surrogateescape")
+        strict = level >= 2 and data[match.start() + level] == 0x20
+        body = min(match.end() + 1, size)
+        headings.append([level, section_id(text), strict, match.start() + offset, body + offset])
+    return headings
+
+
+def section_ends(headings: list, size: int) -> list:
+    """Offset where each section ends: the next heading of the same or a higher level"""
+    ends = [size] * len(headings)
+    open_sections = []
+    for index, heading in enumerate(headings):
+        while open_sections and headings[open_sections[-1]][LEVEL] >= heading[LEVEL]:
+            ends[open_sections.pop()] = heading[START]
+        open_sections.append(index)
+    return ends
+
+
+def with_newline(data: bytes) -> bytes:
+    # awk prints every record with a newline, including an unterminated last line
+    return data + b"\n" if data and not data.endswith(b"\n") else data
+
+
+class IndexCache:
+    """Section indexes on disk, one JSON file per content hash"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.directory, digest + ".json")
+
+    def load(self, digest: str):
+        try:
+            with open(self._path(digest), encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data.get("headings") if data.get("version") == INDEX_VERSION else None
+
+    def store(self, digest: str, headings: list) -> None:
+        path = self._path(digest)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            write_atomic(path, json.dumps({"version": INDEX_VERSION, "headings": headings}).encode())
+            self._prune()
+        except OSError:
+            pass   # the cache is an optimization only
+
+    def _prune(self) -> None:
+        entries = [entry for entry in os.scandir(self.directory) if entry.name.endswith(".json")]
+        if len(entries) <= MAX_CACHE_ENTRIES:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+        for entry in entries[:len(entries) - MAX_CACHE_ENTRIES]:
+            try:
+                os.unlink(entry.path)
+            except OSError:
+                pass
+
+
+def write_atomic(path: str, data: bytes, mode=None) -> None:
+    """Write through a temporary file in the same directory and rename it over path"""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666 if mode is None else mode)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        if mode is not None:
+            os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+class Document:
+    """A markdown file in memory with its heading index"""
+
+    def __init__(self, path: str, data: bytes, headings: list):
+        self.path = path
+        self.data = data
+        self.headings = headings
+        self.ends = section_ends(headings, len(data))
+        self.changed = False
+
+    @classmethod
+    def load(cls, path: str, cache=None) -> "Document":
+        with open(path, "rb") as f:
+            data = f.read()
+        if cache is None:
+            return cls(path, data, parse_headings(data))
+        digest = hashlib.sha256(data).hexdigest()
+        headings = cache.load(digest)
+        if headings is None:
+            headings = parse_headings(data)
+            cache.store(digest, headings)
+        return cls(path, data, headings)
+
+    def find(self, section: str, strict: bool = False) -> int:
+        """Index of the first heading with the section's id, or -1"""
+        slug = section_id(section[1:] if section.startswith("#") else section)
+        for index, heading in enumerate(self.headings):
+            if heading[SLUG] == slug and (heading[STRICT] or not strict):
+                return index
+        return -1
+
+    def level(self, section: str) -> int:
+        index = self.find(section, strict=True)
+        return self.headings[index][LEVEL] if index >= 0 else 0
+
+    def extract(self, section: str, with_heading: bool = False):
+        """Section bytes, or None when no heading has the id"""
+        index = self.find(section)
+        if index < 0:
+            return None
+        heading = self.headings[index]
+        return with_newline(self.data[heading[START if with_heading else BODY]:self.ends[index]])
+
+    def replace(self, section: str, content: bytes) -> bool:
+        """Replace the body of every (outermost) section with the id"""
+        slug = section_id(section[1:] if section.startswith("#") else section)
+        matches = []
+        covered = -1
+        for index, heading in enumerate(self.headings):
+            if heading[SLUG] == slug and heading[START] >= covered:
+                matches.append(index)
+                covered = self.ends[index]
+        # From the last section back, so earlier offsets stay valid
+        for index in reversed(matches):
+            self._splice(index, content)
+        if matches:
+            self.ends = section_ends(self.headings, len(self.data))
+            self.changed = True
+        return bool(matches)
+
+    def _splice(self, index: int, content: bytes) -> None:
+        heading = self.headings[index]
+        start, end = heading[START], self.ends[index]
+        block = with_newline(self.data[start:heading[BODY]]) + content + b"\n\n"
+        self.data = self.data[:start] + block + self.data[end:]
+        # Headings of the old section give way to those of the new block
+        # (the heading line itself, and any in the content); later ones shift
+        delta = len(block) - (end - start)
+        after = self.headings[index:]
+        following = [heading for heading in after if heading[START] >= end]
+        for heading in following:
+            heading[START] += delta
+            heading[BODY] += delta
+        self.headings[index:] = parse_headings(block, start) + following
+
+    def save(self, cache=None) -> None:
+        if not self.changed:
+            return
+        self.data = with_newline(self.data)
+        write_atomic(self.path, self.data, os.stat(self.path).st_mode & 0o7777)
+        self.changed = False
+        if cache is not None:
+            # The next call finds the rewritten document already indexed
+            cache.store(hashlib.sha256(self.data).hexdigest(), self.headings)
+
+
+def read_operations(stream) -> list:
+    """(op, file, section, path) tuples of a batch, validated before anything runs"""
+    operations = []
+    for number, line in enumerate(stream.read().split(b"\n"), 1):
+        line = line.rstrip(b"\r")
+        if not line.strip():
+            continue
+        fields = [os.fsdecode(field) for field in line.split(b"\t")]
+        op = fields[0]
+        if op not in OPERATIONS:
+            raise ValueError(f"line {number}: unknown operation: {op}")
+        if len(fields) < OPERATIONS[op]:
+            raise ValueError(f"line {number}: {op} needs {OPERATIONS[op] - 1} fields")
+        operations.append((op, fields[1], fields[2], fields[3] if len(fields) > 3 else ""))
+    return operations
+
+
+def run_batch(operations: list, cache=None, out=None) -> int:
+    """Run batch operations, write the changed documents and report each operation"""
+    out = out or sys.stdout
+    documents = {}
+    failed = False
+    for op, path, section, extra in operations:
+        suffix = ""
+        try:
+            if path not in documents:
+                documents[path] = None   # until it has been read
+                documents[path] = Document.load(path, cache)
+            document = documents[path]
+            if document is None:
+                raise OSError(f"cannot read {path}")
+            if op == "exists":
+                found = document.find(section, strict=True) >= 0
+            elif op == "level":
+                level = document.level(section)
+                found = level > 0
+                suffix = f"\t{level}"
+            elif op == "extract":
+                content = document.extract(section)
+                found = content is not None
+                with open(extra, "wb") as f:
+                    f.write(content or b"")
+            else:
+                with open(extra, "rb") as f:
+                    found = document.replace(section, f.read())
+            result = "ok" if found else "missing"
+        except OSError:
+            result = "error"
+            failed = True
+        out.write(f"{result}\t{op}\t{path}\t{section}{suffix}\n")
+
+    for path, document in documents.items():
+        if document is None:
+            continue
+        try:
+            document.save(cache)
+        except OSError as e:
+            print(f"Error: cannot write {path}: {e}", file=sys.stderr)
+            failed = True
+    return 1 if failed else 0
+
+
+def parse_args(argv=None):
+    # Imported here: the documentation step queries sections many times
+    import argparse
+    parser = argparse.ArgumentParser(description="Index markdown sections and extract or replace them")
+    cache = parser.add_mutually_exclusive_group()
+    cache.add_argument("--cache", default=CACHE_DIR, metavar="DIR",
+                       help=f"Section index cache directory (default: {CACHE_DIR})")
+    cache.add_argument("--no-cache", action="store_true", help="Parse documents without the index cache")
+    commands = parser.add_subparsers(dest="command", required=True)
+    index = commands.add_parser("index", help="Print level, id, start, body and end offsets of every heading")
+    index.add_argument("file")
+    extract = commands.add_parser("extract", help="Print a section (nothing when it does not exist)")
+    extract.add_argument("--with-heading", action="store_true", help="Include the heading line")
+    extract.add_argument("file")
+    extract.add_argument("section")
+    for name, summary in (("exists", "Exit 0 when a ## section exists"),
+                          ("level", "Print the level of a ## section (0 when missing)")):
+        query = commands.add_parser(name, help=summary)
+        query.add_argument("file")
+        query.add_argument("section")
+    replace = commands.add_parser("replace", help="Replace the content of a section")
+    replace.add_argument("file")
+    replace.add_argument("section")
+    replace.add_argument("content_file", nargs="?", help="New content (default: stdin)")
+    commands.add_parser("batch", help="Run tab-separated operations from stdin")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    cache = None if args.no_cache else IndexCache(args.cache)
+
+    if args.command == "batch":
+        try:
+            operations = read_operations(sys.stdin.buffer)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+        return run_batch(operations, cache)
+
+    try:
+        document = Document.load(args.file, cache)
+        if args.command == "replace":
+            if args.content_file:
+                with open(args.content_file, "rb") as f:
+                    content = f.read()
+            else:
+                content = sys.stdin.buffer.read()
+            document.replace(args.section, content)
+            # replace_doc_section fails rather than leave an empty file
+            if not document.data:
+                return 1
+            document.save(cache)
+            return 0
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    if args.command == "index":
+        lines = [f"{heading[LEVEL]}\t{heading[SLUG]}\t{heading[START]}\t{heading[BODY]}\t{end}\n"
+                 for heading, end in zip(document.headings, document.ends)]
+        sys.stdout.write("".join(lines))
+    elif args.command == "extract":
+        sys.stdout.buffer.write(document.extract(args.section, args.with_heading) or b"")
+    elif args.command == "exists":
+        return 0 if document.find(args.section, strict=True) >= 0 else 1
+    else:
+        level = document.level(args.section)
+        print(level)
+        return 0 if level else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
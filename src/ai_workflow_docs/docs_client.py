@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Documentation Daemon Client
+Sends one command to docs_daemon.py and prints its output
+
+Usage:
+    ai-workflow-docs client [--socket PATH] [--json] [--fallback] COMMAND [ARGS...]
+
+Examples:
+    ai-workflow-docs client check_doc_links docs
+    ai-workflow-docs client validate_context_blocks 'prompts/**/*.yaml'
+    ai-workflow-docs client function init_ai_cache
+    ai-workflow-docs client --fallback validate_api_docs docs/api
+
+Exits with the command's exit code. When no daemon is listening it exits 69
+(EX_UNAVAILABLE), or with --fallback runs the tool module directly instead.
+Only the standard library's socket/json are imported so start-up stays cheap.
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import json
+import os
+import socket
+import sys
+
+SOCKET_PATH = os.path.join(".ai_workflow", "run", "docs_daemon.sock")
+EX_UNAVAILABLE = 69
+
+# Directory holding the ai_workflow_docs package, for running tools with --fallback
+PACKAGE_PARENT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Daemon tool commands, each run by --fallback as `python -m ai_workflow_docs.<command>`
+TOOL_COMMANDS = ("check_doc_links", "validate_api_docs", "validate_context_blocks",
+                 "extract_api_docs", "enhance_api_docs")
+
+USAGE = "Usage: ai-workflow-docs client [--socket PATH] [--json] [--fallback] COMMAND [ARGS...]"
+
+
+def request(socket_path: str, command: str, args: list) -> dict:
+    """Send one request and return the decoded response"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        payload = {"command": command, "args": args, "cwd": os.getcwd()}
+        sock.sendall(json.dumps(payload).encode('utf-8') + b"\n")
+        sock.shutdown(socket.SHUT_WR)
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return json.loads(b"".join(chunks))
+
+
+def main(argv=None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    socket_path = os.environ.get("DOCS_DAEMON_SOCKET") or SOCKET_PATH
+    as_json = fallback = False
+    while argv and argv[0].startswith("--"):
+        option = argv.pop(0)
+        if option == "--socket" and argv:
+            socket_path = argv.pop(0)
+        elif option == "--json":
+            as_json = True
+        elif option == "--fallback":
+            fallback = True
+        else:
+            print(USAGE, file=sys.stderr)
+            return 2
+    if not argv:
+        print(USAGE, file=sys.stderr)
+        return 2
+    command, args = argv[0], argv[1:]
+
+    try:
+        response = request(socket_path, command, args)
+    except (OSError, ValueError) as e:
+        if fallback and command in TOOL_COMMANDS:
+            env = dict(os.environ)
+            env["PYTHONPATH"] = os.pathsep.join(filter(None, [PACKAGE_PARENT, env.get("PYTHONPATH")]))
+            os.execve(sys.executable,
+                      [sys.executable, "-m", f"ai_workflow_docs.{command}"] + args, env)
+        print(f"docs daemon unavailable at {socket_path}: {e}", file=sys.stderr)
+        return EX_UNAVAILABLE
+
+    if as_json:
+        print(json.dumps(response.get("result"), indent=2))
+    else:
+        sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    return response.get("exit_code", 1)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,710 @@
+#!/usr/bin/env python3
+"""
+Documentation Tooling Daemon
+Keeps parsed docs and the shell function index in memory and serves the doc tools over a Unix socket
+
+Usage:
+    ai-workflow-docs daemon [--root DIR] [--socket PATH] [--poll SECONDS] [--force-polling]
+    ai-workflow-docs client check_doc_links docs
+
+At start-up every markdown file under the root is tokenized (doc_corpus), a
+path index is built (check_doc_links.PathIndex) and every library shell
+module is parsed for functions (extract_api_docs). A watcher thread keeps
+that state current: inotify through ctypes on Linux, or a periodic mtime
+scan where inotify is unavailable or its watch limit is reached. Only the
+files that changed are re-parsed. Each request first applies the changes
+the watcher has queued (reading any inotify events still pending, or
+rescanning when polling), and the broken_links/heading_spacing queries
+re-read listed documents whose mtime or size differs from the parsed copy,
+so an edit made just before a query is never answered from stale state.
+Directories in SKIP_DIRS are neither watched nor indexed; links into them
+are checked on disk.
+
+Requests arrive as one JSON line per connection on a Unix socket:
+    {"command": "check_doc_links", "args": ["docs"], "cwd": "/path"}
+and are answered with one JSON line:
+    {"exit_code": 0, "stdout": "...", "stderr": "...", "result": ...}
+
+Tool commands (same arguments and output as the scripts):
+    check_doc_links, validate_api_docs, validate_context_blocks,
+    extract_api_docs, enhance_api_docs
+Queries:
+    ping, function NAME, headings FILE,
+    broken_links [ROOT | --files FILE...],
+    heading_spacing [ROOT | --files FILE...], reload, shutdown
+
+Requests are handled one at a time: tools print to the process-wide stdout
+and resolve paths against the client's working directory.
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import argparse
+import contextlib
+import ctypes
+import ctypes.util
+import fnmatch
+import io
+import json
+import os
+import re
+import select
+import signal
+import socket
+import socketserver
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from . import check_doc_links, enhance_api_docs, extract_api_docs
+from . import validate_api_docs, validate_context_blocks
+from .doc_corpus import DocCorpus, Document
+from .prompt_rules import RuleSet
+from .reporter import BLUE, GREEN, NC, RED, reporting
+
+SOCKET_PATH = Path(".ai_workflow/run/docs_daemon.sock")
+POLL_INTERVAL = 2.0
+DEBOUNCE = 0.05
+
+# Directories that are not watched, indexed or parsed as project docs
+SKIP_DIRS = {'.git', 'node_modules', 'venv', '.venv', 'vendor', 'build', 'dist',
+             '.ai_workflow', '.link_cache', '__pycache__'}
+
+# The markdown lint and documentation steps' shell checks, for the queries
+MISSING_HEADING_SPACE_RE = re.compile(rb'^#[^# \n]', re.MULTILINE)
+LINE_LINK_RE = re.compile(r'\[.*\]\((.*)\)')
+
+
+# ==============================================================================
+# IN-MEMORY STATE
+# ==============================================================================
+
+class DocState:
+    """Parsed documents, path index and shell function index for one project root"""
+
+    def __init__(self, root: Path):
+        self.root = os.path.abspath(root)
+        self.module_dirs = {os.path.join(self.root, d) for d in extract_api_docs.DEFAULT_ROOTS}
+        self.documents: Dict[str, Document] = {}
+        # (mtime_ns, size) of each document when it was parsed
+        self.stats: Dict[str, Tuple[int, int]] = {}
+        self.modules: Dict[str, List[extract_api_docs.Function]] = {}
+        self.functions: Dict[str, List[Tuple[str, int, bool]]] = {}
+        self.prompt_caches: Dict[Optional[Path], validate_context_blocks.PromptCache] = {}
+        self.rule_sets: Dict[str, Tuple[int, RuleSet]] = {}
+        self.updates = 0
+        self.load()
+
+    def load(self) -> None:
+        """(Re)build all state from a full walk of the root"""
+        self.path_index = check_doc_links.PathIndex(self.root, SKIP_DIRS)
+        self.documents = {}
+        self.stats = {}
+        self.modules = {}
+        for path in self.path_index.paths:
+            self._index_file(path)
+        self._rebuild_functions()
+
+    def _skipped(self, path: str) -> bool:
+        relative = os.path.relpath(path, self.root)
+        return any(part in SKIP_DIRS for part in relative.split(os.sep)[:-1])
+
+    def _is_module(self, path: str) -> bool:
+        name = os.path.basename(path)
+        return os.path.dirname(path) in self.module_dirs \
+            and any(fnmatch.fnmatch(name, g) for g in extract_api_docs.DEFAULT_GLOBS) \
+            and not any(fnmatch.fnmatch(name, e) for e in extract_api_docs.DEFAULT_EXCLUDES)
+
+    def _index_file(self, path: str) -> bool:
+        """Parse a file if it is a document or a shell module. Returns True if it was"""
+        if path.endswith('.md') and not self._skipped(path) and os.path.isfile(path):
+            stat = os.stat(path)
+            self.stats[path] = (stat.st_mtime_ns, stat.st_size)
+            self.documents[path] = Document(Path(path), Path(self.root))
+            return True
+        if self._is_module(path) and os.path.isfile(path):
+            self.modules[path] = extract_api_docs.parse_module(Path(path))[1]
+            return True
+        return False
+
+    def _forget(self, path: str) -> bool:
+        """Drop a deleted path (and everything below it). Returns True if state changed"""
+        prefix = path + os.sep
+        gone = {p for p in self.path_index.paths if p == path or p.startswith(prefix)}
+        self.path_index.paths -= gone
+        changed = False
+        for table in (self.documents, self.stats, self.modules):
+            for p in [p for p in table if p in gone]:
+                del table[p]
+                changed = True
+        return changed
+
+    def _rebuild_functions(self) -> None:
+        functions: Dict[str, List[Tuple[str, int, bool]]] = {}
+        for path in sorted(self.modules):
+            location = os.path.relpath(path, self.root)
+            for name, line, comments in self.modules[path]:
+                functions.setdefault(name, []).append((location, line, bool(comments)))
+        self.functions = functions
+
+    def apply(self, paths: Set[str]) -> None:
+        """Bring state up to date for changed, created or deleted paths"""
+        modules_changed = False
+        for path in sorted(paths):
+            if not SKIP_DIRS.isdisjoint(os.path.relpath(path, self.root).split(os.sep)):
+                continue  # not indexed: lookups below skipped directories probe the disk
+            if os.path.isdir(path) and not os.path.islink(path):
+                self.path_index.paths.add(path)
+                for dirpath, dirnames, filenames in os.walk(path):
+                    dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+                    for name in dirnames + filenames:
+                        full = os.path.join(dirpath, name)
+                        self.path_index.paths.add(full)
+                        modules_changed |= self._index_file(full) and self._is_module(full)
+            elif os.path.lexists(path):
+                self.path_index.paths.add(path)
+                modules_changed |= self._index_file(path) and self._is_module(path)
+            else:
+                modules_changed |= self._forget(path) and os.path.dirname(path) in self.module_dirs
+            self.updates += 1
+        if modules_changed:
+            self._rebuild_functions()
+
+    def refresh(self, paths: List[str]) -> None:
+        """Re-parse (or drop) documents whose mtime or size no longer matches the parsed copy
+
+        Lets a query answer correctly for files changed after the watcher's
+        last batch (or between polling scans).
+        """
+        stale = set()
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                if path in self.documents:
+                    stale.add(path)
+                continue
+            if path.endswith('.md') and self.stats.get(path) != (stat.st_mtime_ns, stat.st_size) \
+                    and (path == self.root or path.startswith(self.root + os.sep)):
+                stale.add(path)
+        if stale:
+            self.apply(stale)
+
+    def prompt_cache(self, cache_dir: Optional[Path]) -> validate_context_blocks.PromptCache:
+        cache = self.prompt_caches.get(cache_dir)
+        if cache is None:
+            cache = self.prompt_caches[cache_dir] = validate_context_blocks.PromptCache(cache_dir)
+        return cache
+
+    def rules(self, rules_file: Path) -> RuleSet:
+        """Compiled rule set, reloaded only when the YAML file changes"""
+        key = os.path.abspath(rules_file)
+        mtime = os.stat(key).st_mtime_ns
+        cached = self.rule_sets.get(key)
+        if cached is None or cached[0] != mtime:
+            cached = self.rule_sets[key] = (mtime, RuleSet.from_yaml(Path(key)))
+        return cached[1]
+
+
+# ==============================================================================
+# FILESYSTEM WATCHERS
+# ==============================================================================
+
+class InotifyWatcher:
+    """Recursive inotify watches via ctypes (Linux)"""
+
+    name = "inotify"
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ISDIR = 0x40000000
+    IN_NONBLOCK = os.O_NONBLOCK
+    IN_CLOEXEC = 0o2000000
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+    EVENT = struct.Struct('iIII')
+
+    def __init__(self, root: str):
+        if not sys.platform.startswith('linux'):
+            raise OSError("inotify is only available on Linux")
+        self.root = root
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c') or None, use_errno=True)
+        self.fd = self.libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches: Dict[int, str] = {}
+        self._stop = threading.Event()
+        # Events read but not yet applied; drain() hands them over
+        self.lock = threading.Lock()
+        self.pending: Set[str] = set()
+        self.overflowed = False
+        self.add_tree(root)
+
+    def add_tree(self, top: str) -> None:
+        """Watch a directory and every directory below it"""
+        for dirpath, dirnames, _ in os.walk(top):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(dirpath), self.MASK)
+            if wd < 0:
+                # ENOSPC: fs.inotify.max_user_watches reached
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {dirpath}")
+            self.watches[wd] = dirpath
+
+    def _read(self) -> Tuple[Set[str], bool]:
+        """Drain pending events. Returns (changed paths, overflowed)"""
+        changed: Set[str] = set()
+        overflow = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changed, overflow
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = self.EVENT.unpack_from(data, offset)
+                name = data[offset + self.EVENT.size:offset + self.EVENT.size + length].rstrip(b'\0')
+                offset += self.EVENT.size + length
+                if mask & self.IN_Q_OVERFLOW:
+                    overflow = True
+                    continue
+                if mask & self.IN_IGNORED:
+                    self.watches.pop(wd, None)
+                    continue
+                directory = self.watches.get(wd)
+                if directory is None:
+                    continue
+                path = os.path.join(directory, os.fsdecode(name)) if name else directory
+                changed.add(path)
+                if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO) \
+                        and os.path.basename(path) not in SKIP_DIRS:
+                    self.add_tree(path)
+
+    def _collect(self) -> None:
+        """Move pending events into the pending set"""
+        with self.lock:
+            changed, overflow = self._read()
+            self.pending |= changed
+            self.overflowed |= overflow
+
+    def drain(self) -> Tuple[Set[str], bool]:
+        """Read queued events and hand over every change not yet applied
+
+        Returns (changed paths, overflowed). Events are only ever held in
+        the pending set, so a change is either handed over here or still
+        queued in the kernel, never in flight.
+        """
+        with self.lock:
+            if not self._stop.is_set():
+                changed, overflow = self._read()
+                self.pending |= changed
+                self.overflowed |= overflow
+            changed, overflow = self.pending, self.overflowed
+            self.pending, self.overflowed = set(), False
+        return changed, overflow
+
+    def run(self, callback: Callable[[], None]) -> None:
+        """Call back with debounced batches of changes (collected by drain()) until stopped"""
+        while not self._stop.is_set():
+            ready, _, _ = select.select([self.fd], [], [], 0.5)
+            if not ready:
+                continue
+            self._collect()
+            # Let a burst of writes (e.g. git checkout) settle into one batch
+            while select.select([self.fd], [], [], DEBOUNCE)[0]:
+                self._collect()
+            callback()
+        with self.lock:
+            os.close(self.fd)
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+class PollingWatcher:
+    """Fallback watcher: compares (mtime, size) snapshots every interval"""
+
+    name = "polling"
+
+    def __init__(self, root: str, interval: float = POLL_INTERVAL):
+        self.root = root
+        self.interval = interval
+        self._stop = threading.Event()
+        self.lock = threading.Lock()
+        self.snapshot = self._scan()
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            for name in dirnames + filenames:
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.lstat(path)
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def drain(self) -> Tuple[Set[str], bool]:
+        """Rescan and hand over every change since the previous scan
+
+        There is no event queue to read, so a request always pays for one
+        scan rather than being answered from a snapshot up to an interval old.
+        """
+        with self.lock:
+            current = self._scan()
+            changed = {p for p, state in current.items() if self.snapshot.get(p) != state}
+            changed |= self.snapshot.keys() - current.keys()
+            self.snapshot = current
+        return changed, False
+
+    def run(self, callback: Callable[[], None]) -> None:
+        """Call back every interval until stopped; drain() does the scan"""
+        while not self._stop.wait(self.interval):
+            callback()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+def create_watcher(root: str, poll_interval: float, force_polling: bool):
+    """inotify where possible, polling otherwise"""
+    if not force_polling:
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError) as e:
+            print(f"{BLUE}ℹ{NC} inotify unavailable ({e}); polling every {poll_interval}s")
+    return PollingWatcher(root, poll_interval)
+
+
+# ==============================================================================
+# REQUEST HANDLING
+# ==============================================================================
+
+class DocDaemon:
+    """Dispatches client requests against the in-memory state"""
+
+    def __init__(self, root: Path, poll_interval: float = POLL_INTERVAL, force_polling: bool = False):
+        start = time.perf_counter()
+        self.state = DocState(root)
+        self.load_time = time.perf_counter() - start
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.requests = 0
+        self.watcher = create_watcher(self.state.root, poll_interval, force_polling)
+        self.server: Optional[socketserver.BaseServer] = None
+
+        self.tools: Dict[str, Callable[[List[str]], Optional[int]]] = {
+            "check_doc_links": self._check_doc_links,
+            "validate_api_docs": self._validate_api_docs,
+            "validate_context_blocks": self._validate_context_blocks,
+            "extract_api_docs": extract_api_docs.main,
+            "enhance_api_docs": enhance_api_docs.main,
+        }
+        self.queries: Dict[str, Callable[[List[str]], Tuple[int, object, str]]] = {
+            "ping": self._ping,
+            "function": self._function,
+            "headings": self._headings,
+            "broken_links": self._broken_links,
+            "heading_spacing": self._heading_spacing,
+            "reload": self._reload,
+        }
+
+    def on_change(self) -> None:
+        with self.lock:
+            self._sync()
+
+    def _sync(self) -> None:
+        """Apply the changes the watcher has seen; the caller holds self.lock"""
+        paths, rescan = self.watcher.drain()
+        if rescan:
+            self.state.load()
+        elif paths:
+            self.state.apply(paths)
+
+    def handle(self, request: dict) -> dict:
+        """Run one request; never raises"""
+        command = request.get("command", "")
+        args = [str(a) for a in request.get("args", [])]
+        cwd = request.get("cwd") or self.state.root
+
+        with self.lock:
+            self.requests += 1
+            previous_cwd = os.getcwd()
+            stdout, stderr = io.StringIO(), io.StringIO()
+            result = None
+            try:
+                os.chdir(cwd)
+                with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                    self._sync()
+                    if command in self.tools:
+                        exit_code = self.tools[command](args)
+                    elif command in self.queries:
+                        exit_code, result, text = self.queries[command](args)
+                        print(text, end="")
+                    else:
+                        print(f"Error: unknown command: {command}", file=sys.stderr)
+                        exit_code = 2
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+                if not isinstance(e.code, (int, type(None))):
+                    stderr.write(f"{e.code}\n")
+            except Exception as e:  # a failing tool must not take the daemon down
+                stderr.write(f"Error: {command} failed: {type(e).__name__}: {e}\n")
+                exit_code = 1
+            finally:
+                os.chdir(previous_cwd)
+
+        return {"exit_code": exit_code or 0, "stdout": stdout.getvalue(),
+                "stderr": stderr.getvalue(), "result": result}
+
+    # Tools -----------------------------------------------------------------
+
+    def _check_doc_links(self, argv: List[str]) -> int:
+        """check_doc_links.py using the shared path index and parsed documents"""
+        args = check_doc_links.parse_args(argv)
+        project_root = os.path.abspath(Path(args.docs_dir).parent)
+        index = self.state.path_index if project_root == self.state.root else None
+        if index is not None:
+            index.lookups = index.probes = 0
+        checker = check_doc_links.create_checker(args, index)
+        if index is not None:
+            checker.documents = dict(self.state.documents)
+        # Everything is already in memory, so a worker pool would only add start-up cost
+        with reporting(checker, args, "check-links"):
+            return checker.validate_all(jobs=1)
+
+    def _validate_api_docs(self, argv: List[str]) -> int:
+        args = validate_api_docs.parse_args(argv)
+        try:
+            # Only this request's plugins, not every module an earlier request loaded
+            checks = validate_api_docs.load_plugins(args.plugin)
+        except ImportError as e:
+            print(f"Error: Could not load plugin: {e}", file=sys.stderr)
+            return 2
+        validator = validate_api_docs.APIDocValidator(args.docs_dir, checks)
+        if validator.docs_dir.exists():
+            validator.corpus = DocCorpus(validator.docs_dir, preloaded=self.state.documents)
+        with reporting(validator, args, "validate-api"):
+            return validator.validate_all()
+
+    def _validate_context_blocks(self, argv: List[str]) -> int:
+        """validate_context_blocks.py with a parse cache and rule set kept across requests"""
+        args = validate_context_blocks.parse_args(argv)
+        yaml_files = validate_context_blocks.expand_paths(args.paths)
+        if not yaml_files:
+            print(f"Error: File not found: {' '.join(args.paths)}")
+            return 2
+        try:
+            required = validate_context_blocks.required_prompts(args)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return 2
+        cache = self.state.prompt_cache(args.cache_dir.resolve() if args.cache else None)
+        return validate_context_blocks.validate_files(yaml_files, cache, self.state.rules(args.rules),
+                                                      required)
+
+    # Queries ---------------------------------------------------------------
+
+    def _ping(self, argv: List[str]) -> Tuple[int, object, str]:
+        info = {
+            "root": self.state.root,
+            "watcher": self.watcher.name,
+            "documents": len(self.state.documents),
+            "modules": len(self.state.modules),
+            "functions": sum(len(v) for v in self.state.functions.values()),
+            "paths": len(self.state.path_index.paths),
+            "updates": self.state.updates,
+            "requests": self.requests,
+            "uptime": round(time.time() - self.started, 1),
+            "load_time": round(self.load_time, 3),
+        }
+        text = "".join(f"{key}: {value}\n" for key, value in info.items())
+        return 0, info, text
+
+    def _function(self, argv: List[str]) -> Tuple[int, object, str]:
+        """Where is a shell function defined, and is it documented"""
+        if not argv:
+            return 2, None, "Usage: function NAME\n"
+        matches = [{"module": m, "line": line, "documented": documented}
+                   for m, line, documented in self.state.functions.get(argv[0], [])]
+        text = "".join(f"{m['module']}:{m['line']}{'' if m['documented'] else ' (undocumented)'}\n"
+                       for m in matches)
+        return (0 if matches else 1), matches, text
+
+    def _headings(self, argv: List[str]) -> Tuple[int, object, str]:
+        if not argv:
+            return 2, None, "Usage: headings FILE\n"
+        doc = self.state.documents.get(os.path.abspath(argv[0]))
+        if doc is None:
+            return 1, None, f"Not a tracked markdown file: {argv[0]}\n"
+        headings = [{"level": h.level, "text": h.text, "line": h.line} for h in doc.headings]
+        result = {"headings": headings, "anchors": sorted(doc.anchors)}
+        text = "".join(f"{h['line']}: {'#' * h['level']} {h['text']}\n" for h in headings)
+        return 0, result, text
+
+    def _listed_files(self, argv: List[str]) -> Optional[List[Tuple[str, bytes]]]:
+        """(name, contents) for `--files NAME...`, or for the corpus documents under ROOT
+
+        Listed files are served from the corpus when it holds them and read
+        from disk otherwise, so the answer does not depend on SKIP_DIRS.
+        """
+        if argv[:1] == ["--files"]:
+            names = argv[1:]
+            self.state.refresh([os.path.abspath(name) for name in names])
+        else:
+            top = os.path.abspath(argv[0] if argv else ".")
+            if top != self.state.root and not top.startswith(self.state.root + os.sep):
+                return None
+            prefix = top.rstrip(os.sep) + os.sep
+            self.state.refresh([p for p in self.state.documents if p.startswith(prefix)])
+            names = [f"./{self.state.documents[p].relative_path.as_posix()}"
+                     for p in sorted(self.state.documents) if p.startswith(prefix)]
+        files = []
+        for name in names:
+            doc = self.state.documents.get(os.path.abspath(name))
+            try:
+                data = doc.data if doc is not None and doc.read_error is None else Path(name).read_bytes()
+            except OSError:
+                continue
+            files.append((name, data))
+        return files
+
+    def _broken_links(self, argv: List[str]) -> Tuple[int, object, str]:
+        """Internal links whose target (relative to the linking file) is missing
+
+        Same rules and report format as the documentation step's shell test:
+        the greedy first link on each line, #anchors not stripped, no
+        code-block skipping.
+        """
+        files = self._listed_files(argv)
+        if files is None:
+            return 69, None, f"Not under the daemon root ({self.state.root})\n"
+        broken = []
+        for name, data in files:
+            # `while read` drops a final line without a newline
+            for line in data.decode('utf-8', 'surrogateescape').split('\n')[:-1]:
+                match = LINE_LINK_RE.search(line)
+                if not match:
+                    continue
+                url = match.group(1)
+                if not url or url.startswith(('http://', 'https://', '#', 'mailto:')):
+                    continue
+                if not os.path.exists(f"{os.path.dirname(name)}/{url}"):
+                    broken.append((name, url))
+        text = "".join(f"⚠️  {path}: Broken link to {url}\n" for path, url in broken)
+        return 0, [{"file": path, "link": url} for path, url in broken], text
+
+    def _heading_spacing(self, argv: List[str]) -> Tuple[int, object, str]:
+        """Files with a '#' heading marker not followed by a space (grep -l "^#[^# ]")"""
+        files = self._listed_files(argv)
+        if files is None:
+            return 69, None, f"Not under the daemon root ({self.state.root})\n"
+        matched = [name for name, data in files if MISSING_HEADING_SPACE_RE.search(data)]
+        return 0, matched, "".join(f"{f}\n" for f in matched)
+
+    def _reload(self, argv: List[str]) -> Tuple[int, object, str]:
+        start = time.perf_counter()
+        self.state.load()
+        return 0, None, f"Reloaded in {time.perf_counter() - start:.2f}s\n"
+
+    # Serving -----------------------------------------------------------------
+
+    def serve(self, socket_path: Path) -> int:
+        socket_path = socket_path.resolve() if not socket_path.is_absolute() else socket_path
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if socket_path.exists():
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(socket_path))
+                print(f"{RED}✗ ERROR{NC}: A daemon is already listening on {socket_path}", file=sys.stderr)
+                return 1
+            except OSError:
+                socket_path.unlink()  # stale socket from a daemon that died
+            finally:
+                probe.close()
+
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                line = self.rfile.readline()
+                shutdown = False
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    response = {"exit_code": 2, "stdout": "", "stderr": "Error: malformed request\n"}
+                else:
+                    if request.get("command") == "shutdown":
+                        response = {"exit_code": 0, "stdout": "Shutting down\n", "stderr": ""}
+                        shutdown = True
+                    else:
+                        response = daemon.handle(request)
+                self.wfile.write(json.dumps(response).encode('utf-8') + b"\n")
+                self.wfile.flush()
+                if shutdown:
+                    threading.Thread(target=daemon.server.shutdown, daemon=True).start()
+
+        old_umask = os.umask(0o077)
+        try:
+            self.server = socketserver.ThreadingUnixStreamServer(str(socket_path), Handler)
+        finally:
+            os.umask(old_umask)
+        self.server.daemon_threads = True
+
+        watcher_thread = threading.Thread(target=self.watcher.run, args=(self.on_change,), daemon=True)
+        watcher_thread.start()
+
+        def stop(signum, frame):
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+        signal.signal(signal.SIGTERM, stop)
+        signal.signal(signal.SIGINT, stop)
+
+        print(f"{GREEN}✓{NC} Docs daemon ready on {socket_path}")
+        print(f"{BLUE}ℹ{NC} {len(self.state.documents)} documents, {len(self.state.modules)} modules, "
+              f"{len(self.state.path_index.paths)} paths loaded in {self.load_time:.2f}s; "
+              f"watching with {self.watcher.name}")
+        sys.stdout.flush()
+        try:
+            self.server.serve_forever()
+        finally:
+            self.watcher.stop()
+            self.server.server_close()
+            with contextlib.suppress(OSError):
+                socket_path.unlink()
+        return 0
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Serve the documentation tools from memory over a Unix socket")
+    parser.add_argument("--root", type=Path, default=Path("."),
+                        help="Project root to load and watch (default: current directory)")
+    parser.add_argument("--socket", type=Path, default=None,
+                        help=f"Socket path (default: $DOCS_DAEMON_SOCKET or <root>/{SOCKET_PATH})")
+    parser.add_argument("--poll", type=float, default=POLL_INTERVAL,
+                        help=f"Polling interval when inotify is unavailable (default: {POLL_INTERVAL}s)")
+    parser.add_argument("--force-polling", action="store_true",
+                        help="Use the polling watcher even where inotify is available")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    socket_path = args.socket or Path(os.environ.get("DOCS_DAEMON_SOCKET") or args.root / SOCKET_PATH)
+    daemon = DocDaemon(args.root, args.poll, args.force_polling)
+    return daemon.serve(socket_path)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+Step Duration Model
+Per-step duration regressions fitted with NumPy on the ML training data of
+lib/ml_optimization.sh
+
+Usage:
+    ai-workflow-docs duration-model [--data FILE] [--model-dir DIR] fit [--if-stale]
+    ai-workflow-docs duration-model [--model-dir DIR] predict FEATURES_JSON STEP... [--total]
+    ai-workflow-docs duration-model [--model-dir DIR] parallel-benefit CHANGE_TYPE
+    ai-workflow-docs duration-model [--model-dir DIR] skip-steps CHANGE_TYPE
+
+ml_optimization.sh used to answer every prediction with `jq -s` over the
+whole training_data.jsonl that record_step_execution appends to: one pass
+per step predicted, two per step for skip recommendations. `fit` reads
+the records into NumPy arrays once, caching them in training_arrays.npz,
+so a refit only parses records appended since the last one. It then fits
+a recency-weighted ridge regression of duration on the
+extract_change_features features for each step. Counts are log1p-scaled
+and the change type is one-hot encoded. Records are weighted
+1 / (age in days + 1), as the jq estimator weighted similar runs. Steps
+with fewer than MIN_FIT_SAMPLES records get their weighted mean.
+
+The fitted coefficients are written to duration_model.json together with
+the per-change-type parallel/serial averages and skip candidates. The
+step statistics go to statistics.json, in the calculate_model_statistics
+layout. Prediction is then a matrix-vector product over the JSON model
+and does not import NumPy. `fit --if-stale` returns without loading
+anything when the training data has not changed since the model was
+fitted.
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import json
+import math
+import os
+import sys
+
+# Defaults relative to the working directory; ml_optimization.sh passes
+# ${ML_TRAINING_DATA} and ${ML_MODEL_DIR}
+TRAINING_DATA = os.path.join(".ml_data", "training_data.jsonl")
+MODEL_DIR = os.path.join(".ml_data", "models")
+MODEL_FILE = "duration_model.json"
+STATISTICS_FILE = "statistics.json"
+ARRAYS_FILE = "training_arrays.npz"
+# Bump when the features or the model layout change; older models are refitted
+MODEL_VERSION = "1"
+
+NUMERIC_FEATURES = ("total_files", "doc_files", "code_files", "test_files",
+                    "config_files", "lines_changed", "max_depth")
+CHANGE_TYPES = ("docs_only", "code_only", "test_only", "config_change", "mixed")
+FEATURES = (("intercept",) + tuple(f"log_{name}" for name in NUMERIC_FEATURES)
+            + tuple(f"type_{name}" for name in CHANGE_TYPES))
+
+# Records a step needs before a regression is fitted instead of its mean
+MIN_FIT_SAMPLES = 3 * len(FEATURES)
+# Ridge penalty relative to the total sample weight (the intercept is not penalized)
+RIDGE = 1e-3
+
+# recommend_skip_steps: a step is skipped for a change type after more
+# than SKIP_MIN_RUNS runs that never found issues
+SKIP_MIN_RUNS = 5
+
+# Columns of the training arrays besides the feature matrix
+COLUMNS = ("step", "duration", "timestamp", "issues", "parallel", "total_duration", "change_type")
+
+
+def number(value, default=0.0) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return default
+    return float(value)
+
+
+def feature_vector(features: dict) -> list:
+    """Model inputs for an extract_change_features object"""
+    if not isinstance(features, dict):
+        features = {}
+    vector = [1.0]
+    vector.extend(math.log1p(max(number(features.get(name)), 0.0)) for name in NUMERIC_FEATURES)
+    # predict_step_duration treats a missing change type as "mixed"
+    change_type = features.get("change_type") or "mixed"
+    vector.extend(1.0 if change_type == name else 0.0 for name in CHANGE_TYPES)
+    return vector
+
+
+def source_signature(data_file: str) -> dict:
+    st = os.stat(data_file)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "inode": st.st_ino}
+
+
+def write_json(path: str, data) -> None:
+    temp_file = f"{path}.tmp.{os.getpid()}"
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    os.replace(temp_file, path)
+
+
+# ----------------------------------------------------------------------
+# Training arrays
+# ----------------------------------------------------------------------
+
+def parse_records(chunk: bytes, type_names: list) -> tuple:
+    """(column lists, feature rows) for the JSON lines in chunk
+
+    Change types are stored as indexes into type_names, which grows as new
+    types appear. Lines that are not step records are skipped.
+    """
+    columns = {name: [] for name in COLUMNS}
+    rows = []
+    type_index = {name: i for i, name in enumerate(type_names)}
+    for line in chunk.splitlines():
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(record, dict) or isinstance(record.get("step"), bool) \
+                or not isinstance(record.get("step"), int):
+            continue
+        features = record.get("features") if isinstance(record.get("features"), dict) else {}
+        change_type = features.get("change_type")
+        # jq's group_by puts records without a change type first; "" sorts the same way
+        change_type = change_type if isinstance(change_type, str) else ""
+        if change_type not in type_index:
+            type_index[change_type] = len(type_names)
+            type_names.append(change_type)
+        parallel = record.get("parallel")
+        columns["step"].append(record["step"])
+        columns["duration"].append(number(record.get("duration")))
+        columns["timestamp"].append(number(record.get("timestamp")))
+        columns["issues"].append(number(record.get("issues_found")))
+        columns["parallel"].append(int(parallel) if isinstance(parallel, bool) else -1)
+        columns["total_duration"].append(number(record.get("total_duration"), math.nan))
+        columns["change_type"].append(type_index[change_type])
+        rows.append(feature_vector(features))
+    return columns, rows
+
+
+def load_training_arrays(data_file: str, cache_file=None) -> dict:
+    """Training records as NumPy arrays, parsing only what was appended since cache_file
+
+    training_data.jsonl is append-only; the cache is rebuilt when the file
+    was replaced or truncated.
+    """
+    import numpy as np
+
+    signature = source_signature(data_file)
+    arrays, offset, type_names = None, 0, []
+    if cache_file and os.path.exists(cache_file):
+        try:
+            with np.load(cache_file) as cached:
+                if int(cached["inode"]) == signature["inode"] and int(cached["offset"]) <= signature["size"]:
+                    arrays = {name: cached[name] for name in COLUMNS + ("X",)}
+                    offset = int(cached["offset"])
+                    type_names = [str(name) for name in cached["type_names"]]
+        except (OSError, ValueError, KeyError):
+            arrays = None
+    if arrays is None:
+        offset, type_names = 0, []
+
+    with open(data_file, 'rb') as f:
+        f.seek(offset)
+        chunk = f.read()
+    # An unfinished last line is parsed next time
+    end = chunk.rfind(b"\n") + 1
+    columns, rows = parse_records(chunk[:end], type_names)
+    new = {
+        "step": np.array(columns["step"], dtype=np.int32),
+        "duration": np.array(columns["duration"], dtype=np.float64),
+        "timestamp": np.array(columns["timestamp"], dtype=np.float64),
+        "issues": np.array(columns["issues"], dtype=np.float64),
+        "parallel": np.array(columns["parallel"], dtype=np.int8),
+        "total_duration": np.array(columns["total_duration"], dtype=np.float64),
+        "change_type": np.array(columns["change_type"], dtype=np.int32),
+        "X": np.array(rows, dtype=np.float64).reshape(len(rows), len(FEATURES)),
+    }
+    if arrays is not None:
+        new = {name: np.concatenate([arrays[name], new[name]]) for name in new}
+    new["type_names"] = type_names
+
+    if cache_file and end:
+        temp_file = f"{cache_file}.tmp.{os.getpid()}.npz"
+        np.savez(temp_file, offset=offset + end, inode=signature["inode"],
+                 type_names=np.array(type_names, dtype=str),
+                 **{name: new[name] for name in COLUMNS + ("X",)})
+        os.replace(temp_file, cache_file)
+    return new
+
+
+# ----------------------------------------------------------------------
+# Fitting
+# ----------------------------------------------------------------------
+
+def fit_model(arrays: dict) -> dict:
+    """Per-step weighted ridge regressions, as a JSON-serializable model"""
+    import numpy as np
+
+    steps, durations, X = arrays["step"], arrays["duration"], arrays["X"]
+    if not len(steps):
+        return {"version": MODEL_VERSION, "features": list(FEATURES), "steps": [], "coef": [],
+                "samples": [], "rmse": [], "parallel": {}, "skip": {}}
+    age_days = (arrays["timestamp"].max() - arrays["timestamp"]) / 86400
+    weights = 1.0 / (age_days + 1)
+    penalty = np.full(len(FEATURES), RIDGE)
+    penalty[0] = 0.0
+
+    step_ids = np.unique(steps)
+    coef = np.zeros((len(step_ids), len(FEATURES)))
+    samples, rmse = [], []
+    for row, step in enumerate(step_ids):
+        mask = steps == step
+        Xs, ys, ws = X[mask], durations[mask], weights[mask]
+        if len(ys) < MIN_FIT_SAMPLES:
+            coef[row, 0] = np.average(ys, weights=ws)
+        else:
+            gram = Xs.T @ (Xs * ws[:, None]) + np.diag(penalty * ws.sum())
+            coef[row] = np.linalg.solve(gram, Xs.T @ (ws * ys))
+        residuals = np.maximum(Xs @ coef[row], 0.0) - ys
+        samples.append(int(len(ys)))
+        rmse.append(float(np.sqrt(np.mean(residuals ** 2))))
+
+    return {
+        "version": MODEL_VERSION,
+        "features": list(FEATURES),
+        "steps": [int(step) for step in step_ids],
+        "coef": coef.round(6).tolist(),
+        "samples": samples,
+        "rmse": [round(value, 3) for value in rmse],
+        "parallel": parallel_averages(arrays),
+        "skip": skip_candidates(arrays),
+    }
+
+
+def parallel_averages(arrays: dict) -> dict:
+    """Mean total_duration per change type with and without parallel execution"""
+    import numpy as np
+
+    averages = {}
+    timed = ~np.isnan(arrays["total_duration"])
+    for index, name in enumerate(arrays["type_names"]):
+        entry = {}
+        for label, flag in (("parallel", 1), ("serial", 0)):
+            mask = timed & (arrays["change_type"] == index) & (arrays["parallel"] == flag)
+            entry[label] = float(arrays["total_duration"][mask].mean()) if mask.any() else 0.0
+        averages[name] = entry
+    return averages
+
+
+def skip_candidates(arrays: dict) -> dict:
+    """Steps with more than SKIP_MIN_RUNS runs and no issues found, per change type"""
+    import numpy as np
+
+    if not len(arrays["step"]):
+        return {}
+    n_steps = int(arrays["step"].max()) + 1
+    key = arrays["change_type"].astype(np.int64) * n_steps + arrays["step"]
+    size = len(arrays["type_names"]) * n_steps
+    runs = np.bincount(key, minlength=size).reshape(-1, n_steps)
+    with_issues = np.bincount(key, weights=arrays["issues"] > 0, minlength=size).reshape(-1, n_steps)
+    skip = (runs > SKIP_MIN_RUNS) & (with_issues == 0)
+    return {name: [int(step) for step in np.flatnonzero(skip[index])]
+            for index, name in enumerate(arrays["type_names"])}
+
+
+def step_statistics(arrays: dict) -> list:
+    """Duration statistics per change type and step, as calculate_model_statistics wrote them"""
+    import numpy as np
+
+    if not len(arrays["step"]):
+        return []
+    type_names = arrays["type_names"]
+    order = sorted(range(len(type_names)), key=lambda i: type_names[i])
+    n_steps = int(arrays["step"].max()) + 1
+    key = arrays["change_type"].astype(np.int64) * n_steps + arrays["step"]
+    size = len(type_names) * n_steps
+    durations = arrays["duration"]
+    counts = np.bincount(key, minlength=size)
+    sums = np.bincount(key, weights=durations, minlength=size)
+    squares = np.bincount(key, weights=durations ** 2, minlength=size)
+    lows = np.full(size, np.inf)
+    highs = np.full(size, -np.inf)
+    np.minimum.at(lows, key, durations)
+    np.maximum.at(highs, key, durations)
+
+    statistics = []
+    for index in order:
+        steps = []
+        for step in range(n_steps):
+            cell = index * n_steps + step
+            count = int(counts[cell])
+            if not count:
+                continue
+            mean = sums[cell] / count
+            steps.append({
+                "step": step,
+                "avg_duration": float(mean),
+                "min_duration": float(lows[cell]),
+                "max_duration": float(highs[cell]),
+                "std_dev": float(math.sqrt(max(squares[cell] / count - mean ** 2, 0.0))),
+                "sample_count": count,
+            })
+        statistics.append({"change_type": type_names[index] or None, "steps": steps})
+    return statistics
+
+
+def fit(data_file: str, model_dir: str, if_stale: bool = False) -> bool:
+    """Fit and write the model and statistics; False when --if-stale found them current"""
+    model_file = os.path.join(model_dir, MODEL_FILE)
+    signature = source_signature(data_file)
+    if if_stale:
+        try:
+            with open(model_file, encoding='utf-8') as f:
+                model = json.load(f)
+            if model.get("version") == MODEL_VERSION and model.get("source") == signature:
+                return False
+        except (OSError, ValueError):
+            pass
+    os.makedirs(model_dir, exist_ok=True)
+    arrays = load_training_arrays(data_file, os.path.join(model_dir, ARRAYS_FILE))
+    model = fit_model(arrays)
+    model["source"] = signature
+    model["records"] = int(len(arrays["step"]))
+    write_json(model_file, model)
+    write_json(os.path.join(model_dir, STATISTICS_FILE), step_statistics(arrays))
+    return True
+
+
+# ----------------------------------------------------------------------
+# Prediction
+# ----------------------------------------------------------------------
+
+class DurationModel:
+    """A fitted duration_model.json"""
+
+    def __init__(self, model: dict):
+        self.model = model
+        self.rows = {step: row for step, row in zip(model["steps"], model["coef"])}
+
+    @classmethod
+    def load(cls, model_dir: str) -> "DurationModel":
+        with open(os.path.join(model_dir, MODEL_FILE), encoding='utf-8') as f:
+            model = json.load(f)
+        if model.get("version") != MODEL_VERSION:
+            raise ValueError(f"model version {model.get('version')} (expected {MODEL_VERSION}); run fit")
+        return cls(model)
+
+    def predict(self, steps: list, features: dict) -> list:
+        """Predicted whole seconds for each step (0 for steps never recorded)"""
+        vector = feature_vector(features)
+        predictions = []
+        for step in steps:
+            row = self.rows.get(step)
+            value = sum(c * x for c, x in zip(row, vector)) if row else 0.0
+            predictions.append(max(int(value), 0))
+        return predictions
+
+    def parallel_benefit(self, change_type: str) -> float:
+        """Percentage saved by parallel execution, as recommend_parallelization computed it"""
+        averages = self.model["parallel"].get(change_type, {})
+        serial, parallel = averages.get("serial", 0.0), averages.get("parallel", 0.0)
+        if not serial or not parallel:
+            return 0.0
+        return (serial - parallel) * 100 / serial
+
+    def skip_steps(self, change_type: str) -> list:
+        return self.model["skip"].get(change_type, [])
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Per-step duration model for ML optimization")
+    parser.add_argument("--data", default=TRAINING_DATA, help=f"Training data (default: {TRAINING_DATA})")
+    parser.add_argument("--model-dir", default=MODEL_DIR, help=f"Model directory (default: {MODEL_DIR})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    fit_command = commands.add_parser("fit", help="Fit the model and write statistics.json")
+    fit_command.add_argument("--if-stale", action="store_true",
+                             help="Only fit when the training data changed since the last fit")
+
+    predict = commands.add_parser("predict", help="Print the predicted seconds of each step")
+    predict.add_argument("features", help="extract_change_features JSON")
+    predict.add_argument("steps", nargs="+", type=int, metavar="STEP")
+    predict.add_argument("--total", action="store_true", help="Print the sum instead")
+
+    benefit = commands.add_parser("parallel-benefit", help="Print the parallel execution saving in percent")
+    benefit.add_argument("change_type")
+    skip = commands.add_parser("skip-steps", help="Print steps that never found issues for a change type")
+    skip.add_argument("change_type")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    try:
+        if args.command == "fit":
+            try:
+                fit(args.data, args.model_dir, args.if_stale)
+            except ImportError:
+                print("Error: NumPy is required to fit the duration model (pip install numpy)", file=sys.stderr)
+                return 2
+            return 0
+
+        model = DurationModel.load(args.model_dir)
+        if args.command == "predict":
+            predictions = model.predict(args.steps, json.loads(args.features or "{}"))
+            print(sum(predictions) if args.total else "\n".join(map(str, predictions)))
+        elif args.command == "parallel-benefit":
+            # Two decimals, truncated like `bc` with scale=2 (which prints 0 as "0")
+            benefit = math.trunc(model.parallel_benefit(args.change_type) * 100) / 100
+            print(f"{benefit:.2f}" if benefit else "0")
+        elif args.command == "skip-steps":
+            print(" ".join(map(str, model.skip_steps(args.change_type))))
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Enhance the API reference with introduction and usage guide
+
+Usage:
+    ai-workflow-docs enhance [API_FILE] [--index FILE]
+
+Module, function and category counts in the introduction are computed from
+the NDJSON index extract_api_docs.py writes next to the reference. To build
+the reference and its introduction in a single pass over the sources, run
+"extract_api_docs.py --introduction" instead.
+
+The reference is streamed line by line into a temp file next to it, the
+introduction is injected at "## Table of Contents", and the temp file is
+renamed over the original, so memory use does not grow with the reference
+and an interrupted run never leaves a truncated file. Running it again
+replaces an existing introduction instead of adding a second one, and leaves
+the file untouched when the introduction is already current.
+
+Version: 1.1.0
+Created: 2026-02-10
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, List
+
+API_FILE = Path("docs") / "api" / "COMPLETE_API_REFERENCE.md"
+
+TOC_HEADING = "## Table of Contents"
+INTRO_HEADING = "## Introduction"
+
+INTRODUCTION_HEADER = """
+## Introduction
+
+This document provides a complete API reference for all library modules in the AI Workflow Automation system. The system consists of **{modules} library modules** with **{functions} functions** organized into **{categories} categories**.
+
+### Purpose
+
+This reference serves as:
+- **Developer Guide**: Understand available functions and their usage
+- **Integration Reference**: Learn how to use workflow modules in custom scripts
+- **Maintenance Guide**: Track function signatures and documentation
+- **Code Navigation**: Quickly find relevant functions by category
+
+### Module Organization
+
+Modules are organized into the following categories:
+
+"""
+
+# Category blurbs, in the order categories are listed; categories found in the
+# index but missing here are appended alphabetically
+CATEGORY_DESCRIPTIONS = {
+    "AI & Caching": "AI prompt management, response caching, persona handling",
+    "Core Infrastructure": "Change detection, metrics, tech stack, optimization",
+    "Configuration": "Project configuration, wizard, kind detection",
+    "Git Operations": "Git automation, caching, submodule management, auto-commit",
+    "File Operations": "File editing and manipulation utilities",
+    "Documentation": "Auto-documentation, changelog, templates, validation",
+    "Step Management": "Step execution, loading, registry, validation cache",
+    "Session & State": "Session management, backlog, summaries",
+    "Optimization": "Smart execution, ML optimization, multi-stage pipeline",
+    "Performance & Monitoring": "Performance tracking, dashboard",
+    "Validation & Testing": "Enhanced validations, API coverage, test execution",
+    "Utilities": "Colors, argument parsing, health checks, version bumping",
+    "AI Model Selection": "Model selection for AI calls",
+    "Cleanup": "Cleanup handlers and templates",
+    "Hooks": "Pre-commit hook installation and checks",
+    "User Experience": "Audio notifications",
+}
+
+# Highlighted modules per category; function counts come from the index
+KEY_MODULES = {
+    "Core Infrastructure": [
+        ("change_detection.sh", "Detect code, documentation, and test changes"),
+        ("metrics.sh", "Performance metrics collection and reporting"),
+        ("workflow_optimization.sh", "Smart execution and performance optimization"),
+        ("tech_stack.sh", "Tech stack detection and configuration"),
+    ],
+    "AI & Caching": [
+        ("ai_helpers.sh", "Core AI integration with GitHub Copilot CLI"),
+        ("ai_cache.sh", "AI response caching with 60-80% token reduction"),
+        ("ai_personas.sh", "Specialized AI personas for different tasks"),
+        ("ai_prompt_builder.sh", "Dynamic prompt construction with context awareness"),
+    ],
+    "Git Operations": [
+        ("git_automation.sh", "Automated git operations and artifact staging"),
+        ("auto_commit.sh", "Intelligent commit message generation"),
+        ("git_cache.sh", "Git operation caching for performance"),
+    ],
+    "Step Management": [
+        ("step_execution.sh", "Execute workflow steps with dependency management"),
+        ("step_loader.sh", "Dynamic step loading with configuration support"),
+        ("step_registry.sh", "Step registration and metadata management"),
+        ("step_validation_cache.sh", "Cache validation results across runs"),
+    ],
+    "Optimization": [
+        ("ml_optimization.sh", "Machine learning-based step prediction"),
+        ("multi_stage_pipeline.sh", "Progressive 3-stage validation"),
+        ("conditional_execution.sh", "Smart step skipping based on changes"),
+        ("dependency_graph.sh", "Step dependency analysis and optimization"),
+    ],
+}
+
+USAGE_GUIDE = """### Usage Patterns
+
+#### Sourcing Modules
+
+```bash
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Source required modules
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+source "${SCRIPT_DIR}/lib/ai_helpers.sh"
+source "${SCRIPT_DIR}/lib/change_detection.sh"
+source "${SCRIPT_DIR}/lib/metrics.sh"
+
+# Use module functions
+init_metrics
+analyze_changes
+# ... your code
+finalize_metrics
+```
+
+#### Using AI Helpers
+
+```bash
+# Initialize AI cache
+init_ai_cache
+
+# Call AI with specific persona
+ai_call "documentation_specialist" "Analyze this file" "output.md"
+
+# Build dynamic prompt
+build_ai_prompt "code_reviewer" "additional context" > prompt.txt
+```
+
+#### Change Detection
+
+```bash
+# Analyze what changed
+analyze_changes
+
+# Check specific change types
+if has_code_changes; then
+    echo "Code changes detected"
+fi
+
+if has_doc_changes; then
+    echo "Documentation changes detected"
+fi
+
+# Get filtered file lists
+get_changed_code_files
+get_changed_doc_files
+```
+
+#### Metrics Collection
+
+```bash
+# Initialize metrics
+init_metrics
+
+# Track step execution
+start_step_timer "01" "Documentation Analysis"
+# ... execute step
+stop_step_timer "01" "success"
+
+# Finalize and report
+finalize_metrics
+generate_metrics_report
+```
+
+#### Step Execution
+
+```bash
+# Load step configuration
+load_step_config "documentation_updates"
+
+# Execute step with dependencies
+execute_step_with_dependencies "documentation_updates"
+
+# Check step status
+if step_completed "documentation_updates"; then
+    echo "Step completed successfully"
+fi
+```
+
+### Function Naming Conventions
+
+Functions follow consistent naming patterns:
+
+- **Verb_Noun**: `init_metrics`, `analyze_changes`, `validate_config`
+- **Get_Something**: `get_changed_files`, `get_step_name`, `get_execution_mode`
+- **Has/Is_Something**: `has_code_changes`, `is_workflow_artifact`, `is_copilot_available`
+- **Check_Something**: `check_prerequisites`, `check_git_status`
+- **Build/Generate_Something**: `build_prompt`, `generate_report`
+
+### Return Values and Exit Codes
+
+Most functions follow these conventions:
+
+- **0** - Success
+- **1** - General error
+- **2** - Invalid arguments
+- **3** - Missing dependencies
+- **4** - Configuration error
+
+### Error Handling
+
+All modules follow consistent error handling:
+
+```bash
+function example_function() {
+    local param="${1:-}"
+    
+    # Validate parameters
+    if [[ -z "$param" ]]; then
+        echo "ERROR: Parameter required" >&2
+        return 1
+    fi
+    
+    # Execute with error handling
+    if ! some_command; then
+        echo "ERROR: Command failed" >&2
+        return 1
+    fi
+    
+    return 0
+}
+```
+
+### Testing
+
+Each module has corresponding test files in `src/workflow/lib/test_*.sh`. Run tests with:
+
+```bash
+cd src/workflow/lib
+./test_enhancements.sh        # Run all tests
+./test_batch_operations.sh    # Test specific module
+```
+
+### Documentation Standards
+
+All functions should include:
+- **Description**: What the function does
+- **Parameters**: List of parameters with types and descriptions
+- **Returns**: Return value and exit codes
+- **Examples**: Usage examples when complex
+- **Notes**: Important implementation details
+
+---
+
+"""
+
+
+def plural(count: int, word: str) -> str:
+    return f"{count} {word}" if count == 1 else f"{count} {word}s"
+
+
+def build_introduction(records: Iterable[dict]) -> str:
+    """Render the introduction from the extractor's index records.
+    
+    Only the "module" records (category and function count per module) are
+    needed, so this accepts the NDJSON index or the extractor's in-memory list.
+    """
+    module_counts: Dict[str, int] = defaultdict(int)
+    function_counts: Dict[str, int] = {}
+    for record in records:
+        if record.get("kind") == "module":
+            module_counts[record["category"]] += 1
+            function_counts[record["module"]] = record["functions"]
+    
+    intro = INTRODUCTION_HEADER.format(modules=len(function_counts),
+                                       functions=sum(function_counts.values()),
+                                       categories=len(module_counts))
+    
+    categories = [c for c in CATEGORY_DESCRIPTIONS if c in module_counts]
+    categories += sorted(c for c in module_counts if c not in CATEGORY_DESCRIPTIONS)
+    for number, category in enumerate(categories, start=1):
+        description = CATEGORY_DESCRIPTIONS.get(category)
+        intro += f"{number}. **{category}** ({plural(module_counts[category], 'module')})"
+        intro += f" - {description}\n" if description else "\n"
+    
+    intro += "\n### Key Modules\n\n"
+    for category, modules in KEY_MODULES.items():
+        present = [(name, text) for name, text in modules if name in function_counts]
+        if not present:
+            continue
+        intro += f"#### {category}\n"
+        for name, text in present:
+            intro += f"- **{name}** ({plural(function_counts[name], 'function')}) - {text}\n"
+        intro += "\n"
+    
+    return intro + USAGE_GUIDE
+
+
+def load_index(index_file: Path) -> Iterator[dict]:
+    """Stream records from the extractor's NDJSON index."""
+    with open(index_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def insert_introduction(api_file: Path, introduction: str) -> str:
+    """Stream api_file into a temp file with the introduction placed before the TOC.
+    
+    An existing introduction (from "## Introduction" up to the TOC) is replaced.
+    Returns "inserted", "updated" or "unchanged"; raises ValueError when the
+    reference has no table of contents.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=api_file.parent, prefix=f".{api_file.name}.", suffix=".tmp")
+    try:
+        with open(api_file, 'r', encoding='utf-8', newline='') as src, \
+                os.fdopen(fd, 'w', encoding='utf-8', newline='') as dst:
+            existing: Optional[List[str]] = None
+            toc_line = None
+            for line in src:
+                stripped = line.strip()
+                if stripped == TOC_HEADING:
+                    toc_line = line
+                    break
+                if stripped == INTRO_HEADING and existing is None:
+                    existing = []
+                if existing is not None:
+                    existing.append(line)
+                else:
+                    dst.write(line)
+            
+            if toc_line is None:
+                raise ValueError(f"Could not find '{TOC_HEADING}' in {api_file}")
+            
+            # The introduction opens with a blank line, which an existing one
+            # has already left in the copied header
+            if existing is not None:
+                text = introduction.lstrip('\n') + '\n'
+                if ''.join(existing) == text:
+                    return "unchanged"
+                status = "updated"
+            else:
+                text = introduction + '\n'
+                status = "inserted"
+            
+            dst.write(text)
+            dst.write(toc_line)
+            shutil.copyfileobj(src, dst)
+        
+        shutil.copymode(api_file, temp_path)
+        os.replace(temp_path, api_file)
+        return status
+    finally:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Add the introduction and usage guide to the API reference")
+    parser.add_argument("api_file", nargs="?", type=Path, default=API_FILE,
+                        help=f"API reference to enhance (default: {API_FILE})")
+    parser.add_argument("--index", type=Path,
+                        help="Extractor NDJSON index (default: API_FILE with .ndjson suffix)")
+    args = parser.parse_args(argv)
+    index_file = args.index or args.api_file.with_suffix(".ndjson")
+    
+    try:
+        introduction = build_introduction(load_index(index_file))
+        status = insert_introduction(args.api_file, introduction)
+    except FileNotFoundError as e:
+        print(f"Error: {e.filename} not found; run `ai-workflow-docs extract` first")
+        return 1
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+    
+    if status == "unchanged":
+        print(f"✓ API reference already has the current introduction: {args.api_file}")
+    else:
+        print(f"✓ Enhanced API reference with introduction and usage guide ({status})")
+        print(f"  File: {args.api_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+External Link Checker
+Validates http(s) URLs concurrently with per-host connection pooling
+
+URLs are checked from an asyncio event loop; blocking http.client requests run
+on a thread pool, with keep-alive connections pooled per host. Concurrency is
+bounded globally and per host, requests to one host are rate limited, HEAD is
+tried first with a GET fallback, and results are cached in the same
+.link_cache/<sha256(url)>.cache format (and LINK_CACHE_TTL semantics) used
+by lib/link_validator.sh, so shell and Python runs share one cache.
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import asyncio
+import hashlib
+import http.client
+import os
+import ssl
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+# Defaults mirror lib/link_validator.sh
+LINK_CACHE_TTL = int(os.environ.get("LINK_CACHE_TTL", 24 * 3600))
+MAX_CONCURRENT_URL_CHECKS = 5
+URL_CHECK_TIMEOUT = 10
+URL_CHECK_RETRIES = 2        # curl --retry 2
+URL_RETRY_DELAY = 1.0        # curl --retry-delay 1
+MAX_REDIRECTS = 5
+MAX_GET_BODY = 64 * 1024     # bytes read from a GET before giving up the connection
+
+USER_AGENT = "ai-workflow-link-checker/1.0"
+
+# Statuses that mean "HEAD not supported here, try GET"
+HEAD_FALLBACK_STATUSES = {400, 403, 404, 405, 406, 500, 501, 503}
+# Statuses worth retrying (like curl --retry)
+RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+# Written by lib/link_validator.sh when curl is missing: the URL was never
+# checked, so both the shell and this module treat the entry as a miss
+UNCHECKED_STATUS = "valid:no-curl"
+
+
+class URLStatus(NamedTuple):
+    """Result of checking one URL"""
+    url: str
+    valid: bool
+    status: str      # cache format: "valid" or "broken:<code>" (valid only if exactly "valid")
+    cached: bool
+
+
+class URLCache:
+    """File-per-URL cache compatible with lib/link_validator.sh"""
+
+    def __init__(self, cache_dir: Path, ttl: int = LINK_CACHE_TTL):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+
+    def _path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.cache"
+
+    def get(self, url: str) -> Optional[str]:
+        """Return the cached status if younger than the TTL and actually checked"""
+        path = self._path(url)
+        try:
+            if time.time() - path.stat().st_mtime >= self.ttl:
+                return None
+            status = path.read_text(encoding='utf-8').strip()
+        except OSError:
+            return None
+        return None if status == UNCHECKED_STATUS else status
+
+    def put(self, url: str, status: str) -> None:
+        """Store a status (written atomically)"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(url)
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        temp_path.write_text(status + "\n", encoding='utf-8')
+        os.replace(temp_path, path)
+
+
+class _HostPool:
+    """Idle keep-alive connections and rate limiting for one scheme://host"""
+
+    def __init__(self, scheme: str, netloc: str, size: int, rate: float, timeout: float):
+        self.scheme = scheme
+        self.netloc = netloc
+        self.timeout = timeout
+        self.idle: List[http.client.HTTPConnection] = []
+        self.slots = asyncio.Semaphore(size)
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.next_start = 0.0
+
+    async def throttle(self) -> None:
+        """Space request starts at least 1/rate seconds apart"""
+        if not self.interval:
+            return
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        start = max(now, self.next_start)
+        self.next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def connection(self, fresh: bool = False) -> Tuple[http.client.HTTPConnection, bool]:
+        """Reuse an idle connection or open a new one. Returns (connection, reused)"""
+        if self.idle and not fresh:
+            return self.idle.pop(), True
+        if self.scheme == 'https':
+            return http.client.HTTPSConnection(
+                self.netloc, timeout=self.timeout,
+                context=ssl.create_default_context()), False
+        return http.client.HTTPConnection(self.netloc, timeout=self.timeout), False
+
+    def release(self, conn: http.client.HTTPConnection, reusable: bool) -> None:
+        if reusable:
+            self.idle.append(conn)
+        else:
+            conn.close()
+
+    def close(self) -> None:
+        for conn in self.idle:
+            conn.close()
+        self.idle.clear()
+
+
+def _send(conn: http.client.HTTPConnection, method: str, target: str) -> Tuple[int, Optional[str], bool]:
+    """Blocking request. Returns (status, location, connection reusable)"""
+    conn.request(method, target, headers={"User-Agent": USER_AGENT, "Accept": "*/*"})
+    response = conn.getresponse()
+    response.read(MAX_GET_BODY)
+    reusable = response.isclosed() and not response.will_close
+    if not response.isclosed():
+        response.close()
+    return response.status, response.getheader("Location"), reusable
+
+
+class ExternalLinkChecker:
+    """Checks many URLs concurrently, one connection pool per host"""
+
+    def __init__(self, cache: Optional[URLCache] = None,
+                 concurrency: int = MAX_CONCURRENT_URL_CHECKS,
+                 per_host: int = 2, host_rate: float = 10.0,
+                 timeout: float = URL_CHECK_TIMEOUT, retries: int = URL_CHECK_RETRIES,
+                 retry_delay: float = URL_RETRY_DELAY):
+        self.cache = cache
+        self.concurrency = max(1, concurrency)
+        self.per_host = max(1, per_host)
+        self.host_rate = host_rate
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.requests = 0
+        self.cache_hits = 0
+
+    def check(self, urls: Iterable[str]) -> Dict[str, URLStatus]:
+        """Check unique URLs and return their statuses"""
+        return asyncio.run(self.check_async(urls))
+
+    async def check_async(self, urls: Iterable[str]) -> Dict[str, URLStatus]:
+        results: Dict[str, URLStatus] = {}
+        pending: List[str] = []
+        for url in dict.fromkeys(urls):
+            cached = self.cache.get(url) if self.cache is not None else None
+            if cached is not None:
+                self.cache_hits += 1
+                results[url] = URLStatus(url, cached == "valid", cached, True)
+            else:
+                pending.append(url)
+
+        if pending:
+            self._pools: Dict[Tuple[str, str], _HostPool] = {}
+            self._limit = asyncio.Semaphore(self.concurrency)
+            self._executor = ThreadPoolExecutor(max_workers=self.concurrency)
+            try:
+                for status in await asyncio.gather(*(self._check_url(u) for u in pending)):
+                    results[status.url] = status
+                    if self.cache is not None:
+                        self.cache.put(status.url, status.status)
+            finally:
+                for pool in self._pools.values():
+                    pool.close()
+                self._executor.shutdown(wait=True)
+        return results
+
+    def _pool(self, scheme: str, netloc: str) -> _HostPool:
+        key = (scheme, netloc.lower())
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _HostPool(
+                scheme, netloc, self.per_host, self.host_rate, self.timeout)
+        return pool
+
+    async def _check_url(self, url: str) -> URLStatus:
+        async with self._limit:
+            code = await self._fetch(url, "HEAD")
+            if code in HEAD_FALLBACK_STATUSES:
+                code = await self._fetch(url, "GET")
+        valid = 200 <= code < 400
+        return URLStatus(url, valid, "valid" if valid else f"broken:{code:03d}", False)
+
+    async def _fetch(self, url: str, method: str) -> int:
+        """Follow redirects and retry transient failures; 0 means no response"""
+        for redirect in range(MAX_REDIRECTS + 1):
+            code, location = await self._request_with_retries(url, method)
+            if code not in REDIRECT_STATUSES or not location:
+                return code
+            url = urljoin(url, location)
+        return code
+
+    async def _request_with_retries(self, url: str, method: str) -> Tuple[int, Optional[str]]:
+        parts = urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.netloc:
+            return 0, None
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        pool = self._pool(parts.scheme, parts.netloc)
+        loop = asyncio.get_running_loop()
+
+        code, location = 0, None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                await asyncio.sleep(self.retry_delay)
+            async with pool.slots:
+                await pool.throttle()
+                conn, reused = pool.connection()
+                self.requests += 1
+                try:
+                    code, location, reusable = await loop.run_in_executor(
+                        self._executor, _send, conn, method, target)
+                    pool.release(conn, reusable)
+                except (OSError, http.client.HTTPException):
+                    conn.close()
+                    code, location = 0, None
+                    if reused:
+                        # The server dropped an idle keep-alive connection;
+                        # retry at once on a fresh one without using an attempt
+                        conn, _ = pool.connection(fresh=True)
+                        self.requests += 1
+                        try:
+                            code, location, reusable = await loop.run_in_executor(
+                                self._executor, _send, conn, method, target)
+                            pool.release(conn, reusable)
+                        except (OSError, http.client.HTTPException):
+                            conn.close()
+            if code not in RETRY_STATUSES and code != 0:
+                break
+        return code, location
@@ -0,0 +1,969 @@
+#!/usr/bin/env python3
+"""
+API Documentation Extractor for AI Workflow Automation
+Parses source modules to extract comprehensive API documentation
+
+Usage:
+    ai-workflow-docs extract [--root DIR ...] [--glob PATTERN ...]
+                                [--categories FILE] [--output FILE]
+                                [--index FILE | --no-index] [--sqlite FILE]
+                                [--introduction]
+                                [--incremental] [--cache-dir DIR] [--jobs N]
+
+Paths default to this repository (src/workflow/lib/*.sh ->
+docs/api/COMPLETE_API_REFERENCE.md) but every root, glob, the category map
+and the output are configurable, so the tool runs in CI containers and
+against other repositories. Extractors for bash, Python, JavaScript/TypeScript
+and Go mirror the languages lib/api_coverage.sh recognises; more can be added
+with @register_extractor.
+
+With --incremental, per-module parse results and rendered markdown fragments
+are cached keyed by file mtime and content hash; only changed modules are
+re-parsed and the reference is re-assembled by streaming cached fragments.
+With --jobs N, modules are parsed in a process pool and merged back in
+category order, so the output is identical to a serial run. The "Last
+Updated" date defaults to the newest module's mtime, so regenerating
+unchanged sources gives an identical reference on any day.
+
+Alongside the markdown, a structured index (one JSON object per module and
+per function: location, category, line, documented flag, parsed params,
+returns and examples) is written as NDJSON, and optionally as an SQLite
+database indexed on function name and module, so tooling can look functions
+up without scanning the reference. With --introduction, the introduction from
+enhance_api_docs.py is written in the same pass, with its statistics computed
+from these records.
+"""
+
+import argparse
+import datetime
+import fnmatch
+import hashlib
+import io
+import json
+import os
+import re
+import shutil
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from collections import defaultdict
+from typing import IO, List, Dict, Iterator, Optional, Tuple
+
+from .enhance_api_docs import build_introduction
+
+# Defaults, relative to the project root (--project-root, default: current directory)
+DEFAULT_ROOTS = ["src/workflow/lib"]
+DEFAULT_GLOBS = ["*.sh"]
+DEFAULT_EXCLUDES = ["test_*"]
+DEFAULT_OUTPUT = "docs/api/COMPLETE_API_REFERENCE.md"
+DEFAULT_TITLE = "Complete API Reference - AI Workflow Automation"
+# Source of the default document version
+VERSION_SOURCE = "src/workflow/execute_tests_docs_workflow.sh"
+
+# Incremental parse cache (per-module results + rendered fragments)
+CACHE_DIR = Path(".ai_workflow") / "cache" / "api_docs"
+# Bump when parsing or fragment formatting changes to invalidate cached fragments
+CACHE_VERSION = "1.1.0"
+
+# (function name, line number, documentation comment lines)
+Function = Tuple[str, int, List[str]]
+
+# Module categories for organization
+MODULE_CATEGORIES = {
+    "ai_cache.sh": "AI & Caching",
+    "ai_helpers.sh": "AI & Caching",
+    "ai_personas.sh": "AI & Caching",
+    "ai_prompt_builder.sh": "AI & Caching",
+    "ai_validation.sh": "AI & Caching",
+    "analysis_cache.sh": "AI & Caching",
+    "change_detection.sh": "Core Infrastructure",
+    "metrics.sh": "Core Infrastructure",
+    "workflow_optimization.sh": "Core Infrastructure",
+    "tech_stack.sh": "Core Infrastructure",
+    "config.sh": "Configuration",
+    "config_wizard.sh": "Configuration",
+    "project_kind_config.sh": "Configuration",
+    "project_kind_detection.sh": "Configuration",
+    "git_automation.sh": "Git Operations",
+    "git_cache.sh": "Git Operations",
+    "git_submodule_helpers.sh": "Git Operations",
+    "auto_commit.sh": "Git Operations",
+    "batch_ai_commit.sh": "Git Operations",
+    "file_operations.sh": "File Operations",
+    "edit_operations.sh": "File Operations",
+    "doc_section_extractor.sh": "Documentation",
+    "doc_section_mapper.sh": "Documentation",
+    "doc_template_validator.sh": "Documentation",
+    "auto_documentation.sh": "Documentation",
+    "changelog_generator.sh": "Documentation",
+    "link_validator.sh": "Documentation",
+    "validation.sh": "Validation & Testing",
+    "enhanced_validations.sh": "Validation & Testing",
+    "metrics_validation.sh": "Validation & Testing",
+    "api_coverage.sh": "Validation & Testing",
+    "code_example_tester.sh": "Validation & Testing",
+    "deployment_validator.sh": "Validation & Testing",
+    "step_execution.sh": "Step Management",
+    "step_loader.sh": "Step Management",
+    "step_metadata.sh": "Step Management",
+    "step_registry.sh": "Step Management",
+    "step_adaptation.sh": "Step Management",
+    "step_validation_cache.sh": "Step Management",
+    "step_validation_cache_integration.sh": "Step Management",
+    "session_manager.sh": "Session & State",
+    "backlog.sh": "Session & State",
+    "summary.sh": "Session & State",
+    "dependency_cache.sh": "Optimization",
+    "dependency_graph.sh": "Optimization",
+    "code_changes_optimization.sh": "Optimization",
+    "docs_only_optimization.sh": "Optimization",
+    "full_changes_optimization.sh": "Optimization",
+    "conditional_execution.sh": "Optimization",
+    "incremental_analysis.sh": "Optimization",
+    "skip_predictor.sh": "Optimization",
+    "ml_optimization.sh": "Optimization",
+    "multi_stage_pipeline.sh": "Optimization",
+    "workflow_profiles.sh": "Optimization",
+    "performance.sh": "Performance & Monitoring",
+    "performance_monitoring.sh": "Performance & Monitoring",
+    "dashboard.sh": "Performance & Monitoring",
+    "model_selector.sh": "AI Model Selection",
+    "utils.sh": "Utilities",
+    "colors.sh": "Utilities",
+    "jq_wrapper.sh": "Utilities",
+    "argument_parser.sh": "Utilities",
+    "health_check.sh": "Utilities",
+    "third_party_exclusion.sh": "Utilities",
+    "version_bump.sh": "Utilities",
+    "cleanup_handlers.sh": "Cleanup",
+    "cleanup_template.sh": "Cleanup",
+    "audio_notifications.sh": "User Experience",
+    "precommit_hooks.sh": "Hooks",
+}
+
+
+FUNC_PATTERN = re.compile(r'^\s*(function\s+)?([a-zA-Z_][a-zA-Z0-9_]*)\s*\(\)')
+
+
+def read_module(file_path: Path) -> Tuple[List[str], str]:
+    """Read a module once, returning its lines and the SHA256 of its content."""
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        lines = io.StringIO(data.decode('utf-8'), newline=None).readlines()
+    except Exception as e:
+        print(f"Error reading {file_path}: {e}")
+        return [], ""
+    
+    return lines, hashlib.sha256(data).hexdigest()
+
+
+# ==============================================================================
+# LANGUAGE EXTRACTORS
+# ==============================================================================
+
+class Extractor(ABC):
+    """Extracts a module's purpose and documented functions from its source lines."""
+    
+    language = ""
+    suffixes: Tuple[str, ...] = ()
+    # Code fence language used for examples
+    fence = ""
+    # Line comment marker
+    comment = "#"
+    
+    def purpose(self, lines: List[str]) -> str:
+        """First meaningful header comment."""
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#!'):
+                continue
+            if not line.startswith(self.comment):
+                break
+            text = line[len(self.comment):].strip()
+            if text and not text.startswith('-') and not text.startswith('='):
+                return text
+        return ""
+    
+    @abstractmethod
+    def functions(self, lines: List[str]) -> List[Function]:
+        """(name, line number, documentation comment lines) of each public function."""
+    
+    def preceding_comments(self, lines: List[str], i: int) -> List[str]:
+        """Comment lines directly above line i (outermost first)."""
+        comments = []
+        j = i - 1
+        while j >= 0 and lines[j].strip().startswith(self.comment):
+            comment = lines[j].strip()[len(self.comment):].strip()
+            if comment:  # Skip empty comment lines
+                comments.insert(0, comment)
+            j -= 1
+        return comments
+
+
+# Registered extractors by file suffix
+EXTRACTORS: Dict[str, Extractor] = {}
+
+
+def register_extractor(cls):
+    """Class decorator registering an extractor for its file suffixes.
+    
+    The class is instantiated here, so one without functions() fails at import.
+    """
+    extractor = cls()
+    for suffix in cls.suffixes:
+        EXTRACTORS[suffix] = extractor
+    return cls
+
+
+def extractor_for(file_path: Path) -> Optional[Extractor]:
+    """Return the extractor registered for a file's suffix, if any."""
+    return EXTRACTORS.get(file_path.suffix.lower())
+
+
+@register_extractor
+class BashExtractor(Extractor):
+    """Shell functions: name() and function name()"""
+    
+    language = "bash"
+    suffixes = (".sh", ".bash")
+    fence = "bash"
+    
+    def functions(self, lines: List[str]) -> List[Function]:
+        return [(match.group(2), i + 1, self.preceding_comments(lines, i))
+                for i, match in enumerate(map(FUNC_PATTERN.match, lines)) if match]
+
+
+@register_extractor
+class PythonExtractor(Extractor):
+    """Public def / async def; docstring first, else preceding # comments"""
+    
+    language = "python"
+    suffixes = (".py",)
+    fence = "python"
+    pattern = re.compile(r'^\s*(?:async\s+)?def\s+([a-zA-Z][a-zA-Z0-9_]*)')
+    
+    def purpose(self, lines: List[str]) -> str:
+        for i, line in enumerate(lines):
+            stripped = line.strip()
+            if not stripped or stripped.startswith('#'):
+                continue
+            if stripped[:3] in ('"""', "'''"):
+                doc = self._docstring(lines, i)
+                return doc[0] if doc else ""
+            break
+        return super().purpose(lines)
+    
+    def _docstring(self, lines: List[str], start: int) -> List[str]:
+        """Lines of the docstring opening at line index start."""
+        first = lines[start].strip()
+        quote = first[:3]
+        body = first[3:]
+        if quote in body:
+            head = body.split(quote)[0].strip()
+            return [head] if head else []
+        doc = [body.strip()] if body.strip() else []
+        for line in lines[start + 1:]:
+            text = line.strip()
+            if quote in text:
+                head = text.split(quote)[0].strip()
+                if head:
+                    doc.append(head)
+                break
+            if text:
+                doc.append(text)
+        return doc
+    
+    def functions(self, lines: List[str]) -> List[Function]:
+        functions = []
+        for i, line in enumerate(lines):
+            match = self.pattern.match(line)
+            if not match:
+                continue
+            # Docstring follows the line that closes the signature
+            body = i
+            while body < len(lines) and not lines[body].rstrip().endswith(':'):
+                body += 1
+            doc = []
+            if body + 1 < len(lines) and lines[body + 1].strip()[:3] in ('"""', "'''"):
+                doc = self._docstring(lines, body + 1)
+            functions.append((match.group(1), i + 1, doc or self.preceding_comments(lines, i)))
+        return functions
+
+
+@register_extractor
+class JavaScriptExtractor(Extractor):
+    """function / const arrow / class declarations with // or JSDoc comments"""
+    
+    language = "javascript"
+    suffixes = (".js", ".jsx", ".mjs", ".ts", ".tsx")
+    fence = "javascript"
+    comment = "//"
+    patterns = (
+        re.compile(r'^\s*(?:export\s+)?(?:async\s+)?function\s+([a-zA-Z][a-zA-Z0-9_]*)'),
+        re.compile(r'^\s*(?:export\s+)?const\s+([a-zA-Z][a-zA-Z0-9_]*)\s*=\s*(?:async\s+)?(?:\(|function)'),
+        re.compile(r'^\s*(?:export\s+)?class\s+([a-zA-Z][a-zA-Z0-9_]*)'),
+    )
+    
+    def purpose(self, lines: List[str]) -> str:
+        for line in lines:
+            text = line.strip()
+            if not text or text.startswith('#!') or text in ('/**', '/*'):
+                continue
+            if text.startswith(('//', '/*', '*')):
+                text = text.lstrip('/*').rstrip('*/').strip()
+                if text and not text.startswith(('-', '=', '@')):
+                    return text
+                continue
+            break
+        return ""
+    
+    def preceding_comments(self, lines: List[str], i: int) -> List[str]:
+        j = i - 1
+        if j >= 0 and lines[j].strip().endswith('*/'):
+            comments = []
+            while j >= 0:
+                text = lines[j].strip()
+                opening = text.startswith('/*')
+                text = text.lstrip('/*').rstrip('*/').strip()
+                if text:
+                    # JSDoc tags map onto the markdown sections: @param -> param
+                    comments.insert(0, text[1:] if text.startswith('@') else text)
+                if opening:
+                    break
+                j -= 1
+            return comments
+        return super().preceding_comments(lines, i)
+    
+    def functions(self, lines: List[str]) -> List[Function]:
+        functions = []
+        for i, line in enumerate(lines):
+            for pattern in self.patterns:
+                match = pattern.match(line)
+                if match:
+                    functions.append((match.group(1), i + 1, self.preceding_comments(lines, i)))
+                    break
+        return functions
+
+
+@register_extractor
+class GoExtractor(Extractor):
+    """Exported (capitalised) top-level funcs with preceding // comments"""
+    
+    language = "go"
+    suffixes = (".go",)
+    fence = "go"
+    comment = "//"
+    pattern = re.compile(r'^func\s+([A-Z][a-zA-Z0-9_]*)')
+    
+    def functions(self, lines: List[str]) -> List[Function]:
+        return [(match.group(1), i + 1, self.preceding_comments(lines, i))
+                for i, match in enumerate(map(self.pattern.match, lines)) if match]
+
+
+def parse_module(file_path: Path) -> Tuple[str, List[Function]]:
+    """Read a module once and return (purpose, functions)."""
+    lines, _ = read_module(file_path)
+    extractor = extractor_for(file_path) or EXTRACTORS[".sh"]
+    return extractor.purpose(lines), extractor.functions(lines)
+
+
+def extract_module_purpose(file_path: Path) -> str:
+    """Extract module purpose from header comments."""
+    return parse_module(file_path)[0]
+
+
+def extract_functions(file_path: Path) -> List[Tuple[str, int, List[str]]]:
+    """Extract all function definitions with their line numbers and preceding comments."""
+    return parse_module(file_path)[1]
+
+
+def parse_function_comments(comments: List[str]) -> Dict[str, List[str]]:
+    """Split a function's comment lines into description, parameters, returns,
+    exit_codes, examples and notes sections."""
+    sections = {name: [] for name in
+                ("description", "parameters", "returns", "exit_codes", "examples", "notes")}
+    current_section = sections["description"]
+    
+    for comment in comments:
+        comment_lower = comment.lower()
+        
+        if comment_lower.startswith('param'):
+            current_section = sections["parameters"]
+        elif comment_lower.startswith('return'):
+            current_section = sections["returns"]
+        elif comment_lower.startswith('exit'):
+            current_section = sections["exit_codes"]
+        elif comment_lower.startswith('example'):
+            current_section = sections["examples"]
+        elif comment_lower.startswith('note'):
+            current_section = sections["notes"]
+        elif comment in ['---', '===', '']:
+            continue
+        current_section.append(comment)
+    
+    return sections
+
+
+def format_function_doc(func_name: str, line_num: int, comments: List[str],
+                        fence: str = "bash") -> str:
+    """Format function documentation in markdown."""
+    doc = f"### `{func_name}`\n\n"
+    
+    if comments:
+        sections = parse_function_comments(comments)
+        description = sections["description"]
+        parameters = sections["parameters"]
+        returns = sections["returns"]
+        exit_codes = sections["exit_codes"]
+        examples = sections["examples"]
+        notes = sections["notes"]
+        
+        # Format description
+        if description:
+            doc += "**Description**: " + " ".join(description) + "\n\n"
+        
+        # Format parameters
+        if parameters:
+            doc += "**Parameters**:\n"
+            for param in parameters:
+                doc += f"- {param}\n"
+            doc += "\n"
+        
+        # Format returns
+        if returns:
+            doc += "**Returns**: " + " ".join(returns) + "\n\n"
+        
+        # Format exit codes
+        if exit_codes:
+            doc += "**Exit Codes**:\n"
+            for code in exit_codes:
+                doc += f"- {code}\n"
+            doc += "\n"
+        
+        # Format examples
+        if examples:
+            doc += f"**Examples**:\n```{fence}\n"
+            for example in examples:
+                if not example.lower().startswith('example'):
+                    doc += f"{example}\n"
+            doc += "```\n\n"
+        
+        # Format notes
+        if notes:
+            doc += "**Notes**:\n"
+            for note in notes:
+                doc += f"- {note}\n"
+            doc += "\n"
+    else:
+        doc += "*No documentation available*\n\n"
+    
+    doc += f"**Source Line**: {line_num}\n\n"
+    doc += "---\n\n"
+    
+    return doc
+
+
+def module_anchor(module_name: str) -> str:
+    """GitHub anchor of a '## Module: <name>' heading."""
+    return "module-" + re.sub(r'[^\w\- ]', '', module_name.lower()).replace(' ', '-')
+
+
+def format_module_doc(module_name: str, category: str, purpose: str,
+                      functions: List[Function], location: str = "",
+                      fence: str = "bash") -> str:
+    """Format one module's section (header, purpose and functions) in markdown."""
+    doc = f"## Module: {module_name}\n\n"
+    doc += f"**Location**: `{location or 'src/workflow/lib/' + module_name}`  \n"
+    doc += f"**Category**: {category}\n\n"
+    
+    if purpose:
+        doc += f"**Purpose**: {purpose}\n\n"
+    
+    doc += f"**Functions**: {len(functions)}\n\n"
+    
+    if functions:
+        for func_name, line_num, comments in functions:
+            doc += format_function_doc(func_name, line_num, comments, fence)
+    else:
+        doc += "*No public functions documented*\n\n"
+    
+    doc += "\n"
+    return doc
+
+
+# ==============================================================================
+# STRUCTURED INDEX
+# ==============================================================================
+
+def index_records(module_name: str, location: str, category: str, language: str,
+                  purpose: str, functions: List[Function]) -> Iterator[dict]:
+    """Yield one "module" record followed by one "function" record per function."""
+    yield {
+        "kind": "module",
+        "module": module_name,
+        "location": location,
+        "category": category,
+        "language": language,
+        "purpose": purpose,
+        "functions": len(functions),
+    }
+    for func_name, line_num, comments in functions:
+        sections = parse_function_comments(comments)
+        yield {
+            "kind": "function",
+            "module": module_name,
+            "function": func_name,
+            "line": line_num,
+            "documented": bool(comments),
+            "description": " ".join(sections["description"]),
+            "params": sections["parameters"],
+            "returns": " ".join(sections["returns"]),
+            "exit_codes": sections["exit_codes"],
+            "examples": [line for line in sections["examples"]
+                         if not line.lower().startswith('example')],
+            "notes": sections["notes"],
+        }
+
+
+@contextmanager
+def atomic_output(path: Path) -> Iterator[IO[str]]:
+    """Write path through a temp file beside it, renamed into place on success.
+    
+    The temp file is removed if writing fails, leaving path untouched.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            yield f
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+def write_ndjson_index(index_file: Path, records: List[dict]) -> None:
+    """Write index records one JSON object per line, replacing the file atomically."""
+    index_file.parent.mkdir(parents=True, exist_ok=True)
+    with atomic_output(index_file) as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+            f.write("\n")
+
+
+def write_sqlite_index(db_file: Path, records: List[dict]) -> None:
+    """Write index records to an SQLite database indexed by function name and module.
+    
+    Example:
+        sqlite3 api_index.db "SELECT module, line FROM functions WHERE function = 'ai_call'"
+    """
+    db_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=db_file.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        _fill_sqlite_index(temp_path, records)
+        os.replace(temp_path, db_file)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+def _fill_sqlite_index(db_path: str, records: List[dict]) -> None:
+    """Create the index tables in a new database and insert the records."""
+    import sqlite3
+    
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executescript("""
+            CREATE TABLE modules (
+                module TEXT PRIMARY KEY, location TEXT, category TEXT,
+                language TEXT, purpose TEXT, functions INTEGER);
+            CREATE TABLE functions (
+                function TEXT NOT NULL, module TEXT NOT NULL, line INTEGER,
+                documented INTEGER, description TEXT, params TEXT, returns TEXT,
+                exit_codes TEXT, examples TEXT, notes TEXT);
+        """)
+        conn.executemany(
+            "INSERT OR REPLACE INTO modules VALUES (?, ?, ?, ?, ?, ?)",
+            ((r["module"], r["location"], r["category"], r["language"], r["purpose"], r["functions"])
+             for r in records if r["kind"] == "module"))
+        conn.executemany(
+            "INSERT INTO functions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            ((r["function"], r["module"], r["line"], int(r["documented"]), r["description"],
+              json.dumps(r["params"]), r["returns"], json.dumps(r["exit_codes"]),
+              json.dumps(r["examples"]), json.dumps(r["notes"]))
+             for r in records if r["kind"] == "function"))
+        # Indexes are built after the bulk insert, which is cheaper than maintaining them row by row
+        conn.executescript("""
+            CREATE INDEX idx_functions_function ON functions(function);
+            CREATE INDEX idx_functions_module ON functions(module);
+            CREATE INDEX idx_modules_category ON modules(category);
+        """)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+class ModuleCache:
+    """Per-module parse results and markdown fragments keyed by mtime and content hash.
+    
+    A module is reused without reading it when its mtime and size are unchanged;
+    otherwise it is re-hashed and only re-parsed if the content really changed.
+    """
+    
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.index_file = cache_dir / "index.json"
+        self.modules: Dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+        
+        try:
+            data = json.loads(self.index_file.read_text(encoding='utf-8'))
+            if data.get("version") == CACHE_VERSION:
+                self.modules = data.get("modules", {})
+        except (OSError, ValueError):
+            pass
+    
+    def fragment_path(self, module_path: Path) -> Path:
+        """Location of a module's cached markdown fragment."""
+        key = hashlib.sha256(str(module_path).encode('utf-8')).hexdigest()[:16]
+        return self.cache_dir / "fragments" / f"{module_path.stem}-{key}.md"
+    
+    def lookup(self, module_path: Path, category: str, location: str) -> Optional[dict]:
+        """Return the cached entry if the module (and its category and location) is unchanged."""
+        entry = self.modules.get(str(module_path))
+        if entry is None or (entry["category"], entry["location"]) != (category, location) \
+                or not self.fragment_path(module_path).exists():
+            self.misses += 1
+            return None
+        
+        stat = module_path.stat()
+        if (entry["mtime_ns"], entry["size"]) != (stat.st_mtime_ns, stat.st_size):
+            if entry["sha256"] != hashlib.sha256(module_path.read_bytes()).hexdigest():
+                self.misses += 1
+                return None
+            entry["mtime_ns"], entry["size"] = stat.st_mtime_ns, stat.st_size
+        
+        self.hits += 1
+        return entry
+    
+    def store(self, module_path: Path, category: str, location: str, purpose: str,
+              functions: List[Function], fragment: str, sha256: str) -> dict:
+        """Record a freshly parsed module and write its fragment."""
+        fragment_file = self.fragment_path(module_path)
+        fragment_file.parent.mkdir(parents=True, exist_ok=True)
+        fragment_file.write_text(fragment, encoding='utf-8')
+        
+        stat = module_path.stat()
+        entry = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": sha256,
+            "category": category,
+            "location": location,
+            "purpose": purpose,
+            "functions": functions,
+        }
+        self.modules[str(module_path)] = entry
+        return entry
+    
+    def prune(self) -> None:
+        """Forget modules that no longer exist, removing their fragments."""
+        for key in [key for key in self.modules if not os.path.exists(key)]:
+            del self.modules[key]
+            try:
+                self.fragment_path(Path(key)).unlink()
+            except OSError:
+                pass
+    
+    def save(self) -> None:
+        """Write the cache index atomically, without entries of deleted modules."""
+        self.prune()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with atomic_output(self.index_file) as f:
+            json.dump({"version": CACHE_VERSION, "modules": self.modules}, f)
+
+
+def render_module(module_path: Path, category: str, location: str) -> Tuple[str, List[Function], str, str]:
+    """Parse one module and render its fragment.
+    
+    Returns (purpose, functions, fragment, sha256). Top-level so it can run in
+    a worker process; the file is read exactly once.
+    """
+    lines, digest = read_module(module_path)
+    extractor = extractor_for(module_path) or EXTRACTORS[".sh"]
+    purpose, functions = extractor.purpose(lines), extractor.functions(lines)
+    fragment = format_module_doc(module_path.name, category, purpose, functions,
+                                 location, extractor.fence)
+    return purpose, functions, fragment, digest
+
+
+def generate_toc(modules_by_category: Dict[str, List[Path]]) -> str:
+    """Generate table of contents organized by category."""
+    toc = "## Table of Contents\n\n"
+    
+    for category in sorted(modules_by_category.keys()):
+        toc += f"### {category}\n\n"
+        
+        for module_path in sorted(modules_by_category[category]):
+            module_name = module_path.name
+            toc += f"- [{module_name}](#{module_anchor(module_name)})\n"
+        
+        toc += "\n"
+    
+    toc += "---\n\n"
+    return toc
+
+
+# ==============================================================================
+# CONFIGURATION
+# ==============================================================================
+
+def load_categories(config_file: Path) -> Dict[str, str]:
+    """Load a module -> category map from JSON or YAML.
+    
+    Accepts a flat {module: category} mapping, a {category: [modules]}
+    mapping, or either form nested under a top-level "categories" key. Keys
+    may be file names, paths relative to the project root, or glob patterns.
+    """
+    text = config_file.read_text(encoding='utf-8')
+    if config_file.suffix.lower() in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise SystemExit(f"Error: PyYAML is required to read {config_file} (pip install pyyaml)")
+        data = yaml.safe_load(text) or {}
+    else:
+        data = json.loads(text)
+    
+    if isinstance(data, dict) and isinstance(data.get("categories"), dict):
+        data = data["categories"]
+    if not isinstance(data, dict):
+        raise SystemExit(f"Error: {config_file}: expected a mapping of modules to categories")
+    
+    categories = {}
+    for key, value in data.items():
+        if isinstance(value, list):
+            for module in value:
+                categories[str(module)] = str(key)
+        else:
+            categories[str(key)] = str(value)
+    return categories
+
+
+def category_for(module_path: Path, location: str, categories: Dict[str, str]) -> str:
+    """Category of a module: exact name, then relative path, then first matching glob."""
+    for key in (module_path.name, location):
+        if key in categories:
+            return categories[key]
+    for pattern, category in categories.items():
+        if fnmatch.fnmatch(location, pattern) or fnmatch.fnmatch(module_path.name, pattern):
+            return category
+    return "Uncategorized"
+
+
+def discover_modules(roots: List[Path], globs: List[str], excludes: List[str]) -> Iterator[Path]:
+    """Yield each source file once, in a single pass over every root and glob."""
+    seen = set()
+    for root in roots:
+        for pattern in globs:
+            for path in root.glob(pattern):
+                if path in seen or not path.is_file() or extractor_for(path) is None:
+                    continue
+                if any(fnmatch.fnmatch(path.name, exclude) for exclude in excludes):
+                    continue
+                seen.add(path)
+                yield path
+
+
+def detect_version(project_root: Path) -> str:
+    """Workflow version from SCRIPT_VERSION in the main orchestrator, if present."""
+    try:
+        text = (project_root / VERSION_SOURCE).read_text(encoding='utf-8')
+    except OSError:
+        return "unknown"
+    match = re.search(r'^SCRIPT_VERSION="([^"]+)"', text, re.MULTILINE)
+    return match.group(1) if match else "unknown"
+
+
+def source_date(modules: List[Path]) -> str:
+    """Date of the newest module's mtime, so regenerating unchanged sources gives the same header"""
+    mtimes = [module.stat().st_mtime for module in modules]
+    if not mtimes:
+        return datetime.date.today().isoformat()
+    return datetime.date.fromtimestamp(max(mtimes)).isoformat()
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Generate a complete API reference from source modules")
+    parser.add_argument("--project-root", type=Path, default=Path("."),
+                        help="Base for relative paths and module locations (default: current directory)")
+    parser.add_argument("--root", dest="roots", action="append", type=Path,
+                        help=f"Source root to scan; repeatable (default: {' '.join(DEFAULT_ROOTS)})")
+    parser.add_argument("--glob", dest="globs", action="append",
+                        help=f"Glob relative to each root, e.g. '**/*.py'; repeatable "
+                             f"(default: {' '.join(DEFAULT_GLOBS)})")
+    parser.add_argument("--exclude", dest="excludes", action="append",
+                        help=f"File name pattern to skip; repeatable (default: {' '.join(DEFAULT_EXCLUDES)})")
+    parser.add_argument("--categories", type=Path,
+                        help="JSON/YAML module -> category map (default: built-in MODULE_CATEGORIES)")
+    parser.add_argument("-o", "--output", type=Path,
+                        help=f"Output markdown file (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--title", default=DEFAULT_TITLE, help="Document title")
+    parser.add_argument("--doc-version", help=f"Version shown in the header (default: from {VERSION_SOURCE})")
+    parser.add_argument("--date",
+                        help="Last Updated date shown in the header (default: date of the newest module)")
+    parser.add_argument("--index", type=Path,
+                        help="NDJSON function index (default: output path with .ndjson suffix)")
+    parser.add_argument("--no-index", action="store_true", help="Do not write the NDJSON index")
+    parser.add_argument("--sqlite", type=Path,
+                        help="Also write the index to this SQLite database")
+    parser.add_argument("--introduction", action="store_true",
+                        help="Include the introduction and usage guide (see enhance_api_docs.py)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only re-parse modules changed since the last run")
+    parser.add_argument("--cache-dir", type=Path,
+                        help=f"Incremental cache directory (default: <project root>/{CACHE_DIR})")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Parse modules in N worker processes (0 = one per CPU)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    project_root = args.project_root.resolve()
+    cache = ModuleCache(args.cache_dir or project_root / CACHE_DIR) if args.incremental else None
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    
+    roots = [project_root / root for root in (args.roots or DEFAULT_ROOTS)]
+    output_file = project_root / (args.output or DEFAULT_OUTPUT)
+    categories = load_categories(args.categories) if args.categories else MODULE_CATEGORIES
+    version = args.doc_version or detect_version(project_root)
+    
+    print("Extracting API documentation from library modules...")
+    
+    # Create output directory
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Gather all modules and organize by category
+    modules_by_category = defaultdict(list)
+    locations: Dict[Path, str] = {}
+    for module in discover_modules(roots, args.globs or DEFAULT_GLOBS,
+                                   args.excludes if args.excludes is not None else DEFAULT_EXCLUDES):
+        try:
+            location = module.resolve().relative_to(project_root).as_posix()
+        except ValueError:
+            location = module.as_posix()
+        locations[module] = location
+        modules_by_category[category_for(module, location, categories)].append(module)
+    
+    # Count totals
+    total_modules = len(locations)
+    date = args.date or source_date(list(locations))
+    total_functions = 0
+    
+    print(f"Found {total_modules} modules")
+    
+    # Modules in output order; cache hits are reused, the rest are parsed
+    ordered = [(module_path, category, locations[module_path])
+               for category in sorted(modules_by_category.keys())
+               for module_path in sorted(modules_by_category[category])]
+    cached = {}
+    if cache:
+        for module_path, category, location in ordered:
+            entry = cache.lookup(module_path, category, location)
+            if entry is not None:
+                cached[module_path] = entry
+    pending = [item for item in ordered if item[0] not in cached]
+    
+    # The pool (if any) is shut down even when a worker raises
+    with ExitStack() as stack:
+        if jobs > 1 and len(pending) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=jobs))
+            rendered = executor.map(render_module, *zip(*pending),
+                                    chunksize=max(1, len(pending) // (jobs * 4)))
+        else:
+            rendered = (render_module(*item) for item in pending)
+        
+        # Merge results in category order; fragments are either kept in memory
+        # or, in incremental mode, streamed from the cache afterwards
+        fragments: List[Tuple[Path, Optional[str]]] = []
+        records: List[dict] = []
+        module_count = 0
+        for module_path, category, location in ordered:
+            module_count += 1
+            
+            entry = cached.get(module_path)
+            if entry is not None:
+                total_functions += len(entry["functions"])
+                fragments.append((cache.fragment_path(module_path), None))
+                records.extend(index_records(module_path.name, location, category,
+                                             extractor_for(module_path).language,
+                                             entry["purpose"], entry["functions"]))
+                continue
+            
+            print(f"Processing [{module_count}/{total_modules}] {module_path.name}...")
+            
+            purpose, functions, fragment, digest = next(rendered)
+            total_functions += len(functions)
+            records.extend(index_records(module_path.name, location, category,
+                                         extractor_for(module_path).language, purpose, functions))
+            
+            if cache:
+                cache.store(module_path, category, location, purpose, functions, fragment, digest)
+                fragments.append((cache.fragment_path(module_path), None))
+            else:
+                fragments.append((module_path, fragment))
+    
+    # Assemble the reference in a temp file and rename it into place
+    with atomic_output(output_file) as out:
+        # Write header
+        out.write(f"# {args.title}\n\n")
+        out.write(f"> **Version**: {version}  \n")
+        out.write(f"> **Last Updated**: {date}  \n")
+        out.write("> **Generated**: Auto-generated from source code  \n\n")
+        out.write(f"**Total Modules**: {total_modules}  \n")
+        out.write(f"**Total Functions**: {total_functions}  \n\n")
+        
+        if args.introduction:
+            out.write(build_introduction(records) + "\n")
+        
+        # Write TOC
+        out.write(generate_toc(modules_by_category))
+        
+        # Write module sections
+        for source, fragment in fragments:
+            if fragment is not None:
+                out.write(fragment)
+            else:
+                with open(source, 'r', encoding='utf-8') as f:
+                    shutil.copyfileobj(f, out)
+    
+    index_file = None if args.no_index else project_root / (args.index or output_file.with_suffix(".ndjson"))
+    if index_file:
+        write_ndjson_index(index_file, records)
+    if args.sqlite:
+        write_sqlite_index(project_root / args.sqlite, records)
+    
+    if cache:
+        cache.save()
+        print(f"\n  Cache: {cache.hits} modules reused, {cache.misses} re-parsed")
+    
+    print(f"\n✓ API documentation generated: {output_file}")
+    print(f"  Total modules: {total_modules}")
+    print(f"  Total functions: {total_functions}")
+    print(f"  File size: {output_file.stat().st_size / 1024:.1f} KB")
+    if index_file:
+        print(f"  Index: {index_file}")
+    if args.sqlite:
+        print(f"  SQLite index: {project_root / args.sqlite}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+File Hashing Service
+Hashes whole file lists for the step validation cache in one process
+
+Usage:
+    ai-workflow-docs hash-files [FILE ...] [--step NAME --type TYPE] [-z] [-j N]
+                                [--index FILE | --no-index] [--stats]
+    ai-workflow-docs hash-files --combined [-z] [FILE ...]
+    ai-workflow-docs hash-files --tree DIR
+    git ls-files -z '*.sh' | ai-workflow-docs hash-files -z --step step9 --type lint
+
+lib/step_validation_cache.sh hashes a file by forking sha256sum and awk,
+which costs thousands of process spawns on a large repository. This
+service hashes every file of a list in one process: files are read through
+mmap (small files with a plain read), hashed on a thread pool (hashlib
+releases the GIL), and a persistent (path, size, mtime_ns) -> sha256 index
+means unchanged files are never read again.
+
+Files come from the arguments or, without arguments, one per line on stdin
+(NUL-separated with -z). One line is printed per file, in input order:
+    <sha256>  <path>            like sha256sum
+    <sha256>\t<cache key>       with --step/--type
+where the cache key is the step_validation_cache.sh format
+<step>:<validation type>:<path without a leading ./>. Missing files hash to
+FILE_NOT_FOUND and unreadable files to an empty string, as in
+calculate_file_hash. With -z output records end in NUL instead of newline.
+
+--combined and --tree print the single hash of calculate_files_hash and
+calculate_directory_hash, without forking cat or stat per file.
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from stat import S_ISREG
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Persistent index of file hashes (relative to the working directory)
+HASH_INDEX = Path(".ai_workflow") / "cache" / "file_hashes" / "index.json"
+# Bump when the index layout changes to discard old indexes
+INDEX_VERSION = "1.0.0"
+
+# Same placeholder as calculate_file_hash in step_validation_cache.sh
+FILE_NOT_FOUND = "FILE_NOT_FOUND"
+
+# Files at least this large are hashed through mmap instead of read()
+MMAP_THRESHOLD = 64 * 1024
+
+# Files modified this recently are hashed but not recorded: a write within
+# the same mtime tick would otherwise leave a stale hash behind
+RACY_WINDOW_NS = 2 * 1_000_000_000
+
+
+def cache_key(step: str, validation_type: str, path: str) -> str:
+    """Key in the generate_validation_cache_key format: step:type:path (one leading ./ removed)"""
+    if path.startswith("./"):
+        path = path[2:]
+    return f"{step}:{validation_type}:{path}"
+
+
+def sha256_file(path: str, size: int) -> str:
+    """SHA-256 of a file's content; large files are mapped rather than copied"""
+    with open(path, 'rb') as f:
+        if size < MMAP_THRESHOLD:
+            return hashlib.sha256(f.read()).hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return hashlib.sha256(data).hexdigest()
+
+
+class HashIndex:
+    """Persistent (path, size, mtime_ns) -> sha256 index
+
+    Entries are keyed by absolute path. A file whose size and mtime are
+    unchanged since it was recorded is not read again.
+    """
+
+    def __init__(self, index_file: Path):
+        self.index_file = index_file
+        self.entries: Dict[str, List] = {}
+        self.dirty = False
+        try:
+            data = json.loads(index_file.read_text(encoding='utf-8'))
+            if data.get("version") == INDEX_VERSION:
+                self.entries = data.get("entries", {})
+        except (OSError, ValueError):
+            pass
+
+    def lookup(self, path: str, stat: os.stat_result) -> Optional[str]:
+        """Recorded hash if the file's size and mtime are unchanged"""
+        entry = self.entries.get(path)
+        if entry is not None and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+            return entry[2]
+        return None
+
+    def store(self, path: str, stat: os.stat_result, digest: str, now_ns: int) -> None:
+        if now_ns - stat.st_mtime_ns < RACY_WINDOW_NS:
+            self.entries.pop(path, None)
+        else:
+            self.entries[path] = [stat.st_size, stat.st_mtime_ns, digest]
+        self.dirty = True
+
+    def save(self) -> None:
+        """Write the index atomically (only when something changed)"""
+        if not self.dirty:
+            return
+        self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.index_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"version": INDEX_VERSION, "entries": self.entries}, f)
+            os.replace(temp_path, self.index_file)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+
+class FileHasher:
+    """Hashes file lists on a thread pool, consulting an optional HashIndex"""
+
+    def __init__(self, index: Optional[HashIndex] = None, jobs: int = 0):
+        self.index = index
+        self.jobs = jobs if jobs > 0 else min(32, (os.cpu_count() or 1) * 2)
+        self.hits = 0
+        self.misses = 0
+        self.bytes_read = 0
+
+    def _stat(self, path: str) -> Tuple[str, Optional[os.stat_result], Optional[str]]:
+        """(absolute path, stat, known hash); stat is None for missing or non-regular files"""
+        absolute = os.path.abspath(path)
+        try:
+            stat = os.stat(absolute)
+        except OSError:
+            return absolute, None, FILE_NOT_FOUND
+        if not S_ISREG(stat.st_mode):
+            return absolute, None, FILE_NOT_FOUND
+        known = self.index.lookup(absolute, stat) if self.index is not None else None
+        return absolute, stat, known
+
+    @staticmethod
+    def _hash(item: Tuple[str, os.stat_result]) -> str:
+        path, stat = item
+        try:
+            return sha256_file(path, stat.st_size)
+        except (OSError, ValueError):
+            return ""   # sha256sum fails and awk prints nothing
+
+    def hash_files(self, paths: List[str]) -> List[str]:
+        """Hashes for paths, in the same order"""
+        now_ns = time.time_ns()
+        stats = [self._stat(path) for path in paths]
+        pending = [(absolute, stat) for absolute, stat, known in stats if known is None]
+        self.hits = len(stats) - len(pending)
+        self.misses = len(pending)
+
+        if len(pending) > 1 and self.jobs > 1:
+            with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+                computed = list(executor.map(self._hash, pending))
+        else:
+            computed = [self._hash(item) for item in pending]
+
+        fresh = iter(computed)
+        digests = []
+        for absolute, stat, known in stats:
+            if known is None:
+                known = next(fresh)
+                self.bytes_read += stat.st_size
+                if self.index is not None and known:
+                    self.index.store(absolute, stat, known, now_ns)
+            digests.append(known)
+        return digests
+
+
+def combined_hash(paths: Iterable[str]) -> str:
+    """calculate_files_hash: SHA-256 of the concatenated contents of the regular files
+
+    Each file contributes what $(cat file) gives the shell: NUL bytes dropped
+    and trailing newlines stripped. Missing and unreadable files add nothing.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        if not os.path.isfile(path):
+            continue
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            continue
+        digest.update(data.replace(b"\0", b"").rstrip(b"\n"))
+    return digest.hexdigest()
+
+
+def tree_hash(top: str) -> str:
+    """calculate_directory_hash: SHA-256 of "<size> <path>" lines for every regular file
+
+    Paths are spelled as `find TOP -type f` prints them and sorted bytewise
+    (LC_ALL=C sort); symbolic links are not followed or listed.
+    """
+    entries = []
+    for dirpath, _, filenames in os.walk(top):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            try:
+                stat = os.lstat(path)
+            except OSError:
+                continue
+            if S_ISREG(stat.st_mode):
+                entries.append((os.fsencode(path), stat.st_size))
+    entries.sort()
+    return hashlib.sha256(b"".join(b"%d %s\n" % (size, path) for path, size in entries)).hexdigest()
+
+
+def read_paths(stream, null_separated: bool) -> List[str]:
+    """File list from a binary stream, one path per line or NUL-terminated"""
+    data = stream.read()
+    separator = b"\0" if null_separated else b"\n"
+    return [os.fsdecode(p) for p in data.split(separator) if p]
+
+
+def format_records(paths: Iterable[str], digests: Iterable[str], step: Optional[str],
+                   validation_type: Optional[str], null_separated: bool) -> str:
+    end = "\0" if null_separated else "\n"
+    if step is None:
+        return "".join(f"{digest}  {path}{end}" for path, digest in zip(paths, digests))
+    return "".join(f"{digest}\t{cache_key(step, validation_type, path)}{end}"
+                   for path, digest in zip(paths, digests))
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Hash files for the step validation cache in one process")
+    parser.add_argument("files", nargs="*", help="Files to hash (default: read from stdin)")
+    parser.add_argument("-z", "--null", action="store_true",
+                        help="NUL-separated input and output records")
+    parser.add_argument("--step", help="Step name; prints <hash>\\t<cache key> records")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--combined", action="store_true",
+                      help="Print one hash of the files' concatenated contents (calculate_files_hash)")
+    mode.add_argument("--tree", metavar="DIR",
+                      help="Print the hash of DIR's file sizes and paths (calculate_directory_hash)")
+    parser.add_argument("--type", dest="validation_type", help="Validation type for the cache key")
+    parser.add_argument("--index", type=Path, default=HASH_INDEX,
+                        help=f"Persistent hash index (default: {HASH_INDEX})")
+    parser.add_argument("--no-index", action="store_true", help="Hash every file, without an index")
+    parser.add_argument("-j", "--jobs", type=int, default=0,
+                        help="Hashing threads (default: 2 per CPU, at most 32)")
+    parser.add_argument("--stats", action="store_true", help="Print index hits and bytes read to stderr")
+    args = parser.parse_args(argv)
+    if (args.step is None) != (args.validation_type is None):
+        parser.error("--step and --type must be given together")
+    if (args.combined or args.tree is not None) and args.step is not None:
+        parser.error("--combined and --tree print a single hash and take no --step")
+    return args
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.tree is not None:
+        print(tree_hash(args.tree))
+        return 0
+    paths = args.files or read_paths(sys.stdin.buffer, args.null)
+    if args.combined:
+        print(combined_hash(paths))
+        return 0
+
+    index = None if args.no_index else HashIndex(args.index)
+    hasher = FileHasher(index, args.jobs)
+    digests = hasher.hash_files(paths)
+    if index is not None:
+        try:
+            index.save()
+        except OSError as e:
+            print(f"Warning: could not save hash index {args.index}: {e}", file=sys.stderr)
+
+    # Paths are written back byte for byte, even when they are not valid UTF-8
+    sys.stdout.buffer.write(os.fsencode(format_records(paths, digests, args.step,
+                                                       args.validation_type, args.null)))
+    sys.stdout.flush()
+    if args.stats:
+        print(f"Files: {len(paths)}, index hits: {hasher.hits}, hashed: {hasher.misses} "
+              f"({hasher.bytes_read} bytes)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
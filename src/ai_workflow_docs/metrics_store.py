@@ -0,0 +1,573 @@
+#!/usr/bin/env python3
+"""
+Workflow Metrics Store
+Indexed SQLite history of workflow runs with precomputed rollups, used by
+lib/metrics.sh
+
+Usage:
+    ai-workflow-docs metrics [--db FILE] record current_run.json [--history FILE]
+                             [--keep-runs N] [--max-age-days D] [--trim-history]
+    ai-workflow-docs metrics [--db FILE] import-history history.jsonl
+    ai-workflow-docs metrics [--db FILE] compact [--keep-runs N] [--max-age-days D]
+                             [--history FILE --trim-history]
+    ai-workflow-docs metrics [--db FILE] summary [--recent N]
+    ai-workflow-docs metrics [--db FILE] success-rate [--last N]
+    ai-workflow-docs metrics [--db FILE] duration [--scope workflow|step_N] [--stat mean|p50|p90|...]
+    ai-workflow-docs metrics [--db FILE] stats [--json]
+
+lib/metrics.sh appends every finished run to history.jsonl, and used to
+answer history questions by grepping or slurping (`jq -s`) the whole file,
+so each report got slower as the history grew. This store records each run
+once, and keeps per-scope rollups ("workflow" and "step_N"): run and
+success counts, a running mean and variance (Welford), min/max, and a
+histogram of durations in logarithmic buckets from which percentiles are
+read to within HISTOGRAM_GROWTH / 2. Rollup queries read one row plus at
+most a few hundred buckets, however long the history.
+
+`record --history FILE` imports an existing history.jsonl the first time,
+then appends the run to it. Rollups cover every run ever recorded.
+Retention (`compact`, also run by `record`) only drops the raw run rows
+beyond --keep-runs or older than --max-age-days; the newest run is always
+kept. history.jsonl is left whole unless --trim-history is given, which
+rewrites it, one compact record per line, to the runs that are kept. The
+database is only VACUUMed once free pages reach VACUUM_FREE_FRACTION, so a
+full store does not rewrite itself for each recorded run. `record` exits 0
+once the run is stored and appended; a failed retention pass is a warning.
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import math
+import os
+import sqlite3
+import sys
+import time
+
+# Default database (relative to the working directory); metrics.sh passes
+# ${METRICS_DIR}/metrics.db
+METRICS_DB = os.path.join(".ai_workflow", "metrics", "metrics.db")
+# Bump when the schema changes; older databases are rebuilt
+SCHEMA_VERSION = "1"
+
+# Retention defaults, as METRICS_RETENTION_RUNS/DAYS in metrics.sh
+DEFAULT_KEEP_RUNS = 1000
+DEFAULT_MAX_AGE_DAYS = 365
+
+# Ratio between histogram bucket bounds: percentiles are within 2.5%
+HISTOGRAM_GROWTH = 1.05
+LOG_GROWTH = math.log(HISTOGRAM_GROWTH)
+
+# Statistics accepted by `duration --stat`
+PERCENTILES = {"p50": 50, "p90": 90, "p95": 95, "p99": 99}
+
+# compact() VACUUMs once free pages make up this fraction of the database
+VACUUM_FREE_FRACTION = 0.25
+
+# Seconds a writer waits for another writer's lock
+BUSY_TIMEOUT = 30.0
+
+# Step statuses whose duration is a real execution time
+TIMED_STEP_STATUSES = ("success", "failed")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT UNIQUE,
+    end_epoch INTEGER NOT NULL,
+    status TEXT,
+    success INTEGER NOT NULL,
+    duration REAL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_end_epoch ON runs (end_epoch);
+
+CREATE TABLE IF NOT EXISTS steps (
+    run INTEGER NOT NULL,
+    step TEXT NOT NULL,
+    name TEXT,
+    status TEXT,
+    duration REAL,
+    PRIMARY KEY (run, step)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS runs_delete AFTER DELETE ON runs BEGIN
+    DELETE FROM steps WHERE run = OLD.id;
+END;
+
+CREATE TABLE IF NOT EXISTS rollups (
+    scope TEXT PRIMARY KEY,
+    runs INTEGER NOT NULL,
+    successes INTEGER NOT NULL,
+    timed INTEGER NOT NULL,
+    mean REAL NOT NULL,
+    m2 REAL NOT NULL,
+    min REAL,
+    max REAL,
+    last_epoch INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS histogram (
+    scope TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (scope, bucket)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+def bucket_of(seconds: float) -> int:
+    return int(math.log1p(max(seconds, 0.0)) / LOG_GROWTH)
+
+
+def bucket_value(bucket: int) -> float:
+    """Midpoint of a histogram bucket"""
+    return math.expm1((bucket + 0.5) * LOG_GROWTH)
+
+
+def format_duration(seconds) -> str:
+    """Same output as format_duration in metrics.sh (which takes whole seconds)"""
+    total = int(round(seconds or 0))
+    hours, minutes, seconds = total // 3600, total % 3600 // 60, total % 60
+    if hours:
+        return f"{hours}h {minutes}m {seconds}s"
+    if minutes:
+        return f"{minutes}m {seconds}s"
+    return f"{seconds}s"
+
+
+def number(value):
+    """Numeric field of a run record, or None"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+def read_records(text: str) -> list:
+    """Run records from history.jsonl
+
+    finalize_metrics appends current_run.json as jq pretty-prints it, so
+    records span several lines; any run of concatenated JSON objects is read.
+    """
+    import json
+    decoder = json.JSONDecoder()
+    records, position = [], 0
+    while True:
+        while position < len(text) and text[position].isspace():
+            position += 1
+        if position >= len(text):
+            return records
+        try:
+            record, position = decoder.raw_decode(text, position)
+        except ValueError:
+            # Skip a truncated record (an interrupted append) up to the next line
+            newline = text.find("\n", position)
+            if newline < 0:
+                return records
+            position = newline + 1
+            continue
+        if isinstance(record, dict):
+            records.append(record)
+
+
+class MetricsStore:
+    """Run history with per-scope rollups and a retention policy"""
+
+    def __init__(self, db_path: str):
+        self.db_path = str(db_path)
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        # Autocommit mode: write transactions are opened explicitly below
+        self.conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._ensure_schema()
+
+    def _ensure_schema(self) -> None:
+        version = None
+        try:
+            row = self.conn.execute("SELECT value FROM meta WHERE name = 'schema_version'").fetchone()
+            version = row[0] if row else None
+        except sqlite3.OperationalError:
+            pass
+        if version == SCHEMA_VERSION:
+            return
+        with self.transaction():
+            if version is not None:
+                for table in ("runs", "steps", "rollups", "histogram", "meta"):
+                    self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+            for statement in self._statements():
+                self.conn.execute(statement)
+            self.conn.execute("INSERT OR IGNORE INTO meta VALUES ('created', ?)", (str(time.time()),))
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)", (SCHEMA_VERSION,))
+
+    @staticmethod
+    def _statements() -> list:
+        """SCHEMA split into statements (trigger bodies keep their inner semicolons)"""
+        statements, current = [], ""
+        for line in SCHEMA.splitlines(keepends=True):
+            current += line
+            if sqlite3.complete_statement(current):
+                statements.append(current.strip())
+                current = ""
+        return statements
+
+    def transaction(self):
+        return _Transaction(self.conn)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record(self, record: dict) -> bool:
+        """Add a run record (the current_run.json layout); False if its run ID is already stored"""
+        with self.transaction():
+            return self._record(record)
+
+    def import_records(self, records: list) -> int:
+        """Add run records in one transaction; returns the number not already stored"""
+        with self.transaction():
+            return sum(self._record(record) for record in records)
+
+    def import_history_once(self, history_file: str) -> int:
+        """Import history_file unless a history was already imported into this store"""
+        if self.conn.execute("SELECT 1 FROM meta WHERE name = 'history_imported'").fetchone():
+            return 0
+        try:
+            with open(history_file, encoding='utf-8') as f:
+                records = read_records(f.read())
+        except FileNotFoundError:
+            records = []
+        imported = self.import_records(records)
+        with self.transaction():
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('history_imported', ?)", (str(time.time()),))
+        return imported
+
+    def _record(self, record: dict) -> bool:
+        import json
+        run_id = record.get("workflow_run_id") or None
+        end_epoch = number(record.get("end_epoch")) or number(record.get("start_epoch")) or time.time()
+        end_epoch = int(end_epoch)
+        duration = number(record.get("duration_seconds"))
+        success = record.get("success")
+        if not isinstance(success, bool):
+            success = record.get("status") == "success"
+        cursor = self.conn.execute(
+            "INSERT OR IGNORE INTO runs (run_id, end_epoch, status, success, duration, record)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (run_id, end_epoch, record.get("status"), int(success), duration,
+             json.dumps(record, separators=(",", ":"))))
+        if cursor.rowcount == 0:
+            return False
+        run = cursor.lastrowid
+        self._add("workflow", success, duration, end_epoch)
+
+        steps = record.get("steps")
+        for step, data in (steps.items() if isinstance(steps, dict) else ()):
+            if not isinstance(data, dict):
+                continue
+            status = data.get("status")
+            step_duration = number(data.get("duration_seconds"))
+            self.conn.execute("INSERT OR REPLACE INTO steps VALUES (?, ?, ?, ?, ?)",
+                              (run, step, data.get("name"), status, step_duration))
+            if status in TIMED_STEP_STATUSES:
+                self._add(step, status == "success", step_duration, end_epoch)
+        return True
+
+    def _add(self, scope: str, success: bool, duration, epoch: int) -> None:
+        """Fold one observation into the scope's rollup and histogram"""
+        row = self.conn.execute("SELECT runs, successes, timed, mean, m2, min, max FROM rollups"
+                                " WHERE scope = ?", (scope,)).fetchone()
+        runs, successes, timed, mean, m2, low, high = row or (0, 0, 0, 0.0, 0.0, None, None)
+        runs += 1
+        successes += int(bool(success))
+        if duration is not None:
+            timed += 1
+            delta = duration - mean
+            mean += delta / timed
+            m2 += delta * (duration - mean)
+            low = duration if low is None else min(low, duration)
+            high = duration if high is None else max(high, duration)
+            self.conn.execute("INSERT INTO histogram VALUES (?, ?, 1) ON CONFLICT (scope, bucket)"
+                              " DO UPDATE SET count = count + 1", (scope, bucket_of(duration)))
+        self.conn.execute("INSERT OR REPLACE INTO rollups VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                          (scope, runs, successes, timed, mean, m2, low, high, epoch))
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+
+    def compact(self, keep_runs: int = DEFAULT_KEEP_RUNS, max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+                history_file=None) -> int:
+        """Drop runs beyond keep_runs or older than max_age_days; returns the number dropped
+
+        Rollups are unchanged. When history_file is given and runs were
+        dropped (or the file is not in one-record-per-line form yet), it is
+        rewritten to the kept runs. Freed pages are reused by later runs;
+        the file is only VACUUMed once they reach VACUUM_FREE_FRACTION.
+        """
+        newest = self.conn.execute("SELECT max(id) FROM runs").fetchone()[0]
+        if newest is None:
+            return 0
+        cutoff = time.time() - max_age_days * 86400
+        with self.transaction():
+            dropped = self.conn.execute(
+                "DELETE FROM runs WHERE id <> ? AND (end_epoch < ? OR id NOT IN"
+                " (SELECT id FROM runs ORDER BY id DESC LIMIT ?))",
+                (newest, cutoff, max(1, keep_runs))).rowcount
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('last_compaction', ?)", (str(time.time()),))
+        if history_file and (dropped or not self._history_compacted(history_file)):
+            self.write_history(history_file)
+        if dropped:
+            self._vacuum_if_fragmented()
+        return dropped
+
+    def _vacuum_if_fragmented(self) -> bool:
+        """VACUUM when free pages reach VACUUM_FREE_FRACTION; returns True if it ran
+
+        Past keep_runs every recorded run drops one row, and a VACUUM each
+        time would rewrite the whole database per run.
+        """
+        free = self.conn.execute("PRAGMA freelist_count").fetchone()[0]
+        pages = self.conn.execute("PRAGMA page_count").fetchone()[0]
+        if not pages or free < pages * VACUUM_FREE_FRACTION:
+            return False
+        self.conn.execute("VACUUM")
+        return True
+
+    def _history_compacted(self, history_file: str) -> bool:
+        """True if history_file holds exactly the stored records, one per line"""
+        try:
+            with open(history_file, 'rb') as f:
+                lines = sum(1 for line in f if line.strip())
+        except OSError:
+            return False
+        return lines == self.conn.execute("SELECT count(*) FROM runs").fetchone()[0]
+
+    def write_history(self, history_file: str) -> None:
+        """Replace history_file with the stored records, oldest first"""
+        temp_file = f"{history_file}.tmp.{os.getpid()}"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            for (record,) in self.conn.execute("SELECT record FROM runs ORDER BY id"):
+                f.write(record + "\n")
+        os.replace(temp_file, history_file)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def rollup(self, scope: str = "workflow"):
+        row = self.conn.execute("SELECT runs, successes, timed, mean, m2, min, max, last_epoch"
+                                " FROM rollups WHERE scope = ?", (scope,)).fetchone()
+        if row is None:
+            return None
+        runs, successes, timed, mean, m2, low, high, last_epoch = row
+        return {
+            "runs": runs,
+            "successes": successes,
+            "success_rate": successes * 100 // runs if runs else 0,
+            "timed": timed,
+            "mean": mean if timed else None,
+            "stddev": math.sqrt(m2 / (timed - 1)) if timed > 1 else 0.0,
+            "min": low,
+            "max": high,
+            "last_epoch": last_epoch,
+        }
+
+    def percentile(self, scope: str, percent: float):
+        """Duration below which percent of the scope's timed runs fall, or None"""
+        rollup = self.rollup(scope)
+        if rollup is None or not rollup["timed"]:
+            return None
+        rank = max(1, math.ceil(percent / 100 * rollup["timed"]))
+        seen = 0
+        for bucket, count in self.conn.execute("SELECT bucket, count FROM histogram WHERE scope = ?"
+                                               " ORDER BY bucket", (scope,)):
+            seen += count
+            if seen >= rank:
+                return min(max(bucket_value(bucket), rollup["min"]), rollup["max"])
+        return rollup["max"]
+
+    def success_rate(self, last: int) -> int:
+        """Success percentage of the last runs still stored"""
+        row = self.conn.execute("SELECT count(*), sum(success) FROM"
+                                " (SELECT success FROM runs ORDER BY id DESC LIMIT ?)", (last,)).fetchone()
+        return (row[1] or 0) * 100 // row[0] if row[0] else 0
+
+    def recent(self, count: int) -> list:
+        return self.conn.execute("SELECT run_id, status, success, duration, end_epoch FROM runs"
+                                 " ORDER BY id DESC LIMIT ?", (count,)).fetchall()
+
+    def stats(self) -> dict:
+        scopes = [scope for (scope,) in self.conn.execute("SELECT scope FROM rollups ORDER BY scope")]
+        meta = dict(self.conn.execute("SELECT name, value FROM meta"))
+        stats = {}
+        for scope in scopes:
+            stats[scope] = self.rollup(scope)
+            stats[scope].update({name: self.percentile(scope, p) for name, p in PERCENTILES.items()})
+        return {
+            "stored_runs": self.conn.execute("SELECT count(*) FROM runs").fetchone()[0],
+            "last_compaction": float(meta["last_compaction"]) if "last_compaction" in meta else None,
+            "location": self.db_path,
+            "rollups": stats,
+        }
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT, rolled back on any exception"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute("COMMIT" if exc_type is None else "ROLLBACK")
+        return False
+
+
+def format_summary(store: MetricsStore, recent: int) -> str:
+    """Historical Performance block of summary.md, as generate_historical_stats prints it"""
+    rollup = store.rollup("workflow")
+    if rollup is None:
+        return "_No historical data available yet._"
+    lines = [
+        f"- **Total Runs:** {rollup['runs']}",
+        f"- **Successful Runs:** {rollup['successes']}",
+        f"- **Success Rate:** {rollup['success_rate']}%",
+        f"- **Average Duration:** {format_duration(rollup['mean'])}",
+    ]
+    if rollup["timed"]:
+        lines.append(f"- **Duration p50 / p90:** {format_duration(store.percentile('workflow', 50))}"
+                     f" / {format_duration(store.percentile('workflow', 90))}")
+    lines += ["", f"### Recent Runs (Last {recent})", ""]
+    for run_id, status, success, duration, end_epoch in store.recent(recent):
+        ended = time.strftime("%Y-%m-%d %H:%M", time.localtime(end_epoch))
+        lines.append(f"- {run_id or 'unknown'}: {'✅' if success else '❌'} {status or 'unknown'},"
+                     f" {format_duration(duration)} ({ended})")
+    return "\n".join(lines)
+
+
+def format_stats(stats: dict) -> str:
+    """Rollup table for `stats`"""
+    lines = ["", "Workflow Metrics Store:",
+             f"  Stored Runs: {stats['stored_runs']}",
+             f"  Location: {stats['location']}", "",
+             f"  {'Scope':12} {'Runs':>6} {'Success':>8} {'Mean':>10} {'p50':>10} {'p90':>10} {'Max':>10}"]
+    for scope, rollup in stats["rollups"].items():
+        lines.append(f"  {scope:12} {rollup['runs']:6d} {rollup['success_rate']:7d}%"
+                     + "".join(f" {format_duration(rollup[name]):>10}" for name in ("mean", "p50", "p90", "max")))
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Indexed workflow metrics history with rollups")
+    parser.add_argument("--db", default=METRICS_DB, help=f"Metrics database (default: {METRICS_DB})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def retention_options(command):
+        command.add_argument("--keep-runs", type=int, default=DEFAULT_KEEP_RUNS,
+                             help=f"Runs kept in the history (default: {DEFAULT_KEEP_RUNS})")
+        command.add_argument("--max-age-days", type=float, default=DEFAULT_MAX_AGE_DAYS,
+                             help=f"Drop runs older than this (default: {DEFAULT_MAX_AGE_DAYS})")
+        command.add_argument("--trim-history", action="store_true",
+                             help="Also rewrite --history to the kept runs (default: leave it whole)")
+
+    record = commands.add_parser("record", help="Add a finished run, then apply retention")
+    record.add_argument("run_file", help="current_run.json of the run")
+    record.add_argument("--history", metavar="FILE",
+                        help="history.jsonl to import on first use and append the run to")
+    retention_options(record)
+
+    history = commands.add_parser("import-history", help="Add the runs of a history.jsonl file")
+    history.add_argument("history_file")
+
+    compact = commands.add_parser("compact", help="Apply the retention policy")
+    compact.add_argument("--history", metavar="FILE", help="history.jsonl for --trim-history")
+    retention_options(compact)
+
+    summary = commands.add_parser("summary", help="Print the Historical Performance block of summary.md")
+    summary.add_argument("--recent", type=int, default=5, help="Recent runs listed (default: 5)")
+
+    rate = commands.add_parser("success-rate", help="Print the success percentage of the last runs")
+    rate.add_argument("--last", type=int, default=10, help="Runs considered (default: 10)")
+
+    duration = commands.add_parser("duration", help="Print a duration statistic in whole seconds")
+    duration.add_argument("--scope", default="workflow", help="workflow or step_N (default: workflow)")
+    duration.add_argument("--stat", default="mean", choices=["mean", "min", "max"] + list(PERCENTILES),
+                          help="Statistic (default: mean)")
+
+    stats = commands.add_parser("stats", help="Print every rollup")
+    stats.add_argument("--json", action="store_true", help="Print statistics as JSON")
+    return parser.parse_args(argv)
+
+
+def trimmed_history(args):
+    """history.jsonl that retention should rewrite, or None to leave it alone"""
+    return args.history if args.trim_history else None
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    try:
+        store = MetricsStore(args.db)
+    except (OSError, sqlite3.Error) as e:
+        print(f"Error: cannot open metrics store {args.db}: {e}", file=sys.stderr)
+        return 2
+
+    try:
+        if args.command == "record":
+            import json
+            with open(args.run_file, encoding='utf-8') as f:
+                record = json.load(f)
+            if args.history:
+                store.import_history_once(args.history)
+            if store.record(record) and args.history:
+                with open(args.history, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record, separators=(",", ":")) + "\n")
+            # The run is stored: a failure now must not make metrics.sh append it again
+            try:
+                store.compact(args.keep_runs, args.max_age_days, trimmed_history(args))
+            except (OSError, sqlite3.Error) as e:
+                print(f"Warning: retention skipped: {e}", file=sys.stderr)
+        elif args.command == "import-history":
+            with open(args.history_file, encoding='utf-8') as f:
+                print(store.import_records(read_records(f.read())))
+        elif args.command == "compact":
+            print(store.compact(args.keep_runs, args.max_age_days, trimmed_history(args)))
+        elif args.command == "summary":
+            print(format_summary(store, args.recent))
+        elif args.command == "success-rate":
+            print(store.success_rate(args.last))
+        elif args.command == "duration":
+            rollup = store.rollup(args.scope)
+            if args.stat in PERCENTILES:
+                value = store.percentile(args.scope, PERCENTILES[args.stat])
+            else:
+                value = rollup[args.stat] if rollup else None
+            print(int(round(value)) if value is not None else 0)
+        elif args.command == "stats":
+            import json
+            stats = store.stats()
+            print(json.dumps(stats, indent=2) if args.json else format_stats(stats))
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    except sqlite3.Error as e:
+        print(f"Error: metrics store {args.db}: {e}", file=sys.stderr)
+        return 2
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
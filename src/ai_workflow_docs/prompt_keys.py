@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+"""
+Prompt Cache Keys
+Canonical AI response cache keys and near-duplicate prompt detection
+
+Usage:
+    printf '%s\\0%s' "$prompt" "$context" | ai-workflow-docs prompt-key [--templates FILE]
+    ai-workflow-docs prompt-key [--templates FILE] [--rules FILE] [--cache-dir DIR | --no-cache]
+                                [--db FILE [--threshold 0.8] [--ttl SECONDS]] [--explain]
+                                [PROMPT [CONTEXT]]
+
+generate_cache_key in lib/ai_cache.sh hashed "prompt|context" verbatim, so
+prompts that differed only in whitespace, a timestamp, {modified_count} or
+the order of a file list never hit the cache. This module derives the key
+from a canonical form of the prompt instead:
+
+1. Whitespace runs are collapsed to a space, or to a blank line when they
+   contain one.
+2. The prompt templates of ai_helpers.yaml (every string with {param}
+   placeholders, as checked by validate_context_blocks.py) are located in
+   the prompt by their literal text, so the stable template text is
+   separated from the parameter values filled in by the shell. A parameter
+   ending a template extends to the next blank line.
+3. Parameter values are canonicalized by prompt_key_rules.yaml: ignored
+   parameters are dropped, file lists are sorted and de-duplicated, and
+   volatile text (timestamps, run IDs) is replaced everywhere else.
+
+The key is the SHA-256 of that canonical form, so it keeps the 64-hex-digit
+format of the old keys. Templates and rules are compiled once per content
+hash and cached as JSON, so PyYAML is only imported when they change.
+
+With --db, prompts are also compared with the prompts cached in the
+ai_cache_store.py database. Each prompt's word 4-gram shingles are reduced
+to a one-permutation MinHash signature and indexed by LSH bands. On a cache
+miss the most similar cached prompt with an estimated Jaccard similarity
+of at least --threshold is reported as "<key> <near key> <similarity>".
+Near duplicates are reported, never served: they measure how many more
+hits better canonicalization rules would give.
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import hashlib
+import json
+import os
+import re
+import struct
+import sys
+import time
+
+DEFAULT_TEMPLATES = os.path.join('.workflow_core', 'config', 'ai_helpers.yaml')
+DEFAULT_RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'prompt_key_rules.yaml')
+CACHE_DIR = os.path.join('.ai_workflow', 'cache', 'prompt_keys')
+DEFAULT_PARAM_PATTERN = r'\{(\w+)\}'
+
+# Bump when the canonical form changes; every key changes with it
+KEY_VERSION = "1"
+
+# Templates with less literal text than this are too generic to locate
+MIN_LITERAL_CHARS = 24
+
+# Near-duplicate detection: word n-gram size, signature bins, LSH band rows
+SHINGLE_SIZE = 4
+SIGNATURE_BINS = 64
+BAND_ROWS = 4
+EMPTY_BIN = 2 ** 64 - 1
+NEAR_DUPLICATE_THRESHOLD = 0.8
+
+# Same defaults as ai_cache_store.py
+DEFAULT_TTL = 86400
+BUSY_TIMEOUT = 30.0
+
+WHITESPACE_RE = re.compile(r'\s+')
+LIST_SEPARATOR_RE = re.compile(r'[\s,]+')
+TOKEN_RE = re.compile(r'\w+')
+
+
+PARAGRAPH_BREAK = "\n\n"
+
+
+def collapse(match) -> str:
+    return PARAGRAPH_BREAK if match.group().count("\n") > 1 else " "
+
+
+def normalize_whitespace(text: str) -> str:
+    return WHITESPACE_RE.sub(collapse, text).strip()
+
+
+def collect_templates(data, param_re, path: str = "") -> dict:
+    """Every string with parameters in a YAML document, keyed by dotted path"""
+    templates = {}
+    if isinstance(data, dict):
+        items = ((str(key), value) for key, value in data.items())
+    elif isinstance(data, list):
+        items = ((str(i), value) for i, value in enumerate(data))
+    else:
+        if isinstance(data, str) and param_re.search(data):
+            templates[path] = data
+        return templates
+    for name, value in items:
+        templates.update(collect_templates(value, param_re, f"{path}.{name}" if path else name))
+    return templates
+
+
+class Template:
+    """A prompt template compiled to literal segments located with str.find()
+
+    head is the literal text before the first parameter; each step is a
+    parameter followed by the literal that ends it, and tail a parameter
+    ending the template, which extends to the next blank line. A parameter
+    starting the template has no anchor and stays part of the surrounding
+    text; adjacent parameters are captured together.
+    """
+
+    __slots__ = ("id", "head", "steps", "tail", "literal_chars")
+
+    def __init__(self, template_id: str, head: str, steps: list, tail=None):
+        self.id = template_id
+        self.head = head
+        self.steps = steps
+        self.tail = tail
+        self.literal_chars = len(head) + sum(len(literal) for _, literal in steps)
+
+    @classmethod
+    def compile(cls, template_id: str, text: str, param_re):
+        """Template for text, or None when it has too little literal text to locate"""
+        parts = param_re.split(normalize_whitespace(text))
+        # parts alternates literal, name, literal, ...; strip literal edges so
+        # that empty or whitespace-only values still match
+        literals = [part.strip() for part in parts[0::2]]
+        names = parts[1::2]
+        head, steps, pending = literals[0], [], []
+        for name, literal in zip(names, literals[1:]):
+            pending.append(name)
+            if literal:
+                steps.append((" ".join(pending), literal))
+                pending = []
+        template = cls(template_id, head, steps, " ".join(pending) or None)
+        if not head or not steps or template.literal_chars < MIN_LITERAL_CHARS:
+            return None
+        return template
+
+    def find(self, text: str, start: int = 0):
+        """(begin, end, {param: value}) of the first occurrence in text, or None"""
+        begin = text.find(self.head, start)
+        if begin < 0:
+            return None
+        pos = begin + len(self.head)
+        values = {}
+        for name, literal in self.steps:
+            end = text.find(literal, pos)
+            if end < 0:
+                return None
+            values.setdefault(name, text[pos:end].strip())
+            pos = end + len(literal)
+        if self.tail is not None:
+            end = text.find(PARAGRAPH_BREAK, pos)
+            end = len(text) if end < 0 else end
+            values.setdefault(self.tail, text[pos:end].strip())
+            pos = end
+        return begin, pos, values
+
+    def to_json(self) -> list:
+        return [self.id, self.head, [list(step) for step in self.steps], self.tail]
+
+    @classmethod
+    def from_json(cls, data: list) -> "Template":
+        return cls(data[0], data[1], [tuple(step) for step in data[2]], data[3])
+
+
+class KeyCanonicalizer:
+    """Canonical form and cache key of a (prompt, context) pair"""
+
+    def __init__(self, templates: list, rules: dict):
+        # Longest templates first, so a template is not claimed by a shorter one it contains
+        self.templates = sorted(templates, key=lambda t: (-t.literal_chars, t.id))
+        self.ignore = set(rules.get("ignore_params", []))
+        self.unordered = set(rules.get("unordered_params", []))
+        self.volatile = [(re.compile(spec["pattern"]), spec.get("replacement", ""))
+                         for spec in rules.get("volatile_patterns", [])]
+
+    @classmethod
+    def load(cls, templates_file: str = DEFAULT_TEMPLATES, rules_file: str = DEFAULT_RULES_FILE,
+             cache_dir=CACHE_DIR) -> "KeyCanonicalizer":
+        """Compile templates and rules, reusing a cached compilation of the same content
+
+        A missing templates file is not an error: keys are then canonicalized
+        by whitespace and volatile patterns only.
+        """
+        try:
+            with open(templates_file, 'rb') as f:
+                templates_source = f.read()
+        except OSError:
+            templates_source = b""
+        with open(rules_file, 'rb') as f:
+            rules_source = f.read()
+        digest = hashlib.sha256(b"\0".join([KEY_VERSION.encode(), templates_source,
+                                            rules_source])).hexdigest()
+        cache_file = os.path.join(cache_dir, f"{digest}.json") if cache_dir else None
+
+        compiled = None
+        if cache_file:
+            try:
+                with open(cache_file, encoding='utf-8') as f:
+                    compiled = json.load(f)
+            except (OSError, ValueError):
+                pass
+        if compiled is None:
+            compiled = compile_sources(templates_source, rules_source)
+            if cache_file:
+                write_json(cache_file, compiled)
+        return cls([Template.from_json(t) for t in compiled["templates"]], compiled["rules"])
+
+    def scrub(self, text: str) -> str:
+        for pattern, replacement in self.volatile:
+            text = pattern.sub(replacement, text)
+        return text
+
+    def canonical_value(self, name: str, value: str):
+        names = name.split(" ")
+        if all(n in self.unordered for n in names):
+            return sorted(set(LIST_SEPARATOR_RE.split(value)) - {""})
+        return self.scrub(value)
+
+    def canonical_text(self, text: str) -> dict:
+        """Text with each located template replaced by {{template id}}, plus its parameters"""
+        text = normalize_whitespace(text)
+        matched = []
+        for template in self.templates:
+            found = template.find(text)
+            while found is not None:
+                begin, end, values = found
+                params = {name: self.canonical_value(name, value) for name, value in values.items()
+                          if not all(n in self.ignore for n in name.split(" "))}
+                matched.append([template.id, params])
+                marker = "{{" + template.id + "}}"
+                text = text[:begin] + marker + text[end:]
+                found = template.find(text, begin + len(marker))
+        return {"text": self.scrub(text), "templates": matched}
+
+    def document(self, prompt: str, context: str = "") -> dict:
+        return {"version": KEY_VERSION, "prompt": self.canonical_text(prompt),
+                "context": self.canonical_text(context)}
+
+    @staticmethod
+    def key(document: dict) -> str:
+        encoded = json.dumps(document, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def compile_sources(templates_source: bytes, rules_source: bytes) -> dict:
+    """Parse the templates and rules YAML into the cached (JSON) form"""
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    try:
+        rules = yaml.load(rules_source, Loader=loader) or {}
+        data = yaml.load(templates_source, Loader=loader) if templates_source else None
+    except yaml.YAMLError as e:
+        raise ValueError(f"invalid YAML: {e}") from e
+    param_re = re.compile(rules.get("param_pattern", DEFAULT_PARAM_PATTERN))
+
+    templates, seen = [], set()
+    for template_id, text in collect_templates(data, param_re).items():
+        template = Template.compile(template_id, text, param_re)
+        # Backup files repeat templates; the first path wins
+        if template is not None and (template.head, tuple(template.steps)) not in seen:
+            seen.add((template.head, tuple(template.steps)))
+            templates.append(template.to_json())
+    return {"templates": templates, "rules": rules}
+
+
+def write_json(path: str, data) -> None:
+    """Write JSON atomically; the cache is best effort"""
+    import tempfile
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+
+
+# ----------------------------------------------------------------------
+# Near-duplicate detection
+# ----------------------------------------------------------------------
+
+def shingle_text(document: dict) -> str:
+    """The words of a canonical document, templates included by id"""
+    words = []
+    for part in (document["prompt"], document["context"]):
+        words.append(part["text"])
+        for template_id, params in part["templates"]:
+            words.append(template_id)
+            for name in sorted(params):
+                value = params[name]
+                words.append(name)
+                words.append(" ".join(value) if isinstance(value, list) else value)
+    return " ".join(words)
+
+
+def signature(text: str) -> list:
+    """One-permutation MinHash of the word n-gram shingles of text
+
+    Each shingle hash goes to bin hash % SIGNATURE_BINS, which keeps the
+    smallest hash // SIGNATURE_BINS. Bins no shingle reached hold EMPTY_BIN.
+    """
+    tokens = TOKEN_RE.findall(text.lower())
+    if len(tokens) <= SHINGLE_SIZE:
+        shingles = {" ".join(tokens)}
+    else:
+        shingles = {" ".join(tokens[i:i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)}
+    bins = [EMPTY_BIN] * SIGNATURE_BINS
+    for shingle in shingles:
+        value = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
+        index, rank = value % SIGNATURE_BINS, value // SIGNATURE_BINS
+        if rank < bins[index]:
+            bins[index] = rank
+    return bins
+
+
+def similarity(a: list, b: list) -> float:
+    """Estimated Jaccard similarity of two signatures' shingle sets"""
+    matches = used = 0
+    for x, y in zip(a, b):
+        if x == EMPTY_BIN and y == EMPTY_BIN:
+            continue
+        used += 1
+        matches += x == y
+    return matches / used if used else 0.0
+
+
+def band_hashes(sig: list) -> list:
+    """One LSH bucket per band of BAND_ROWS bins; bands of empty bins are skipped"""
+    hashes = []
+    for band, start in enumerate(range(0, len(sig), BAND_ROWS)):
+        rows = sig[start:start + BAND_ROWS]
+        if all(row == EMPTY_BIN for row in rows):
+            continue
+        digest = hashlib.blake2b(struct.pack(f">B{len(rows)}Q", band, *rows), digest_size=8).digest()
+        # SQLite integers are signed 64-bit
+        hashes.append(int.from_bytes(digest, 'big') >> 1)
+    return hashes
+
+
+def pack_signature(sig: list) -> bytes:
+    return struct.pack(f">{len(sig)}Q", *sig)
+
+
+def unpack_signature(blob: bytes) -> list:
+    return list(struct.unpack(f">{len(blob) // 8}Q", blob))
+
+
+SIGNATURE_SCHEMA = """
+BEGIN IMMEDIATE;
+CREATE TABLE IF NOT EXISTS prompt_signatures (
+    key TEXT PRIMARY KEY,
+    signature BLOB NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS prompt_signatures_created ON prompt_signatures (created);
+CREATE TABLE IF NOT EXISTS prompt_bands (band_hash INTEGER NOT NULL, key TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS prompt_bands_hash ON prompt_bands (band_hash);
+CREATE INDEX IF NOT EXISTS prompt_bands_key ON prompt_bands (key);
+CREATE TRIGGER IF NOT EXISTS entries_delete_signature AFTER DELETE ON entries BEGIN
+    DELETE FROM prompt_bands WHERE key = OLD.key;
+    DELETE FROM prompt_signatures WHERE key = OLD.key;
+END;
+COMMIT;
+"""
+
+
+class NearDuplicateIndex:
+    """Prompt signatures stored next to the responses in the ai_cache_store database
+
+    Signatures are deleted with their cache entries (by trigger); signatures
+    of prompts whose response was never stored are pruned after the TTL.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    @classmethod
+    def open(cls, db_path: str):
+        """Index in an existing response store, or None when there is no store yet"""
+        import sqlite3
+        if not os.path.exists(db_path):
+            return None
+        conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT, isolation_level=None)
+        tables = {name for (name,) in conn.execute("SELECT name FROM sqlite_master")}
+        if "entries" not in tables:
+            conn.close()
+            return None
+        if "entries_delete_signature" not in tables:
+            conn.executescript(SIGNATURE_SCHEMA)
+        return cls(conn)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def lookup(self, key: str, sig: list, threshold: float = NEAR_DUPLICATE_THRESHOLD,
+               ttl: float = DEFAULT_TTL):
+        """(near key, similarity) of the most similar fresh cached prompt, or None
+
+        Nothing is reported when key itself is cached and fresh.
+        """
+        now = time.time()
+        row = self.conn.execute("SELECT created FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is not None and now - row[0] <= ttl:
+            return None
+        bands = band_hashes(sig)
+        if not bands:
+            return None
+        rows = self.conn.execute(
+            "SELECT DISTINCT s.key, s.signature FROM prompt_bands b"
+            " JOIN prompt_signatures s ON s.key = b.key JOIN entries e ON e.key = s.key"
+            f" WHERE b.band_hash IN ({','.join('?' * len(bands))}) AND s.key != ? AND e.created >= ?",
+            (*bands, key, now - ttl))
+        best = max(((similarity(sig, unpack_signature(blob)), near_key) for near_key, blob in rows),
+                   default=None)
+        if best is None or best[0] < threshold:
+            return None
+        return best[1], best[0]
+
+    def record(self, key: str, sig: list, ttl: float = DEFAULT_TTL) -> None:
+        """Index a prompt's signature (once per key)"""
+        if self.conn.execute("SELECT 1 FROM prompt_signatures WHERE key = ?", (key,)).fetchone():
+            return
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            orphans = ("SELECT key FROM prompt_signatures WHERE created < ?"
+                       " AND key NOT IN (SELECT key FROM entries)")
+            self.conn.execute(f"DELETE FROM prompt_bands WHERE key IN ({orphans})", (now - ttl,))
+            self.conn.execute(f"DELETE FROM prompt_signatures WHERE key IN ({orphans})", (now - ttl,))
+            self.conn.execute("INSERT OR REPLACE INTO prompt_signatures VALUES (?, ?, ?)",
+                              (key, pack_signature(sig), now))
+            self.conn.executemany("INSERT INTO prompt_bands VALUES (?, ?)",
+                                  [(band, key) for band in band_hashes(sig)])
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+
+def read_input(stream) -> tuple:
+    """(prompt, context) from "prompt\\0context" on a binary stream"""
+    prompt, _, context = stream.read().decode('utf-8', errors='replace').partition("\0")
+    return prompt, context
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Canonical AI response cache keys for prompts")
+    parser.add_argument("prompt", nargs="?", help="Prompt (default: read \"prompt\\0context\" from stdin)")
+    parser.add_argument("context", nargs="?", default="", help="Prompt context")
+    parser.add_argument("--templates", default=DEFAULT_TEMPLATES,
+                        help=f"Prompt templates YAML (default: {DEFAULT_TEMPLATES})")
+    parser.add_argument("--rules", default=DEFAULT_RULES_FILE,
+                        help="Canonicalization rules YAML (default: prompt_key_rules.yaml)")
+    parser.add_argument("--cache-dir", default=CACHE_DIR,
+                        help=f"Compiled templates cache (default: {CACHE_DIR})")
+    parser.add_argument("--no-cache", action="store_true", help="Compile templates on every run")
+    parser.add_argument("--db", help="Report near duplicates among the prompts cached in this "
+                                     "ai_cache_store.py database")
+    parser.add_argument("--threshold", type=float, default=NEAR_DUPLICATE_THRESHOLD,
+                        help=f"Minimum estimated similarity of a near duplicate "
+                             f"(default: {NEAR_DUPLICATE_THRESHOLD})")
+    parser.add_argument("--ttl", type=float, default=DEFAULT_TTL,
+                        help=f"Only cached entries younger than this count (default: {DEFAULT_TTL})")
+    parser.add_argument("--explain", action="store_true",
+                        help="Print the canonical form as JSON before the key")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.prompt is None:
+        prompt, context = read_input(sys.stdin.buffer)
+    else:
+        prompt, context = args.prompt, args.context
+
+    try:
+        canonicalizer = KeyCanonicalizer.load(args.templates, args.rules,
+                                              None if args.no_cache else args.cache_dir)
+    except (OSError, ValueError) as e:
+        print(f"Error: cannot load prompt key rules: {e}", file=sys.stderr)
+        return 2
+    document = canonicalizer.document(prompt, context)
+    key = canonicalizer.key(document)
+    if args.explain:
+        print(json.dumps(document, indent=2, ensure_ascii=False))
+
+    near = None
+    if args.db:
+        import sqlite3
+        try:
+            index = NearDuplicateIndex.open(args.db)
+            if index is not None:
+                sig = signature(shingle_text(document))
+                near = index.lookup(key, sig, args.threshold, args.ttl)
+                index.record(key, sig, args.ttl)
+                index.close()
+        except sqlite3.Error as e:
+            # The key is still usable; only near-duplicate reporting is lost
+            print(f"Warning: near-duplicate index {args.db}: {e}", file=sys.stderr)
+
+    print(key if near is None else f"{key} {near[0]} {near[1]:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Prompt Template Rules
+Declarative checks for AI prompt task templates, compiled once and applied in a single scan
+
+Rules are loaded from YAML (see context_block_rules.yaml) and every regex is
+compiled once at load time. Each template is scanned once for parameters
+(one findall() shared by all parameter rules); literals are located with
+str.find(), so no Python-level loop runs over the template's characters or
+tokens.
+
+Rule types:
+    contains         - a literal must appear            (text)
+    required_params  - parameters that must be used     (params)
+    param_forbid     - parameters must not match regex  (pattern)
+    section_lines    - every non-blank line between two
+                       literals must match a regex       (start, end, line_pattern)
+
+New types can be added with @rule_type("name").
+
+Version: 1.0.0
+Created: 2026-10-18
+"""
+
+import re
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Set
+
+import yaml
+
+DEFAULT_RULES_FILE = Path(__file__).resolve().parent / "context_block_rules.yaml"
+DEFAULT_PARAM_PATTERN = r'\{(\w+)\}'
+
+
+class Scan(NamedTuple):
+    """A template and the parameters found in it"""
+    text: str
+    params: List[str]       # in order of appearance, with repeats
+    names: Set[str]         # distinct parameter names
+
+
+class Rule(ABC):
+    """Base class: one declarative check"""
+
+    def __init__(self, spec: dict):
+        self.id = spec.get("id", self.__class__.__name__)
+        self.message = spec["message"]
+        self.description = spec.get("description", "")
+
+    @abstractmethod
+    def check(self, scan: Scan) -> Optional[str]:
+        """Return a failure message, or None when the template passes"""
+
+
+RULE_TYPES: Dict[str, type] = {}
+
+
+def rule_type(name: str):
+    """Register a Rule subclass under a YAML "type" name"""
+    def decorator(cls):
+        RULE_TYPES[name] = cls
+        return cls
+    return decorator
+
+
+@rule_type("contains")
+class ContainsRule(Rule):
+    def __init__(self, spec: dict):
+        super().__init__(spec)
+        self.text = spec["text"]
+
+    def check(self, scan: Scan) -> Optional[str]:
+        if self.text not in scan.text:
+            return self.message
+        return None
+
+
+@rule_type("required_params")
+class RequiredParamsRule(Rule):
+    def __init__(self, spec: dict):
+        super().__init__(spec)
+        self.params = list(spec["params"])
+
+    def check(self, scan: Scan) -> Optional[str]:
+        missing = [p for p in self.params if p not in scan.names]
+        if missing:
+            return self.message.format(items=", ".join(missing), count=len(missing))
+        return None
+
+
+@rule_type("param_forbid")
+class ParamForbidRule(Rule):
+    def __init__(self, spec: dict):
+        super().__init__(spec)
+        self.pattern = re.compile(spec["pattern"])
+
+    def check(self, scan: Scan) -> Optional[str]:
+        # Test each distinct name once, then report every occurrence in order
+        search = self.pattern.search
+        bad_names = {name for name in scan.names if search(name)}
+        if bad_names:
+            bad = [p for p in scan.params if p in bad_names]
+            return self.message.format(items=", ".join(bad), count=len(bad))
+        return None
+
+
+@rule_type("section_lines")
+class SectionLinesRule(Rule):
+    def __init__(self, spec: dict):
+        super().__init__(spec)
+        self.start = spec["start"]
+        self.end = spec["end"]
+        self.line_pattern = re.compile(spec["line_pattern"])
+
+    def check(self, scan: Scan) -> Optional[str]:
+        text = scan.text
+        body_start = text.find(self.start)
+        if body_start < 0:
+            return None
+        body_start += len(self.start)
+        body_end = text.find(self.end, body_start)
+        if body_end < 0:
+            body_end = len(text)
+
+        match = self.line_pattern.match
+        bad = sum(1 for line in text[body_start:body_end].split('\n')
+                  if line.strip() and not match(line.strip()))
+        if bad:
+            return self.message.format(count=bad, items="")
+        return None
+
+
+class RuleSet:
+    """A compiled set of rules sharing one parameter scan"""
+
+    def __init__(self, rules: List[Rule], param_pattern: str = DEFAULT_PARAM_PATTERN):
+        self.rules = rules
+        self.param_re = re.compile(param_pattern)
+        if self.param_re.groups > 1:
+            raise ValueError(f"param_pattern must have at most one group: {param_pattern}")
+
+    @classmethod
+    def from_yaml(cls, path: Path = DEFAULT_RULES_FILE) -> "RuleSet":
+        with open(path, encoding='utf-8') as f:
+            spec = yaml.safe_load(f) or {}
+        rules = []
+        for rule_spec in spec.get("rules", []):
+            try:
+                rules.append(RULE_TYPES[rule_spec["type"]](rule_spec))
+            except KeyError as e:
+                raise ValueError(f"{path}: invalid rule {rule_spec.get('id', rule_spec)}: missing or unknown {e}")
+            except TypeError as e:  # e.g. a registered type without check()
+                raise ValueError(f"{path}: invalid rule {rule_spec.get('id', rule_spec)}: {e}")
+        return cls(rules, spec.get("param_pattern", DEFAULT_PARAM_PATTERN))
+
+    def scan(self, text: str) -> Scan:
+        """Collect the template's parameters in one pass"""
+        params = self.param_re.findall(text)
+        return Scan(text, params, set(params))
+
+    def check(self, text: str) -> List[str]:
+        """Return the failure messages for one template"""
+        scan = self.scan(text)
+        failures = []
+        for rule in self.rules:
+            failure = rule.check(scan)
+            if failure:
+                failures.append(failure)
+        return failures
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Reporter
+Buffered, pluggable result reporting shared by the documentation validators
+
+Usage:
+    from ai_workflow_docs.reporter import Reporter, add_report_arguments, reporting
+
+    class MyValidator(Reporter):
+        def validate_all(self) -> int:
+            self.success("Everything in place")
+            return 1 if self.counts['error'] else 0
+
+    add_report_arguments(parser)
+    with reporting(validator, args, "my-tool"):
+        exit_code = validator.validate_all()
+
+Every recorded message passes through report(level, msg), which counts it
+and hands it to the configured sinks (one per --format, plus the
+--stream-results file). Subclasses override report() to redirect messages
+(check_doc_links buffers them per file).
+
+Formats:
+    text   colored lines; errors and warnings on stderr, written in batches
+    json   one document: {"tool", "version", "results": [...], "summary"}
+    sarif  SARIF 2.1.0 log of warnings and errors, for code scanning
+    junit  JUnit XML, one test case per result (errors are failures)
+
+Structured formats are written incrementally, to --output or stdout; when
+they go to stdout, the human-readable progress is moved to stderr. Results
+that start with "<file>: " are attributed to that file.
+
+--quiet drops success results from every format (they are still counted).
+--stream-results FILE writes each result to FILE as NDJSON as it is
+produced, and the validator then keeps only counts instead of its
+errors/warnings/successes lists, so memory stays flat on large trees.
+
+Version: 1.1.0
+Created: 2026-10-18
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+from abc import ABC, abstractmethod
+from html import escape
+from pathlib import Path
+from typing import IO, Callable, Dict, Iterator, List, Optional, Type
+
+from . import __version__
+
+# ANSI color codes
+RED = '\033[0;31m'
+GREEN = '\033[0;32m'
+YELLOW = '\033[1;33m'
+BLUE = '\033[0;34m'
+NC = '\033[0m'  # No Color
+
+LEVELS = ('error', 'warning', 'success')
+
+# "<file>: message" prefix used by per-file results
+LOCATION_RE = re.compile(r"^([^\s:]+\.\w+): ")
+
+# Lines written to a non-interactive stream per batch
+TEXT_BATCH_LINES = 512
+
+
+def quoteattr(value: str) -> str:
+    """XML attribute value with quotes (html.escape is much lighter to import than xml.sax)"""
+    return f'"{escape(value)}"'
+
+
+def summary(counts: Dict[str, int]) -> Dict[str, int]:
+    """Result counts as reported in the json format and --stream-results file"""
+    return {"errors": counts['error'], "warnings": counts['warning'], "successes": counts['success']}
+
+
+def split_location(msg: str):
+    """Return (file, message) for results of the form "<file>: message"; file may be None"""
+    match = LOCATION_RE.match(msg)
+    if match is None:
+        return None, msg
+    return match.group(1), msg[match.end():]
+
+
+# Output formats ------------------------------------------------------------
+
+FORMATS: Dict[str, Type["Sink"]] = {}
+
+
+def register_format(name: str) -> Callable[[Type["Sink"]], Type["Sink"]]:
+    """Class decorator registering a sink as a --format choice"""
+    def decorator(cls: Type["Sink"]) -> Type["Sink"]:
+        FORMATS[name] = cls
+        return cls
+    return decorator
+
+
+class Sink(ABC):
+    """Receives results as they are reported
+
+    tool names the producing subcommand, base is the directory result paths
+    are relative to and stream is where the format writes (None for text).
+    """
+
+    # Structured sinks take over stdout; the text progress moves to stderr
+    structured = True
+
+    def __init__(self, tool: str, base: Optional[Path] = None, stream: Optional[IO[str]] = None):
+        self.tool = tool
+        self.base = base
+        self.stream = stream
+
+    def location(self, msg: str):
+        """(uri, message) for a result, with uri relative to the working directory"""
+        path, text = split_location(msg)
+        if path is not None and self.base is not None:
+            path = Path(os.path.normpath(self.base / path)).as_posix()
+        return path, text
+
+    @abstractmethod
+    def emit(self, level: str, msg: str) -> None:
+        """Write one result; level is 'error', 'warning' or 'success'"""
+
+    def close(self, counts: Dict[str, int]) -> None:
+        """Finish the output once all results are in"""
+
+
+@register_format("text")
+class TextSink(Sink):
+    """Colored lines as the validators always printed them, in batches"""
+
+    structured = False
+
+    def __init__(self, tool: str, base: Optional[Path] = None, stream: Optional[IO[str]] = None):
+        super().__init__(tool, base, stream)
+        self.pending: List[str] = []
+        # An interactive stderr shows errors as they happen
+        self.batch = 1 if sys.stderr.isatty() else TEXT_BATCH_LINES
+
+    def emit(self, level: str, msg: str) -> None:
+        if level == 'success':
+            # stdout is already block-buffered when it is not a terminal
+            sys.stdout.write(f"{GREEN}✓{NC} {msg}\n")
+            return
+        if level == 'error':
+            self.pending.append(f"{RED}✗ ERROR{NC}: {msg}\n")
+        else:
+            self.pending.append(f"{YELLOW}⚠ WARNING{NC}: {msg}\n")
+        if len(self.pending) >= self.batch:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.pending:
+            sys.stderr.write("".join(self.pending))
+            self.pending.clear()
+
+    def close(self, counts: Dict[str, int]) -> None:
+        self.flush()
+
+
+@register_format("json")
+class JSONSink(Sink):
+    """One JSON document, written result by result"""
+
+    def __init__(self, tool: str, base: Optional[Path] = None, stream: Optional[IO[str]] = None):
+        super().__init__(tool, base, stream)
+        self.stream.write('{"tool": %s, "version": %s, "results": [' % (
+            json.dumps(f"ai-workflow-docs {tool}"), json.dumps(__version__)))
+        self.separator = "\n"
+
+    def emit(self, level: str, msg: str) -> None:
+        path, text = self.location(msg)
+        self.stream.write(self.separator + json.dumps({"level": level, "file": path, "message": text},
+                                                      ensure_ascii=False))
+        self.separator = ",\n"
+
+    def close(self, counts: Dict[str, int]) -> None:
+        self.stream.write('\n], "summary": %s}\n' % json.dumps(summary(counts)))
+
+
+@register_format("sarif")
+class SARIFSink(Sink):
+    """SARIF 2.1.0 log; only warnings and errors become results"""
+
+    SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+    def __init__(self, tool: str, base: Optional[Path] = None, stream: Optional[IO[str]] = None):
+        super().__init__(tool, base, stream)
+        driver = {"name": f"ai-workflow-docs {tool}", "version": __version__,
+                  "rules": [{"id": tool, "shortDescription": {"text": f"ai-workflow-docs {tool}"}}]}
+        self.stream.write('{"$schema": %s, "version": "2.1.0", "runs": [{"tool": {"driver": %s}, "results": [' % (
+            json.dumps(self.SCHEMA), json.dumps(driver)))
+        self.separator = "\n"
+
+    def emit(self, level: str, msg: str) -> None:
+        if level == 'success':
+            return
+        path, text = self.location(msg)
+        result = {"ruleId": self.tool, "level": level, "message": {"text": text}}
+        if path is not None:
+            result["locations"] = [{"physicalLocation": {"artifactLocation": {"uri": path}}}]
+        self.stream.write(self.separator + json.dumps(result, ensure_ascii=False))
+        self.separator = ",\n"
+
+    def close(self, counts: Dict[str, int]) -> None:
+        self.stream.write("\n]}]}\n")
+
+
+@register_format("junit")
+class JUnitSink(Sink):
+    """JUnit XML; test cases are spooled to a temporary file until the counts are known"""
+
+    def __init__(self, tool: str, base: Optional[Path] = None, stream: Optional[IO[str]] = None):
+        super().__init__(tool, base, stream)
+        self.spool = tempfile.TemporaryFile(mode="w+", encoding="utf-8")
+        # Emitted cases (with --quiet, successes are counted but not emitted)
+        self.cases = 0
+        self.failures = 0
+
+    def emit(self, level: str, msg: str) -> None:
+        path, text = self.location(msg)
+        self.cases += 1
+        self.failures += level == 'error'
+        case = f'  <testcase classname={quoteattr(path or self.tool)} name={quoteattr(text)}'
+        if level == 'error':
+            case += f'>\n    <failure message={quoteattr(text)} type="error"/>\n  </testcase>\n'
+        elif level == 'warning':
+            case += f'>\n    <system-out>WARNING: {escape(text, quote=False)}</system-out>\n  </testcase>\n'
+        else:
+            case += '/>\n'
+        self.spool.write(case)
+
+    def close(self, counts: Dict[str, int]) -> None:
+        self.stream.write('<?xml version="1.0" encoding="UTF-8"?>\n<testsuites>\n')
+        self.stream.write(f'<testsuite name={quoteattr("ai-workflow-docs " + self.tool)} '
+                          f'tests="{self.cases}" failures="{self.failures}" errors="0" skipped="0">\n')
+        self.spool.seek(0)
+        shutil.copyfileobj(self.spool, self.stream)
+        self.spool.close()
+        self.stream.write('</testsuite>\n</testsuites>\n')
+
+
+class NDJSONSink(Sink):
+    """--stream-results: one JSON object per result, then a summary record"""
+
+    def emit(self, level: str, msg: str) -> None:
+        path, text = self.location(msg)
+        self.stream.write(json.dumps({"kind": "result", "level": level, "file": path, "message": text},
+                                     ensure_ascii=False) + "\n")
+
+    def close(self, counts: Dict[str, int]) -> None:
+        self.stream.write(json.dumps({"kind": "summary", **summary(counts)}) + "\n")
+
+
+# Reporter ------------------------------------------------------------------
+
+class Reporter:
+    """Counts validation messages and passes them to the configured sinks"""
+
+    def __init__(self):
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self.successes: List[str] = []
+        self.counts: Dict[str, int] = dict.fromkeys(LEVELS, 0)
+        self.sinks: List[Sink] = [TextSink("")]
+        # False in bounded-memory mode: results are only counted and streamed
+        self.keep_results = True
+        self.quiet = False
+        # Directory the "<file>: " prefixes of results are relative to
+        self.location_base: Optional[Path] = None
+
+    def report(self, level: str, msg: str) -> None:
+        """Record a message; level is 'error', 'warning' or 'success'"""
+        self.counts[level] += 1
+        if level == 'success' and self.quiet:
+            return
+        if self.keep_results:
+            if level == 'error':
+                self.errors.append(msg)
+            elif level == 'warning':
+                self.warnings.append(msg)
+            else:
+                self.successes.append(msg)
+        for sink in self.sinks:
+            sink.emit(level, msg)
+
+    def error(self, msg: str) -> None:
+        """Record an error"""
+        self.report('error', msg)
+
+    def warning(self, msg: str) -> None:
+        """Record a warning"""
+        self.report('warning', msg)
+
+    def success(self, msg: str) -> None:
+        """Record a success"""
+        self.report('success', msg)
+
+    def info(self, msg: str) -> None:
+        """Print info message"""
+        print(f"{BLUE}ℹ{NC} {msg}")
+
+    def flush_results(self) -> None:
+        """Write out batched text results so a following summary comes after them"""
+        sys.stdout.flush()
+        for sink in self.sinks:
+            if isinstance(sink, TextSink):
+                sink.flush()
+
+    def print_totals(self) -> None:
+        """Print the success/warning/error counts"""
+        self.flush_results()
+        print(f"Successes: {self.counts['success']}")
+        print(f"Warnings:  {self.counts['warning']}")
+        print(f"Errors:    {self.counts['error']}")
+
+    def close_report(self) -> None:
+        """Finish every sink's output"""
+        for sink in self.sinks:
+            sink.close(self.counts)
+
+
+def add_report_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add --format, --output, --quiet and --stream-results to a validator's parser"""
+    parser.add_argument("--format", choices=sorted(FORMATS), default="text",
+                        help="Result format (default: text)")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Write json/sarif/junit results to this file (default: stdout)")
+    parser.add_argument("-q", "--quiet", action="store_true",
+                        help="Do not report successes (they are still counted)")
+    parser.add_argument("--stream-results", type=Path, default=None, metavar="FILE",
+                        help="Stream every result to FILE as NDJSON and keep only counts in memory")
+
+
+@contextlib.contextmanager
+def reporting(reporter: Reporter, args: argparse.Namespace, tool: str) -> Iterator[None]:
+    """Configure a reporter from parsed arguments for the duration of one run
+
+    Output files are opened here and every sink is closed on exit.
+    """
+    with contextlib.ExitStack() as stack:
+        stdout = sys.stdout
+        if args.output is not None:
+            stream = stack.enter_context(open(args.output, "w", encoding="utf-8"))
+        else:
+            stream = stdout
+        sink = FORMATS[args.format](tool, reporter.location_base, stream)
+        reporter.sinks = [sink]
+        reporter.quiet = args.quiet
+        if args.stream_results is not None:
+            results = stack.enter_context(open(args.stream_results, "w", encoding="utf-8"))
+            reporter.sinks.append(NDJSONSink(tool, reporter.location_base, results))
+            reporter.keep_results = False
+        if sink.structured and stream is stdout:
+            # Keep stdout a clean document; progress and summaries go to stderr
+            stack.enter_context(contextlib.redirect_stdout(sys.stderr))
+        try:
+            yield
+        finally:
+            reporter.close_report()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+API Documentation Validator
+Validates structure and completeness of API documentation
+
+Usage:
+    ai-workflow-docs validate-api [docs_dir] [--plugin MODULE ...] [--format text|json|sarif|junit] [--quiet]
+
+Each --plugin module is imported before validation; the checks it
+registers with @register_check run after the built-in ones.
+
+Version: 1.1.0
+Created: 2026-02-07
+"""
+
+import argparse
+import sys
+import re
+from importlib import import_module
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from .doc_corpus import DocCorpus
+from .reporter import Reporter, add_report_arguments, reporting
+
+# Additional checks registered by plugins: (section title, check function)
+# Each check is called as check(validator, corpus) after the built-in checks.
+Check = Tuple[str, Callable[["APIDocValidator", DocCorpus], None]]
+REGISTERED_CHECKS: List[Check] = []
+
+
+def register_check(title: str):
+    """Decorator registering an extra check that runs against the shared corpus
+
+    Example:
+        @register_check("Link Text Validation")
+        def check_link_text(validator, corpus):
+            for doc in corpus:
+                ...
+    """
+    def decorator(func: Callable[["APIDocValidator", DocCorpus], None]):
+        REGISTERED_CHECKS.append((title, func))
+        return func
+    return decorator
+
+
+def load_plugins(modules: List[str]) -> List[Check]:
+    """Import plugin modules and return the checks they registered
+    
+    Modules are imported once per process, so a module loaded by an earlier
+    call (e.g. an earlier docs daemon request) still yields its checks.
+    Raises ImportError when a module cannot be imported.
+    """
+    names = {import_module(module).__name__ for module in modules}
+    return [(title, check) for title, check in REGISTERED_CHECKS if check.__module__ in names]
+
+
+class APIDocValidator(Reporter):
+    """Validates API documentation structure and completeness"""
+    
+    def __init__(self, docs_dir: str = "docs/api", checks: Optional[List[Check]] = None):
+        super().__init__()
+        self.docs_dir = Path(docs_dir)
+        self.corpus: Optional[DocCorpus] = None
+        # Extra checks to run (default: every registered check)
+        self.checks = REGISTERED_CHECKS if checks is None else checks
+        # Corpus paths are relative to the parent of the docs directory
+        self.location_base = self.docs_dir.parent
+        
+    def validate_all(self) -> int:
+        """Run all validation checks. Returns 0 if valid, 1 if errors"""
+        print("╔════════════════════════════════════════════════════════╗")
+        print("║      API Documentation Validator v1.1.0               ║")
+        print("╚════════════════════════════════════════════════════════╝")
+        print()
+        
+        # Check if docs directory exists
+        if not self.docs_dir.exists():
+            self.info(f"API docs directory not found: {self.docs_dir}")
+            self.info("Skipping API documentation validation (optional)")
+            return 0
+            
+        self.info(f"Validating API documentation in: {self.docs_dir}")
+        print()
+        
+        # Load every document once; all checks share the parsed corpus
+        # (a caller such as the docs daemon may supply one already loaded)
+        if self.corpus is None:
+            self.corpus = DocCorpus(self.docs_dir)
+        
+        # Run validation checks
+        self._validate_structure()
+        self._validate_markdown_files()
+        self._validate_code_examples()
+        self._validate_cross_references()
+        
+        for title, check in self.checks:
+            print()
+            print(f"═══ {title} ═══")
+            check(self, self.corpus)
+        
+        # Print summary
+        self.flush_results()
+        print()
+        print("═══ Validation Summary ═══")
+        self.print_totals()
+        
+        return 1 if self.counts['error'] else 0
+        
+    def _validate_structure(self) -> None:
+        """Validate API documentation directory structure"""
+        print("═══ Structure Validation ═══")
+        
+        # Check for README
+        readme = self.docs_dir / "README.md"
+        if readme.exists():
+            self.success(f"API README found: {readme.name}")
+        else:
+            self.warning(f"API README not found: {readme}")
+            
+        # Count markdown files
+        self.info(f"Found {len(self.corpus)} API documentation files")
+        
+        if len(self.corpus) == 0:
+            self.warning("No API documentation files found")
+        else:
+            self.success(f"API documentation files present: {len(self.corpus)}")
+            
+    def _validate_markdown_files(self) -> None:
+        """Validate markdown file structure"""
+        print()
+        print("═══ Markdown Structure Validation ═══")
+        
+        for doc in self.corpus:
+            relative_path = doc.relative_path
+            
+            if doc.read_error:
+                self.error(f"{relative_path}: Failed to read - {doc.read_error}")
+                continue
+                
+            # Check for title (# heading)
+            if not any(h.level == 1 and re.match(r'\w', h.text) for h in doc.headings):
+                self.warning(f"{relative_path}: Missing top-level heading")
+            else:
+                self.success(f"{relative_path}: Has title")
+                
+            # Check for sections
+            sections = [h for h in doc.headings if h.level == 2]
+            if len(sections) < 2:
+                self.warning(f"{relative_path}: Few sections ({len(sections)})")
+                
+            # Check for code blocks
+            if doc.code_blocks:
+                self.info(f"{relative_path}: Has {len(doc.code_blocks)} code blocks")
+                
+    def _validate_code_examples(self) -> None:
+        """Validate code examples in documentation"""
+        print()
+        print("═══ Code Example Validation ═══")
+        
+        total_examples = 0
+        invalid_examples = 0
+        
+        for doc in self.corpus:
+            relative_path = doc.relative_path
+            
+            if doc.read_error:
+                self.error(f"{relative_path}: Failed to validate examples - {doc.read_error}")
+                continue
+                
+            for block in doc.code_blocks:
+                total_examples += 1
+                
+                # Check for language specification
+                if not block.language:
+                    self.warning(f"{relative_path}: Code block without language")
+                    invalid_examples += 1
+                    
+                # Check for empty code blocks
+                if not block.code.strip():
+                    self.warning(f"{relative_path}: Empty code block")
+                    invalid_examples += 1
+                
+        if total_examples > 0:
+            self.success(f"Validated {total_examples} code examples")
+            if invalid_examples > 0:
+                self.warning(f"{invalid_examples} code examples need improvement")
+        else:
+            self.info("No code examples found")
+            
+    def _validate_cross_references(self) -> None:
+        """Validate cross-references between API docs"""
+        print()
+        print("═══ Cross-Reference Validation ═══")
+        
+        all_files = self.corpus.stems
+        broken_refs = 0
+        
+        for doc in self.corpus:
+            relative_path = doc.relative_path
+            
+            if doc.read_error:
+                self.error(f"{relative_path}: Failed to validate references - {doc.read_error}")
+                continue
+                
+            for link in doc.links:
+                link_url = link.url
+                # Check for internal .md references
+                if link_url.endswith('.md') and not link_url.startswith('http'):
+                    # Extract filename
+                    ref_file = Path(link_url).stem
+                    if ref_file not in all_files:
+                        self.warning(f"{relative_path}: Broken reference to {link_url}")
+                        broken_refs += 1
+                
+        if broken_refs == 0:
+            self.success("All cross-references valid")
+        else:
+            self.warning(f"Found {broken_refs} broken cross-references")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Validate API documentation structure and completeness")
+    parser.add_argument("docs_dir", nargs="?", default="docs/api",
+                        help="API documentation directory (default: docs/api)")
+    parser.add_argument("--plugin", action="append", default=[], metavar="MODULE",
+                        help="Import MODULE to register extra checks; repeatable")
+    add_report_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main entry point"""
+    args = parse_args(argv)
+    
+    try:
+        load_plugins(args.plugin)
+    except ImportError as e:
+        print(f"Error: Could not load plugin: {e}", file=sys.stderr)
+        return 2
+    
+    # Create validator and run
+    validator = APIDocValidator(args.docs_dir)
+    with reporting(validator, args, "validate-api"):
+        return validator.validate_all()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Context Block Consistency Validator
+Validates that all workflow step prompts follow standardized context block structure.
+
+Usage:
+    ai-workflow-docs validate-context [PATH_OR_GLOB ...] [--cache] [--cache-dir DIR]
+                                       [--rules FILE] [--require KEY ... | --no-require]
+
+Each argument may be a YAML file, a directory (searched recursively for
+*.yaml, *.yml and *.yaml.backup* files) or a glob such as
+'prompts/**/*.yaml'. Every file is validated in one process and reported
+together, with per-file timing. Documents are parsed with libyaml's
+CSafeLoader when available, and the step prompts extracted from each file are
+cached by content hash, so identical copies (e.g. backups) are parsed once
+and, with --cache, unchanged files are not re-parsed on later runs. Every
+top-level step*_prompt key is validated. The prompts given with --require
+(default: the six of REQUIRED_PROMPTS) must be present in every file, and
+a file without any step*_prompt key fails.
+
+Checks (declared in context_block_rules.yaml, compiled once by prompt_rules.py):
+1. Presence of **Context:** block
+2. Standard parameters: project_name, project_description, primary_language, change_scope, modified_count
+3. Parameter naming convention (snake_case, no title case)
+4. Bullet list format consistency
+
+Exit codes:
+    0 - All validations passed
+    1 - Validation failures found
+    2 - No input files found
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+import yaml
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .prompt_rules import DEFAULT_RULES_FILE, RuleSet
+
+# libyaml is several times faster than the pure-Python loader
+SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+DEFAULT_FILE = '.workflow_core/config/ai_helpers.yaml'
+CACHE_DIR = Path('.ai_workflow/cache/context_blocks')
+YAML_PATTERNS = ('*.yaml', '*.yml', '*.yaml.backup*')
+
+# Top-level keys holding step prompts, e.g. step2_consistency_prompt
+STEP_PROMPT_RE = re.compile(r'^step(\d+)\w*_prompt$')
+
+# Step prompts every file must define (the original validator's list)
+REQUIRED_PROMPTS = (
+    'step2_consistency_prompt',
+    'step3_script_refs_prompt',
+    'step4_directory_prompt',
+    'step5_test_review_prompt',
+    'step8_dependencies_prompt',
+    'step9_code_quality_prompt',
+)
+
+
+class PromptCache:
+    """Step prompts extracted from YAML documents, keyed by content hash.
+    
+    Entries are kept in memory for the run and, when a cache directory is
+    given, stored as small JSON files so later runs skip YAML parsing.
+    """
+    
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = cache_dir
+        self.entries: Dict[str, Dict[str, str]] = {}
+    
+    def get(self, digest: str) -> Optional[Dict[str, str]]:
+        if digest in self.entries:
+            return self.entries[digest]
+        if self.cache_dir is None:
+            return None
+        try:
+            prompts = json.loads((self.cache_dir / f"{digest}.json").read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        self.entries[digest] = prompts
+        return prompts
+    
+    def put(self, digest: str, prompts: Dict[str, str]) -> None:
+        self.entries[digest] = prompts
+        if self.cache_dir is None:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(prompts, f)
+        os.replace(temp_path, self.cache_dir / f"{digest}.json")
+
+
+def extract_step_prompts(data) -> Dict[str, str]:
+    """Map each top-level step*_prompt key to its task_template, in step order."""
+    if not isinstance(data, dict):
+        return {}
+    prompts = []
+    for key, value in data.items():
+        match = STEP_PROMPT_RE.match(str(key))
+        if match:
+            task = value.get('task_template', '') if isinstance(value, dict) else ''
+            prompts.append((int(match.group(1)), str(key), task or ''))
+    return {key: task for _, key, task in sorted(prompts)}
+
+
+def load_step_prompts(yaml_file: Path, cache: PromptCache) -> Tuple[Dict[str, str], bool]:
+    """Read a YAML file once and return (step prompts, served from cache)."""
+    content = yaml_file.read_bytes()
+    digest = hashlib.sha256(content).hexdigest()
+    
+    prompts = cache.get(digest)
+    if prompts is not None:
+        return prompts, True
+    
+    prompts = extract_step_prompts(yaml.load(content, Loader=SafeLoader))
+    cache.put(digest, prompts)
+    return prompts, False
+
+
+def step_label(prompt_name: str) -> str:
+    """'Step 2 (step2_consistency_prompt)': unique even when two keys share a step number"""
+    return f"Step {STEP_PROMPT_RE.match(prompt_name).group(1)} ({prompt_name})"
+
+
+def check_prompt(step_num: str, task: str, rules: Optional[RuleSet] = None) -> List[str]:
+    """Run the context block rules on one task_template."""
+    rules = rules or RuleSet.from_yaml()
+    return [f"{step_num}: {failure}" for failure in rules.check(task)]
+
+
+def validate_files(yaml_files: List[Path], cache: Optional[PromptCache] = None,
+                   rules: Optional[RuleSet] = None,
+                   required: Tuple[str, ...] = REQUIRED_PROMPTS) -> int:
+    """Validate every file and print one combined report.
+    
+    A file fails when it cannot be parsed, has no step*_prompt keys, lacks
+    one of the required prompts, or a prompt breaks a rule.
+    """
+    cache = cache or PromptCache()
+    rules = rules or RuleSet.from_yaml()
+    results = []
+    total_start = time.perf_counter()
+    
+    print("Validating Context Block Structure...")
+    print("=" * 79)
+    
+    for yaml_file in yaml_files:
+        start = time.perf_counter()
+        failures: List[str] = []
+        prompts: Dict[str, str] = {}
+        cached = False
+        try:
+            prompts, cached = load_step_prompts(yaml_file, cache)
+        except (OSError, yaml.YAMLError) as e:
+            failures.append(f"Could not load YAML: {e}")
+        else:
+            if not prompts:
+                failures.append("No step*_prompt keys found")
+            for prompt_name in required:
+                if prompt_name not in prompts:
+                    failures.append(f"{step_label(prompt_name)}: Prompt not found in YAML")
+        
+        for prompt_name, task in prompts.items():
+            failures.extend(check_prompt(step_label(prompt_name), task, rules))
+        
+        elapsed = (time.perf_counter() - start) * 1000
+        results.append((yaml_file, prompts, failures))
+        
+        status = "❌" if failures else "✅"
+        print(f"{status} {yaml_file} ({len(prompts)} prompts, {elapsed:.1f} ms{', cached' if cached else ''})")
+    
+    total_elapsed = (time.perf_counter() - total_start) * 1000
+    failed = [r for r in results if r[2]]
+    prompt_count = sum(len(r[1]) for r in results)
+    
+    # Report results
+    print()
+    print(f"Files: {len(results)}, prompts: {prompt_count}, "
+          f"failed files: {len(failed)}, total time: {total_elapsed:.1f} ms")
+    print()
+    if not failed:
+        print("✅ ALL VALIDATIONS PASSED")
+        print()
+        print("All step prompts have:")
+        for rule in rules.rules:
+            print(f"  • {rule.description or rule.id}")
+        return 0
+    else:
+        print("❌ VALIDATION FAILURES FOUND")
+        print()
+        for yaml_file, _, failures in failed:
+            print(f"  {yaml_file}:")
+            for failure in failures:
+                print(f"    • {failure}")
+        return 1
+
+
+def validate_context_blocks(yaml_file):
+    """Validate context block structure across all step prompts."""
+    return validate_files([Path(yaml_file)])
+
+
+def expand_paths(arguments: List[str]) -> List[Path]:
+    """Expand files, directories and glob patterns into a sorted, de-duplicated file list."""
+    files = set()
+    for argument in arguments:
+        path = Path(argument)
+        if path.is_dir():
+            for pattern in YAML_PATTERNS:
+                files.update(p for p in path.rglob(pattern) if p.is_file())
+        elif path.is_file():
+            files.add(path)
+        else:
+            files.update(Path(p) for p in glob.glob(argument, recursive=True) if Path(p).is_file())
+    return sorted(files)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Validate step prompt context blocks in YAML files")
+    parser.add_argument("paths", nargs="*", default=[DEFAULT_FILE],
+                        help=f"YAML files, directories or glob patterns (default: {DEFAULT_FILE})")
+    parser.add_argument("--cache", action="store_true",
+                        help="Persist parsed prompts by content hash between runs")
+    parser.add_argument("--cache-dir", type=Path, default=CACHE_DIR,
+                        help=f"Parse cache directory for --cache (default: {CACHE_DIR})")
+    parser.add_argument("--rules", type=Path, default=DEFAULT_RULES_FILE,
+                        help="Rule set YAML (default: context_block_rules.yaml next to this script)")
+    require = parser.add_mutually_exclusive_group()
+    require.add_argument("--require", action="append", metavar="KEY",
+                         help="Step prompt every file must define; repeatable "
+                              f"(default: {' '.join(REQUIRED_PROMPTS)})")
+    require.add_argument("--no-require", action="store_true",
+                         help="Only validate the step prompts each file defines")
+    return parser.parse_args(argv)
+
+
+def required_prompts(args: argparse.Namespace) -> Tuple[str, ...]:
+    """Prompts every file must define, from --require / --no-require."""
+    if args.no_require:
+        return ()
+    required = tuple(args.require or REQUIRED_PROMPTS)
+    invalid = [key for key in required if not STEP_PROMPT_RE.match(key)]
+    if invalid:
+        raise ValueError(f"not a step*_prompt key: {', '.join(invalid)}")
+    return required
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    
+    yaml_files = expand_paths(args.paths)
+    if not yaml_files:
+        print(f"Error: File not found: {' '.join(args.paths)}")
+        return 2
+    
+    try:
+        required = required_prompts(args)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 2
+    
+    try:
+        rules = RuleSet.from_yaml(args.rules)
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        print(f"Error: Could not load rules: {e}")
+        return 2
+    
+    return validate_files(yaml_files, PromptCache(args.cache_dir if args.cache else None), rules,
+                          required)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1791,6 +1791,20 @@ execute_full_workflow() {
         log_to_workflow "INFO" "Docs-only fast track disabled by user"
     fi
     
+    # Check for DAG scheduling (explicit --dag-schedule, before the fixed tracks)
+    # Steps start as soon as their dependencies finish, longest critical path first
+    if [[ "${DAG_SCHEDULE:-false}" == "true" && "$DRY_RUN" != true ]]; then
+        print_info "⚡ DAG Scheduled Execution Enabled (${DAG_MAX_WORKERS:-4} workers)"
+        echo ""
+        
+        if type -t execute_dag_schedule > /dev/null 2>&1 && dag_scheduler_available; then
+            execute_dag_schedule "${DAG_MAX_WORKERS:-4}"
+            return $?
+        else
+            print_warning "DAG scheduler not available - falling back to standard execution"
+        fi
+    fi
+    
     # Check for 4-track parallel execution (v2.7.0 - SECOND PRIORITY)
     # This provides maximum performance for full-stack changes with test sharding
     if [[ "${FULL_CHANGES_4TRACK:-false}" == "true" && "$DRY_RUN" != true ]]; then
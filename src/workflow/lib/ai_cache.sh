@@ -3,7 +3,7 @@ set -euo pipefail
 
 ################################################################################
 # AI Response Caching Module
-# Version: 1.0.0
+# Version: 1.2.0
 # Purpose: Cache AI responses to reduce token usage and improve performance
 # Part of: Tests & Documentation Workflow Automation v2.3.0
 # Created: December 18, 2025
@@ -26,6 +26,39 @@ AI_CACHE_INDEX="${AI_CACHE_DIR}/index.json"
 AI_CACHE_TTL=86400  # 24 hours in seconds
 AI_CACHE_MAX_SIZE_MB=100  # Maximum cache size in MB
 
+# Indexed response store (ai_workflow_docs.ai_cache_store): one SQLite database
+# instead of a .txt/.meta file pair per key. The file layout is kept as the
+# fallback when python3 is unavailable or USE_PYTHON_AI_CACHE=false.
+USE_PYTHON_AI_CACHE=${USE_PYTHON_AI_CACHE:-true}
+AI_CACHE_STORE_SCRIPT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)/ai_workflow_docs/ai_cache_store.py"
+
+# Canonical cache keys (ai_workflow_docs.prompt_keys): prompts that differ only
+# in whitespace, timestamps, {modified_count} or file order share a key.
+# Near-duplicate cached prompts are reported on a miss (store backend only).
+AI_CACHE_CANONICAL_KEYS=${AI_CACHE_CANONICAL_KEYS:-true}
+AI_CACHE_NEAR_DUPLICATES=${AI_CACHE_NEAR_DUPLICATES:-true}
+AI_PROMPT_TEMPLATES=${AI_PROMPT_TEMPLATES:-"$(cd "$(dirname "${BASH_SOURCE[0]}")/../../.." && pwd)/.workflow_core/config/ai_helpers.yaml"}
+AI_PROMPT_KEYS_SCRIPT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)/ai_workflow_docs/prompt_keys.py"
+
+# ==============================================================================
+# RESPONSE STORE
+# ==============================================================================
+
+# Check whether the indexed response store can be used
+# Returns: 0 if python3 and ai_cache_store.py are available
+ai_cache_store_available() {
+    [[ "${USE_PYTHON_AI_CACHE}" == "true" ]] && command -v python3 &>/dev/null \
+        && [[ -f "${AI_CACHE_STORE_SCRIPT}" ]]
+}
+
+# Run an ai_cache_store subcommand against the cache database
+# The script is run directly rather than with -m: lookups run once per AI call
+# and skip importing the package
+# Args: subcommand and its arguments (see ai_cache_store.py)
+ai_cache_store() {
+    python3 "${AI_CACHE_STORE_SCRIPT}" --db "${AI_CACHE_DB:-${AI_CACHE_DIR}/responses.db}" "$@"
+}
+
 # ==============================================================================
 # CACHE INITIALIZATION
 # ==============================================================================
@@ -38,6 +71,25 @@ init_ai_cache() {
     
     mkdir -p "${AI_CACHE_DIR}"
     
+    if ai_cache_store_available; then
+        # Creates the database, moves entries left in the file layout into it,
+        # then applies TTL expiry and size eviction
+        local legacy_args=()
+        if compgen -G "${AI_CACHE_DIR}/*.txt" > /dev/null; then
+            legacy_args=(--import-legacy "${AI_CACHE_DIR}")
+        fi
+        if ! ai_cache_store init --ttl "${AI_CACHE_TTL}" --max-mb "${AI_CACHE_MAX_SIZE_MB}" \
+            "${legacy_args[@]}"; then
+            print_error "AI cache store could not be initialized: ${AI_CACHE_DB:-${AI_CACHE_DIR}/responses.db}"
+            return 0
+        fi
+        
+        if [[ "${VERBOSE}" == "true" ]]; then
+            print_info "AI cache initialized: ${AI_CACHE_DB:-${AI_CACHE_DIR}/responses.db}"
+        fi
+        return 0
+    fi
+    
     # Create index file if it doesn't exist
     if [[ ! -f "${AI_CACHE_INDEX}" ]]; then
         cat > "${AI_CACHE_INDEX}" << 'EOF'
@@ -66,6 +118,29 @@ EOF
 # CACHE KEY GENERATION
 # ==============================================================================
 
+# Check whether canonical prompt keys can be generated
+# Returns: 0 if python3 and prompt_keys.py are available
+ai_prompt_keys_available() {
+    [[ "${AI_CACHE_CANONICAL_KEYS}" == "true" ]] && command -v python3 &>/dev/null \
+        && [[ -f "${AI_PROMPT_KEYS_SCRIPT}" ]]
+}
+
+# Run prompt_keys.py on a prompt and its context
+# Compiled templates are cached in the cache directory once it exists
+# Args: $1 = prompt text, $2 = context, remaining = prompt_keys.py options
+ai_prompt_key() {
+    local prompt="$1"
+    local context="$2"
+    shift 2
+    
+    local cache_args=(--no-cache)
+    if [[ -d "${AI_CACHE_DIR}" ]]; then
+        cache_args=(--cache-dir "${AI_CACHE_DIR}/prompt_keys")
+    fi
+    printf '%s\0%s' "${prompt}" "${context}" \
+        | python3 "${AI_PROMPT_KEYS_SCRIPT}" --templates "${AI_PROMPT_TEMPLATES}" "${cache_args[@]}" "$@"
+}
+
 # Generate a cache key from prompt and context
 # Args: $1 = prompt text, $2 = context (optional)
 # Returns: SHA256 hash as cache key
@@ -73,11 +148,33 @@ generate_cache_key() {
     local prompt="$1"
     local context="${2:-}"
     
+    if ai_prompt_keys_available && ai_prompt_key "${prompt}" "${context}"; then
+        return 0
+    fi
+    
     # Combine prompt and context, then hash
     local combined="${prompt}|${context}"
     echo -n "${combined}" | sha256sum | awk '{print $1}'
 }
 
+# Generate a cache key and look for a near-duplicate cached prompt
+# Args: $1 = prompt text, $2 = context (optional)
+# Returns: "<key>", or "<key> <near key> <similarity>" when the key is not
+#          cached but a similar prompt is
+lookup_cache_key() {
+    local prompt="$1"
+    local context="${2:-}"
+    
+    if [[ "${USE_AI_CACHE}" == "true" ]] && [[ "${AI_CACHE_NEAR_DUPLICATES}" == "true" ]] \
+        && ai_prompt_keys_available && ai_cache_store_available \
+        && ai_prompt_key "${prompt}" "${context}" \
+            --db "${AI_CACHE_DB:-${AI_CACHE_DIR}/responses.db}" --ttl "${AI_CACHE_TTL}"; then
+        return 0
+    fi
+    
+    generate_cache_key "${prompt}" "${context}"
+}
+
 # ==============================================================================
 # CACHE OPERATIONS
 # ==============================================================================
@@ -94,6 +191,11 @@ check_cache() {
         return 1
     fi
     
+    if ai_cache_store_available; then
+        ai_cache_store has "${cache_key}" --ttl "${AI_CACHE_TTL}"
+        return
+    fi
+    
     # Check if cache file exists (meta is optional for backward compatibility)
     if [[ ! -f "${cache_file}" ]]; then
         return 1
@@ -123,6 +225,17 @@ get_cached_response() {
     local cache_key="$1"
     local cache_file="${AI_CACHE_DIR}/${cache_key}.txt"
     
+    if [[ "${USE_AI_CACHE}" == "true" ]] && ai_cache_store_available; then
+        # One process both checks and reads the entry
+        if ai_cache_store get "${cache_key}" --ttl "${AI_CACHE_TTL}"; then
+            if [[ "${VERBOSE}" == "true" ]]; then
+                print_success "Using cached AI response (key: ${cache_key:0:8}...)"
+            fi
+            return 0
+        fi
+        return 1
+    fi
+    
     if check_cache "${cache_key}"; then
         cat "${cache_file}"
         
@@ -153,6 +266,22 @@ save_to_cache() {
         return 0
     fi
     
+    if ai_cache_store_available; then
+        # The response is stored with the trailing newline the .txt file had;
+        # entries above AI_CACHE_MAX_SIZE_MB are evicted least recently read first
+        if printf '%s\n' "${response}" | ai_cache_store put "${cache_key}" \
+            --prompt "${prompt:0:100}" --context "${context}" \
+            --run-id "${WORKFLOW_RUN_ID:-unknown}" --version "${SCRIPT_VERSION:-1.0.0}" \
+            --max-mb "${AI_CACHE_MAX_SIZE_MB}"; then
+            if [[ "${VERBOSE}" == "true" ]]; then
+                print_success "Response cached (key: ${cache_key:0:8}...)"
+            fi
+        elif [[ "${VERBOSE}" == "true" ]]; then
+            print_info "Could not cache response (key: ${cache_key:0:8}...)"
+        fi
+        return 0
+    fi
+    
     local cache_file="${AI_CACHE_DIR}/${cache_key}.txt"
     local cache_meta="${AI_CACHE_DIR}/${cache_key}.meta"
     
@@ -193,6 +322,11 @@ update_cache_index() {
         return 0
     fi
     
+    # The response store records access times itself
+    if ai_cache_store_available; then
+        return 0
+    fi
+    
     if [[ ! -f "${AI_CACHE_INDEX}" ]]; then
         init_ai_cache
     fi
@@ -229,6 +363,16 @@ cleanup_ai_cache_old_entries() {
         return 0
     fi
     
+    if ai_cache_store_available; then
+        # Indexed delete by creation time instead of a directory scan
+        local expired_count
+        expired_count=$(ai_cache_store expire --ttl "${AI_CACHE_TTL}") || return 0
+        if [[ "${VERBOSE}" == "true" ]] && [[ "${expired_count}" -gt 0 ]]; then
+            print_info "Cleaned up ${expired_count} expired cache entries"
+        fi
+        return 0
+    fi
+    
     local now=$(date +%s)
     local deleted_count=0
     
@@ -283,6 +427,15 @@ cleanup_ai_cache_old_entries() {
 
 # Get cache statistics
 get_cache_stats() {
+    if ai_cache_store_available; then
+        if [[ ! -f "${AI_CACHE_DB:-${AI_CACHE_DIR}/responses.db}" ]]; then
+            echo "Cache not initialized"
+            return 1
+        fi
+        ai_cache_store stats
+        return
+    fi
+    
     if [[ ! -f "${AI_CACHE_INDEX}" ]]; then
         echo "Cache not initialized"
         return 1
@@ -325,18 +478,18 @@ call_ai_with_cache() {
     local context="$2"
     local ai_command="$3"
     
-    # Generate cache key
-    local cache_key=$(generate_cache_key "${prompt}" "${context}")
+    # Generate cache key (with a near-duplicate cached prompt, if any)
+    local cache_key near_key near_similarity
+    read -r cache_key near_key near_similarity <<< "$(lookup_cache_key "${prompt}" "${context}")"
     
     # Try to get cached response
     if get_cached_response "${cache_key}"; then
+        record_cache_hit
         return 0
     fi
     
     # Cache miss - call AI
-    if [[ "${VERBOSE}" == "true" ]]; then
-        print_info "Cache miss - calling AI (key: ${cache_key:0:8}...)"
-    fi
+    record_ai_cache_miss "${cache_key}" "${near_key}" "${near_similarity}"
     
     local response
     response=$(eval "${ai_command}" 2>&1)
@@ -362,23 +515,47 @@ call_ai_with_cache() {
 declare -g AI_CACHE_HITS=0
 declare -g AI_CACHE_MISSES=0
 declare -g AI_CACHE_TOKENS_SAVED=0
+# Misses whose prompt was a near duplicate of a cached one
+declare -g AI_CACHE_NEAR_MISSES=0
 
 record_cache_hit() {
-    ((AI_CACHE_HITS++))
+    AI_CACHE_HITS=$((AI_CACHE_HITS + 1))
     local estimated_tokens=${1:-1000}  # Estimate tokens saved
-    ((AI_CACHE_TOKENS_SAVED+=estimated_tokens))
+    AI_CACHE_TOKENS_SAVED=$((AI_CACHE_TOKENS_SAVED + estimated_tokens))
 }
 
 record_cache_miss() {
-    ((AI_CACHE_MISSES++))
+    AI_CACHE_MISSES=$((AI_CACHE_MISSES + 1))
+}
+
+# Count a miss from lookup_cache_key, including a near-duplicate cached prompt
+# (record_cache_miss is also defined by analysis_cache.sh)
+# Args: $1 = cache_key, $2 = near-duplicate key (optional), $3 = similarity (optional)
+record_ai_cache_miss() {
+    local cache_key="$1"
+    local near_key="${2:-}"
+    local near_similarity="${3:-}"
+    
+    AI_CACHE_MISSES=$((AI_CACHE_MISSES + 1))
+    if [[ -n "${near_key}" ]]; then
+        AI_CACHE_NEAR_MISSES=$((AI_CACHE_NEAR_MISSES + 1))
+    fi
+    if [[ "${VERBOSE}" == "true" ]]; then
+        print_info "Cache miss - calling AI (key: ${cache_key:0:8}...)"
+        if [[ -n "${near_key}" ]]; then
+            print_info "Near-duplicate of cached prompt ${near_key:0:8}... (similarity ${near_similarity})"
+        fi
+    fi
 }
 
 get_cache_metrics() {
     local total=$((AI_CACHE_HITS + AI_CACHE_MISSES))
     local hit_rate=0
+    local near_hit_rate=0
     
     if [[ ${total} -gt 0 ]]; then
         hit_rate=$(awk "BEGIN {printf \"%.1f\", (${AI_CACHE_HITS} / ${total}) * 100}")
+        near_hit_rate=$(awk "BEGIN {printf \"%.1f\", ((${AI_CACHE_HITS} + ${AI_CACHE_NEAR_MISSES}) / ${total}) * 100}")
     fi
     
     cat << EOF
@@ -387,6 +564,7 @@ AI Cache Metrics (This Run):
   Cache Hits: ${AI_CACHE_HITS}
   Cache Misses: ${AI_CACHE_MISSES}
   Hit Rate: ${hit_rate}%
+  Near-duplicate Misses: ${AI_CACHE_NEAR_MISSES} (hit rate if served: ${near_hit_rate}%)
   Estimated Tokens Saved: ${AI_CACHE_TOKENS_SAVED}
 EOF
 }
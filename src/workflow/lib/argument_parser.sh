@@ -177,6 +177,13 @@ parse_workflow_arguments() {
                 print_info "3-Track parallel execution enabled - optimal performance mode"
                 shift
                 ;;
+            --dag-schedule)
+                DAG_SCHEDULE=true
+                PARALLEL_EXECUTION=true  # Implies parallel execution
+                export DAG_SCHEDULE PARALLEL_EXECUTION
+                print_info "DAG scheduling enabled - steps start as soon as their dependencies finish"
+                shift
+                ;;
             --no-ai-cache)
                 USE_AI_CACHE=false
                 export USE_AI_CACHE
@@ -460,6 +467,8 @@ OPTIONS:
   --smart-execution      Enable change-based step skipping
   --parallel             Enable parallel execution of independent steps
   --parallel-tracks      Enable 3-track parallel execution (optimal mode)
+  --dag-schedule         Run steps as their dependencies finish, critical path first
+                         (workers: DAG_MAX_WORKERS, default 4)
   --no-resume            Start fresh, ignore checkpoints
   --no-fast-track        Disable docs-only fast track optimization
   
@@ -6,6 +6,7 @@ set -euo pipefail
 # Purpose: Auto-detect docs-only, test-only, or full-stack changes
 # Part of: Tests & Documentation Workflow Automation v2.0.0
 # Created: December 18, 2025
+# Version: 2.1.0 - Compiled pattern classification of large change sets
 ################################################################################
 
 # ==============================================================================
@@ -36,6 +37,24 @@ WORKFLOW_ARTIFACTS=(
     "Thumbs.db"
 )
 
+# All artifact patterns as one anchored regex (each glob with * -> .*)
+# Rebuilt by filter_workflow_artifacts if WORKFLOW_ARTIFACTS changes
+WORKFLOW_ARTIFACTS_REGEX=""
+WORKFLOW_ARTIFACTS_REGEX_SOURCE=""
+
+# Build WORKFLOW_ARTIFACTS_REGEX from WORKFLOW_ARTIFACTS when it is stale
+compile_workflow_artifacts_regex() {
+    local source="${WORKFLOW_ARTIFACTS[*]}"
+    [[ "$source" == "$WORKFLOW_ARTIFACTS_REGEX_SOURCE" && -n "$WORKFLOW_ARTIFACTS_REGEX" ]] && return 0
+    
+    local pattern alternation=""
+    for pattern in "${WORKFLOW_ARTIFACTS[@]}"; do
+        alternation+="${alternation:+|}${pattern//\*/.*}"
+    done
+    WORKFLOW_ARTIFACTS_REGEX="^(${alternation})$"
+    WORKFLOW_ARTIFACTS_REGEX_SOURCE="$source"
+}
+
 # Filter out ephemeral workflow artifacts from file list
 # Usage: filter_workflow_artifacts <file_list>
 # Returns: Filtered file list (one file per line)
@@ -45,26 +64,14 @@ filter_workflow_artifacts() {
     # Return empty if input is empty
     [[ -z "$file_list" ]] && return 0
     
+    compile_workflow_artifacts_regex
     local filtered=""
     
     while IFS= read -r file; do
         [[ -z "$file" ]] && continue
         
-        local should_exclude=false
-        
-        # Check each artifact pattern
-        for pattern in "${WORKFLOW_ARTIFACTS[@]}"; do
-            # Convert glob pattern to regex for matching
-            local regex_pattern="${pattern//\*/.*}"
-            
-            if [[ "$file" =~ ^${regex_pattern}$ ]]; then
-                should_exclude=true
-                break
-            fi
-        done
-        
         # Include file if not excluded
-        if [[ "$should_exclude" == false ]]; then
+        if [[ ! "$file" =~ $WORKFLOW_ARTIFACTS_REGEX ]]; then
             filtered+="${file}"$'\n'
         fi
     done <<< "$file_list"
@@ -79,15 +86,8 @@ filter_workflow_artifacts() {
 is_workflow_artifact() {
     local file="$1"
     
-    for pattern in "${WORKFLOW_ARTIFACTS[@]}"; do
-        local regex_pattern="${pattern//\*/.*}"
-        
-        if [[ "$file" =~ ^${regex_pattern}$ ]]; then
-            return 0
-        fi
-    done
-    
-    return 1
+    compile_workflow_artifacts_regex
+    [[ "$file" =~ $WORKFLOW_ARTIFACTS_REGEX ]]
 }
 
 # ==============================================================================
@@ -295,6 +295,53 @@ STEP_RECOMMENDATIONS=(
     ["full-stack"]="0,1,2,3,4,5,6,7,8,9,10,11,12,13"  # All steps
 )
 
+# ==============================================================================
+# COMPILED CLASSIFIER (v2.1.0)
+# ==============================================================================
+
+# Large change sets are classified by change_classifier.py in one process:
+# WORKFLOW_ARTIFACTS and FILE_PATTERNS are compiled once instead of being
+# matched pattern by pattern for every file in bash
+USE_PYTHON_CHANGE_CLASSIFIER="${USE_PYTHON_CHANGE_CLASSIFIER:-true}"
+CHANGE_CLASSIFIER_SCRIPT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)/ai_workflow_docs/change_classifier.py"
+
+# Check whether the Python change classifier can be used
+change_classifier_available() {
+    [[ "${USE_PYTHON_CHANGE_CLASSIFIER}" == "true" ]] && command -v python3 &>/dev/null && \
+        [[ -f "${CHANGE_CLASSIFIER_SCRIPT}" ]]
+}
+
+# Run a change_classifier.py command with the patterns of this module
+# Usage: change_classifier [-z] <command> [args...] < file_list
+change_classifier() {
+    local args=()
+    local pattern name
+    for pattern in "${WORKFLOW_ARTIFACTS[@]}"; do
+        args+=(--artifact "$pattern")
+    done
+    for name in "${!FILE_PATTERNS[@]}"; do
+        args+=(--category "${name}=${FILE_PATTERNS[$name]}")
+    done
+    python3 "${CHANGE_CLASSIFIER_SCRIPT}" "${args[@]}" "$@"
+}
+
+# List changed files NUL-separated and sorted: the diff since the baseline
+# (or against HEAD plus staged changes) and untracked files
+# Usage: list_changed_files_z [baseline_commit]
+list_changed_files_z() {
+    local baseline="${1:-}"
+    
+    {
+        if [[ -n "$baseline" ]]; then
+            git diff --name-only -z "${baseline}..HEAD" 2>/dev/null || true
+        else
+            git diff --name-only -z HEAD 2>/dev/null || true
+            git diff --cached --name-only -z 2>/dev/null || true
+        fi
+        git ls-files -z --others --exclude-standard 2>/dev/null || true
+    } | sort -zu
+}
+
 # ==============================================================================
 # CHANGE DETECTION
 # ==============================================================================
@@ -316,6 +363,15 @@ detect_change_type() {
         fi
     fi
     
+    # One pass over the -z file list with the compiled patterns (the bash
+    # loop below runs if the classifier fails)
+    local change_type
+    if change_classifier_available \
+        && change_type=$(list_changed_files_z "$baseline" | change_classifier -z change-type); then
+        echo "$change_type"
+        return
+    fi
+    
     # Get changed files based on baseline
     local modified_files
     local staged_files
@@ -458,54 +514,85 @@ analyze_changes() {
         fi
     fi
     
-    # Get changed files based on baseline
-    local modified_files
-    local staged_files
-    local untracked_files
+    # Counts of the filtered files in each category they match
+    local total_count=0
+    local artifacts_filtered=0
+    local docs_count=0
+    local tests_count=0
+    local config_count=0
+    local scripts_count=0
+    local code_count=0
     
-    if [[ -n "$baseline" ]]; then
-        modified_files=$(git diff --name-only "${baseline}..HEAD" 2>/dev/null)
-        staged_files=""
-        untracked_files=$(git ls-files --others --exclude-standard 2>/dev/null)
+    local classified
+    if change_classifier_available \
+        && classified=$(list_changed_files_z "$baseline" | change_classifier -z counts); then
+        local name count
+        while read -r name count; do
+            case "$name" in
+                total) total_count=$count ;;
+                artifacts) artifacts_filtered=$count ;;
+                docs) docs_count=$count ;;
+                tests) tests_count=$count ;;
+                config) config_count=$count ;;
+                scripts) scripts_count=$count ;;
+                code) code_count=$count ;;
+            esac
+        done <<< "$classified"
     else
-        modified_files=$(git diff --name-only HEAD 2>/dev/null)
-        staged_files=$(git diff --cached --name-only 2>/dev/null)
-        untracked_files=$(git ls-files --others --exclude-standard 2>/dev/null)
+        # Get changed files based on baseline
+        local modified_files
+        local staged_files
+        local untracked_files
+        
+        if [[ -n "$baseline" ]]; then
+            modified_files=$(git diff --name-only "${baseline}..HEAD" 2>/dev/null)
+            staged_files=""
+            untracked_files=$(git ls-files --others --exclude-standard 2>/dev/null)
+        else
+            modified_files=$(git diff --name-only HEAD 2>/dev/null)
+            staged_files=$(git diff --cached --name-only 2>/dev/null)
+            untracked_files=$(git ls-files --others --exclude-standard 2>/dev/null)
+        fi
+        
+        local all_changes=$(echo -e "${modified_files}\n${staged_files}\n${untracked_files}" | sort -u | grep -v '^$')
+        
+        # Filter out workflow artifacts
+        local filtered_changes=$(filter_workflow_artifacts "$all_changes")
+        total_count=$(echo "${filtered_changes}" | grep -c . || true)
+        artifacts_filtered=$(($(echo "$all_changes" | grep -c . || true) - total_count))
+        
+        # Count by category
+        local file
+        while IFS= read -r file; do
+            [[ -z "$file" ]] && continue
+            if matches_pattern "$file" "${FILE_PATTERNS[docs]}"; then ((docs_count++)) || true; fi
+            if matches_pattern "$file" "${FILE_PATTERNS[tests]}"; then ((tests_count++)) || true; fi
+            if matches_pattern "$file" "${FILE_PATTERNS[config]}"; then ((config_count++)) || true; fi
+            if matches_pattern "$file" "${FILE_PATTERNS[scripts]}"; then ((scripts_count++)) || true; fi
+            if matches_pattern "$file" "${FILE_PATTERNS[code]}"; then ((code_count++)) || true; fi
+        done <<< "${filtered_changes}"
     fi
     
-    local all_changes=$(echo -e "${modified_files}\n${staged_files}\n${untracked_files}" | sort -u | grep -v '^$')
-    
-    # Filter out workflow artifacts
-    local filtered_changes=$(filter_workflow_artifacts "$all_changes")
-    local artifacts_filtered=$(($(echo "$all_changes" | wc -l) - $(echo "$filtered_changes" | wc -l)))
-    
     echo "## Change Analysis"
     echo ""
     if [[ -n "$baseline_info" ]]; then
         echo "**Baseline:** ${baseline_info}"
         echo ""
     fi
-    echo "**Total Files Changed:** $(echo "${filtered_changes}" | wc -l)"
+    echo "**Total Files Changed:** ${total_count}"
     if [[ $artifacts_filtered -gt 0 ]]; then
         echo "**Workflow Artifacts Filtered:** ${artifacts_filtered}"
     fi
     echo ""
     
-    # Count by category
-    local docs_files=$(echo "${filtered_changes}" | while read -r f; do matches_pattern "$f" "${FILE_PATTERNS[docs]}" && echo "$f"; done)
-    local tests_files=$(echo "${filtered_changes}" | while read -r f; do matches_pattern "$f" "${FILE_PATTERNS[tests]}" && echo "$f"; done)
-    local config_files=$(echo "${filtered_changes}" | while read -r f; do matches_pattern "$f" "${FILE_PATTERNS[config]}" && echo "$f"; done)
-    local scripts_files=$(echo "${filtered_changes}" | while read -r f; do matches_pattern "$f" "${FILE_PATTERNS[scripts]}" && echo "$f"; done)
-    local code_files=$(echo "${filtered_changes}" | while read -r f; do matches_pattern "$f" "${FILE_PATTERNS[code]}" && echo "$f"; done)
-    
     # Display breakdown
     echo "### By Category"
     echo ""
-    [[ -n "${docs_files}" ]] && echo "- **Documentation:** $(echo "${docs_files}" | wc -l) files"
-    [[ -n "${tests_files}" ]] && echo "- **Tests:** $(echo "${tests_files}" | wc -l) files"
-    [[ -n "${config_files}" ]] && echo "- **Configuration:** $(echo "${config_files}" | wc -l) files"
-    [[ -n "${scripts_files}" ]] && echo "- **Scripts:** $(echo "${scripts_files}" | wc -l) files"
-    [[ -n "${code_files}" ]] && echo "- **Code:** $(echo "${code_files}" | wc -l) files"
+    [[ ${docs_count} -gt 0 ]] && echo "- **Documentation:** ${docs_count} files"
+    [[ ${tests_count} -gt 0 ]] && echo "- **Tests:** ${tests_count} files"
+    [[ ${config_count} -gt 0 ]] && echo "- **Configuration:** ${config_count} files"
+    [[ ${scripts_count} -gt 0 ]] && echo "- **Scripts:** ${scripts_count} files"
+    [[ ${code_count} -gt 0 ]] && echo "- **Code:** ${code_count} files"
     echo ""
     
     # Determine change type
@@ -621,20 +708,36 @@ assess_change_impact() {
         all_files=$(git diff --name-only HEAD 2>/dev/null)
     fi
     
-    local filtered_files=$(filter_workflow_artifacts "$all_files")
-    local total_files=$(echo "$filtered_files" | grep -v '^$' | wc -l)
-    
-    # Count code files specifically
+    local total_files=0
     local code_count=0
     local doc_count=0
-    while IFS= read -r file; do
-        [[ -z "$file" ]] && continue
-        if matches_pattern "$file" "${FILE_PATTERNS[code]}"; then
-            ((code_count++)) || true
-        elif matches_pattern "$file" "${FILE_PATTERNS[docs]}"; then
-            ((doc_count++)) || true
-        fi
-    done <<< "$filtered_files"
+    
+    local classified
+    if change_classifier_available \
+        && classified=$(printf '%s\n' "$all_files" | change_classifier counts --order code,docs); then
+        # Code first, then docs, as below
+        local name count
+        while read -r name count; do
+            case "$name" in
+                total) total_files=$count ;;
+                code) code_count=$count ;;
+                docs) doc_count=$count ;;
+            esac
+        done <<< "$classified"
+    else
+        local filtered_files=$(filter_workflow_artifacts "$all_files")
+        total_files=$(echo "$filtered_files" | grep -c . || true)
+        
+        # Count code files specifically
+        while IFS= read -r file; do
+            [[ -z "$file" ]] && continue
+            if matches_pattern "$file" "${FILE_PATTERNS[code]}"; then
+                ((code_count++)) || true
+            elif matches_pattern "$file" "${FILE_PATTERNS[docs]}"; then
+                ((doc_count++)) || true
+            fi
+        done <<< "$filtered_files"
+    fi
     
     # Impact based on change type and file count
     # Calibrated thresholds (v2.3.1):
@@ -727,6 +830,18 @@ classify_files_by_nature() {
     local staged_files
     local untracked_files
     
+    if change_classifier_available; then
+        local classifier_baseline="$baseline"
+        if [[ -z "$baseline" ]] || ! git rev-parse --verify "${baseline}^{commit}" &>/dev/null; then
+            classifier_baseline=""
+        fi
+        local classified
+        if classified=$(list_changed_files_z "$classifier_baseline" | change_classifier -z nature); then
+            echo "$classified"
+            return
+        fi
+    fi
+    
     if [[ -n "$baseline" ]] && git rev-parse --verify "${baseline}^{commit}" &>/dev/null; then
         modified_files=$(git diff --name-only "${baseline}..HEAD" 2>/dev/null)
         staged_files=""
@@ -777,7 +892,8 @@ classify_files_by_nature() {
 }
 
 # Export functions for use in workflow
-export -f filter_workflow_artifacts is_workflow_artifact
+export -f filter_workflow_artifacts is_workflow_artifact compile_workflow_artifacts_regex
+export -f change_classifier_available change_classifier list_changed_files_z
 export -f detect_change_type analyze_changes get_recommended_steps
 export -f should_execute_step display_execution_plan assess_change_impact
 export -f generate_change_report classify_files_by_nature
@@ -6,6 +6,7 @@ set -euo pipefail
 # Purpose: Visualize execution flow and identify parallelization opportunities
 # Part of: Tests & Documentation Workflow Automation v2.0.0
 # Created: December 18, 2025
+# Version: 2.7.0 - DAG scheduling with critical-path priority
 ################################################################################
 
 # ==============================================================================
@@ -466,31 +467,104 @@ display_execution_phases() {
     echo ""
 }
 
-# Calculate critical path duration
+# Step ids of the dependency graph in workflow order (0, 0a, 0b, 1, ..., 11.5, 11.7, 12, ...)
+get_dependency_graph_steps() {
+    printf '%s\n' "${!STEP_DEPENDENCIES[@]}" | sort -V
+}
+
+# Calculate critical path through workflow
+# Longest chain of STEP_TIME_ESTIMATES through STEP_DEPENDENCIES
+# Returns: Space-separated list of steps in critical path
 calculate_critical_path() {
-    local total=0
+    local -A finish=()
+    local -A previous=()
+    local remaining=()
+    local step dep best ready
+    mapfile -t remaining < <(get_dependency_graph_steps)
+    
+    # Finish time of each step once all of its dependencies have one
+    while [[ ${#remaining[@]} -gt 0 ]]; do
+        local pending=()
+        for step in "${remaining[@]}"; do
+            best=0
+            ready=true
+            previous[$step]=""
+            IFS=',' read -ra DEPS <<< "${STEP_DEPENDENCIES[$step]}"
+            for dep in "${DEPS[@]}"; do
+                [[ -z "$dep" ]] && continue
+                if [[ ! -v finish[$dep] ]]; then
+                    ready=false
+                    break
+                fi
+                if [[ ${finish[$dep]} -gt $best ]]; then
+                    best=${finish[$dep]}
+                    previous[$step]="$dep"
+                fi
+            done
+            if [[ "$ready" == true ]]; then
+                finish[$step]=$((best + ${STEP_TIME_ESTIMATES[$step]:-60}))
+            else
+                pending+=("$step")
+            fi
+        done
+        # No progress means a dependency cycle
+        [[ ${#pending[@]} -eq ${#remaining[@]} ]] && return 1
+        remaining=("${pending[@]}")
+    done
     
-    # Critical path: 0 → 5 → 6 → 7 → 10 → 11
-    total=$((total + STEP_TIME_ESTIMATES[0]))  # Pre-Analysis
-    total=$((total + STEP_TIME_ESTIMATES[5]))  # Test Review
-    total=$((total + STEP_TIME_ESTIMATES[6]))  # Test Generation
-    total=$((total + STEP_TIME_ESTIMATES[7]))  # Test Execution
-    total=$((total + STEP_TIME_ESTIMATES[10])) # Context Analysis
-    total=$((total + STEP_TIME_ESTIMATES[11])) # Git Finalization
+    # Walk back from the step that finishes last
+    local last=""
+    for step in "${!finish[@]}"; do
+        if [[ -z "$last" ]] || [[ ${finish[$step]} -gt ${finish[$last]} ]]; then
+            last="$step"
+        fi
+    done
+    
+    local path="$last"
+    while [[ -n "${previous[$last]}" ]]; do
+        last="${previous[$last]}"
+        path="$last $path"
+    done
     
-    echo "${total}"
+    echo "$path"
 }
 
 # Export functions for use in workflow
 export -f check_dependencies get_next_runnable_steps get_parallel_steps
 export -f generate_dependency_diagram generate_execution_plan
-export -f display_execution_phases calculate_critical_path
+export -f display_execution_phases calculate_critical_path get_dependency_graph_steps
 
 # ==============================================================================
 # JSON EXPORT (NEW v2.6.1)
 # ==============================================================================
 
+# Quote a string for JSON output
+# Usage: json_string <value>
+json_string() {
+    local value="${1//\\/\\\\}"
+    value="${value//\"/\\\"}"
+    value="${value//$'\t'/\\t}"
+    printf '"%s"' "${value//$'\n'/\\n}"
+}
+
+# Quote a comma-separated step list as a JSON array of step ids
+# Usage: json_step_array <step_list_csv>
+json_step_array() {
+    local step_ids=() step
+    IFS=',' read -ra STEP_ARRAY <<< "$1"
+    for step in "${STEP_ARRAY[@]}"; do
+        step="${step// /}"
+        if [[ -n "$step" ]]; then
+            step_ids+=("\"${step}\"")
+        fi
+    done
+    local IFS=','
+    echo "[${step_ids[*]}]"
+}
+
 # Export step metadata and dependencies as JSON
+# Step ids are strings ("0a", "11.5"); the critical path and timings are
+# computed from STEP_DEPENDENCIES and STEP_TIME_ESTIMATES
 # Usage: export_step_metadata_json [output_file]
 export_step_metadata_json() {
     local output_file="${1:-/dev/stdout}"
@@ -500,129 +574,83 @@ export_step_metadata_json() {
         source "$(dirname "${BASH_SOURCE[0]}")/step_metadata.sh"
     fi
     
-    cat > "$output_file" << 'JSONEOF'
-{
-  "version": "2.6.1",
-  "generated": "$(date -Iseconds)",
-  "workflow": {
-    "total_steps": 16,
-    "parallelizable": true,
-    "supports_smart_execution": true
-  },
-  "steps": [
-JSONEOF
-    
-    # Generate JSON for each step
-    local first=true
-    for step in {0..14}; do
-        # Skip if step doesn't exist
-        if [[ ! -v STEP_DEPENDENCIES[$step] ]]; then
-            continue
-        fi
-        
-        # Add comma separator
-        if [[ "$first" == "false" ]]; then
-            echo "    ," >> "$output_file"
-        fi
-        first=false
+    local step_ids=()
+    mapfile -t step_ids < <(get_dependency_graph_steps)
+    local critical_path
+    critical_path=$(calculate_critical_path)
+    local critical_time sequential_time
+    critical_time=$(calculate_total_time "${critical_path// /,}")
+    sequential_time=$(calculate_total_time "$(IFS=','; echo "${step_ids[*]}")")
+    
+    {
+        echo "{"
+        echo "  \"version\": \"2.7.0\","
+        echo "  \"generated\": \"$(date -Iseconds)\","
+        echo "  \"workflow\": {"
+        echo "    \"total_steps\": ${#step_ids[@]},"
+        echo "    \"parallelizable\": true,"
+        echo "    \"supports_smart_execution\": true"
+        echo "  },"
+        echo "  \"steps\": ["
         
-        # Get metadata
-        local name="${STEP_NAMES[$step]:-Step $step}"
-        local desc="${STEP_DESCRIPTIONS[$step]:-No description}"
-        local category="${STEP_CATEGORIES[$step]:-unknown}"
-        local can_skip="${STEP_CAN_SKIP[$step]:-false}"
-        local can_parallel="${STEP_CAN_PARALLELIZE[$step]:-false}"
-        local needs_ai="${STEP_REQUIRES_AI[$step]:-false}"
-        local affects="${STEP_AFFECTS_FILES[$step]:-}"
-        local deps="${STEP_DEPENDENCIES[$step]:-}"
-        local time="${STEP_TIME_ESTIMATES[$step]:-60}"
+        # Generate JSON for each step
+        local -A categories=()
+        local step separator=","
+        local i
+        for i in "${!step_ids[@]}"; do
+            step="${step_ids[$i]}"
+            [[ $i -eq $((${#step_ids[@]} - 1)) ]] && separator=""
+            
+            local category="${STEP_CATEGORIES[$step]:-unknown}"
+            categories[$category]+="${categories[$category]:+,}${step}"
+            
+            echo "    {"
+            echo "      \"id\": \"${step}\","
+            echo "      \"name\": $(json_string "${STEP_NAMES[$step]:-Step $step}"),"
+            echo "      \"description\": $(json_string "${STEP_DESCRIPTIONS[$step]:-No description}"),"
+            echo "      \"category\": $(json_string "$category"),"
+            echo "      \"dependencies\": $(json_step_array "${STEP_DEPENDENCIES[$step]:-}"),"
+            echo "      \"estimated_time_seconds\": ${STEP_TIME_ESTIMATES[$step]:-60},"
+            echo "      \"can_skip\": ${STEP_CAN_SKIP[$step]:-false},"
+            echo "      \"can_parallelize\": ${STEP_CAN_PARALLELIZE[$step]:-false},"
+            echo "      \"requires_ai\": ${STEP_REQUIRES_AI[$step]:-false},"
+            echo "      \"affects_files\": $(json_string "${STEP_AFFECTS_FILES[$step]:-}")"
+            echo "    }${separator}"
+        done
         
-        # Convert dependencies to JSON array
-        local deps_json="[]"
-        if [[ -n "$deps" ]]; then
-            deps_json="[$(echo "$deps" | sed 's/,/,/g')]"
-        fi
-        
-        cat >> "$output_file" << STEPJSON
-    {
-      "id": $step,
-      "name": "$name",
-      "description": "$desc",
-      "category": "$category",
-      "dependencies": $deps_json,
-      "estimated_time_seconds": $time,
-      "can_skip": $can_skip,
-      "can_parallelize": $can_parallel,
-      "requires_ai": $needs_ai,
-      "affects_files": "$affects"
-    }
-STEPJSON
-    done
-    
-    cat >> "$output_file" << 'JSONEOF'
-  ],
-  "categories": {
-    "analysis": [0, 10],
-    "documentation": [1],
-    "validation": [2, 3, 4, 8],
-    "testing": [5, 6, 7],
-    "quality": [9, 12, 13, 14],
-    "versioning": [15],
-    "finalization": [11]
-  },
-  "parallelization": {
-    "max_parallel_groups": 7,
-    "groups": [
-      {
-        "id": 1,
-        "steps": [1, 3, 4, 5, 8, 13, 14],
-        "description": "Independent validation after Pre-Analysis"
-      },
-      {
-        "id": 2,
-        "steps": [2, 12],
-        "description": "Documentation checks"
-      },
-      {
-        "id": 3,
-        "steps": [6],
-        "description": "Test generation"
-      },
-      {
-        "id": 4,
-        "steps": [7, 9],
-        "description": "Test execution and quality"
-      },
-      {
-        "id": 5,
-        "steps": [10],
-        "description": "Context analysis"
-      },
-      {
-        "id": 6,
-        "steps": [15],
-        "description": "Version update"
-      },
-      {
-        "id": 7,
-        "steps": [11],
-        "description": "Final git operations"
-      }
-    ]
-  },
-  "critical_path": {
-    "steps": [0, 5, 6, 7, 10, 15, 11],
-    "total_time_seconds": 825,
-    "description": "Longest sequential chain through workflow"
-  },
-  "optimization": {
-    "sequential_time_seconds": 1440,
-    "parallel_time_seconds": 975,
-    "time_savings_seconds": 465,
-    "time_savings_percent": 32
-  }
-}
-JSONEOF
+        echo "  ],"
+        echo "  \"categories\": {"
+        local names=()
+        mapfile -t names < <(printf '%s\n' "${!categories[@]}" | sort)
+        separator=","
+        for i in "${!names[@]}"; do
+            [[ $i -eq $((${#names[@]} - 1)) ]] && separator=""
+            echo "    $(json_string "${names[$i]}"): $(json_step_array "${categories[${names[$i]}]}")${separator}"
+        done
+        echo "  },"
+        echo "  \"parallelization\": {"
+        echo "    \"max_parallel_groups\": ${#PARALLEL_GROUPS[@]},"
+        echo "    \"groups\": ["
+        separator=","
+        for i in "${!PARALLEL_GROUPS[@]}"; do
+            [[ $i -eq $((${#PARALLEL_GROUPS[@]} - 1)) ]] && separator=""
+            echo "      {\"id\": $((i + 1)), \"steps\": $(json_step_array "${PARALLEL_GROUPS[$i]}")}${separator}"
+        done
+        echo "    ]"
+        echo "  },"
+        echo "  \"critical_path\": {"
+        echo "    \"steps\": $(json_step_array "${critical_path// /,}"),"
+        echo "    \"total_time_seconds\": ${critical_time},"
+        echo "    \"description\": \"Longest sequential chain through workflow\""
+        echo "  },"
+        echo "  \"optimization\": {"
+        echo "    \"sequential_time_seconds\": ${sequential_time},"
+        echo "    \"parallel_time_seconds\": ${critical_time},"
+        echo "    \"time_savings_seconds\": $((sequential_time - critical_time)),"
+        echo "    \"time_savings_percent\": $(( (sequential_time - critical_time) * 100 / sequential_time ))"
+        echo "  }"
+        echo "}"
+    } > "$output_file"
     
     if [[ "$output_file" != "/dev/stdout" ]]; then
         echo "Step metadata exported to: $output_file"
@@ -681,14 +709,6 @@ get_ready_steps() {
     echo "${ready[@]}" | tr ' ' ','
 }
 
-# Calculate critical path through workflow
-# Returns: Space-separated list of steps in critical path
-calculate_critical_path() {
-    # Hardcoded based on dependency analysis
-    # This is the longest sequential chain
-    echo "0 5 6 7 10 15 11"
-}
-
 # Calculate total time for step list
 # Usage: calculate_total_time <step_list_csv>
 calculate_total_time() {
@@ -704,12 +724,135 @@ calculate_total_time() {
     echo "$total"
 }
 
+# ==============================================================================
+# DAG SCHEDULER (NEW v2.7.0)
+# ==============================================================================
+
+# Start each step as soon as its dependencies finish, longest remaining
+# critical path first, instead of waiting for the whole previous phase.
+# Scheduling is done by dag_scheduler.py; the steps run here so they keep
+# the workflow's shell state.
+USE_PYTHON_DAG_SCHEDULER="${USE_PYTHON_DAG_SCHEDULER:-true}"
+DAG_SCHEDULER_SCRIPT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)/ai_workflow_docs/dag_scheduler.py"
+DAG_MAX_WORKERS="${DAG_MAX_WORKERS:-4}"
+
+# Check whether the Python DAG scheduler can be used
+dag_scheduler_available() {
+    [[ "${USE_PYTHON_DAG_SCHEDULER}" == "true" ]] && command -v python3 &>/dev/null && \
+        [[ -f "${DAG_SCHEDULER_SCRIPT}" ]]
+}
+
+# Run a dag_scheduler.py command
+# Usage: dag_scheduler <metadata_json|trace_json> [options] <command> [args...]
+dag_scheduler() {
+    python3 "${DAG_SCHEDULER_SCRIPT}" "$@"
+}
+
+# Execute the workflow steps on a bounded pool in dependency order
+# Steps not selected (should_execute_step) are skipped and do not block
+# their dependents. After a failure no new steps are started.
+# Writes step logs, trace.json and GANTT.txt to ${BACKLOG_RUN_DIR}/dag_schedule
+# Usage: execute_dag_schedule [workers]
+# Returns: 0 if all succeed, 1 if any fail
+execute_dag_schedule() {
+    local workers="${1:-${DAG_MAX_WORKERS}}"
+    local dag_dir="${BACKLOG_RUN_DIR}/dag_schedule"
+    mkdir -p "$dag_dir"
+    
+    if ! dag_scheduler_available; then
+        echo "DAG scheduler not available (python3 and ${DAG_SCHEDULER_SCRIPT} required)" >&2
+        return 1
+    fi
+    
+    local metadata="${dag_dir}/step_metadata.json"
+    export_step_metadata_json "$metadata" > /dev/null
+    
+    # Historical step durations prioritize better than the static estimates
+    local durations_args=()
+    if type -t metrics_store_ready > /dev/null 2>&1 && metrics_store_ready && \
+        metrics_store stats --json > "${dag_dir}/durations.json" 2>/dev/null; then
+        durations_args=(--durations "${dag_dir}/durations.json")
+    fi
+    
+    coproc DAG_SCHEDULER_PROC {
+        dag_scheduler "$metadata" "${durations_args[@]}" dispatch \
+            --workers "$workers" --trace "${dag_dir}/trace.json"
+    }
+    # The coproc variables are unset when it exits; keep the descriptors
+    local from_scheduler="${DAG_SCHEDULER_PROC[0]}"
+    local to_scheduler="${DAG_SCHEDULER_PROC[1]}"
+    local scheduler_pid="${DAG_SCHEDULER_PROC_PID}"
+    
+    local -A step_pids=()
+    local finished=()
+    local action step pid status candidate
+    local result=1
+    
+    while read -r -u "$from_scheduler" action step; do
+        case "$action" in
+            start)
+                if should_execute_step "$step"; then
+                    execute_step "$step" > "${dag_dir}/step_${step}.log" 2>&1 &
+                    step_pids[$!]="$step"
+                else
+                    finished+=("${step} skipped")
+                fi
+                ;;
+            wait)
+                if [[ ${#finished[@]} -eq 0 ]]; then
+                    # Reap one finished step. Bash may already have reaped it
+                    # (wait -n only sees running jobs), so look first; then
+                    # block in wait -n -p (bash 5.1+) or poll
+                    pid=""
+                    while [[ -z "${pid:-}" ]]; do
+                        status=0
+                        for candidate in "${!step_pids[@]}"; do
+                            if ! kill -0 "$candidate" 2>/dev/null; then
+                                pid="$candidate"
+                                break
+                            fi
+                        done
+                        if [[ -n "$pid" ]]; then
+                            wait "$pid" || status=$?
+                        elif [[ $((BASH_VERSINFO[0] * 100 + BASH_VERSINFO[1])) -ge 501 ]]; then
+                            wait -n -p pid "${!step_pids[@]}" || status=$?
+                        else
+                            sleep 1
+                        fi
+                    done
+                    finished+=("${step_pids[$pid]} ${status}")
+                    unset "step_pids[$pid]"
+                fi
+                echo "done ${finished[0]}" >&"$to_scheduler"
+                finished=("${finished[@]:1}")
+                ;;
+            end)
+                [[ "$step" == "ok" ]] && result=0
+                break
+                ;;
+        esac
+    done
+    
+    # Steps still running if the scheduler stopped early
+    for pid in "${!step_pids[@]}"; do
+        wait "$pid" || true
+    done
+    wait "$scheduler_pid" 2>/dev/null || true
+    
+    if [[ -f "${dag_dir}/trace.json" ]]; then
+        dag_scheduler "${dag_dir}/trace.json" gantt > "${dag_dir}/GANTT.txt" || true
+        cat "${dag_dir}/GANTT.txt"
+    fi
+    
+    return $result
+}
+
 # Export additional functions
-export -f export_step_metadata_json
+export -f export_step_metadata_json json_string json_step_array
 export -f query_step_info
 export -f get_ready_steps
-export -f calculate_critical_path
 export -f calculate_total_time
+export -f dag_scheduler_available dag_scheduler execute_dag_schedule
 
 ################################################################################
 # Module enhanced with step metadata support (v2.6.1)
@@ -4,7 +4,7 @@ set -euo pipefail
 ################################################################################
 # Documentation Section Extractor
 # Purpose: Extract and replace specific sections in markdown files
-# Version: 1.0.0
+# Version: 1.1.0 - Batched section operations on an indexed document
 # Created: 2026-02-07
 ################################################################################
 
@@ -54,10 +54,10 @@ extract_doc_section() {
         
         # Match heading and check if it matches our section
         /^#+[[:space:]]/ {
-            # Get heading level and text
-            match($0, /^(#+)[[:space:]]+(.+)$/, arr)
-            heading_level = length(arr[1])
-            heading_text = arr[2]
+            # Get heading level and text (POSIX match(), so mawk works too)
+            match($0, /^#+/)
+            heading_level = RLENGTH
+            heading_text = substr($0, RLENGTH + 1)
             
             # Normalize heading text to ID format
             gsub(/[^a-zA-Z0-9-]/, "-", heading_text)
@@ -99,9 +99,9 @@ extract_doc_section_with_heading() {
         BEGIN { found=0; level=0 }
         
         /^#+[[:space:]]/ {
-            match($0, /^(#+)[[:space:]]+(.+)$/, arr)
-            heading_level = length(arr[1])
-            heading_text = arr[2]
+            match($0, /^#+/)
+            heading_level = RLENGTH
+            heading_text = substr($0, RLENGTH + 1)
             
             gsub(/[^a-zA-Z0-9-]/, "-", heading_text)
             gsub(/--+/, "-", heading_text)
@@ -154,9 +154,9 @@ replace_doc_section() {
         BEGIN { found=0; level=0; replaced=0 }
         
         /^#+[[:space:]]/ {
-            match($0, /^(#+)[[:space:]]+(.+)$/, arr)
-            heading_level = length(arr[1])
-            heading_text = arr[2]
+            match($0, /^#+/)
+            heading_level = RLENGTH
+            heading_text = substr($0, RLENGTH + 1)
             
             gsub(/[^a-zA-Z0-9-]/, "-", heading_text)
             gsub(/--+/, "-", heading_text)
@@ -285,6 +285,125 @@ get_section_level() {
     return 1
 }
 
+# ==============================================================================
+# BATCHED SECTION OPERATIONS (v1.1.0)
+# ==============================================================================
+
+# Each function above rescans the document from the top, so updating many
+# sections of one file costs a scan per section. doc_sections.py indexes a
+# document once (cached by content hash), runs a whole list of operations
+# against it and writes each changed document once, atomically
+USE_PYTHON_DOC_SECTIONS="${USE_PYTHON_DOC_SECTIONS:-true}"
+DOC_SECTIONS_SCRIPT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)/ai_workflow_docs/doc_sections.py"
+
+# Section index cache; empty for ${PROJECT_ROOT}/.ai_workflow/cache/doc_sections,
+# so the cache does not follow the working directory
+DOC_SECTIONS_CACHE_DIR="${DOC_SECTIONS_CACHE_DIR:-}"
+
+# Operations queued by queue_doc_section_replace
+DOC_SECTION_BATCH_FILE=""
+
+# Check whether the Python section index can be used
+doc_sections_available() {
+    [[ "${USE_PYTHON_DOC_SECTIONS}" == "true" ]] && command -v python3 &>/dev/null && \
+        [[ -f "${DOC_SECTIONS_SCRIPT}" ]]
+}
+
+# Run a doc_sections.py command
+# Usage: doc_sections <command> [args...]
+doc_sections() {
+    python3 "${DOC_SECTIONS_SCRIPT}" \
+        --cache "${DOC_SECTIONS_CACHE_DIR:-${PROJECT_ROOT:-$(pwd)}/.ai_workflow/cache/doc_sections}" "$@"
+}
+
+# Run a list of section operations, one tab-separated operation per line:
+#   extract FILE SECTION OUTPUT_FILE
+#   exists  FILE SECTION
+#   level   FILE SECTION
+#   replace FILE SECTION CONTENT_FILE
+# Prints "ok|missing|error<TAB>op<TAB>file<TAB>section" per operation, with
+# the heading level appended for level
+# Usage: run_doc_section_batch < operations
+# Returns: 0 unless an operation failed
+run_doc_section_batch() {
+    if doc_sections_available; then
+        doc_sections batch
+        return
+    fi
+    
+    # Fallback: one scan of the document per operation
+    local op doc_file section_id path result level
+    local status=0
+    while IFS=$'\t' read -r op doc_file section_id path; do
+        [[ -z "$op" ]] && continue
+        result="missing"
+        level=""
+        if [[ ! -f "$doc_file" ]]; then
+            result="error"
+        else
+            case "$op" in
+                exists)
+                    section_exists "$doc_file" "$section_id" && result="ok"
+                    ;;
+                level)
+                    level=$(get_section_level "$doc_file" "$section_id") && result="ok"
+                    level=$'\t'"${level}"
+                    ;;
+                extract)
+                    [[ -n "$(extract_doc_section_with_heading "$doc_file" "$section_id")" ]] && result="ok"
+                    extract_doc_section "$doc_file" "$section_id" > "$path" || result="error"
+                    ;;
+                replace)
+                    if [[ ! -f "$path" ]]; then
+                        result="error"
+                    elif [[ -n "$(extract_doc_section_with_heading "$doc_file" "$section_id")" ]]; then
+                        replace_doc_section "$doc_file" "$section_id" "$(cat "$path")" && result="ok" || result="error"
+                    fi
+                    ;;
+                *)
+                    result="error"
+                    ;;
+            esac
+        fi
+        if [[ "$result" == "error" ]]; then
+            status=1
+        fi
+        printf '%s\t%s\t%s\t%s%s\n' "$result" "$op" "$doc_file" "$section_id" "$level"
+    done
+    return $status
+}
+
+# Queue a section replacement; flush_doc_section_batch applies the queue
+# Args: $1 - doc file, $2 - section ID, $3 - new content
+queue_doc_section_replace() {
+    local doc_file="$1"
+    local section_id="$2"
+    local new_content="$3"
+    
+    if [[ -z "$DOC_SECTION_BATCH_FILE" ]]; then
+        DOC_SECTION_BATCH_FILE=$(mktemp)
+        track_doc_extractor_temp "$DOC_SECTION_BATCH_FILE"
+    fi
+    
+    local content_file
+    content_file=$(mktemp)
+    track_doc_extractor_temp "$content_file"
+    printf '%s' "$new_content" > "$content_file"
+    printf 'replace\t%s\t%s\t%s\n' "$doc_file" "$section_id" "$content_file" >> "$DOC_SECTION_BATCH_FILE"
+}
+
+# Apply the queued section replacements, each document rewritten once
+# Returns: 0 unless a replacement failed
+flush_doc_section_batch() {
+    [[ -z "$DOC_SECTION_BATCH_FILE" ]] && return 0
+    
+    local status=0
+    run_doc_section_batch < "$DOC_SECTION_BATCH_FILE" > /dev/null || status=$?
+    DOC_SECTION_BATCH_FILE=""
+    cleanup_doc_extractor_files
+    return $status
+}
+
 # Export functions for testing
 export -f extract_doc_section
 export -f extract_doc_section_with_heading
@@ -294,6 +413,8 @@ export -f validate_doc_structure
 export -f get_section_level
 export -f track_doc_extractor_temp
 export -f cleanup_doc_extractor_files
+export -f doc_sections_available doc_sections run_doc_section_batch
+export -f queue_doc_section_replace flush_doc_section_batch
 
 # ==============================================================================
 # CLEANUP TRAP
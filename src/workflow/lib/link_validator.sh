@@ -192,7 +192,11 @@ validate_url() {
         
         if [[ $age -lt $LINK_CACHE_TTL ]]; then
             local cached_status=$(cat "$cache_file")
-            [[ "$cached_status" == "valid" ]] && return 0 || return 1
+            # "valid:no-curl" was never checked: treat it as a miss (as
+            # external_links.py does); anything but "valid" is broken
+            if [[ "$cached_status" != "valid:no-curl" ]]; then
+                [[ "$cached_status" == "valid" ]] && return 0 || return 1
+            fi
         fi
     fi
     
@@ -6,6 +6,7 @@ set -euo pipefail
 # Purpose: Track duration, success rate, and step timing for workflow automation
 # Part of: Tests & Documentation Workflow Automation v2.0.0
 # Created: December 18, 2025
+# Version: 2.1.0 - History statistics from the indexed metrics store
 ################################################################################
 
 # ==============================================================================
@@ -24,6 +25,18 @@ set -euo pipefail
 METRICS_CURRENT=""
 METRICS_HISTORY=""
 METRICS_SUMMARY=""
+METRICS_DB=""
+
+# Indexed history store (ai_workflow_docs/metrics_store.py): runs are recorded
+# once with running rollups, so history statistics do not rescan history.jsonl
+USE_PYTHON_METRICS="${USE_PYTHON_METRICS:-true}"
+METRICS_STORE_SCRIPT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)/ai_workflow_docs/metrics_store.py"
+
+# Retention: runs kept in the store (rollups keep every run). history.jsonl
+# keeps every run unless METRICS_TRIM_HISTORY=true
+METRICS_RETENTION_RUNS="${METRICS_RETENTION_RUNS:-1000}"
+METRICS_RETENTION_DAYS="${METRICS_RETENTION_DAYS:-365}"
+METRICS_TRIM_HISTORY="${METRICS_TRIM_HISTORY:-false}"
 
 # Step timing tracking
 declare -A STEP_START_TIMES
@@ -62,11 +75,13 @@ init_metrics() {
     METRICS_CURRENT="${METRICS_DIR}/current_run.json"
     METRICS_HISTORY="${METRICS_DIR}/history.jsonl"
     METRICS_SUMMARY="${METRICS_DIR}/summary.md"
+    METRICS_DB="${METRICS_DIR}/metrics.db"
     
     # Export for use in other functions
     export METRICS_CURRENT
     export METRICS_HISTORY
     export METRICS_SUMMARY
+    export METRICS_DB
     
     # Create metrics directory if it doesn't exist
     mkdir -p "${METRICS_DIR}"
@@ -91,6 +106,25 @@ EOF
     WORKFLOW_START_EPOCH=$(date +%s)
 }
 
+# Check whether history queries can use the metrics store
+# Returns: 0 if python3 and metrics_store.py are available
+metrics_store_available() {
+    [[ "${USE_PYTHON_METRICS}" == "true" ]] && command -v python3 &>/dev/null && \
+        [[ -f "${METRICS_STORE_SCRIPT}" ]]
+}
+
+# Run a metrics_store.py command against ${METRICS_DB}
+# Usage: metrics_store <command> [args...]
+metrics_store() {
+    python3 "${METRICS_STORE_SCRIPT}" --db "${METRICS_DB:-${METRICS_DIR}/metrics.db}" "$@"
+}
+
+# Check whether the store holds the history (it imports history.jsonl on the first record)
+# Returns: 0 if history queries should go to the store
+metrics_store_ready() {
+    metrics_store_available && [[ -f "${METRICS_DB:-${METRICS_DIR}/metrics.db}" ]]
+}
+
 # Get current execution mode as string
 get_execution_mode() {
     if [[ "${DRY_RUN}" == true ]]; then
@@ -408,9 +442,19 @@ finalize_metrics() {
     fi
     
     # Append to history (JSON Lines format)
+    # The store imports any existing history on first use, appends the run as
+    # one line and applies the retention policy to itself (and to the file
+    # with METRICS_TRIM_HISTORY=true)
     if [[ -f "${METRICS_CURRENT}" ]]; then
-        cat "${METRICS_CURRENT}" >> "${METRICS_HISTORY}"
-        echo >> "${METRICS_HISTORY}"  # Ensure newline between records
+        local trim_args=()
+        [[ "${METRICS_TRIM_HISTORY}" == "true" ]] && trim_args=(--trim-history)
+        if ! metrics_store_available || ! metrics_store record "${METRICS_CURRENT}" \
+                --history "${METRICS_HISTORY}" \
+                --keep-runs "${METRICS_RETENTION_RUNS}" \
+                --max-age-days "${METRICS_RETENTION_DAYS}" "${trim_args[@]}"; then
+            cat "${METRICS_CURRENT}" >> "${METRICS_HISTORY}"
+            echo >> "${METRICS_HISTORY}"  # Ensure newline between records
+        fi
     fi
     
     # Generate summary report
@@ -514,6 +558,11 @@ generate_historical_stats() {
         return
     fi
     
+    # Rollups from the metrics store: constant time however long the history
+    if metrics_store_ready && metrics_store summary --recent 5 2>/dev/null; then
+        return
+    fi
+    
     local total_runs
     local successful_runs
     local success_rate=0
@@ -547,9 +596,15 @@ calculate_average_duration() {
         return
     fi
     
+    local avg
+    if metrics_store_ready && avg=$(metrics_store duration --stat mean 2>/dev/null); then
+        format_duration "${avg}"
+        return
+    fi
+    
     # Extract durations and calculate average (fallback without jq)
     if command -v jq &> /dev/null; then
-        local avg=$(jq -s '[.[].duration_seconds] | add / length' "${METRICS_HISTORY}" 2>/dev/null || echo "0")
+        avg=$(jq -s '[.[].duration_seconds] | add / length' "${METRICS_HISTORY}" 2>/dev/null || echo "0")
         format_duration "${avg%.*}"  # Remove decimal part
     else
         echo "N/A (jq required)"
@@ -585,6 +640,10 @@ get_success_rate() {
         return
     fi
     
+    if metrics_store_ready && metrics_store success-rate --last "${count}" 2>/dev/null; then
+        return
+    fi
+    
     local recent_runs=$(tail -n "$((count * 2))" "${METRICS_HISTORY}")
     local total=$(echo "${recent_runs}" | grep -c "workflow_run_id" || echo "0")
     local successful=$(echo "${recent_runs}" | grep -c '"success": *true' || echo "0")
@@ -601,16 +660,42 @@ get_success_rate() {
 get_average_step_duration() {
     local step_num="$1"
     
+    local avg
+    if metrics_store_ready && avg=$(metrics_store duration --scope "step_${step_num}" --stat mean 2>/dev/null); then
+        format_duration "${avg}"
+        return
+    fi
+    
     if [[ ! -f "${METRICS_HISTORY}" ]] || ! command -v jq &> /dev/null; then
         echo "N/A"
         return
     fi
     
-    local avg=$(jq -s "[.[] | .steps.step_${step_num}.duration_seconds // 0] | add / length" "${METRICS_HISTORY}" 2>/dev/null || echo "0")
-    format_duration "${avg%.*}"
+    # Same sample as the store (TIMED_STEP_STATUSES): timed success/failed runs only
+    avg=$(jq -s --arg step "step_${step_num}" '
+        [.[] | .steps[$step]? // empty
+             | select(.status == "success" or .status == "failed")
+             | .duration_seconds | select(type == "number")]
+        | if length > 0 then add / length | round else 0 end' "${METRICS_HISTORY}" 2>/dev/null || echo "0")
+    format_duration "${avg}"
+}
+
+# Get a step duration percentile across history (requires the metrics store)
+# Usage: get_step_duration_percentile <step_number> [p50|p90|p95|p99]
+get_step_duration_percentile() {
+    local step_num="$1"
+    local percentile="${2:-p90}"
+    
+    local value
+    if metrics_store_ready && value=$(metrics_store duration --scope "step_${step_num}" --stat "${percentile}" 2>/dev/null); then
+        format_duration "${value}"
+    else
+        echo "N/A"
+    fi
 }
 
 # Export functions for use in workflow
 export -f init_metrics start_step_timer stop_step_timer finalize_metrics
 export -f start_phase_timer stop_phase_timer generate_phase_report
 export -f get_success_rate get_average_step_duration generate_metrics_summary
+export -f get_step_duration_percentile metrics_store_available metrics_store metrics_store_ready
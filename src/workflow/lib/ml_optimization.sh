@@ -3,7 +3,7 @@ set -euo pipefail
 
 ################################################################################
 # Machine Learning Optimization Module
-# Version: 3.0.10
+# Version: 3.1.0
 # Purpose: Predictive optimization using historical workflow data
 #
 # Features:
@@ -39,6 +39,13 @@ export ML_TRAINING_DATA ML_MODEL_DIR ML_PREDICTIONS
 MIN_TRAINING_SAMPLES=10  # Minimum samples before ML kicks in
 RETRAINING_INTERVAL=86400  # Retrain every 24 hours
 
+# Fitted duration model (ai_workflow_docs/duration_model.py, NumPy to fit):
+# predictions read the fitted model instead of slurping the training data
+USE_PYTHON_ML_MODEL="${USE_PYTHON_ML_MODEL:-true}"
+ML_DURATION_MODEL_SCRIPT="${WORKFLOW_HOME}/src/ai_workflow_docs/duration_model.py"
+[[ -f "$ML_DURATION_MODEL_SCRIPT" ]] || \
+    ML_DURATION_MODEL_SCRIPT="$(cd "${SCRIPT_DIR}/../.." && pwd)/ai_workflow_docs/duration_model.py"
+
 # ==============================================================================
 # INITIALIZATION
 # ==============================================================================
@@ -63,10 +70,34 @@ init_ml_system() {
     else
         print_success "ML: Ready with $sample_count training samples"
         export ML_ENABLED=true
+        # Refit the duration model if training data was added since the last fit
+        if ml_duration_model_available; then
+            ml_duration_model fit --if-stale 2>/dev/null || \
+                print_warning "ML: Duration model not fitted (NumPy required) - using jq estimates"
+        fi
         return 0
     fi
 }
 
+# Check whether duration_model.py can be run
+# Returns: 0 if python3 and the script are available
+ml_duration_model_available() {
+    [[ "${USE_PYTHON_ML_MODEL}" == "true" ]] && command -v python3 &>/dev/null && \
+        [[ -f "$ML_DURATION_MODEL_SCRIPT" ]]
+}
+
+# Check whether a fitted duration model exists
+# Returns: 0 if predictions can come from the model
+ml_duration_model_ready() {
+    ml_duration_model_available && [[ -f "${ML_MODEL_DIR}/duration_model.json" ]]
+}
+
+# Run a duration_model.py command on ${ML_TRAINING_DATA} and ${ML_MODEL_DIR}
+# Usage: ml_duration_model <command> [args...]
+ml_duration_model() {
+    python3 "$ML_DURATION_MODEL_SCRIPT" --data "$ML_TRAINING_DATA" --model-dir "$ML_MODEL_DIR" "$@"
+}
+
 # ==============================================================================
 # FEATURE EXTRACTION
 # ==============================================================================
@@ -200,6 +231,11 @@ predict_step_duration() {
     
     [[ "${ML_ENABLED:-false}" != "true" ]] && echo "0" && return 1
     
+    # Fitted per-step regression: one matrix-vector product
+    if ml_duration_model_ready && ml_duration_model predict "$features" "$step" 2>/dev/null; then
+        return 0
+    fi
+    
     # Extract relevant features
     local change_type=$(echo "$features" | jq -r '.change_type // "mixed"')
     local total_files=$(echo "$features" | jq -r '.total_files // 0')
@@ -291,10 +327,17 @@ predict_workflow_duration() {
     
     local total_predicted=0
     
-    for step in "${steps[@]}"; do
-        local step_prediction=$(predict_step_duration "$step" "$features")
-        total_predicted=$((total_predicted + step_prediction))
-    done
+    # One call predicts every step from the fitted model
+    if ml_duration_model_ready && \
+            total_predicted=$(ml_duration_model predict "$features" "${steps[@]}" --total 2>/dev/null); then
+        :
+    else
+        total_predicted=0
+        for step in "${steps[@]}"; do
+            local step_prediction=$(predict_step_duration "$step" "$features")
+            total_predicted=$((total_predicted + step_prediction))
+        done
+    fi
     
     # Add parallelization factor if applicable
     if [[ "${PARALLEL_EXECUTION:-false}" == "true" ]]; then
@@ -334,24 +377,32 @@ recommend_parallelization() {
         return 0
     fi
     
-    # Analyze historical performance with/without parallelization
-    local parallel_avg=$(jq_safe -s --arg change_type "$change_type" \
-        '[.[] | select(.features.change_type == $change_type and .parallel == true) | .total_duration] | 
-        if length > 0 then (add / length) else 0 end' \
-        "$ML_TRAINING_DATA" 2>/dev/null)
-    parallel_avg=${parallel_avg//[^0-9.]/}
-    parallel_avg=${parallel_avg:-0}
-    
-    local serial_avg=$(jq_safe -s --arg change_type "$change_type" \
-        '[.[] | select(.features.change_type == $change_type and .parallel == false) | .total_duration] | 
-        if length > 0 then (add / length) else 0 end' \
-        "$ML_TRAINING_DATA" 2>/dev/null)
-    serial_avg=${serial_avg//[^0-9.]/}
-    serial_avg=${serial_avg:-0}
-    
+    # The fitted model keeps these averages per change type
     local parallel_benefit=0
-    if [[ "$serial_avg" != "0" ]] && [[ "$parallel_avg" != "0" ]]; then
-        parallel_benefit=$(echo "scale=2; ($serial_avg - $parallel_avg) * 100 / $serial_avg" | bc)
+    if ml_duration_model_ready && \
+            parallel_benefit=$(ml_duration_model parallel-benefit "$change_type" 2>/dev/null); then
+        :
+    else
+        parallel_benefit=0
+        
+        # Analyze historical performance with/without parallelization
+        local parallel_avg=$(jq_safe -s --arg change_type "$change_type" \
+            '[.[] | select(.features.change_type == $change_type and .parallel == true) | .total_duration] | 
+            if length > 0 then (add / length) else 0 end' \
+            "$ML_TRAINING_DATA" 2>/dev/null)
+        parallel_avg=${parallel_avg//[^0-9.]/}
+        parallel_avg=${parallel_avg:-0}
+        
+        local serial_avg=$(jq_safe -s --arg change_type "$change_type" \
+            '[.[] | select(.features.change_type == $change_type and .parallel == false) | .total_duration] | 
+            if length > 0 then (add / length) else 0 end' \
+            "$ML_TRAINING_DATA" 2>/dev/null)
+        serial_avg=${serial_avg//[^0-9.]/}
+        serial_avg=${serial_avg:-0}
+        
+        if [[ "$serial_avg" != "0" ]] && [[ "$parallel_avg" != "0" ]]; then
+            parallel_benefit=$(echo "scale=2; ($serial_avg - $parallel_avg) * 100 / $serial_avg" | bc)
+        fi
     fi
     
     # Decision logic
@@ -428,27 +479,36 @@ recommend_skip_steps() {
     
     # Learn from historical patterns - which steps had no impact?
     # For each step, check if it ever found issues for similar change patterns
-    for step in {0..14}; do
-        local issues_found=$(jq_safe -s --arg step "$step" \
-            --arg change_type "$change_type" \
-            '[.[] | select(
-                .step == ($step | tonumber) and 
-                .features.change_type == $change_type and 
-                .issues_found > 0
-            )] | length' "$ML_TRAINING_DATA" 2>/dev/null || echo "0")
-        
-        local total_runs=$(jq_safe -s --arg step "$step" \
-            --arg change_type "$change_type" \
-            '[.[] | select(
-                .step == ($step | tonumber) and 
-                .features.change_type == $change_type
-            )] | length' "$ML_TRAINING_DATA" 2>/dev/null || echo "0")
-        
-        # If step never found issues in similar contexts, recommend skip
-        if [[ $total_runs -gt 5 ]] && [[ $issues_found -eq 0 ]]; then
-            skip_steps+=($step)
-        fi
-    done
+    local model_skip
+    if ml_duration_model_ready && model_skip=$(ml_duration_model skip-steps "$change_type" 2>/dev/null); then
+        for step in $model_skip; do
+            if [[ $step -le 14 ]]; then
+                skip_steps+=("$step")
+            fi
+        done
+    else
+        for step in {0..14}; do
+            local issues_found=$(jq_safe -s --arg step "$step" \
+                --arg change_type "$change_type" \
+                '[.[] | select(
+                    .step == ($step | tonumber) and 
+                    .features.change_type == $change_type and 
+                    .issues_found > 0
+                )] | length' "$ML_TRAINING_DATA" 2>/dev/null || echo "0")
+            
+            local total_runs=$(jq_safe -s --arg step "$step" \
+                --arg change_type "$change_type" \
+                '[.[] | select(
+                    .step == ($step | tonumber) and 
+                    .features.change_type == $change_type
+                )] | length' "$ML_TRAINING_DATA" 2>/dev/null || echo "0")
+            
+            # If step never found issues in similar contexts, recommend skip
+            if [[ $total_runs -gt 5 ]] && [[ $issues_found -eq 0 ]]; then
+                skip_steps+=("$step")
+            fi
+        done
+    fi
     
     # Rule-based augmentation
     case "$change_type" in
@@ -673,6 +733,11 @@ retrain_models() {
 calculate_model_statistics() {
     local stats_file="${ML_MODEL_DIR}/statistics.json"
     
+    # Fitting the duration model writes the same statistics
+    if ml_duration_model_available && ml_duration_model fit 2>/dev/null; then
+        return 0
+    fi
+    
     # Calculate statistics per change_type and step
     jq_safe -s 'group_by(.features.change_type) | 
         map({
@@ -866,6 +931,9 @@ display_ml_status() {
 # ==============================================================================
 
 export -f init_ml_system
+export -f ml_duration_model_available
+export -f ml_duration_model_ready
+export -f ml_duration_model
 export -f extract_change_features
 export -f predict_step_duration
 export -f predict_workflow_duration
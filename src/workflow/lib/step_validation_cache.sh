@@ -3,7 +3,7 @@ set -euo pipefail
 
 ################################################################################
 # Step Validation Cache Module
-# Version: 1.0.1
+# Version: 1.1.0
 # Purpose: Cache validation results between workflow runs to skip unchanged files
 # Part of: Tests & Documentation Workflow Automation v2.7.0
 # Expected Benefit: 60% reduction in repeated workflow runs
@@ -30,6 +30,11 @@ VALIDATION_CACHE_VERSION="1.0.1"
 # Enable/disable validation caching
 USE_VALIDATION_CACHE=${USE_VALIDATION_CACHE:-true}
 
+# Hash file batches in one Python process (ai_workflow_docs/file_hashes.py) when available
+USE_PYTHON_HASHER=${USE_PYTHON_HASHER:-true}
+# (hash index: VALIDATION_HASH_INDEX, default ${VALIDATION_CACHE_DIR}/file_hashes.json)
+VALIDATION_HASHER_SCRIPT="$(cd "$(dirname "${BASH_SOURCE[0]}")/../.." && pwd)/ai_workflow_docs/file_hashes.py"
+
 # Validation cache statistics
 declare -g VALIDATION_CACHE_HITS=0
 declare -g VALIDATION_CACHE_MISSES=0
@@ -96,6 +101,19 @@ EOF
 # FILE HASH CALCULATION
 # ==============================================================================
 
+# Check whether file_hashes.py can be used
+# Returns: 0 if enabled and python3 and file_hashes.py are available
+python_hasher_available() {
+    [[ "${USE_PYTHON_HASHER}" == "true" ]] && command -v python3 &>/dev/null \
+        && [[ -f "${VALIDATION_HASHER_SCRIPT}" ]]
+}
+
+# Run file_hashes.py
+# Args: $@ = file_hashes.py arguments
+python_hasher() {
+    python3 "${VALIDATION_HASHER_SCRIPT}" "$@"
+}
+
 # Calculate SHA256 hash of file content
 # Args: $1 = file path
 # Returns: SHA256 hash string
@@ -114,6 +132,10 @@ calculate_file_hash() {
 # Args: $@ = file paths
 # Returns: Combined SHA256 hash
 calculate_files_hash() {
+    if python_hasher_available && printf '%s\0' "$@" | python_hasher -z --combined; then
+        return 0
+    fi
+    
     local combined_content=""
     
     for file in "$@"; do
@@ -136,12 +158,48 @@ calculate_directory_hash() {
         return 1
     fi
     
+    if python_hasher_available && python_hasher --tree "${dir_path}"; then
+        return 0
+    fi
+    
     # Create hash from directory structure (file paths + sizes)
-    find "${dir_path}" -type f 2>/dev/null | sort | while read -r file; do
+    find "${dir_path}" -type f 2>/dev/null | LC_ALL=C sort | while IFS= read -r file; do
         stat -c "%s %n" "${file}" 2>/dev/null
     done | sha256sum | awk '{print $1}'
 }
 
+# Calculate hashes for many files at once
+# Args: $1 = step_name, $2 = validation_type, $@ = file paths
+# Returns: One "<hash>\t<cache_key>" record per file, NUL-terminated
+# Uses one Python process with a persistent (path, size, mtime) hash index
+# instead of a sha256sum fork per file; falls back to calculate_file_hash.
+batch_calculate_file_hashes() {
+    local step_name="$1"
+    local validation_type="$2"
+    shift 2
+    
+    if python_hasher_available; then
+        local hash_file
+        hash_file=$(mktemp)
+        track_step_val_cache_temp "${hash_file}"
+        if printf '%s\0' "$@" \
+            | python_hasher -z --step "${step_name}" --type "${validation_type}" \
+                --index "${VALIDATION_HASH_INDEX:-${VALIDATION_CACHE_DIR}/file_hashes.json}" \
+                > "${hash_file}"; then
+            cat "${hash_file}"
+            rm -f "${hash_file}"
+            return 0
+        fi
+        rm -f "${hash_file}"
+    fi
+    
+    local file_path
+    for file_path in "$@"; do
+        printf '%s\t%s\0' "$(calculate_file_hash "${file_path}")" \
+            "$(generate_validation_cache_key "${step_name}" "${validation_type}" "${file_path}")"
+    done
+}
+
 # ==============================================================================
 # CACHE KEY GENERATION
 # ==============================================================================
@@ -196,6 +254,7 @@ check_validation_cache() {
     local cached_entry=$(jq -r ".entries[\"${cache_key}\"] // empty" "${VALIDATION_CACHE_INDEX}" 2>/dev/null)
     
     if [[ -z "${cached_entry}" ]]; then
+        ((VALIDATION_CACHE_MISSES++))
         return 1
     fi
     
@@ -211,6 +270,7 @@ check_validation_cache() {
         if [[ "${VERBOSE:-false}" == "true" ]]; then
             print_info "Validation cache expired for: ${cache_key}"
         fi
+        ((VALIDATION_CACHE_MISSES++))
         return 1
     fi
     
@@ -389,9 +449,18 @@ batch_validate_files_cached() {
     local validated_count=0
     local cached_count=0
     
+    # Hash the whole batch up front (one process instead of a fork per file)
+    local -A batch_hashes=()
+    local record_hash record_key
+    while IFS=$'\t' read -r -d '' record_hash record_key; do
+        batch_hashes["${record_key}"]="${record_hash}"
+    done < <(batch_calculate_file_hashes "${step_name}" "${validation_type}" "$@")
+    
     for file_path in "$@"; do
-        local cache_key=$(generate_validation_cache_key "${step_name}" "${validation_type}" "${file_path}")
-        local file_hash=$(calculate_file_hash "${file_path}")
+        # Same key as generate_validation_cache_key, without a subshell
+        local cache_key="${step_name}:${validation_type}:${file_path#./}"
+        local file_hash="${batch_hashes[${cache_key}]:-}"
+        [[ -n "${file_hash}" ]] || file_hash=$(calculate_file_hash "${file_path}") || true
         
         # Check cache
         if check_validation_cache "${cache_key}" "${file_hash}"; then
@@ -584,7 +653,7 @@ invalidate_changed_files_cache() {
 
 # Export all public functions
 export -f init_validation_cache
-export -f calculate_file_hash calculate_files_hash calculate_directory_hash
+export -f python_hasher_available python_hasher calculate_file_hash calculate_files_hash calculate_directory_hash batch_calculate_file_hashes
 export -f generate_validation_cache_key generate_directory_validation_key
 export -f check_validation_cache get_validation_result save_validation_result
 export -f validate_file_cached validate_directory_cached batch_validate_files_cached
@@ -107,17 +107,17 @@ assert_equals() {
     local actual="$2"
     local test_name="$3"
     
-    ((TESTS_RUN++))
+    TESTS_RUN=$((TESTS_RUN + 1))
     
     if [[ "${expected}" == "${actual}" ]]; then
         echo -e "${GREEN}✓${NC} ${test_name}"
-        ((TESTS_PASSED++))
+        TESTS_PASSED=$((TESTS_PASSED + 1))
         return 0
     else
         echo -e "${RED}✗${NC} ${test_name}"
         echo "  Expected: ${expected}"
         echo "  Actual: ${actual}"
-        ((TESTS_FAILED++))
+        TESTS_FAILED=$((TESTS_FAILED + 1))
         return 1
     fi
 }
@@ -127,16 +127,16 @@ assert_file_exists() {
     local file_path="$1"
     local test_name="$2"
     
-    ((TESTS_RUN++))
+    TESTS_RUN=$((TESTS_RUN + 1))
     
     if [[ -f "${file_path}" ]] || [[ -d "${file_path}" ]]; then
         echo -e "${GREEN}✓${NC} ${test_name}"
-        ((TESTS_PASSED++))
+        TESTS_PASSED=$((TESTS_PASSED + 1))
         return 0
     else
         echo -e "${RED}✗${NC} ${test_name}"
         echo "  Path not found: ${file_path}"
-        ((TESTS_FAILED++))
+        TESTS_FAILED=$((TESTS_FAILED + 1))
         return 1
     fi
 }
@@ -146,16 +146,16 @@ assert_true() {
     local condition="$1"
     local test_name="$2"
     
-    ((TESTS_RUN++))
+    TESTS_RUN=$((TESTS_RUN + 1))
     
     if eval "${condition}"; then
         echo -e "${GREEN}✓${NC} ${test_name}"
-        ((TESTS_PASSED++))
+        TESTS_PASSED=$((TESTS_PASSED + 1))
         return 0
     else
         echo -e "${RED}✗${NC} ${test_name}"
         echo "  Condition failed: ${condition}"
-        ((TESTS_FAILED++))
+        TESTS_FAILED=$((TESTS_FAILED + 1))
         return 1
     fi
 }
@@ -181,7 +181,7 @@ test_cache_initialization() {
     
     # Test 4: Index has correct version
     local version=$(jq -r '.version' "${VALIDATION_CACHE_INDEX}")
-    assert_equals "1.0.0" "${version}" "Index has correct version"
+    assert_equals "${VALIDATION_CACHE_VERSION}" "${version}" "Index has correct version"
     
     cleanup_test_env
 }
@@ -210,7 +210,8 @@ test_file_hash_calculation() {
     assert_true "[[ '${hash1}' != '${hash3}' ]]" "Different files produce different hashes"
     
     # Test 4: Non-existent file returns error
-    local hash4=$(calculate_file_hash "${TEST_DIR}/nonexistent.js" 2>/dev/null || echo "FILE_NOT_FOUND")
+    local hash4
+    hash4=$(calculate_file_hash "${TEST_DIR}/nonexistent.js" 2>/dev/null) || true
     assert_equals "FILE_NOT_FOUND" "${hash4}" "Non-existent file returns error"
     
     cleanup_test_env
@@ -411,6 +412,30 @@ test_batch_validation() {
     cleanup_test_env
 }
 
+test_batch_file_hashes() {
+    echo -e "\n${BLUE}Testing Batch File Hashing${NC}"
+    
+    setup_test_env
+    
+    local files=("${TEST_DIR}/src/test.js" "${TEST_DIR}/src/README.md" "${TEST_DIR}/missing.js")
+    
+    # Test 1: Batch records match per-file hashes and cache keys
+    local batch_records expected_records
+    batch_records=$(batch_calculate_file_hashes "step9" "lint" "${files[@]}" | tr '\0' '\n')
+    expected_records=$(USE_PYTHON_HASHER=false batch_calculate_file_hashes "step9" "lint" "${files[@]}" | tr '\0' '\n')
+    assert_equals "${expected_records}" "${batch_records}" "Batch hashes match calculate_file_hash"
+    
+    # Test 2: Missing files hash to FILE_NOT_FOUND
+    assert_true "[[ '${batch_records}' == *'FILE_NOT_FOUND'* ]]" "Missing file reported as FILE_NOT_FOUND"
+    
+    # Test 3: A second run gives the same records
+    local second_records
+    second_records=$(batch_calculate_file_hashes "step9" "lint" "${files[@]}" | tr '\0' '\n')
+    assert_equals "${batch_records}" "${second_records}" "Batch hashes stable across runs"
+    
+    cleanup_test_env
+}
+
 # ==============================================================================
 # VALIDATION WRAPPER TESTS
 # ==============================================================================
@@ -508,7 +533,7 @@ test_cache_statistics() {
     VALIDATION_CACHE_HITS=7
     VALIDATION_CACHE_MISSES=3
     local stats_output=$(export_validation_cache_metrics)
-    local hit_rate=$(echo "${stats_output}" | jq -r '.validation_cache_hit_rate')
+    local hit_rate=$(echo "${stats_output}" | grep -o '"validation_cache_hit_rate": [0-9.]*' | awk '{print $2}')
     assert_equals "70.0" "${hit_rate}" "Calculate correct hit rate"
     
     cleanup_test_env
@@ -564,6 +589,7 @@ run_all_tests() {
     test_cache_invalidation
     test_cache_expiration
     test_batch_validation
+    test_batch_file_hashes
     test_validate_file_cached
     test_validate_directory_cached
     test_cache_statistics
@@ -340,20 +340,22 @@ execute_ai_bootstrap_documentation() {
         print_info "Log file: $log_file"
     fi
     
-    # Use AI cache if available
-    local cache_key=""
-    if declare -f generate_cache_key &>/dev/null; then
-        cache_key=$(generate_cache_key "technical_writer" "$prompt")
+    # Use AI cache if available (with a near-duplicate cached prompt, if any)
+    local cache_key="" near_key="" near_similarity=""
+    if declare -f lookup_cache_key &>/dev/null; then
+        read -r cache_key near_key near_similarity <<< "$(lookup_cache_key "technical_writer" "$prompt")"
     fi
     
     # Check cache first
     if [[ -n "$cache_key" ]] && declare -f get_cached_response &>/dev/null; then
         local cached_response
         if cached_response=$(get_cached_response "$cache_key"); then
+            record_cache_hit
             print_success "Using cached AI response"
             echo "$cached_response" > "$output_file"
             return 0
         fi
+        record_ai_cache_miss "$cache_key" "$near_key" "$near_similarity"
     fi
     
     # Use standard execute_copilot_prompt function for consistency
@@ -363,6 +365,10 @@ execute_ai_bootstrap_documentation() {
             # If log file was created, save it to output file as well
             if [[ -n "$log_file" && -f "$log_file" ]]; then
                 cp "$log_file" "$output_file"
+                # Serve the same analysis from the cache next time
+                if [[ -n "$cache_key" ]] && declare -f save_to_cache &>/dev/null; then
+                    save_to_cache "$cache_key" "$(cat "$output_file")" "technical_writer" "$prompt"
+                fi
             fi
             print_success "AI documentation gap analysis completed"
             return 0
@@ -145,7 +145,19 @@ step13_markdown_linting() {
     local antipattern_count=0
     
     # Check for missing spaces after hash symbols
-    local missing_space_files=$(grep -l "^#[^# ]" $(find . -name "*.md" -not -path "*/node_modules/*" 2>/dev/null) 2>/dev/null | wc -l)
+    # (answered by the docs daemon when one is serving this project; it runs
+    # the same check on the same files from its in-memory corpus)
+    local missing_space_files=0
+    local md_files=()
+    mapfile -t md_files < <(find . -name "*.md" -not -path "*/node_modules/*" 2>/dev/null)
+    local docs_client="${WORKFLOW_HOME:-}/scripts/docs_client.py"
+    local daemon_files
+    if [[ -S "${DOCS_DAEMON_SOCKET:-.ai_workflow/run/docs_daemon.sock}" && -f "$docs_client" ]] \
+        && daemon_files=$(python3 "$docs_client" heading_spacing --files "${md_files[@]}" 2>/dev/null); then
+        missing_space_files=$(grep -c . <<< "$daemon_files" || true)
+    elif [[ ${#md_files[@]} -gt 0 ]]; then
+        missing_space_files=$(grep -l "^#[^# ]" "${md_files[@]}" 2>/dev/null | wc -l)
+    fi
     if [[ $missing_space_files -gt 0 ]]; then
         print_warning "Found $missing_space_files files with missing spaces after #"
         ((antipattern_count++))
@@ -0,0 +1,11 @@
+"""
+Shared pytest setup for the ai_workflow_docs tests
+
+Makes the package importable from src/ without installing it.
+"""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO_ROOT / "src"))
@@ -0,0 +1,71 @@
+"""
+Tests for the SQLite AI response store
+"""
+
+import pytest
+
+from ai_workflow_docs import ai_cache_store
+from ai_workflow_docs.ai_cache_store import ACCESS_REFRESH, ResponseCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    store = ResponseCache(tmp_path / "responses.db")
+    yield store
+    store.close()
+
+
+def access(cache, key):
+    return cache.conn.execute("SELECT last_accessed, access_count FROM entries WHERE key = ?",
+                              (key,)).fetchone()
+
+
+def test_round_trip_and_ttl(cache):
+    value = b"response " * 100   # above COMPRESS_MIN_BYTES
+    cache.put("k", value)
+    assert cache.get("k") == value
+    assert cache.get("k", ttl=-1) is None
+    assert cache.get("missing") is None
+
+
+def test_recent_hit_does_not_write(cache, monkeypatch):
+    cache.put("k", b"v")
+    stored = access(cache, "k")
+
+    def no_write():
+        raise AssertionError("get took the write lock")
+    monkeypatch.setattr(cache, "transaction", no_write)
+    assert cache.get("k") == b"v"
+    assert access(cache, "k") == stored
+
+
+def test_stale_access_time_is_refreshed(cache, monkeypatch):
+    cache.put("k", b"v")
+    last_accessed, count = access(cache, "k")
+
+    later = last_accessed + ACCESS_REFRESH + 1
+    monkeypatch.setattr(ai_cache_store.time, "time", lambda: later)
+    assert cache.get("k", ttl=None) == b"v"
+    assert access(cache, "k") == (later, count + 1)
+
+
+def test_hit_after_newer_write_is_recorded(cache):
+    cache.put("read", b"v")
+    cache.put("written", b"w")
+    last_accessed, count = access(cache, "read")
+
+    assert cache.get("read") == b"v"
+    refreshed, refreshed_count = access(cache, "read")
+    assert refreshed > last_accessed and refreshed_count == count + 1
+    # Nothing stored since: the next hit is throttled again
+    assert cache.get("read") == b"v"
+    assert access(cache, "read") == (refreshed, refreshed_count)
+
+
+def test_eviction_keeps_entry_read_since_newer_writes(cache):
+    cache.put("recent", b"r")
+    for i in range(4):
+        cache.get("recent")
+        cache.put(f"bulk_{i}", bytes(100), max_bytes=250)
+    assert cache.has("recent")
+    assert not cache.has("bulk_0")
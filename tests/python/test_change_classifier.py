@@ -0,0 +1,77 @@
+"""
+Tests that change_classifier.py gives lib/change_detection.sh the same answers
+as its bash loops, and that the bash loops take over when it fails
+"""
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+CHANGE_LIB = Path(__file__).resolve().parents[2] / "src" / "workflow" / "lib" / "change_detection.sh"
+
+FUNCTIONS = ("detect_change_type", "analyze_changes", "assess_change_impact", "classify_files_by_nature")
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+
+
+def git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True,
+                   env={**os.environ, "GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@example.com",
+                        "GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@example.com"})
+
+
+def write(repo: Path, files) -> None:
+    for name in files:
+        path = repo / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"{name} {len(list(repo.iterdir()))}\n")
+
+
+def classify(repo: Path, function: str, **env: str) -> subprocess.CompletedProcess:
+    return subprocess.run(["bash", "-c", f"source '{CHANGE_LIB}'; {function}"], cwd=repo,
+                          capture_output=True, text=True, env={**os.environ, "PROJECT_ROOT": str(repo), **env})
+
+
+@pytest.fixture
+def repo(tmp_path):
+    git(tmp_path, "init", "-q")
+    write(tmp_path, ["README.md", "src/app.py", "tests/test_app.py"])
+    git(tmp_path, "add", "-A")
+    git(tmp_path, "commit", "-q", "-m", "baseline")
+    return tmp_path
+
+
+CHANGE_SETS = {
+    "docs": ["README.md", "docs/guide.md", "docs/with space.md"],
+    "code": ["src/app.py", "src/util.js"],
+    "mixed": ["README.md", "src/app.py", "tests/test_app.py", "package.json", "scripts/run.sh",
+              ".ai_workflow/logs/run.log", "notes.tmp", "assets/logo.png"],
+    "artifacts": [".ai_workflow/backlog/report.md", "editor.swp"],
+}
+
+
+@pytest.mark.parametrize("change_set", sorted(CHANGE_SETS))
+@pytest.mark.parametrize("function", FUNCTIONS)
+def test_classifier_matches_bash(repo, change_set, function):
+    write(repo, CHANGE_SETS[change_set])
+    git(repo, "add", "src")   # some changes staged, the rest modified or untracked
+
+    python = classify(repo, function, USE_PYTHON_CHANGE_CLASSIFIER="true")
+    shell = classify(repo, function, USE_PYTHON_CHANGE_CLASSIFIER="false")
+    assert python.returncode == shell.returncode == 0, python.stderr + shell.stderr
+    assert python.stdout == shell.stdout
+
+
+@pytest.mark.parametrize("function", FUNCTIONS)
+def test_failing_classifier_falls_back_to_bash(repo, tmp_path_factory, function):
+    write(repo, CHANGE_SETS["mixed"])
+    failing = tmp_path_factory.mktemp("bin") / "change_classifier.py"
+    failing.write_text("import sys\nsys.exit(2)\n")
+
+    shell = classify(repo, function, USE_PYTHON_CHANGE_CLASSIFIER="false")
+    broken = classify(repo, f"CHANGE_CLASSIFIER_SCRIPT='{failing}'; {function}")
+    assert broken.stdout == shell.stdout
+    assert shell.stdout.strip()
@@ -0,0 +1,164 @@
+"""
+Tests for check_doc_links.py: the path existence index and the
+incremental result cache
+"""
+
+import json
+import os
+
+import pytest
+
+from ai_workflow_docs.check_doc_links import PathIndex, create_checker, parse_args
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "docs" / "guide").mkdir(parents=True)
+    (tmp_path / "docs" / "index.md").write_text("# Index\n")
+    (tmp_path / "docs" / "guide" / "setup.md").write_text("# Setup\n")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+    return tmp_path
+
+
+def test_paths_below_root_are_answered_from_the_index(project):
+    index = PathIndex(project)
+    assert index.exists(str(project / "docs" / "guide" / "setup.md"))
+    assert index.exists(str(project / "docs" / "guide"))
+    assert index.exists(str(project / "docs" / "guide" / ".." / "index.md"))
+    assert not index.exists(str(project / "docs" / "missing.md"))
+    assert (index.lookups, index.probes) == (4, 0)
+
+
+def test_skipped_and_outside_paths_are_probed(project, tmp_path_factory):
+    outside = tmp_path_factory.mktemp("outside") / "file.md"
+    outside.write_text("x")
+    index = PathIndex(project)
+    assert str(project / ".git" / "HEAD") not in index.paths
+    assert index.exists(str(project / ".git" / "HEAD"))
+    assert index.exists(str(outside))
+    assert index.probes == 2
+
+
+def test_index_matches_os_path_exists(project):
+    index = PathIndex(project)
+    candidates = [os.path.join(str(project), *parts) for parts in [
+        ("docs",), ("docs", "index.md"), ("docs", "INDEX.md"), ("docs", "guide", "setup.md", "x"),
+        ("docs", "guide", "..", "..", "docs", "index.md"), ("nope",), (".git", "HEAD")]]
+    assert [index.exists(path) for path in candidates] == [os.path.exists(path) for path in candidates]
+
+
+def test_directory_symlinks_are_followed(project, tmp_path_factory):
+    shared = tmp_path_factory.mktemp("shared")
+    (shared / "common.md").write_text("# Common\n")
+    os.symlink(shared, project / "docs" / "shared")
+
+    index = PathIndex(project)
+    assert index.exists(str(project / "docs" / "shared" / "common.md"))
+    assert not index.exists(str(project / "docs" / "shared" / "missing.md"))
+    assert index.probes == 0
+
+
+def test_symlink_loops_terminate_and_are_probed(project):
+    os.symlink(project / "docs", project / "docs" / "guide" / "up")
+
+    index = PathIndex(project)
+    assert index.unwalked == [str(project / "docs" / "guide" / "up") + os.sep]
+    # Below the loop the filesystem answers, like os.path.exists
+    assert index.exists(str(project / "docs" / "guide" / "up" / "index.md"))
+    assert not index.exists(str(project / "docs" / "guide" / "up" / "missing.md"))
+    assert index.probes == 2
+
+
+def test_contains_does_not_count(project):
+    index = PathIndex(project)
+    assert index.contains(str(project / "docs" / "index.md"))
+    assert index.contains(str(project / ".git" / "HEAD"))
+    assert (index.lookups, index.probes) == (0, 0)
+
+
+# Incremental result cache ---------------------------------------------------
+
+def check(docs, cache_dir):
+    checker = create_checker(parse_args([str(docs), "--cache-dir", str(cache_dir)]))
+    checker.validate_all()
+    return checker
+
+
+@pytest.fixture
+def linked(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "a.md").write_text("# A\n\nSee [b](b.md#usage) and [c](c.md).\n")
+    (docs / "b.md").write_text("# B\n\n## Usage\n")
+    (docs / "other.md").write_text("# Other\n\n[a](a.md)\n")
+    return docs, tmp_path / "cache"
+
+
+def test_unchanged_files_are_replayed(linked, capsys):
+    docs, cache_dir = linked
+    first = check(docs, cache_dir)
+    assert (first.result_cache.hits, first.result_cache.misses) == (0, 3)
+    assert first.errors == ["docs/a.md: Broken link to c.md"]
+
+    second = check(docs, cache_dir)
+    assert (second.result_cache.hits, second.result_cache.misses) == (3, 0)
+    assert (second.errors, second.counts) == (first.errors, first.counts)
+
+
+def test_created_target_invalidates_the_linking_file(linked, capsys):
+    docs, cache_dir = linked
+    check(docs, cache_dir)
+    (docs / "c.md").write_text("# C\n")
+
+    checker = check(docs, cache_dir)
+    assert checker.errors == []
+    # a.md is re-checked; b.md and other.md are reused, c.md is new
+    assert (checker.result_cache.hits, checker.result_cache.misses) == (2, 2)
+
+
+def test_changed_anchor_target_invalidates_the_linking_file(linked, capsys):
+    docs, cache_dir = linked
+    check(docs, cache_dir)
+    (docs / "b.md").write_text("# B\n\n## Renamed\n")
+
+    checker = check(docs, cache_dir)
+    assert checker.warnings == ["docs/a.md: Broken anchor link: b.md#usage"]
+    assert (checker.result_cache.hits, checker.result_cache.misses) == (1, 2)
+
+
+def test_entries_of_deleted_files_are_pruned(linked, capsys):
+    docs, cache_dir = linked
+    check(docs, cache_dir)
+    (docs / "other.md").unlink()
+    check(docs, cache_dir)
+
+    entries = json.loads((cache_dir / "index.json").read_text())["entries"]
+    assert sorted(key.partition(":")[2] for key in entries) == ["docs/a.md", "docs/b.md"]
+
+
+# Parallel checking ----------------------------------------------------------
+
+def run_checker(docs, jobs):
+    checker = create_checker(parse_args([str(docs)]))
+    exit_code = checker.validate_all(jobs=jobs)
+    return exit_code, checker.errors, checker.warnings, checker.successes, checker.counts, \
+        (checker.path_index.lookups, checker.path_index.probes)
+
+
+def test_parallel_run_matches_serial_run(tmp_path, capsys):
+    docs = tmp_path / "docs"
+    (docs / "guide").mkdir(parents=True)
+    (docs / "index.md").write_text("# Index\n\n## Usage\n\n[usage](#usage) [gone](#gone) [setup](guide/setup.md)\n")
+    (docs / "guide" / "setup.md").write_text("# Setup\n\n[home](../index.md#usage) [x](../missing.md)\n")
+    for i in range(6):
+        (docs / f"page{i}.md").write_text(f"# Page {i}\n\n[next](page{i + 1}.md) [site](https://example.com)\n")
+
+    serial = run_checker(docs, jobs=1)
+    serial_out = capsys.readouterr()
+    parallel = run_checker(docs, jobs=2)
+    parallel_out = capsys.readouterr()
+
+    assert serial == parallel
+    assert serial[0] == 1 and len(serial[1]) == 2
+    assert (serial_out.out, serial_out.err) == (parallel_out.out, parallel_out.err)
@@ -0,0 +1,63 @@
+"""
+Tests for the ai-workflow-docs entry point: subcommand modules are imported
+only when they run, and the old script paths still dispatch to them
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from ai_workflow_docs import cli
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+SUBCOMMAND_MODULES = {f"ai_workflow_docs.{module}" for module, _ in cli.COMMANDS.values()}
+
+
+@pytest.fixture
+def fresh_modules(monkeypatch):
+    """Unload the subcommand modules (and PyYAML) for one test; restored afterwards"""
+    for name in list(sys.modules):
+        if name in SUBCOMMAND_MODULES or name.startswith(("ai_workflow_docs.doc_", "yaml")):
+            monkeypatch.delitem(sys.modules, name)
+    argv0 = sys.argv[0]
+    yield
+    sys.argv[0] = argv0
+
+
+def loaded(names):
+    return sorted(name for name in names if name in sys.modules)
+
+
+def test_help_imports_no_subcommand(fresh_modules, capsys):
+    assert cli.main(["--help"]) == 0
+    assert "check-links" in capsys.readouterr().out
+    assert loaded(SUBCOMMAND_MODULES) == []
+
+
+def test_subcommand_help_imports_only_that_subcommand(fresh_modules, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        cli.main(["check-links", "--help"])
+    assert exit_info.value.code == 0
+    assert "usage: ai-workflow-docs check-links" in capsys.readouterr().out
+    assert loaded(SUBCOMMAND_MODULES) == ["ai_workflow_docs.check_doc_links"]
+    assert "yaml" not in sys.modules
+
+
+def test_unknown_subcommand(capsys):
+    assert cli.main(["no-such-command"]) == 2
+    assert "unknown subcommand" in capsys.readouterr().err
+
+
+def test_script_wrapper_dispatches_to_the_package(tmp_path):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "index.md").write_text("# Index\n\n[missing](missing.md)\n")
+
+    result = subprocess.run([sys.executable, str(REPO_ROOT / "scripts" / "check_doc_links.py"), str(docs)],
+                            cwd=tmp_path, capture_output=True, text=True)
+    assert result.returncode == 1
+    assert "Documentation Link Checker" in result.stdout
+    assert "docs/index.md: Broken link to missing.md" in result.stderr
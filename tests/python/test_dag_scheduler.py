@@ -0,0 +1,118 @@
+"""
+Tests for the workflow DAG scheduler: critical-path ordering, failure
+blocking and the dispatch line protocol
+"""
+
+import io
+import json
+
+import pytest
+
+from ai_workflow_docs import dag_scheduler
+from ai_workflow_docs.dag_scheduler import ListScheduler, StepGraph, simulate, simulate_phases, step_sort_key
+
+# 0 -> 1 -> 2 is the long chain; 3 and 4 are short side branches of 0
+DEPENDENCIES = {"0": [], "1": ["0"], "2": ["1"], "3": ["0"], "4": ["0"], "5": []}
+DURATIONS = {"0": 10, "1": 50, "2": 50, "3": 5, "4": 20, "5": 30}
+
+
+@pytest.fixture
+def graph():
+    return StepGraph(DEPENDENCIES, DURATIONS)
+
+
+def test_step_sort_key_follows_workflow_order():
+    assert sorted(["12", "11.5", "0b", "1", "0", "11", "0a", "x"], key=step_sort_key) == \
+        ["0", "0a", "0b", "1", "11", "11.5", "12", "x"]
+
+
+def test_bottom_levels_and_critical_path(graph):
+    assert graph.bottom_levels == {"0": 110, "1": 100, "2": 50, "3": 5, "4": 20, "5": 30}
+    assert graph.critical_path() == ["0", "1", "2"]
+    assert graph.phases() == [["0", "5"], ["1", "3", "4"], ["2"]]
+
+
+def test_ready_steps_start_by_longest_remaining_path(graph):
+    scheduler = ListScheduler(graph, workers=2)
+    assert scheduler.startable() == ["0", "5"]
+    scheduler.finish("0", True)
+    assert scheduler.startable() == ["1"]
+    scheduler.finish("5", True)
+    assert scheduler.startable() == ["4"]
+    scheduler.finish("1", True)
+    # 2 became ready after 3 but has the longer path
+    assert scheduler.startable() == ["2"]
+
+
+def test_dependencies_finish_before_dependents_start(graph):
+    schedule = {step: (start, end) for step, start, end in simulate(graph, workers=2)}
+    assert set(schedule) == set(DEPENDENCIES)
+    for step, deps in DEPENDENCIES.items():
+        assert all(schedule[dep][1] <= schedule[step][0] for dep in deps)
+    # Never more steps running than workers
+    for step, (start, _) in schedule.items():
+        assert sum(s <= start < e for s, e in schedule.values()) <= 2
+
+
+def test_list_schedule_beats_static_phases(graph):
+    makespan = max(end for _, _, end in simulate(graph, workers=2))
+    phases = max(end for _, _, end in simulate_phases(graph, workers=2))
+    # In phases, 1 cannot start before 5 ends at 30, so 2 starts at 80 rather than 60
+    assert (makespan, phases) == (graph.bottom_levels["0"], 130)
+
+
+def test_failure_blocks_all_dependents(graph):
+    scheduler = ListScheduler(graph, workers=3, keep_going=True)
+    assert scheduler.startable() == ["0", "5"]
+    scheduler.finish("5", True)
+    scheduler.finish("0", True)
+    assert scheduler.startable() == ["1", "4", "3"]
+    scheduler.finish("1", False)
+    scheduler.finish("4", True)
+    scheduler.finish("3", True)
+    assert scheduler.blocked == {"2"}
+    assert scheduler.startable() == []
+    assert scheduler.done and scheduler.failed == ["1"]
+
+
+def test_failure_stops_new_starts_without_keep_going(graph):
+    scheduler = ListScheduler(graph, workers=1)
+    assert scheduler.startable() == ["0"]
+    scheduler.finish("0", False)
+    assert scheduler.startable() == []
+    assert scheduler.done and scheduler.blocked == {"1", "2", "3", "4"}
+
+
+def test_cycles_and_unknown_dependencies_are_rejected():
+    with pytest.raises(ValueError, match="cycle among steps 1, 2"):
+        StepGraph({"0": [], "1": ["2"], "2": ["1"]}, {})
+    with pytest.raises(ValueError, match="unknown step 9"):
+        StepGraph({"0": ["9"]}, {})
+
+
+def test_load_prefers_historical_durations(tmp_path):
+    metadata = tmp_path / "steps.json"
+    metadata.write_text(json.dumps({"steps": [
+        {"id": 0, "dependencies": "", "estimated_time_seconds": 30},
+        {"id": 1, "dependencies": "0", "estimated_time_seconds": 30},
+        {"id": 2, "dependencies": ["0", "1"]},
+    ]}))
+    stats = tmp_path / "stats.json"
+    stats.write_text(json.dumps({"rollups": {"workflow": {"p50": 500}, "step_1": {"p50": 12, "mean": 15},
+                                             "step_2": {"mean": 7}, "step_9": {"p50": 1}}}))
+
+    graph = StepGraph.load(str(metadata), str(stats))
+    assert graph.dependencies == {"0": [], "1": ["0"], "2": ["0", "1"]}
+    assert graph.durations == {"0": 30, "1": 12, "2": 7}
+
+
+def test_dispatch_protocol_reports_failed_steps(graph):
+    replies = io.StringIO("done 0 0\ndone 5 skipped\ndone 1 1\ndone 3 0\ndone 4 0\n")
+    out = io.StringIO()
+    trace = dag_scheduler.dispatch(graph, 2, True, replies, out)
+
+    assert out.getvalue().splitlines() == [
+        "start 0", "start 5", "wait", "start 1", "wait", "start 4", "wait",
+        "start 3", "wait", "wait", "end failed 1"]
+    assert trace["failed"] == ["1"] and trace["not_run"] == ["2"]
+    assert "Failed: 1; not run: 2" in dag_scheduler.format_gantt(trace)
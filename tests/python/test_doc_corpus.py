@@ -0,0 +1,87 @@
+"""
+Tests for the shared documentation corpus: GitHub anchor slugs and the
+single-pass tokenizer
+"""
+
+import pytest
+
+from ai_workflow_docs.doc_corpus import DocCorpus, Document, github_slug
+
+
+@pytest.mark.parametrize("heading, slug", [
+    ("Hello World", "hello-world"),
+    ("API v2.0 (beta)", "api-v20-beta"),
+    ("`run_step` options", "run_step-options"),
+    ("See [the guide](guide.md) first", "see-the-guide-first"),
+    ("![logo](logo.png) Project", "logo-project"),
+    ("Q&A -- notes", "qa----notes"),
+    ("Émigré café", "émigré-café"),
+    ("  Trailing spaces  ", "trailing-spaces"),
+])
+def test_github_slug(heading, slug):
+    assert github_slug(heading) == slug
+
+
+def document(tmp_path, text: str, name: str = "doc.md") -> Document:
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return Document(path, tmp_path)
+
+
+def test_duplicate_headings_get_github_suffixes(tmp_path):
+    doc = document(tmp_path, "# Setup\n## Setup\n## Setup-1\n### Setup\n")
+    assert doc.anchors == {"setup", "setup-1", "setup-1-1", "setup-2"}
+
+
+def test_html_anchors_and_fenced_headings(tmp_path):
+    doc = document(tmp_path, "\n".join([
+        '# Title',
+        '<a name="custom-anchor"></a>',
+        '```bash',
+        '# not a heading',
+        'see [inside](code.md)',
+        '```',
+        'see [outside](other.md) and [second](#title)',
+    ]))
+    assert doc.anchors == {"title", "custom-anchor"}
+    assert [(link.url, link.line, link.in_code) for link in doc.links] == [
+        ("code.md", 5, True), ("other.md", 7, False), ("#title", 7, False)]
+    assert doc.code_blocks[0].language == "bash" and doc.code_blocks[0].closed
+
+
+def test_unclosed_fence_is_reported(tmp_path):
+    doc = document(tmp_path, "# Title\n```python\nprint(1)\n")
+    assert not doc.code_blocks[0].closed
+    assert doc.code_blocks[0].line == 2
+
+
+def test_line_index(tmp_path):
+    doc = document(tmp_path, "first\nsecond line\nthird")
+    offset = doc.text.index("line")
+    assert doc.line_of(offset) == 2
+    assert doc.line_text(2) == "second line"
+    assert doc.line_text(3) == "third"
+
+
+def test_unreadable_document_records_error(tmp_path):
+    path = tmp_path / "latin1.md"
+    path.write_bytes("# Caf\xe9\n".encode("latin-1"))
+    doc = Document(path, tmp_path)
+    assert doc.read_error and doc.headings == []
+
+
+def test_corpus_loads_each_file_once_and_reuses_preloaded(tmp_path):
+    (tmp_path / "docs" / "api").mkdir(parents=True)
+    (tmp_path / "docs" / "a.md").write_text("# A\n")
+    (tmp_path / "docs" / "api" / "b.md").write_text("# B\n")
+
+    corpus = DocCorpus(tmp_path / "docs")
+    assert [doc.relative_path.as_posix() for doc in corpus] == ["docs/a.md", "docs/api/b.md"]
+    assert corpus.get(tmp_path / "docs" / "api" / "b.md").anchors == {"b"}
+    assert corpus.stems == {"a", "b"}
+
+    preloaded = {str((tmp_path / "docs" / "a.md").resolve()): document(tmp_path, "# Preloaded\n", "other.md")}
+    reused = DocCorpus(tmp_path / "docs", preloaded=preloaded)
+    first = reused.get(tmp_path / "docs" / "a.md")
+    assert first.anchors == {"preloaded"}
+    assert first.relative_path.as_posix() == "docs/a.md"
@@ -0,0 +1,122 @@
+"""
+Tests for doc_sections.py: section ids, replace parity with the shell
+functions and the section index cache
+"""
+
+import io
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from ai_workflow_docs.doc_sections import Document, IndexCache, parse_headings, run_batch, section_id
+
+EXTRACTOR_LIB = Path(__file__).resolve().parents[2] / "src" / "workflow" / "lib" / "doc_section_extractor.sh"
+
+DOCUMENT = """# Guide
+
+Intro text.
+
+## Setup
+
+Install it.
+
+### Setup: Linux
+
+apt install it
+
+## Usage & Options
+
+Run it.
+
+## Setup
+
+A second section with the same id.
+
+#not-a-heading
+## Notes
+Last line without a newline"""
+
+
+def bash(script: str, cwd, **env: str) -> subprocess.CompletedProcess:
+    return subprocess.run(["bash", "-c", f"source '{EXTRACTOR_LIB}'; {script}"], cwd=cwd, check=True,
+                          capture_output=True, env={**os.environ, **env})
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Setup", "setup"),
+    ("Usage & Options", "usage-options"),
+    ("  --Setup: Linux--  ", "setup-linux"),
+    ("API_v2 (beta)", "api-v2-beta"),
+])
+def test_section_id(text, expected):
+    assert section_id(text) == expected
+
+
+@pytest.mark.parametrize("section, content", [
+    ("setup", "Replaced setup.\n\nWith two paragraphs."),
+    ("usage-options", "Short."),
+    ("#notes", "New notes."),
+    ("setup-linux", "### Nested heading in content\n\nbody"),
+])
+def test_replace_matches_shell(tmp_path, section, content):
+    (tmp_path / "shell.md").write_text(DOCUMENT)
+    (tmp_path / "content").write_text(content)
+    bash(f"replace_doc_section shell.md '{section}' \"$(cat content)\" || true", tmp_path,
+         USE_PYTHON_DOC_SECTIONS="false")
+
+    (tmp_path / "python.md").write_text(DOCUMENT)
+    out = io.StringIO()
+    run_batch([("replace", str(tmp_path / "python.md"), section, str(tmp_path / "content"))], out=out)
+
+    assert (tmp_path / "python.md").read_bytes() == (tmp_path / "shell.md").read_bytes()
+    assert out.getvalue().startswith("ok\t")
+
+
+def test_replace_of_missing_section_leaves_file_alone(tmp_path):
+    # (the shell function rewrites the file regardless, adding a final newline)
+    doc = tmp_path / "doc.md"
+    doc.write_text(DOCUMENT)
+    (tmp_path / "content").write_text("Never written.")
+    out = io.StringIO()
+    assert run_batch([("replace", str(doc), "missing-section", str(tmp_path / "content"))], out=out) == 0
+    assert out.getvalue().startswith("missing\t")
+    assert doc.read_text() == DOCUMENT
+
+
+def test_batch_sees_its_own_replacements(tmp_path):
+    doc = tmp_path / "doc.md"
+    doc.write_text(DOCUMENT)
+    (tmp_path / "new").write_text("Fresh usage.")
+    out = io.StringIO()
+    run_batch([("replace", str(doc), "usage-options", str(tmp_path / "new")),
+               ("extract", str(doc), "usage-options", str(tmp_path / "extracted")),
+               ("level", str(doc), "setup-linux", "")], out=out)
+
+    assert (tmp_path / "extracted").read_text() == "Fresh usage.\n\n"
+    assert out.getvalue().splitlines()[2] == f"ok\tlevel\t{doc}\tsetup-linux\t3"
+
+
+def test_cached_index_stays_correct_after_replace(tmp_path):
+    doc = tmp_path / "doc.md"
+    doc.write_text(DOCUMENT)
+    (tmp_path / "new").write_text("## Inserted\n\ntext")
+    cache = IndexCache(str(tmp_path / "cache"))
+
+    run_batch([("replace", str(doc), "setup", str(tmp_path / "new"))], cache)
+    reloaded = Document.load(str(doc), cache)
+    assert reloaded.headings == parse_headings(doc.read_bytes())
+    assert reloaded.find("inserted") >= 0
+
+
+def test_shell_cache_goes_under_project_root(tmp_path):
+    project, elsewhere = tmp_path / "project", tmp_path / "elsewhere"
+    project.mkdir()
+    elsewhere.mkdir()
+    (elsewhere / "doc.md").write_text(DOCUMENT)
+    bash("printf 'exists\\tdoc.md\\tsetup\\n' | run_doc_section_batch", elsewhere,
+         PROJECT_ROOT=str(project), USE_PYTHON_DOC_SECTIONS="true")
+
+    assert list((project / ".ai_workflow" / "cache" / "doc_sections").glob("*.json"))
+    assert not (elsewhere / ".ai_workflow").exists()
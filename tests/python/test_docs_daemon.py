@@ -0,0 +1,127 @@
+"""
+Tests for docs_daemon.py: the socket protocol, and that queries see edits
+made just before them
+"""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from ai_workflow_docs import docs_client
+from ai_workflow_docs.docs_daemon import DocDaemon
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets are not available")
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "index.md").write_text("# Index\n\nSee [guide](guide.md).\n")
+    (tmp_path / "docs" / "guide.md").write_text("# Guide\n")
+    return tmp_path
+
+
+@pytest.fixture(params=[False, True], ids=["inotify", "polling"])
+def daemon(project, request, monkeypatch):
+    """A daemon whose watcher thread is not running, so only the request path can catch up"""
+    if not request.param and not sys.platform.startswith("linux"):
+        pytest.skip("inotify is only available on Linux")
+    monkeypatch.chdir(project)
+    return DocDaemon(project, poll_interval=3600, force_polling=request.param)
+
+
+def broken_links(daemon, project, *args):
+    response = daemon.handle({"command": "broken_links", "args": list(args), "cwd": str(project)})
+    assert response["exit_code"] == 0, response["stderr"]
+    return response["result"]
+
+
+def test_edit_is_seen_by_the_next_query(daemon, project):
+    assert broken_links(daemon, project, "--files", "./docs/index.md") == []
+
+    (project / "docs" / "index.md").write_text("# Index\n\nSee [setup](setup.md).\n")
+    assert broken_links(daemon, project, "--files", "./docs/index.md") == [
+        {"file": "./docs/index.md", "link": "setup.md"}]
+
+
+def test_created_and_deleted_documents_are_seen_by_the_next_query(daemon, project):
+    (project / "docs" / "new.md").write_text("# New\n\n[gone](gone.md)\n")
+    (project / "docs" / "guide.md").unlink()
+
+    assert broken_links(daemon, project, "--files", "./docs/index.md", "./docs/new.md") == [
+        {"file": "./docs/index.md", "link": "guide.md"},
+        {"file": "./docs/new.md", "link": "gone.md"}]
+    # Queued events (or the polling rescan) are applied too, not only the listed files
+    assert str(project / "docs" / "guide.md") not in daemon.state.documents
+
+
+def tool(daemon, project, command, *args):
+    response = daemon.handle({"command": command, "args": list(args), "cwd": str(project)})
+    return response["exit_code"], response["stdout"] + response["stderr"]
+
+
+def test_tools_see_files_created_and_edited_just_before(daemon, project):
+    (project / "docs" / "setup.md").write_text("# Setup\n")
+    (project / "docs" / "index.md").write_text("# Index\n\nSee [guide](guide.md) and [setup](setup.md).\n")
+    exit_code, output = tool(daemon, project, "check_doc_links", "docs")
+    assert exit_code == 0, output
+
+    assert "Code block without language" not in tool(daemon, project, "validate_api_docs", "docs")[1]
+    (project / "docs" / "guide.md").write_text("# Guide\n\n```\nmake\n```\n")
+    assert "docs/guide.md: Code block without language" in tool(daemon, project, "validate_api_docs", "docs")[1]
+
+
+def test_links_into_unwatched_directories_are_checked_on_disk(daemon, project):
+    (project / "docs" / "index.md").write_text("# Index\n\nSee [report](../build/report.md).\n")
+    assert tool(daemon, project, "check_doc_links", "docs")[0] == 1
+
+    (project / "build").mkdir()
+    (project / "build" / "report.md").write_text("# Report\n")
+    exit_code, output = tool(daemon, project, "check_doc_links", "docs")
+    assert exit_code == 0, output
+    assert str(project / "build" / "report.md") not in daemon.state.path_index.paths
+
+
+def test_unknown_command(daemon, project):
+    response = daemon.handle({"command": "nope", "args": [], "cwd": str(project)})
+    assert response["exit_code"] == 2
+    assert "unknown command: nope" in response["stderr"]
+
+
+def test_socket_protocol(project):
+    socket_path = project / "daemon.sock"
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT / "src")}
+    server = subprocess.Popen([sys.executable, "-m", "ai_workflow_docs.docs_daemon", "--root", str(project),
+                               "--socket", str(socket_path)], env=env, stdout=subprocess.DEVNULL)
+    try:
+        deadline = time.monotonic() + 30
+        while not socket_path.exists():
+            assert server.poll() is None and time.monotonic() < deadline, "daemon did not start"
+            time.sleep(0.05)
+
+        ping = docs_client.request(str(socket_path), "ping", [])
+        assert ping["exit_code"] == 0
+        assert ping["result"]["documents"] == 2
+
+        response = docs_client.request(str(socket_path), "headings", [str(project / "docs" / "guide.md")])
+        assert response["result"]["headings"] == [{"level": 1, "text": "Guide", "line": 1}]
+        assert response["stdout"] == "1: # Guide\n"
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+            sock.sendall(b"not json\n")
+            assert b'"exit_code": 2' in sock.recv(65536)
+
+        assert docs_client.request(str(socket_path), "shutdown", [])["exit_code"] == 0
+        assert server.wait(timeout=30) == 0
+        assert not socket_path.exists()
+    finally:
+        if server.poll() is None:
+            server.kill()
@@ -0,0 +1,146 @@
+"""
+Tests for the step duration model: fitting, prediction and the incremental
+training arrays
+"""
+
+import json
+import math
+import statistics
+
+import pytest
+
+from ai_workflow_docs import duration_model
+from ai_workflow_docs.duration_model import (ARRAYS_FILE, MIN_FIT_SAMPLES, DurationModel, fit,
+                                             load_training_arrays)
+
+np = pytest.importorskip("numpy")
+
+NOW = 1_700_000_000.0
+DAY = 86400.0
+
+
+def record(step: int, duration: float, timestamp: float = NOW, issues: int = 0, parallel: bool = False,
+           total_duration: float = None, **features) -> dict:
+    """A training_data.jsonl line as record_step_execution writes it"""
+    entry = {"step": step, "duration": duration, "timestamp": timestamp, "issues_found": issues,
+             "parallel": parallel, "features": {"change_type": "mixed", **features}}
+    if total_duration is not None:
+        entry["total_duration"] = total_duration
+    return entry
+
+
+def write_records(path, records, mode="w") -> None:
+    with open(path, mode) as f:
+        for entry in records:
+            f.write(json.dumps(entry) + "\n")
+
+
+def linear_records(count: int) -> list:
+    """Step 1 taking 10 + 5 * log1p(total_files) seconds"""
+    return [record(1, 10 + 5 * math.log1p(files), total_files=files, code_files=files % 7)
+            for files in range(1, count + 1)]
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return tmp_path / "training_data.jsonl", tmp_path / "models"
+
+
+def test_regression_recovers_linear_durations(paths):
+    data, model_dir = paths
+    write_records(data, linear_records(MIN_FIT_SAMPLES + 20))
+    assert fit(str(data), str(model_dir))
+
+    model = DurationModel.load(str(model_dir))
+    for files in (3, 50, 400):
+        expected = 10 + 5 * math.log1p(files)
+        # Predictions are whole seconds
+        assert abs(model.predict([1], {"change_type": "mixed", "total_files": files,
+                                       "code_files": files % 7})[0] - expected) <= 1
+
+
+def test_small_steps_use_recency_weighted_mean(paths):
+    data, model_dir = paths
+    # One day old records weigh 1/2, today's 1
+    write_records(data, [record(2, 10, NOW - DAY), record(2, 40, NOW)])
+    fit(str(data), str(model_dir))
+
+    model = DurationModel.load(str(model_dir))
+    assert model.model["coef"][0][0] == pytest.approx(30)
+    assert model.predict([2, 9], {"total_files": 1000}) == [30, 0]
+
+
+def test_refit_parses_only_appended_records(paths):
+    data, model_dir = paths
+    records = linear_records(10)
+    write_records(data, records[:6])
+    fit(str(data), str(model_dir))
+    # An unfinished line is left for the next fit
+    write_records(data, records[6:], mode="a")
+    with open(data, "a") as f:
+        f.write(json.dumps(record(3, 5))[:20])
+
+    incremental = load_training_arrays(str(data), str(model_dir / ARRAYS_FILE))
+    fresh = load_training_arrays(str(data))
+    assert len(incremental["step"]) == 10
+    for name in duration_model.COLUMNS + ("X",):
+        np.testing.assert_array_equal(incremental[name], fresh[name])
+
+
+def test_if_stale_skips_unchanged_data(paths):
+    data, model_dir = paths
+    write_records(data, [record(1, 10)])
+    assert fit(str(data), str(model_dir), if_stale=True)
+    assert not fit(str(data), str(model_dir), if_stale=True)
+    write_records(data, [record(1, 20)], mode="a")
+    assert fit(str(data), str(model_dir), if_stale=True)
+    assert DurationModel.load(str(model_dir)).model["records"] == 2
+
+
+def test_statistics_match_calculate_model_statistics(paths):
+    data, model_dir = paths
+    durations = [4.0, 9.0, 11.0, 30.0]
+    write_records(data, [record(5, d, change_type="docs_only") for d in durations]
+                  + [record(5, 7.0, change_type=None)])
+    fit(str(data), str(model_dir))
+
+    stats = json.loads((model_dir / duration_model.STATISTICS_FILE).read_text())
+    # Records without a change type sort first, as with jq's group_by
+    assert [group["change_type"] for group in stats] == [None, "docs_only"]
+    step = stats[1]["steps"][0]
+    assert step["sample_count"] == 4
+    assert (step["min_duration"], step["max_duration"]) == (4.0, 30.0)
+    assert step["avg_duration"] == pytest.approx(statistics.mean(durations))
+    assert step["std_dev"] == pytest.approx(statistics.pstdev(durations))
+
+
+def test_parallel_benefit_and_skip_steps(paths):
+    data, model_dir = paths
+    runs = [record(1, 5, parallel=True, total_duration=60, change_type="docs_only"),
+            record(1, 5, parallel=False, total_duration=100, change_type="docs_only")]
+    runs += [record(7, 5, change_type="docs_only") for _ in range(6)]
+    runs += [record(8, 5, change_type="docs_only", issues=int(i == 0)) for i in range(6)]
+    write_records(data, runs)
+    fit(str(data), str(model_dir))
+
+    model = DurationModel.load(str(model_dir))
+    assert model.parallel_benefit("docs_only") == pytest.approx(40)
+    assert model.parallel_benefit("code_only") == 0
+    assert model.skip_steps("docs_only") == [7]
+
+
+def test_cli_predict_total(paths, capsys):
+    data, model_dir = paths
+    write_records(data, [record(1, 12), record(2, 30)])
+    args = ["--data", str(data), "--model-dir", str(model_dir)]
+    assert duration_model.main(args + ["fit"]) == 0
+    assert duration_model.main(args + ["predict", "{}", "1", "2", "3", "--total"]) == 0
+    assert capsys.readouterr().out.strip() == "42"
+
+
+def test_outdated_model_is_rejected(paths):
+    _, model_dir = paths
+    model_dir.mkdir()
+    (model_dir / duration_model.MODEL_FILE).write_text(json.dumps({"version": "0"}))
+    with pytest.raises(ValueError):
+        DurationModel.load(str(model_dir))
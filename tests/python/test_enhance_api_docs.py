@@ -0,0 +1,98 @@
+"""
+Tests for enhance_api_docs.py: introduction statistics computed from the
+extractor's records and the atomic, idempotent streaming rewrite
+"""
+
+import pytest
+
+from ai_workflow_docs import enhance_api_docs, extract_api_docs
+from ai_workflow_docs.enhance_api_docs import build_introduction, insert_introduction
+
+REFERENCE = "# API Reference\n\n**Total Modules**: 3  \n\n## Table of Contents\n\n- [a](#a)\n\n## Module: a\n"
+
+
+def module(name, category, functions):
+    return {"kind": "module", "module": name, "category": category, "functions": functions}
+
+
+RECORDS = [
+    module("ai_cache.sh", "AI & Caching", 12),
+    {"kind": "function", "module": "ai_cache.sh", "function": "init_ai_cache"},
+    module("ai_personas.sh", "AI & Caching", 1),
+    module("custom.sh", "Zeta Tools", 4),
+]
+
+
+def test_introduction_statistics_come_from_the_records():
+    intro = build_introduction(RECORDS)
+    assert "**3 library modules** with **17 functions** organized into **2 categories**" in intro
+    # Known categories first, in CATEGORY_DESCRIPTIONS order, then unknown ones alphabetically
+    assert "1. **AI & Caching** (2 modules) - AI prompt management" in intro
+    assert "2. **Zeta Tools** (1 module)\n" in intro
+    assert "- **ai_cache.sh** (12 functions) - AI response caching" in intro
+    assert "- **ai_personas.sh** (1 function) - Specialized AI personas" in intro
+    # Key modules of categories without records are left out
+    assert "#### Core Infrastructure" not in intro
+
+
+def intro_count(path):
+    return path.read_text().count("\n## Introduction\n")
+
+
+def temp_files(path):
+    return [p for p in path.parent.iterdir() if p.name.endswith(".tmp")]
+
+
+def test_insert_update_and_unchanged(tmp_path):
+    api_file = tmp_path / "API.md"
+    api_file.write_text(REFERENCE)
+    api_file.chmod(0o640)
+
+    assert insert_introduction(api_file, build_introduction(RECORDS)) == "inserted"
+    inserted = api_file.read_text()
+    assert inserted.index("## Introduction") < inserted.index("## Table of Contents")
+    assert inserted.endswith("## Table of Contents\n\n- [a](#a)\n\n## Module: a\n")
+    assert api_file.stat().st_mode & 0o777 == 0o640
+
+    stat = api_file.stat()
+    assert insert_introduction(api_file, build_introduction(RECORDS)) == "unchanged"
+    assert api_file.stat().st_ino == stat.st_ino and api_file.read_text() == inserted
+
+    assert insert_introduction(api_file, build_introduction(RECORDS[:2])) == "updated"
+    assert intro_count(api_file) == 1
+    assert "**1 library modules** with **12 functions**" in api_file.read_text()
+    assert temp_files(api_file) == []
+
+
+def test_missing_table_of_contents_leaves_the_file_intact(tmp_path):
+    api_file = tmp_path / "API.md"
+    api_file.write_text("# API Reference\n\nNo contents here\n")
+    with pytest.raises(ValueError):
+        insert_introduction(api_file, build_introduction(RECORDS))
+    assert api_file.read_text() == "# API Reference\n\nNo contents here\n"
+    assert temp_files(api_file) == []
+
+
+def test_enhancing_matches_extracting_with_introduction(tmp_path, capsys):
+    lib = tmp_path / "src" / "workflow" / "lib"
+    lib.mkdir(parents=True)
+    (lib / "ai_cache.sh").write_text("# AI cache\n\n# Initialize\ninit_ai_cache() {\n    :\n}\n")
+    (lib / "metrics.sh").write_text("# Metrics\ninit_metrics() {\n    :\n}\nfinalize_metrics() {\n    :\n}\n")
+    common = ["--project-root", str(tmp_path), "--doc-version", "1.0.0", "--date", "2026-10-18"]
+
+    extract_api_docs.main(common + ["-o", "docs/combined.md", "--introduction"])
+    extract_api_docs.main(common + ["-o", "docs/api.md"])
+    api_file = tmp_path / "docs" / "api.md"
+    assert enhance_api_docs.main([str(api_file)]) == 0
+    assert api_file.read_text() == (tmp_path / "docs" / "combined.md").read_text()
+
+    assert enhance_api_docs.main([str(api_file)]) == 0
+    assert "already has the current introduction" in capsys.readouterr().out
+
+
+def test_missing_index_is_reported(tmp_path, capsys):
+    api_file = tmp_path / "API.md"
+    api_file.write_text(REFERENCE)
+    assert enhance_api_docs.main([str(api_file)]) == 1
+    assert "run `ai-workflow-docs extract` first" in capsys.readouterr().out
+    assert api_file.read_text() == REFERENCE
@@ -0,0 +1,126 @@
+"""
+Tests for external_links.py against a local stand-in HTTP server
+"""
+
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ai_workflow_docs.external_links import UNCHECKED_STATUS, ExternalLinkChecker, URLCache
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """/ok 200, /missing 404, /moved 301 to /ok, /no-head 405 on HEAD only"""
+
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self, code: int, location: str = None) -> None:
+        body = b"" if self.command == "HEAD" else b"stand-in\n"
+        self.send_response(code)
+        if location:
+            self.send_header("Location", location)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.server.requests.append(("HEAD", self.path))
+        if self.path == "/no-head":
+            self._respond(405)
+        else:
+            self.do_route()
+
+    def do_GET(self):
+        self.server.requests.append(("GET", self.path))
+        self.do_route()
+
+    def do_route(self):
+        if self.path in ("/ok", "/no-head"):
+            self._respond(200)
+        elif self.path == "/moved":
+            self._respond(301, "/ok")
+        else:
+            self._respond(404)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def base_url(httpd) -> str:
+    host, port = httpd.server_address[:2]
+    return f"http://{host}:{port}"
+
+
+def unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def checker(cache=None) -> ExternalLinkChecker:
+    return ExternalLinkChecker(cache, host_rate=0, timeout=5, retries=0, retry_delay=0)
+
+
+def test_statuses(server):
+    url = base_url(server)
+    statuses = checker().check([f"{url}/ok", f"{url}/missing", f"{url}/moved", f"{url}/no-head"])
+
+    assert statuses[f"{url}/ok"].status == "valid"
+    assert statuses[f"{url}/missing"].status == "broken:404"
+    assert not statuses[f"{url}/missing"].valid
+    assert statuses[f"{url}/moved"].status == "valid"
+    assert statuses[f"{url}/no-head"].status == "valid"
+
+
+def test_redirect_is_followed(server):
+    url = base_url(server)
+    checker().check([f"{url}/moved"])
+    assert server.requests == [("HEAD", "/moved"), ("HEAD", "/ok")]
+
+
+def test_head_405_falls_back_to_get(server):
+    url = base_url(server)
+    checker().check([f"{url}/no-head"])
+    assert server.requests == [("HEAD", "/no-head"), ("GET", "/no-head")]
+
+
+def test_connection_refused_is_broken_000():
+    url = f"http://127.0.0.1:{unused_port()}/ok"
+    status = checker().check([url])[url]
+    assert not status.valid
+    assert status.status == "broken:000"
+
+
+def test_results_are_cached(server, tmp_path):
+    url = f"{base_url(server)}/missing"
+    cache = URLCache(tmp_path)
+    checker(cache).check([url])
+
+    again = checker(cache)
+    status = again.check([url])[url]
+    assert status.cached and status.status == "broken:404"
+    assert again.requests == 0
+
+
+def test_unchecked_cache_entry_is_a_miss(server, tmp_path):
+    # lib/link_validator.sh writes valid:no-curl when it could not check a URL
+    url = f"{base_url(server)}/missing"
+    cache = URLCache(tmp_path)
+    cache.put(url, UNCHECKED_STATUS)
+
+    status = checker(cache).check([url])[url]
+    assert not status.cached
+    assert status.status == "broken:404"
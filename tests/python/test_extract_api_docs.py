@@ -0,0 +1,179 @@
+"""
+Tests for extract_api_docs.py: incremental fragment reuse, -j parity, the
+multi-root/multi-language extractors and the NDJSON/SQLite index
+"""
+
+import datetime
+import json
+import os
+import sqlite3
+import types
+
+import pytest
+
+from ai_workflow_docs import extract_api_docs
+from ai_workflow_docs.extract_api_docs import EXTRACTORS, Extractor, main, register_extractor
+
+CATEGORIES = {"Shell": ["*.sh"], "Python": ["*.py"], "Web": ["*.js", "*.ts"], "Go": ["*.go"]}
+
+
+@pytest.fixture
+def project(tmp_path):
+    lib = tmp_path / "lib"
+    lib.mkdir()
+    (lib / "cache.sh").write_text(
+        "#!/bin/bash\n# Response cache helpers\n\n"
+        "# Look up a cached response\n# Parameters:\n# $1 - cache key\n# Returns: 0 on a hit\n"
+        "cache_get() {\n    :\n}\n\n"
+        "function cache_put() {\n    :\n}\n")
+    (lib / "util.sh").write_text("#!/bin/bash\n# Shared utilities\n\n# Print a message\nlog_info() {\n    :\n}\n")
+    (lib / "test_util.sh").write_text("# Excluded by default\ntest_log() {\n    :\n}\n")
+    (lib / "notes.txt").write_text("not a module\n")
+    pkg = tmp_path / "src" / "pkg"
+    pkg.mkdir(parents=True)
+    (pkg / "hashing.py").write_text(
+        '"""File hashing helpers"""\n\n\n'
+        'def file_hash(path):\n    """SHA256 of a file"""\n\n\n'
+        'async def fetch(url,\n          timeout=10):\n    """Fetch a URL"""\n\n\n'
+        'def _private():\n    pass\n')
+    web = tmp_path / "web"
+    web.mkdir()
+    (web / "app.js").write_text(
+        "// Front-end entry point\n\n"
+        "/**\n * Render the page\n * @param root element\n */\n"
+        "export function render(root) {}\n\n"
+        "// Format a date\nconst formatDate = (value) => value;\n\n"
+        "class Store {}\n")
+    (web / "main.go").write_text(
+        "// Command line tool\npackage main\n\n// Run the tool\nfunc Run() {}\n\nfunc helper() {}\n")
+    (tmp_path / "categories.json").write_text(json.dumps(CATEGORIES))
+    return tmp_path
+
+
+def extract(project, output="docs/api.md", *options):
+    main(["--project-root", str(project), "--root", "lib", "--root", "src", "--root", "web",
+          "--glob", "*.sh", "--glob", "**/*.py", "--glob", "*.js", "--glob", "*.go",
+          "--categories", str(project / "categories.json"),
+          "--doc-version", "1.2.3", "--date", "2026-10-18", "-o", output, *options])
+    markdown = (project / output).read_text()
+    index = project / output.replace(".md", ".ndjson")
+    return markdown, [json.loads(line) for line in index.read_text().splitlines()]
+
+
+def functions(records):
+    return {(r["module"], r["function"]) for r in records if r["kind"] == "function"}
+
+
+def test_multi_root_multi_language_extraction(project, capsys):
+    markdown, records = extract(project)
+
+    modules = {r["module"]: (r["language"], r["category"], r["location"])
+               for r in records if r["kind"] == "module"}
+    assert modules == {
+        "cache.sh": ("bash", "Shell", "lib/cache.sh"),
+        "util.sh": ("bash", "Shell", "lib/util.sh"),
+        "hashing.py": ("python", "Python", "src/pkg/hashing.py"),
+        "app.js": ("javascript", "Web", "web/app.js"),
+        "main.go": ("go", "Go", "web/main.go"),
+    }
+    assert functions(records) == {
+        ("cache.sh", "cache_get"), ("cache.sh", "cache_put"), ("util.sh", "log_info"),
+        ("hashing.py", "file_hash"), ("hashing.py", "fetch"),
+        ("app.js", "render"), ("app.js", "formatDate"), ("app.js", "Store"),
+        ("main.go", "Run"),
+    }
+    by_name = {r["function"]: r for r in records if r["kind"] == "function"}
+    assert by_name["cache_get"]["params"] == ["Parameters:", "$1 - cache key"]
+    assert by_name["cache_get"]["returns"] == "Returns: 0 on a hit"
+    assert by_name["fetch"]["description"] == "Fetch a URL"
+    assert by_name["render"]["params"] == ["param root element"]
+    assert not by_name["cache_put"]["documented"]
+
+    assert "**Total Modules**: 5  \n**Total Functions**: 9  \n" in markdown
+    assert "**Purpose**: File hashing helpers" in markdown
+    assert "**Location**: `src/pkg/hashing.py`" in markdown
+    assert "test_log" not in markdown
+
+
+def test_incremental_run_matches_full_run_after_edit_and_delete(project, capsys):
+    cache_dir = project / "cache"
+    extract(project, "docs/api.md", "--incremental", "--cache-dir", str(cache_dir))
+    assert "5 re-parsed" in capsys.readouterr().out
+
+    with open(project / "lib" / "cache.sh", "a") as f:
+        f.write("\n# Drop a cached response\ncache_delete() {\n    :\n}\n")
+    (project / "web" / "main.go").unlink()
+
+    incremental = extract(project, "docs/api.md", "--incremental", "--cache-dir", str(cache_dir))
+    assert "3 modules reused, 1 re-parsed" in capsys.readouterr().out
+    full = extract(project, "docs/full.md")
+    assert incremental == full
+    assert ("cache.sh", "cache_delete") in functions(full[1])
+
+    # The deleted module's entry and fragment are pruned
+    cached = json.loads((cache_dir / "index.json").read_text())["modules"]
+    assert sorted(path.rsplit("/", 1)[1] for path in cached) == ["app.js", "cache.sh", "hashing.py", "util.sh"]
+    assert sorted(f.name.split("-")[0] for f in (cache_dir / "fragments").iterdir()) == \
+        ["app", "cache", "hashing", "util"]
+    assert not list(project.glob("**/*.tmp"))
+
+
+def test_parallel_run_matches_serial_run(project, capsys):
+    serial = extract(project, "docs/serial.md", "-j", "1")
+    serial_out = capsys.readouterr().out
+    parallel = extract(project, "docs/parallel.md", "-j", "2")
+    parallel_out = capsys.readouterr().out
+    assert serial == parallel
+    assert serial_out.replace("serial", "parallel") == parallel_out
+
+
+def test_sqlite_rows_match_ndjson_records(project, capsys):
+    _, records = extract(project, "docs/api.md", "--sqlite", "docs/api.db")
+    conn = sqlite3.connect(project / "docs" / "api.db")
+    try:
+        modules = {row[0]: row for row in conn.execute(
+            "SELECT module, location, category, language, purpose, functions FROM modules")}
+        rows = conn.execute("SELECT function, module, line, documented, description, params, returns,"
+                            " exit_codes, examples, notes FROM functions ORDER BY rowid").fetchall()
+    finally:
+        conn.close()
+
+    assert modules == {r["module"]: (r["module"], r["location"], r["category"], r["language"],
+                                     r["purpose"], r["functions"])
+                       for r in records if r["kind"] == "module"}
+    assert rows == [(r["function"], r["module"], r["line"], int(r["documented"]), r["description"],
+                     json.dumps(r["params"]), r["returns"], json.dumps(r["exit_codes"]),
+                     json.dumps(r["examples"]), json.dumps(r["notes"]))
+                    for r in records if r["kind"] == "function"]
+
+
+def test_unchanged_sources_give_the_same_output_on_another_day(project, monkeypatch, capsys):
+    newest = datetime.datetime(2026, 3, 14, 12).timestamp()
+    for module in ("lib/cache.sh", "lib/util.sh"):
+        os.utime(project / module, (newest, newest))
+    (project / "lib" / "older.sh").write_text("# Older module\nold_helper() {\n    :\n}\n")
+    os.utime(project / "lib" / "older.sh", (newest - 86400 * 30,) * 2)
+
+    outputs = []
+    for day in (1, 2):
+        class Today(datetime.date):
+            @classmethod
+            def today(cls):
+                return cls(2026, 10, day)
+        monkeypatch.setattr(extract_api_docs, "datetime", types.SimpleNamespace(date=Today))
+        main(["--project-root", str(project), "--root", "lib", "--doc-version", "1.2.3",
+              "-o", "docs/api.md", "--incremental"])
+        outputs.append((project / "docs" / "api.md").read_text())
+
+    assert outputs[0] == outputs[1]
+    assert "> **Last Updated**: 2026-03-14  \n" in outputs[0]
+
+
+def test_extractor_without_functions_fails_at_registration(monkeypatch):
+    monkeypatch.setattr(extract_api_docs, "EXTRACTORS", dict(EXTRACTORS))
+    with pytest.raises(TypeError):
+        @register_extractor
+        class HalfWritten(Extractor):
+            language = "lua"
+            suffixes = (".lua",)
+    assert ".lua" not in extract_api_docs.EXTRACTORS
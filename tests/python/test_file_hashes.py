@@ -0,0 +1,57 @@
+"""
+Tests for file_hashes.py against the shell hash functions it replaces
+"""
+
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from ai_workflow_docs.file_hashes import FILE_NOT_FOUND, FileHasher, combined_hash, tree_hash
+
+CACHE_LIB = Path(__file__).resolve().parents[2] / "src" / "workflow" / "lib" / "step_validation_cache.sh"
+
+
+def shell(function: str, *args: str, cwd) -> str:
+    """Output of a step_validation_cache.sh function using its bash implementation"""
+    quoted = " ".join(f"'{a}'" for a in args)
+    result = subprocess.run(["bash", "-c", f"source '{CACHE_LIB}' >/dev/null 2>&1; {function} {quoted}"],
+                            cwd=cwd, env={**os.environ, "USE_PYTHON_HASHER": "false"},
+                            capture_output=True, text=True)
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "docs" / "sub").mkdir(parents=True)
+    (tmp_path / "docs" / "a.md").write_bytes(b"alpha\n\n")
+    (tmp_path / "docs" / "sub" / "b.md").write_bytes(b"nul\0byte\n")
+    (tmp_path / "docs" / "Upper.md").write_bytes(b"no trailing newline")
+    (tmp_path / "docs" / "with space.md").write_bytes(b"spaced\n")
+    os.symlink("a.md", tmp_path / "docs" / "link.md")
+    return tmp_path
+
+
+def test_hash_files_matches_sha256sum(tree):
+    digests = FileHasher().hash_files(["docs/a.md", "docs/missing.md"])
+    assert digests[0] == shell("calculate_file_hash", "docs/a.md", cwd=tree)
+    assert digests[1] == FILE_NOT_FOUND
+
+
+def test_combined_hash_matches_shell(tree):
+    files = ["docs/a.md", "docs/sub/b.md", "docs/missing.md", "docs/Upper.md", "docs/with space.md"]
+    assert combined_hash(files) == shell("calculate_files_hash", *files, cwd=tree)
+    assert combined_hash([]) == shell("calculate_files_hash", cwd=tree)
+
+
+@pytest.mark.parametrize("top", ["docs", "docs/", "./docs"])
+def test_tree_hash_matches_shell(tree, top):
+    assert tree_hash(top) == shell("calculate_directory_hash", top, cwd=tree)
+
+
+def test_tree_hash_sees_size_changes(tree):
+    before = tree_hash("docs")
+    (tree / "docs" / "a.md").write_bytes(b"alpha, longer\n")
+    assert tree_hash("docs") != before
@@ -0,0 +1,131 @@
+"""
+Tests for the workflow metrics store: rollups, percentiles and retention
+"""
+
+import json
+import math
+import sqlite3
+import statistics
+
+import pytest
+
+from ai_workflow_docs import metrics_store
+from ai_workflow_docs.metrics_store import HISTOGRAM_GROWTH, MetricsStore, read_records
+
+
+def run(number: int, duration: float, success: bool = True, end_epoch: int = None, steps: dict = None) -> dict:
+    """A current_run.json record"""
+    return {
+        "workflow_run_id": f"workflow_{number:04d}",
+        "end_epoch": end_epoch if end_epoch is not None else 1_700_000_000 + number,
+        "duration_seconds": duration,
+        "status": "success" if success else "failed",
+        "success": success,
+        "steps": steps or {},
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = MetricsStore(str(tmp_path / "metrics.db"))
+    yield store
+    store.close()
+
+
+def test_rollup_matches_statistics(store):
+    durations = [12.0, 30.5, 7.25, 60.0, 45.0, 18.0]
+    for number, duration in enumerate(durations):
+        store.record(run(number, duration, success=number != 2))
+
+    rollup = store.rollup()
+    assert rollup["runs"] == 6
+    assert rollup["successes"] == 5
+    assert rollup["success_rate"] == 83
+    assert rollup["mean"] == pytest.approx(statistics.mean(durations))
+    assert rollup["stddev"] == pytest.approx(statistics.stdev(durations))
+    assert (rollup["min"], rollup["max"]) == (min(durations), max(durations))
+
+
+def test_duplicate_run_is_ignored(store):
+    assert store.record(run(1, 10))
+    assert not store.record(run(1, 10))
+    assert store.rollup()["runs"] == 1
+
+
+@pytest.mark.parametrize("percent", [50, 90, 95, 99])
+def test_percentiles_within_histogram_resolution(store, percent):
+    durations = [float(d) for d in range(1, 201)]
+    store.import_records([run(n, d) for n, d in enumerate(durations)])
+
+    exact = durations[max(1, math.ceil(percent / 100 * len(durations))) - 1]
+    assert store.percentile("workflow", percent) == pytest.approx(exact, rel=HISTOGRAM_GROWTH - 1)
+
+
+def test_step_scopes_count_timed_statuses_only(store):
+    store.record(run(1, 100, steps={
+        "step_1": {"name": "docs", "status": "success", "duration_seconds": 40},
+        "step_2": {"name": "tests", "status": "skipped", "duration_seconds": 0},
+    }))
+    assert store.rollup("step_1")["mean"] == 40
+    assert store.rollup("step_2") is None
+    assert store.percentile("step_2", 50) is None
+
+
+def test_compact_keeps_rollups_and_newest_run(store):
+    for number in range(5):
+        store.record(run(number, 10 * (number + 1), end_epoch=1))   # all long expired
+    assert store.compact(keep_runs=3, max_age_days=1) == 4
+
+    assert [row[0] for row in store.recent(10)] == ["workflow_0004"]
+    assert store.rollup()["runs"] == 5
+    assert store.rollup()["mean"] == 30
+
+
+def history_lines(path) -> int:
+    return len(path.read_text().splitlines())
+
+
+def test_record_leaves_history_whole_by_default(tmp_path):
+    db, history, current = tmp_path / "metrics.db", tmp_path / "history.jsonl", tmp_path / "current_run.json"
+    for number in range(4):
+        current.write_text(json.dumps(run(number, 5)))
+        assert metrics_store.main(["--db", str(db), "record", str(current), "--history", str(history),
+                                   "--keep-runs", "2", "--max-age-days", "36500"]) == 0
+    assert history_lines(history) == 4
+    assert len(read_records(history.read_text())) == 4
+
+    assert metrics_store.main(["--db", str(db), "compact", "--keep-runs", "2", "--max-age-days", "36500",
+                               "--history", str(history), "--trim-history"]) == 0
+    assert [r["workflow_run_id"] for r in read_records(history.read_text())] == ["workflow_0002", "workflow_0003"]
+
+
+def test_record_succeeds_when_retention_fails(tmp_path, monkeypatch, capsys):
+    db, history, current = tmp_path / "metrics.db", tmp_path / "history.jsonl", tmp_path / "current_run.json"
+    current.write_text(json.dumps(run(1, 5)))
+
+    def fail(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+    monkeypatch.setattr(MetricsStore, "compact", fail)
+
+    # metrics.sh appends the run itself only when record fails
+    assert metrics_store.main(["--db", str(db), "record", str(current), "--history", str(history)]) == 0
+    assert "Warning: retention skipped: database is locked" in capsys.readouterr().err
+    assert history_lines(history) == 1
+
+
+def test_steady_state_retention_does_not_vacuum(store):
+    statements = []
+    store.conn.set_trace_callback(statements.append)
+    for number in range(60):
+        store.record(run(number, 5, steps={"step_1": {"status": "success", "duration_seconds": 1,
+                                                      "output": "x" * 2000}}))
+        assert store.compact(keep_runs=20, max_age_days=36500) == (1 if number >= 20 else 0)
+    assert "VACUUM" not in statements
+
+    assert store.compact(keep_runs=1, max_age_days=36500) == 19
+    assert statements[-1] == "VACUUM"
+
+
+def test_read_records_accepts_pretty_printed_and_truncated_records():
+    text = json.dumps(run(1, 5), indent=2) + "\n" + '{"workflow_run_id": "cut' + "\n" + json.dumps(run(2, 6)) + "\n"
+    assert [r["workflow_run_id"] for r in read_records(text)] == ["workflow_0001", "workflow_0002"]
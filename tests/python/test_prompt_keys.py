@@ -0,0 +1,141 @@
+"""
+Tests for prompt_keys.py: canonical cache keys and near-duplicate lookup
+"""
+
+import io
+import re
+
+import pytest
+
+from ai_workflow_docs import prompt_keys
+from ai_workflow_docs.ai_cache_store import ResponseCache
+from ai_workflow_docs.prompt_keys import KeyCanonicalizer, NearDuplicateIndex, shingle_text, signature
+
+pytest.importorskip("yaml")
+
+TEMPLATES = """
+doc_analysis_prompt:
+  user_prompt: |
+    Review the documentation for the following changed files: {changed_files}
+
+    The repository has {modified_count} modified files.
+
+    Focus area for this review: {focus}
+"""
+
+
+@pytest.fixture
+def canonicalizer(tmp_path):
+    templates = tmp_path / "ai_helpers.yaml"
+    templates.write_text(TEMPLATES)
+    return KeyCanonicalizer.load(str(templates), cache_dir=None)
+
+
+def prompt(files="src/a.py src/b.py", count=2, focus="API reference"):
+    return (f"Review the documentation for the following changed files: {files}\n\n"
+            f"The repository has {count} modified files.\n\n"
+            f"Focus area for this review: {focus}")
+
+
+def key(canonicalizer, text, context=""):
+    return canonicalizer.key(canonicalizer.document(text, context))
+
+
+def test_key_is_sha256_hex(canonicalizer):
+    assert re.fullmatch(r"[0-9a-f]{64}", key(canonicalizer, prompt()))
+
+
+def test_whitespace_differences_share_a_key(canonicalizer):
+    spaced = prompt().replace(" the ", "   the\t").replace("\n\n", "\n  \n\n")
+    assert key(canonicalizer, spaced + "\n") == key(canonicalizer, prompt())
+    # A paragraph break is not a space
+    assert key(canonicalizer, "one two") != key(canonicalizer, "one\n\ntwo")
+
+
+def test_template_parameters_are_separated(canonicalizer):
+    canonical = canonicalizer.document(prompt())["prompt"]
+    assert canonical["text"] == "{{doc_analysis_prompt.user_prompt}}"
+    assert canonical["templates"] == [["doc_analysis_prompt.user_prompt",
+                                       {"changed_files": ["src/a.py", "src/b.py"], "focus": "API reference"}]]
+
+
+def test_unordered_lists_and_ignored_parameters(canonicalizer):
+    base = key(canonicalizer, prompt())
+    assert key(canonicalizer, prompt(files="src/b.py, src/a.py,src/b.py")) == base
+    assert key(canonicalizer, prompt(count=17)) == base
+    assert key(canonicalizer, prompt(files="src/a.py src/c.py")) != base
+    assert key(canonicalizer, prompt(focus="tutorials")) != base
+
+
+def test_volatile_text_is_scrubbed(canonicalizer):
+    first = "Generated 2026-01-05T10:00:00Z for workflow_20260105_100000"
+    second = "Generated 2026-03-09 17:45:12+02:00 for workflow_20260309_174512"
+    assert key(canonicalizer, first) == key(canonicalizer, second)
+    assert key(canonicalizer, prompt(focus=first)) == key(canonicalizer, prompt(focus=second))
+
+
+def test_context_is_part_of_the_key(canonicalizer):
+    assert key(canonicalizer, prompt(), "project: a") != key(canonicalizer, prompt(), "project: b")
+
+
+def test_compiled_templates_are_cached(tmp_path):
+    templates = tmp_path / "ai_helpers.yaml"
+    templates.write_text(TEMPLATES)
+    cache_dir = tmp_path / "cache"
+    first = KeyCanonicalizer.load(str(templates), cache_dir=str(cache_dir))
+    assert len(list(cache_dir.glob("*.json"))) == 1
+    cached = KeyCanonicalizer.load(str(templates), cache_dir=str(cache_dir))
+    assert key(cached, prompt()) == key(first, prompt())
+
+
+def test_missing_templates_file_still_canonicalizes(tmp_path):
+    canonicalizer = KeyCanonicalizer.load(str(tmp_path / "missing.yaml"), cache_dir=None)
+    assert canonicalizer.templates == []
+    assert key(canonicalizer, "a  b") == key(canonicalizer, "a b")
+
+
+def test_similarity_of_signatures():
+    text = " ".join(f"word{i}" for i in range(200))
+    near = text.replace("word100", "changed")
+    unrelated = " ".join(f"other{i}" for i in range(200))
+    sig = signature(text)
+    assert prompt_keys.similarity(sig, sig) == 1.0
+    assert prompt_keys.similarity(sig, signature(near)) >= 0.8
+    assert prompt_keys.similarity(sig, signature(unrelated)) < 0.2
+
+
+def test_near_duplicate_of_cached_prompt_is_reported(canonicalizer, tmp_path):
+    db = tmp_path / "responses.db"
+    store = ResponseCache(str(db))
+    assert NearDuplicateIndex.open(str(tmp_path / "missing.db")) is None
+    index = NearDuplicateIndex.open(str(db))
+
+    focus = " ".join(f"topic{i}" for i in range(100))
+    cached = canonicalizer.document(prompt(focus=focus))
+    cached_key = canonicalizer.key(cached)
+    index.record(cached_key, signature(shingle_text(cached)))
+    store.put(cached_key, b"response")
+
+    near = canonicalizer.document(prompt(focus=focus + " extra"))
+    near_key = canonicalizer.key(near)
+    found = index.lookup(near_key, signature(shingle_text(near)))
+    assert found is not None and found[0] == cached_key and found[1] >= 0.8
+    # A cached key is a hit, not a near duplicate
+    assert index.lookup(cached_key, signature(shingle_text(cached))) is None
+
+    # Signatures go with their responses
+    store.delete(cached_key)
+    assert index.lookup(near_key, signature(shingle_text(near))) is None
+    index.close()
+    store.close()
+
+
+def test_cli_reads_prompt_and_context_from_stdin(tmp_path, monkeypatch, capsys):
+    templates = tmp_path / "ai_helpers.yaml"
+    templates.write_text(TEMPLATES)
+    canonicalizer = KeyCanonicalizer.load(str(templates), cache_dir=None)
+
+    stdin = io.TextIOWrapper(io.BytesIO(f"{prompt()}\0context".encode()))
+    monkeypatch.setattr("sys.stdin", stdin)
+    assert prompt_keys.main(["--templates", str(templates), "--no-cache"]) == 0
+    assert capsys.readouterr().out.strip() == key(canonicalizer, prompt(), "context")
@@ -0,0 +1,90 @@
+"""
+Tests for the reporter's structured output formats and the NDJSON result stream
+"""
+
+import argparse
+import json
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+from ai_workflow_docs.reporter import Reporter, Sink, add_report_arguments, reporting
+
+
+def run(tmp_path: Path, *options: str) -> Reporter:
+    """Report one error, warning and success through the given command line options"""
+    parser = argparse.ArgumentParser()
+    add_report_arguments(parser)
+    args = parser.parse_args(list(options))
+    reporter = Reporter()
+    reporter.location_base = Path("docs")
+    with reporting(reporter, args, "check-links"):
+        reporter.info("Checking links in: docs")
+        reporter.error("guide/setup.md: Broken link to missing.md")
+        reporter.warning("index.md: Broken anchor link: #usage")
+        reporter.success("All <links> & anchors resolved")
+    return reporter
+
+
+def test_json(tmp_path):
+    output = tmp_path / "results.json"
+    run(tmp_path, "--format", "json", "--output", str(output))
+    document = json.loads(output.read_text())
+    assert document["tool"] == "ai-workflow-docs check-links"
+    assert document["summary"] == {"errors": 1, "warnings": 1, "successes": 1}
+    assert document["results"] == [
+        {"level": "error", "file": "docs/guide/setup.md", "message": "Broken link to missing.md"},
+        {"level": "warning", "file": "docs/index.md", "message": "Broken anchor link: #usage"},
+        {"level": "success", "file": None, "message": "All <links> & anchors resolved"},
+    ]
+
+
+def test_sarif(tmp_path):
+    output = tmp_path / "results.sarif"
+    run(tmp_path, "--format", "sarif", "--output", str(output))
+    log = json.loads(output.read_text())
+    assert log["version"] == "2.1.0"
+    (sarif_run,) = log["runs"]
+    assert sarif_run["tool"]["driver"]["name"] == "ai-workflow-docs check-links"
+    # Successes are not SARIF results
+    assert [(r["level"], r["locations"][0]["physicalLocation"]["artifactLocation"]["uri"])
+            for r in sarif_run["results"]] == [("error", "docs/guide/setup.md"), ("warning", "docs/index.md")]
+    assert all(r["ruleId"] == "check-links" for r in sarif_run["results"])
+
+
+def test_junit(tmp_path):
+    output = tmp_path / "results.xml"
+    run(tmp_path, "--format", "junit", "--output", str(output))
+    suite = ET.parse(output).getroot().find("testsuite")
+    assert (suite.get("tests"), suite.get("failures")) == ("3", "1")
+    cases = suite.findall("testcase")
+    assert [case.get("classname") for case in cases] == ["docs/guide/setup.md", "docs/index.md", "check-links"]
+    assert cases[0].find("failure").get("message") == "Broken link to missing.md"
+    assert cases[1].find("system-out").text == "WARNING: Broken anchor link: #usage"
+    assert cases[2].get("name") == "All <links> & anchors resolved"
+
+
+def test_structured_stdout_stays_a_clean_document(tmp_path, capsys):
+    run(tmp_path, "--format", "json")
+    captured = capsys.readouterr()
+    assert json.loads(captured.out)["summary"]["errors"] == 1
+    assert "Checking links in: docs" in captured.err
+
+
+def test_stream_results_keeps_only_counts(tmp_path, capsys):
+    stream = tmp_path / "results.ndjson"
+    reporter = run(tmp_path, "--quiet", "--stream-results", str(stream))
+    records = [json.loads(line) for line in stream.read_text().splitlines()]
+    assert [record["kind"] for record in records] == ["result", "result", "summary"]
+    assert records[0] == {"kind": "result", "level": "error", "file": "docs/guide/setup.md",
+                          "message": "Broken link to missing.md"}
+    # --quiet drops the success from the stream but still counts it
+    assert records[-1] == {"kind": "summary", "errors": 1, "warnings": 1, "successes": 1}
+    assert (reporter.errors, reporter.warnings, reporter.successes) == ([], [], [])
+    assert reporter.counts == {"error": 1, "warning": 1, "success": 1}
+
+
+def test_sink_requires_emit():
+    with pytest.raises(TypeError):
+        Sink("tool")
@@ -0,0 +1,136 @@
+"""
+Tests for validate_api_docs.py: one shared corpus for every check, output
+unchanged from the original validator, and plugin checks
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+from ai_workflow_docs import validate_api_docs
+from ai_workflow_docs.validate_api_docs import APIDocValidator, main, register_check
+
+ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+
+# Output of the original validator (v1.0.0) on the tree below, with two
+# intended differences: files are listed in sorted order, and code fences
+# are counted as open/close pairs (it counted closing fences as blocks too).
+EXPECTED_STDOUT = """\
+╔════════════════════════════════════════════════════════╗
+║      API Documentation Validator v1.1.0               ║
+╚════════════════════════════════════════════════════════╝
+
+ℹ Validating API documentation in: docs/api
+
+═══ Structure Validation ═══
+✓ API README found: README.md
+ℹ Found 3 API documentation files
+✓ API documentation files present: 3
+
+═══ Markdown Structure Validation ═══
+✓ api/README.md: Has title
+ℹ api/README.md: Has 1 code blocks
+✓ api/guide.md: Has title
+ℹ api/guide.md: Has 2 code blocks
+
+═══ Code Example Validation ═══
+✓ Validated 3 code examples
+
+═══ Cross-Reference Validation ═══
+
+═══ Validation Summary ═══
+Successes: 5
+Warnings:  8
+Errors:    0
+"""
+
+EXPECTED_STDERR = """\
+⚠ WARNING: api/guide.md: Few sections (1)
+⚠ WARNING: api/sub/notes.md: Missing top-level heading
+⚠ WARNING: api/sub/notes.md: Few sections (0)
+⚠ WARNING: api/guide.md: Code block without language
+⚠ WARNING: api/guide.md: Empty code block
+⚠ WARNING: 2 code examples need improvement
+⚠ WARNING: api/guide.md: Broken reference to missing.md
+⚠ WARNING: Found 1 broken cross-references
+"""
+
+
+@pytest.fixture
+def docs(tmp_path, monkeypatch):
+    api = tmp_path / "docs" / "api"
+    (api / "sub").mkdir(parents=True)
+    (api / "README.md").write_text(
+        "# API\n\n## Overview\n\nSee [guide](guide.md).\n\n## Usage\n\n"
+        "```bash\nsource lib/ai_cache.sh\n```\n")
+    (api / "guide.md").write_text(
+        "# Guide\n\n## Setup\n\n```\nmake\n```\n\n```python\n```\n\n"
+        "Back to [the index](README.md), see [missing](missing.md) and [site](https://example.com/x.md).\n")
+    (api / "sub" / "notes.md").write_text("Some notes without a heading.\n")
+    monkeypatch.chdir(tmp_path)
+    # Checks registered by a test stay local to it
+    monkeypatch.setattr(validate_api_docs, "REGISTERED_CHECKS", [])
+    return api
+
+
+def test_output_matches_the_original_validator(docs, capsys):
+    assert main(["docs/api"]) == 0
+    captured = capsys.readouterr()
+    assert ANSI_RE.sub("", captured.out) == EXPECTED_STDOUT
+    assert ANSI_RE.sub("", captured.err) == EXPECTED_STDERR
+
+
+def test_each_file_is_read_once(docs, monkeypatch, capsys):
+    reads = []
+    read_bytes, read_text = Path.read_bytes, Path.read_text
+    monkeypatch.setattr(Path, "read_bytes", lambda self: reads.append(self.name) or read_bytes(self))
+    monkeypatch.setattr(Path, "read_text", lambda self, *a, **k: reads.append(self.name) or read_text(self, *a, **k))
+
+    assert main(["docs/api"]) == 0
+    assert sorted(reads) == ["README.md", "guide.md", "notes.md"]
+
+
+def test_registered_check_receives_the_shared_corpus(docs, capsys):
+    seen = []
+
+    @register_check("Link Text Validation")
+    def check_link_text(validator, corpus):
+        seen.append(corpus)
+        for doc in corpus:
+            for link in doc.links:
+                if link.text == "site":
+                    validator.error(f"{doc.relative_path}:{link.line}: External link to a .md file")
+
+    validator = APIDocValidator("docs/api")
+    assert validator.validate_all() == 1
+    assert seen == [validator.corpus]
+    assert [doc.path.name for doc in seen[0]] == ["README.md", "guide.md", "notes.md"]
+    captured = capsys.readouterr()
+    assert "═══ Link Text Validation ═══" in captured.out
+    assert "api/guide.md:12: External link to a .md file" in captured.err
+
+
+def test_plugin_option_loads_checks(docs, tmp_path, monkeypatch, capsys):
+    plugins = tmp_path / "plugins"
+    plugins.mkdir()
+    (plugins / "api_doc_plugin.py").write_text(
+        "from ai_workflow_docs.validate_api_docs import register_check\n\n\n"
+        "@register_check('Document Count')\n"
+        "def count(validator, corpus):\n"
+        "    validator.info(f'Plugin saw {len(corpus)} documents')\n")
+    monkeypatch.syspath_prepend(str(plugins))
+    monkeypatch.delitem(sys.modules, "api_doc_plugin", raising=False)
+
+    assert main(["docs/api", "--plugin", "api_doc_plugin"]) == 0
+    assert "Plugin saw 3 documents" in capsys.readouterr().out
+
+    # Without --plugin (as a later daemon request would be), its checks do not run
+    assert validate_api_docs.load_plugins([]) == []
+    assert [title for title, _ in validate_api_docs.load_plugins(["api_doc_plugin"])] == ["Document Count"]
+
+
+def test_missing_plugin(docs, capsys):
+    assert main(["docs/api", "--plugin", "no_such_plugin_module"]) == 2
+    assert "Could not load plugin" in capsys.readouterr().err
@@ -0,0 +1,147 @@
+"""
+Tests for validate_context_blocks.py and prompt_rules.py: the batch run over
+several YAML files, the required step prompts and the declarative rule set
+"""
+
+import pytest
+import yaml
+
+from ai_workflow_docs import prompt_rules
+from ai_workflow_docs.prompt_rules import Rule, RuleSet, rule_type
+from ai_workflow_docs.validate_context_blocks import REQUIRED_PROMPTS, main
+
+GOOD_TEMPLATE = """Review the changes.
+
+**Context:**
+- Project: {project_name} ({project_description})
+- Language: {primary_language}
+- Scope: {change_scope}, {modified_count} files
+
+**Task:** Report the issues found.
+"""
+
+BAD_TEMPLATE = """**Context:**
+- Project: {Project_Name}
+Scope: {change_scope}, {modified_count} files
+**Task:** Report the issues found.
+"""
+
+
+def write_prompts(path, templates):
+    path.write_text(yaml.safe_dump({key: {"task_template": task} for key, task in templates.items()}))
+    return path
+
+
+def all_prompts(**overrides):
+    templates = {key: GOOD_TEMPLATE for key in REQUIRED_PROMPTS}
+    templates.update(overrides)
+    return templates
+
+
+@pytest.fixture
+def prompts_dir(tmp_path):
+    prompts = tmp_path / "prompts"
+    prompts.mkdir()
+    write_prompts(prompts / "valid.yaml", all_prompts())
+    missing = all_prompts()
+    del missing["step4_directory_prompt"]
+    write_prompts(prompts / "missing.yaml", missing)
+    (prompts / "nested").mkdir()
+    write_prompts(prompts / "nested" / "violation.yml", all_prompts(step2_consistency_prompt=BAD_TEMPLATE))
+    return prompts
+
+
+def report(capsys):
+    """Map each failed file name to its failure lines"""
+    failures = {}
+    current = None
+    for line in capsys.readouterr().out.splitlines():
+        if line.startswith("  ") and line.strip().endswith(":") and not line.startswith("    "):
+            current = line.strip()[:-1].rsplit("/", 1)[-1]
+            failures[current] = []
+        elif line.startswith("    • "):
+            failures[current].append(line[len("    • "):])
+    return failures
+
+
+def test_batch_run_reports_failures_per_file_and_key(prompts_dir, capsys):
+    assert main([str(prompts_dir)]) == 1
+    assert report(capsys) == {
+        "missing.yaml": ["Step 4 (step4_directory_prompt): Prompt not found in YAML"],
+        "violation.yml": [
+            "Step 2 (step2_consistency_prompt): Missing parameters: project_name, project_description, "
+            "primary_language",
+            "Step 2 (step2_consistency_prompt): Non-snake_case parameters: Project_Name",
+            "Step 2 (step2_consistency_prompt): Non-bullet lines in context: 1",
+        ],
+    }
+
+
+def test_valid_file_passes(prompts_dir, capsys):
+    assert main([str(prompts_dir / "valid.yaml")]) == 0
+    out = capsys.readouterr().out
+    assert "Files: 1, prompts: 6, failed files: 0" in out
+    assert "✅ ALL VALIDATIONS PASSED" in out
+
+
+def test_required_prompts_can_be_changed(prompts_dir, capsys):
+    assert main([str(prompts_dir / "missing.yaml"), "--no-require"]) == 0
+    assert main([str(prompts_dir / "valid.yaml"), "--require", "step7_extra_prompt"]) == 1
+    assert report(capsys) == {"valid.yaml": ["Step 7 (step7_extra_prompt): Prompt not found in YAML"]}
+    assert main([str(prompts_dir / "valid.yaml"), "--require", "not_a_prompt"]) == 2
+
+
+def test_file_without_step_prompts_fails(tmp_path, capsys):
+    empty = tmp_path / "empty.yaml"
+    empty.write_text("other_prompt:\n  task_template: hello\n")
+    assert main([str(empty), "--no-require"]) == 1
+    assert report(capsys) == {"empty.yaml": ["No step*_prompt keys found"]}
+
+
+def test_no_input_files(tmp_path, capsys):
+    assert main([str(tmp_path / "nothing" / "*.yaml")]) == 2
+    assert "File not found" in capsys.readouterr().out
+
+
+def test_cached_run_gives_the_same_report(prompts_dir, tmp_path, capsys):
+    cache = ["--cache", "--cache-dir", str(tmp_path / "cache")]
+    assert main([str(prompts_dir), *cache]) == 1
+    first = report(capsys)
+    assert main([str(prompts_dir), *cache]) == 1
+    out = capsys.readouterr().out
+    assert out.count(", cached)") == 3
+    assert main([str(prompts_dir), *cache]) == 1
+    assert report(capsys) == first
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 3
+
+
+def test_custom_rule_set(tmp_path):
+    rules = tmp_path / "rules.yaml"
+    rules.write_text(
+        "param_pattern: '<(\\w+)>'\n"
+        "rules:\n"
+        "  - {id: greeting, type: contains, text: Hello, message: No greeting}\n"
+        "  - {id: name, type: required_params, params: [name, place], message: 'Missing {count}: {items}'}\n")
+    rule_set = RuleSet.from_yaml(rules)
+    assert rule_set.check("Hello <name> from <place>") == []
+    assert rule_set.check("Hi <name>") == ["No greeting", "Missing 1: place"]
+
+
+def test_invalid_rule_is_rejected(tmp_path):
+    rules = tmp_path / "rules.yaml"
+    rules.write_text("rules:\n  - {id: odd, type: no_such_type, message: x}\n")
+    with pytest.raises(ValueError, match="invalid rule odd"):
+        RuleSet.from_yaml(rules)
+
+
+def test_rule_type_without_check_fails_to_compile(tmp_path, monkeypatch):
+    monkeypatch.setattr(prompt_rules, "RULE_TYPES", dict(prompt_rules.RULE_TYPES))
+
+    @rule_type("half_written")
+    class HalfWrittenRule(Rule):
+        pass
+
+    rules = tmp_path / "rules.yaml"
+    rules.write_text("rules:\n  - {id: unfinished, type: half_written, message: x}\n")
+    with pytest.raises(ValueError, match="invalid rule unfinished: .*abstract"):
+        RuleSet.from_yaml(rules)
@@ -137,6 +137,13 @@ setup_test_cache() {
     export USE_AI_CACHE="true"
     export AI_CACHE_TTL=86400
     export VERBOSE="false"
+    # Suites 1-8 exercise the .txt/.meta file layout; suite 9 the response store
+    export USE_PYTHON_AI_CACHE="false"
+}
+
+setup_test_store() {
+    setup_test_cache
+    export USE_PYTHON_AI_CACHE="true"
 }
 
 teardown_test_cache() {
@@ -756,6 +763,143 @@ test_cache_concurrent_access() {
     teardown_test_cache
 }
 
+# ==============================================================================
+# TEST SUITE 9: Response Store
+# ==============================================================================
+
+test_store_round_trip() {
+    setup_test_store
+    init_ai_cache
+    
+    local key=$(generate_cache_key "store_prompt" "store_context")
+    local response=$'Line 1 with \$var and "quotes"\n\nLine 3'
+    
+    save_to_cache "${key}" "${response}" "store_prompt" "store_context"
+    local stored=$(get_from_cache "${key}")
+    
+    if [[ "${stored}" == "${response}" ]] && [[ ! -f "${AI_CACHE_DIR}/${key}.txt" ]]; then
+        pass "Response store returns content without per-key files"
+    else
+        fail "Response store round trip failed | Got: '${stored}'"
+    fi
+    
+    teardown_test_cache
+}
+
+test_store_expired_entry() {
+    setup_test_store
+    init_ai_cache
+    
+    local key=$(generate_cache_key "store_expired" "")
+    save_to_cache "${key}" "Expired response"
+    
+    if AI_CACHE_TTL=-1 check_cache "${key}"; then
+        fail "Expired store entry reported as cached"
+    else
+        AI_CACHE_TTL=-1 cleanup_ai_cache_old_entries
+        assert_contains "$(get_cache_stats)" "Total Entries: 0" "Expired store entries are a miss and are cleaned up"
+    fi
+    
+    teardown_test_cache
+}
+
+test_store_size_eviction() {
+    setup_test_store
+    init_ai_cache
+    
+    local recent_key=$(generate_cache_key "recent" "")
+    save_to_cache "${recent_key}" "Recently read response"
+    
+    # Random content does not compress: 8 x 64KB exceeds a 0.25MB limit
+    # A miss must fail this test, not abort the suite under the sourced set -e
+    local i misses=0
+    for i in 1 2 3 4 5 6 7 8; do
+        get_from_cache "${recent_key}" > /dev/null || misses=$((misses + 1))
+        AI_CACHE_MAX_SIZE_MB=0.25 save_to_cache "$(generate_cache_key "bulk_${i}" "")" \
+            "$(head -c 49152 /dev/urandom | base64 -w0)" || true
+    done
+    
+    local stats
+    stats=$(get_cache_stats) || true
+    if [[ ${misses} -eq 0 ]] && check_cache "${recent_key}" \
+        && ! check_cache "$(generate_cache_key "bulk_1" "")" \
+        && ! echo "${stats}" | grep -q "Total Entries: 9"; then
+        pass "Size limit evicts least recently read entries first"
+    else
+        fail "Size eviction did not keep the recently read entry | ${misses} miss(es) | ${stats}"
+    fi
+    
+    teardown_test_cache
+}
+
+test_store_imports_legacy_entries() {
+    setup_test_cache
+    init_ai_cache
+    
+    local key=$(generate_cache_key "legacy" "")
+    save_to_cache "${key}" "Legacy response"
+    
+    export USE_PYTHON_AI_CACHE="true"
+    init_ai_cache
+    
+    if [[ ! -f "${AI_CACHE_DIR}/${key}.txt" ]] && [[ "$(get_from_cache "${key}")" == "Legacy response" ]]; then
+        pass "init_ai_cache moves file layout entries into the store"
+    else
+        fail "Legacy entries were not imported"
+    fi
+    
+    teardown_test_cache
+}
+
+test_store_concurrent_writers() {
+    setup_test_store
+    init_ai_cache
+    
+    local i
+    for i in 1 2 3 4 5 6 7 8; do
+        save_to_cache "$(generate_cache_key "writer_${i}" "")" "response ${i}" &
+    done
+    wait
+    
+    local missing=0
+    for i in 1 2 3 4 5 6 7 8; do
+        [[ "$(get_from_cache "$(generate_cache_key "writer_${i}" "")")" == "response ${i}" ]] || ((missing++)) || true
+    done
+    assert_equals "0" "${missing}" "Concurrent store writers all commit their entries"
+    
+    teardown_test_cache
+}
+
+# ==============================================================================
+# TEST SUITE 10: Canonical Prompt Keys
+# ==============================================================================
+
+test_prompt_key_ignores_volatile_text() {
+    local key1=$(generate_cache_key $'Review   these files:\n  a.sh\n\nRun at 2026-10-18T10:00:00Z' "ctx")
+    local key2=$(generate_cache_key $'Review these files: a.sh\n\nRun at 2026-10-19T08:30:00Z' "ctx")
+    
+    assert_equals "${key1}" "${key2}" "Prompts differing in whitespace and timestamps share a key"
+}
+
+test_prompt_key_near_duplicate_metrics() {
+    setup_test_store
+    init_ai_cache
+    
+    local prompt=$(python3 -c "print(' '.join('finding%d' % i for i in range(200)))")
+    AI_CACHE_HITS=0
+    AI_CACHE_MISSES=0
+    AI_CACHE_NEAR_MISSES=0
+    
+    call_ai_with_cache "${prompt}" "ctx" "echo first" > /dev/null
+    call_ai_with_cache "${prompt}" "ctx" "echo second" > /dev/null
+    call_ai_with_cache "${prompt/finding150/changed}" "ctx" "echo third" > /dev/null
+    
+    assert_equals "1 2 1" "${AI_CACHE_HITS} ${AI_CACHE_MISSES} ${AI_CACHE_NEAR_MISSES}" \
+        "call_ai_with_cache counts hits, misses and near-duplicate misses"
+    
+    teardown_test_cache
+}
+
 # ==============================================================================
 # RUN ALL TESTS
 # ==============================================================================
@@ -819,6 +963,27 @@ main() {
     test_cache_directory_permission_error
     test_cache_concurrent_access
     
+    echo ""
+    echo "TEST SUITE 9: Response Store (5 tests)"
+    if command -v python3 &>/dev/null; then
+        test_store_round_trip
+        test_store_expired_entry
+        test_store_size_eviction
+        test_store_imports_legacy_entries
+        test_store_concurrent_writers
+    else
+        echo "⚠️  Suite skipped - python3 not available"
+    fi
+    
+    echo ""
+    echo "TEST SUITE 10: Canonical Prompt Keys (2 tests)"
+    if command -v python3 &>/dev/null; then
+        test_prompt_key_ignores_volatile_text
+        test_prompt_key_near_duplicate_metrics
+    else
+        echo "⚠️  Suite skipped - python3 not available"
+    fi
+    
     # Print summary
     echo ""
     print_test_header "Test Summary"
@@ -179,8 +179,15 @@ test_metrics_module() {
     # Test 9: Summary generation
     assert_file_exists "${METRICS_SUMMARY}" "Summary generation creates markdown file"
     
+    # Test 10: Metrics store rollups
+    if metrics_store_available; then
+        assert_equals "100" "$(get_success_rate 10)" "Metrics store records the run"
+        assert_equals "1" "$(grep -c workflow_run_id "${METRICS_HISTORY}")" "Metrics store appends one history line"
+    fi
+    
     # Cleanup
     rm -f "${METRICS_CURRENT}" "${METRICS_HISTORY}" "${METRICS_SUMMARY}"
+    rm -f "${METRICS_DB}" "${METRICS_DB}-wal" "${METRICS_DB}-shm"
 }
 
 # ==============================================================================
@@ -249,6 +256,27 @@ test_change_detection_module() {
     local analysis=$(analyze_changes)
     assert_contains "${analysis}" "Change Analysis" "Change analysis includes header"
     
+    # Test 9: Compiled artifact patterns
+    if is_workflow_artifact ".ai_workflow/logs/run.log" && ! is_workflow_artifact "src/main.sh"; then
+        assert_equals "true" "true" "Workflow artifacts match the compiled pattern"
+        ((TESTS_RUN++))
+        ((TESTS_PASSED++))
+    else
+        ((TESTS_RUN++))
+        ((TESTS_FAILED++))
+        FAILED_TESTS+=("Workflow artifacts match the compiled pattern")
+        echo -e "${RED}✗${NC} Workflow artifacts match the compiled pattern"
+    fi
+    
+    # Test 10: Classifier agrees with the shell filter and categories
+    if change_classifier_available; then
+        local sample_files=$'README.md\n.ai_workflow/logs/run.log\nsrc/app.test.js\nsrc/workflow/lib/x.sh\nconfig.yaml\nnotes.bak\nsrc/main.py'
+        assert_equals "$(filter_workflow_artifacts "${sample_files}")" \
+            "$(printf '%s\n' "${sample_files}" | change_classifier filter)" "Change classifier filters artifacts like the shell"
+        assert_equals "src/workflow/lib/x.sh src/main.py|README.md|src/app.test.js|config.yaml" \
+            "$(printf '%s\n' "${sample_files}" | change_classifier nature)" "Change classifier lists files by nature"
+    fi
+    
     # Cleanup
     rm -rf "${BACKLOG_RUN_DIR}"
 }
@@ -335,6 +363,28 @@ test_dependency_graph_module() {
     local plan_content=$(cat "${plan_file}")
     assert_contains "${plan_content}" "Phase 1" "Execution plan contains phases"
     
+    # Test 11: Critical path follows the estimates through the graph
+    assert_equals "0 6 7 8 10 11.7 15 16 12" "$(calculate_critical_path)" "Critical path is the longest estimated chain"
+    
+    # Test 12: Metadata export is valid JSON covering every step
+    local metadata_file="${BACKLOG_RUN_DIR}/step_metadata.json"
+    export_step_metadata_json "${metadata_file}" > /dev/null
+    local exported_steps
+    exported_steps=$(python3 -c 'import json, sys; print(len(json.load(open(sys.argv[1]))["steps"]))' "${metadata_file}" 2>/dev/null || echo "invalid")
+    assert_equals "${#STEP_DEPENDENCIES[@]}" "${exported_steps}" "Step metadata export is valid JSON with every step"
+    
+    # Test 13: DAG schedule runs every step and writes a Gantt chart
+    if dag_scheduler_available; then
+        local dag_result
+        dag_result=$(
+            execute_step() { sleep 0.1; }
+            should_execute_step() { [[ "$1" != "14" ]]; }
+            execute_dag_schedule 3 > /dev/null && echo "success" || echo "failed"
+        )
+        assert_equals "success" "${dag_result}" "DAG schedule completes the workflow"
+        assert_contains "$(cat "${BACKLOG_RUN_DIR}/dag_schedule/GANTT.txt" 2>/dev/null)" "Makespan" "DAG schedule writes a Gantt chart"
+    fi
+    
     # Cleanup
     rm -rf "${BACKLOG_RUN_DIR}"
 }